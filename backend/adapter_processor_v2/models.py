@@ -7,8 +7,10 @@ from account_v2.models import User
 from cryptography.fernet import Fernet, InvalidToken
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
-from django.db import models
+from django.db import models, transaction
 from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from permissions.models import HasMembersMixin
 from tenant_account_v2.models import OrganizationMember
 from tenant_account_v2.organization_member_service import OrganizationMemberService
@@ -26,6 +28,7 @@ from utils.models.organization_mixin import (
 from unstract.sdk1.constants import AdapterTypes
 from unstract.sdk1.exceptions import SdkError
 from unstract.sdk1.llm import LLM
+from unstract.sdk1.platform import PlatformHelper
 
 logger = logging.getLogger(__name__)
 
@@ -248,3 +251,18 @@ class UserDefaultAdapter(BaseModel):
         verbose_name = "Default Adapter for Organization User"
         verbose_name_plural = "Default Adapters for Organization Users"
         db_table = "default_organization_user_adapter"
+
+
+@receiver(post_save, sender=AdapterInstance)
+@receiver(post_delete, sender=AdapterInstance)
+def invalidate_adapter_config_cache(
+    sender: type, instance: AdapterInstance, **kwargs: Any
+) -> None:
+    """Make workers and tools refetch the adapter's config on next use.
+
+    Deferred to commit so nobody re-caches the old row under the new version.
+    """
+    adapter_instance_id = str(instance.id)
+    transaction.on_commit(
+        lambda: PlatformHelper.invalidate_adapter_config(adapter_instance_id)
+    )
@@ -0,0 +1,39 @@
+"""Adapter config cache invalidation on save / delete.
+
+Workers and tools cache adapter configs per process; saving or deleting an
+adapter must bump its shared version once the change is committed. The
+``on_commit`` hook is captured so no test database is required.
+"""
+
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import django
+from django.apps import apps
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings.test")
+if not apps.ready:
+    django.setup()
+
+from adapter_processor_v2 import models  # noqa: E402
+
+ADAPTER_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def test_invalidated_only_after_commit():
+    with (
+        patch.object(models.transaction, "on_commit") as on_commit,
+        patch.object(models.PlatformHelper, "invalidate_adapter_config") as invalidate,
+    ):
+        models.invalidate_adapter_config_cache(
+            sender=models.AdapterInstance, instance=SimpleNamespace(id=ADAPTER_ID)
+        )
+        invalidate.assert_not_called()
+
+        (callback,), _ = on_commit.call_args
+        callback()
+
+    invalidate.assert_called_once_with(ADAPTER_ID)
@@ -10,7 +10,6 @@ class RateLimitKeys:
 
     All rate limiting keys follow a consistent naming convention:
     - ZSET keys: api_deployment:rate_limit:{scope}:{id}
-    - Lock keys: lock:rate_limit:{scope}:{id}
     - Cache keys: rate_limit:cache:{type}:{id}
     """
 
@@ -18,10 +17,6 @@ class RateLimitKeys:
     GLOBAL_EXECUTIONS_KEY = "api_deployment:rate_limit:global"
     ORG_EXECUTIONS_KEY_PATTERN = "api_deployment:rate_limit:org:{org_id}"
 
-    # Lock keys for distributed locking
-    GLOBAL_LOCK_KEY = "lock:rate_limit:global"
-    ORG_LOCK_KEY_PATTERN = "lock:rate_limit:org:{org_id}"
-
     # Django cache keys for caching DB values
     ORG_LIMIT_CACHE_KEY_PATTERN = "rate_limit:cache:org_limit:{org_id}"
 
@@ -37,18 +32,6 @@ class RateLimitKeys:
         """
         return cls.ORG_EXECUTIONS_KEY_PATTERN.format(org_id=org_id)
 
-    @classmethod
-    def get_org_lock_key(cls, org_id: str) -> str:
-        """Get Redis lock key for organization rate limiting.
-
-        Args:
-            org_id: Organization UUID as string
-
-        Returns:
-            Redis key for org's distributed lock
-        """
-        return cls.ORG_LOCK_KEY_PATTERN.format(org_id=org_id)
-
     @classmethod
     def get_org_limit_cache_key(cls, org_id: str) -> str:
         """Get Django cache key for organization's rate limit value.
@@ -76,10 +59,7 @@ class RateLimitDefaults:
     # TTL and timing
     DEFAULT_TTL_HOURS = 6  # Hours to keep execution in ZSET
     DEFAULT_CACHE_TTL_SECONDS = 600  # 10 minutes cache for org limits
-
-    # Lock timeouts
-    DEFAULT_LOCK_TIMEOUT_SECONDS = 2  # Lock auto-expires
-    DEFAULT_LOCK_BLOCKING_TIMEOUT_SECONDS = 5  # Wait time to acquire
+    DEFAULT_LOCAL_CACHE_TTL_SECONDS = 30  # In-process copy of org limits
 
 
 class RateLimitMessages:
@@ -98,8 +78,6 @@ class RateLimitMessages:
         "Please try again in a few moments."
     )
 
-    LOCK_ACQUISITION_FAILED = "Failed to acquire rate limit lock. Please try again."
-
     REDIS_ERROR = "Rate limiting service temporarily unavailable. Request allowed."
 
     @classmethod
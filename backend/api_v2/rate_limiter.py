@@ -1,4 +1,5 @@
 import logging
+import threading
 import time
 
 from account_v2.models import Organization
@@ -16,6 +17,52 @@ logger = logging.getLogger(__name__)
 
 redis_cache = get_redis_connection("default")
 
+# Outcomes of _CHECK_AND_ACQUIRE_LUA
+_ACQUIRED = 0
+_ORG_LIMIT_HIT = 1
+_GLOBAL_LIMIT_HIT = 2
+
+# KEYS: org ZSET, global ZSET
+# ARGV: cutoff, now, ttl_seconds, org_limit, global_limit, execution_id
+# Returns {outcome, usage}; usage is the count of the exceeded ZSET on refusal.
+# Both keys must live on the same Redis node (no cluster slot split).
+_CHECK_AND_ACQUIRE_LUA = """
+local org_key = KEYS[1]
+local global_key = KEYS[2]
+local cutoff = ARGV[1]
+redis.call("ZREMRANGEBYSCORE", org_key, 0, cutoff)
+redis.call("ZREMRANGEBYSCORE", global_key, 0, cutoff)
+local org_count = redis.call("ZCARD", org_key)
+if org_count >= tonumber(ARGV[4]) then
+    return {1, org_count}
+end
+local global_count = redis.call("ZCARD", global_key)
+if global_count >= tonumber(ARGV[5]) then
+    return {2, global_count}
+end
+local ttl_seconds = tonumber(ARGV[3])
+redis.call("ZADD", org_key, ARGV[2], ARGV[6])
+redis.call("EXPIRE", org_key, ttl_seconds)
+redis.call("ZADD", global_key, ARGV[2], ARGV[6])
+redis.call("EXPIRE", global_key, ttl_seconds)
+return {0, global_count + 1}
+"""
+
+_acquire_script = None
+
+# Process-local copy of org limits in front of the Django cache:
+# {org_id: (expires_at, limit)}
+_org_limits: dict[str, tuple[float, int]] = {}
+_org_limits_lock = threading.Lock()
+
+
+def _get_acquire_script():
+    """Registered once; calls go out as EVALSHA (EVAL on a script cache miss)."""
+    global _acquire_script
+    if _acquire_script is None:
+        _acquire_script = redis_cache.register_script(_CHECK_AND_ACQUIRE_LUA)
+    return _acquire_script
+
 
 class APIDeploymentRateLimiter:
     """Rate limiter for API deployment concurrent requests using Redis ZSET with TTL."""
@@ -50,9 +97,12 @@ class APIDeploymentRateLimiter:
     def _get_org_limit(cls, organization: Organization) -> int:
         """Get the concurrent request limit for an organization.
 
-        Uses Django cache framework to avoid DB queries on every request.
-        Cache automatically cleared on OrganizationRateLimit save/delete.
-        TTL is refreshed on every read to keep frequently-used limits cached.
+        Limits are kept in-process for API_DEPLOYMENT_RATE_LIMIT_LOCAL_CACHE_TTL
+        seconds, so admission doesn't pay a cache round trip per request. Behind
+        that, the Django cache avoids DB queries; it is cleared on
+        OrganizationRateLimit save/delete and its TTL is refreshed on every read
+        to keep frequently-used limits cached. Other processes pick up a changed
+        limit once their local copy expires.
 
         Args:
             organization: Organization instance
@@ -61,6 +111,26 @@ class APIDeploymentRateLimiter:
             Concurrent request limit for the organization
         """
         org_id = str(organization.organization_id)
+        local_ttl = getattr(
+            settings,
+            "API_DEPLOYMENT_RATE_LIMIT_LOCAL_CACHE_TTL",
+            RateLimitDefaults.DEFAULT_LOCAL_CACHE_TTL_SECONDS,
+        )
+        with _org_limits_lock:
+            local = _org_limits.get(org_id)
+        if local is not None and local[0] > time.monotonic():
+            return local[1]
+
+        limit = cls._get_shared_org_limit(organization)
+        if local_ttl > 0:
+            with _org_limits_lock:
+                _org_limits[org_id] = (time.monotonic() + local_ttl, limit)
+        return limit
+
+    @classmethod
+    def _get_shared_org_limit(cls, organization: Organization) -> int:
+        """Get the org limit from the Django cache, falling back to the DB."""
+        org_id = str(organization.organization_id)
         cache_key = RateLimitKeys.get_org_limit_cache_key(org_id)
         cache_ttl = getattr(
             settings,
@@ -100,6 +170,8 @@ class APIDeploymentRateLimiter:
         """
         cache_key = RateLimitKeys.get_org_limit_cache_key(org_id)
         cache.delete(cache_key)
+        with _org_limits_lock:
+            _org_limits.pop(org_id, None)
         logger.info(f"Cleared rate limit cache for org {org_id}")
 
     @classmethod
@@ -150,40 +222,12 @@ class APIDeploymentRateLimiter:
     def check_and_acquire(
         cls, organization: Organization, execution_id: str
     ) -> tuple[bool, dict | None]:
-        """Atomically check rate limits and acquire slot using per-org Redis lock.
-
-        This implementation uses per-organization locks to prevent race conditions
-        within each organization. The global limit is checked but not locked, which
-        means under extreme concurrent load across many organizations, the global
-        limit may briefly be exceeded by 1-2% before self-correcting.
+        """Atomically check rate limits and acquire a slot in one Redis call.
 
-        Future Enhancement: To strictly enforce global limits without any tolerance,
-        add a second lock acquisition for global limit checking:
-
-        ```python
-        # After org limit check passes
-        from redis.lock import Lock
-
-        global_lock = Lock(
-            redis_cache,
-            RateLimitKeys.GLOBAL_LOCK_KEY,
-            timeout=settings.API_DEPLOYMENT_RATE_LIMIT_LOCK_TIMEOUT,
-        )
-        try:
-            if not global_lock.acquire(blocking=True, blocking_timeout=...):
-                return True, None  # Fail open
-
-            # Re-check global limit with lock held
-            global_count = redis_cache.zcard(RateLimitKeys.GLOBAL_EXECUTIONS_KEY)
-            if global_count >= global_limit:
-                return False, {...}
-
-            # Add to both ZSETs while holding global lock
-            pipe.zadd(...)
-            pipe.execute()
-        finally:
-            global_lock.release()
-        ```
+        Trimming expired entries, checking the org and global limits and adding
+        the execution to both ZSETs run as a single Lua script, so concurrent
+        requests (across all organizations) can't interleave between the check
+        and the acquire and both limits are enforced exactly, without a lock.
 
         Args:
             organization: Organization instance
@@ -194,102 +238,53 @@ class APIDeploymentRateLimiter:
                 If can_proceed is False, limit_info contains details about the exceeded limit
         """
         org_id = str(organization.organization_id)
-        org_lock_key = RateLimitKeys.get_org_lock_key(org_id)
         org_key = cls._get_org_key(org_id)
-        current_timestamp = time.time()
-        cutoff = cls._get_cutoff_timestamp()
-        ttl_seconds = cls._get_ttl_seconds()
-
-        from redis.lock import Lock
-
-        lock_timeout = getattr(
-            settings,
-            "API_DEPLOYMENT_RATE_LIMIT_LOCK_TIMEOUT",
-            RateLimitDefaults.DEFAULT_LOCK_TIMEOUT_SECONDS,
-        )
-        lock_blocking_timeout = getattr(
+        global_limit = getattr(
             settings,
-            "API_DEPLOYMENT_RATE_LIMIT_LOCK_BLOCKING_TIMEOUT",
-            RateLimitDefaults.DEFAULT_LOCK_BLOCKING_TIMEOUT_SECONDS,
-        )
-
-        org_lock = Lock(
-            redis_cache,
-            org_lock_key,
-            timeout=lock_timeout,
-            blocking_timeout=lock_blocking_timeout,
+            "API_DEPLOYMENT_GLOBAL_RATE_LIMIT",
+            RateLimitDefaults.DEFAULT_GLOBAL_LIMIT,
         )
 
         try:
-            # Acquire per-organization lock
-            acquired = org_lock.acquire(blocking=True)
-            if not acquired:
-                logger.error(f"Failed to acquire rate limit lock for org {org_id}")
-                # Fail open: allow request to proceed
-                return True, None
-
-            # Cleanup expired entries
-            redis_cache.zremrangebyscore(org_key, 0, cutoff)
-            redis_cache.zremrangebyscore(RateLimitKeys.GLOBAL_EXECUTIONS_KEY, 0, cutoff)
-
-            # Check org-level limit
-            org_count = redis_cache.zcard(org_key)
             org_limit = cls._get_org_limit(organization)
-
-            if org_count >= org_limit:
-                logger.warning(
-                    f"Organization {org_id} hit rate limit: {org_count}/{org_limit}"
-                )
-                return False, {
-                    "limit_type": "organization",
-                    "current_usage": org_count,
-                    "limit": org_limit,
-                }
-
-            # Check global limit (no lock - eventual consistency)
-            global_count = redis_cache.zcard(RateLimitKeys.GLOBAL_EXECUTIONS_KEY)
-            global_limit = getattr(
-                settings,
-                "API_DEPLOYMENT_GLOBAL_RATE_LIMIT",
-                RateLimitDefaults.DEFAULT_GLOBAL_LIMIT,
-            )
-
-            if global_count >= global_limit:
-                logger.warning(
-                    f"Global rate limit exceeded: {global_count}/{global_limit}"
-                )
-                return False, {
-                    "limit_type": "global",
-                    "current_usage": global_count,
-                    "limit": global_limit,
-                }
-
-            # Both checks passed - add to both ZSETs atomically
-            pipe = redis_cache.pipeline()
-            pipe.zadd(org_key, {execution_id: current_timestamp})
-            pipe.expire(org_key, ttl_seconds)
-            pipe.zadd(
-                RateLimitKeys.GLOBAL_EXECUTIONS_KEY, {execution_id: current_timestamp}
+            outcome, current_usage = _get_acquire_script()(
+                keys=[org_key, RateLimitKeys.GLOBAL_EXECUTIONS_KEY],
+                args=[
+                    cls._get_cutoff_timestamp(),
+                    time.time(),
+                    cls._get_ttl_seconds(),
+                    org_limit,
+                    global_limit,
+                    execution_id,
+                ],
             )
-            pipe.expire(RateLimitKeys.GLOBAL_EXECUTIONS_KEY, ttl_seconds)
-            pipe.execute()
+        except Exception as e:
+            logger.error(f"Error in rate limit check for org {org_id}: {e}")
+            # Fail open: allow request on errors
+            return True, None
 
+        if outcome == _ACQUIRED:
             logger.info(
                 f"Rate limit slot acquired for org {org_id}, execution {execution_id}"
             )
             return True, None
 
-        except Exception as e:
-            logger.error(f"Error in rate limit check for org {org_id}: {e}")
-            # Fail open: allow request on errors
-            return True, None
+        if outcome == _ORG_LIMIT_HIT:
+            logger.warning(
+                f"Organization {org_id} hit rate limit: {current_usage}/{org_limit}"
+            )
+            return False, {
+                "limit_type": "organization",
+                "current_usage": current_usage,
+                "limit": org_limit,
+            }
 
-        finally:
-            try:
-                org_lock.release()
-            except Exception as e:
-                # Lock may have already expired or been released
-                logger.debug(f"Error releasing lock for org {org_id}: {e}")
+        logger.warning(f"Global rate limit exceeded: {current_usage}/{global_limit}")
+        return False, {
+            "limit_type": "global",
+            "current_usage": current_usage,
+            "limit": global_limit,
+        }
 
     @classmethod
     def check_rate_limit(cls, organization: Organization) -> tuple[bool, dict | None]:
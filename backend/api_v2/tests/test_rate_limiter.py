@@ -0,0 +1,171 @@
+"""``APIDeploymentRateLimiter.check_and_acquire`` admits a request with a single
+Lua script call and maps the script's outcome onto the existing return shape.
+
+Unit tests: the registered script and the org-limit lookups are patched on the
+imported module, so neither Redis nor the database is needed. The script
+itself is exercised against the configured Redis by the ``integration`` tests
+at the bottom, which skip when no Redis is reachable.
+"""
+
+import time
+import uuid
+from types import SimpleNamespace
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+from redis.exceptions import RedisError
+
+import api_v2.rate_limiter as rl
+from api_v2.rate_limit_constants import RateLimitKeys
+
+ORG_ID = "org-rl"
+
+
+@pytest.fixture
+def organization():
+    org = MagicMock()
+    org.organization_id = ORG_ID
+    return org
+
+
+@pytest.fixture(autouse=True)
+def _fresh_org_limits():
+    rl._org_limits.clear()
+    yield
+    rl._org_limits.clear()
+
+
+@pytest.fixture
+def script():
+    script = MagicMock(return_value=[rl._ACQUIRED, 1])
+    with (
+        mock.patch.object(rl, "_get_acquire_script", return_value=script),
+        mock.patch.object(
+            rl.APIDeploymentRateLimiter, "_get_shared_org_limit", return_value=5
+        ),
+        mock.patch.object(
+            rl,
+            "settings",
+            SimpleNamespace(
+                API_DEPLOYMENT_GLOBAL_RATE_LIMIT=50,
+                API_DEPLOYMENT_RATE_LIMIT_TTL_HOURS=6,
+                API_DEPLOYMENT_RATE_LIMIT_LOCAL_CACHE_TTL=30,
+            ),
+        ),
+    ):
+        yield script
+
+
+def test_acquires_in_one_script_call(script, organization):
+    assert rl.APIDeploymentRateLimiter.check_and_acquire(organization, "exec-1") == (
+        True,
+        None,
+    )
+
+    script.assert_called_once()
+    call = script.call_args.kwargs
+    assert call["keys"] == [
+        RateLimitKeys.get_org_executions_key(ORG_ID),
+        RateLimitKeys.GLOBAL_EXECUTIONS_KEY,
+    ]
+    assert call["args"][3:] == [5, 50, "exec-1"]
+
+
+@pytest.mark.parametrize(
+    "outcome, expected",
+    [
+        (
+            rl._ORG_LIMIT_HIT,
+            {"limit_type": "organization", "current_usage": 5, "limit": 5},
+        ),
+        (
+            rl._GLOBAL_LIMIT_HIT,
+            {"limit_type": "global", "current_usage": 50, "limit": 50},
+        ),
+    ],
+)
+def test_refusal_reports_exceeded_limit(script, organization, outcome, expected):
+    script.return_value = [outcome, expected["current_usage"]]
+
+    assert rl.APIDeploymentRateLimiter.check_and_acquire(organization, "exec-1") == (
+        False,
+        expected,
+    )
+
+
+def test_fails_open_on_redis_error(script, organization):
+    script.side_effect = ConnectionError("redis down")
+
+    assert rl.APIDeploymentRateLimiter.check_and_acquire(organization, "exec-1") == (
+        True,
+        None,
+    )
+
+
+def test_org_limit_cached_in_process(script, organization):
+    limiter = rl.APIDeploymentRateLimiter
+    with mock.patch.object(rl, "cache"):
+        limiter.check_and_acquire(organization, "exec-1")
+        limiter.check_and_acquire(organization, "exec-2")
+        assert limiter._get_shared_org_limit.call_count == 1
+
+        limiter.clear_org_limit_cache(ORG_ID)
+        limiter.check_and_acquire(organization, "exec-3")
+
+    assert limiter._get_shared_org_limit.call_count == 2
+
+
+@pytest.fixture
+def live_keys():
+    """Fresh org/global ZSET keys on the live Redis, removed afterwards."""
+    try:
+        rl.redis_cache.ping()
+    except RedisError as e:
+        pytest.skip(f"Redis not reachable: {e}")
+    prefix = f"test_rate_limiter:{uuid.uuid4().hex}"
+    keys = [f"{prefix}:org", f"{prefix}:global"]
+    yield keys
+    rl.redis_cache.delete(*keys)
+
+
+def _run_script(keys, execution_id, org_limit=2, global_limit=3, now=None):
+    now = time.time() if now is None else now
+    outcome, usage = rl._get_acquire_script()(
+        keys=keys, args=[now - 60, now, 60, org_limit, global_limit, execution_id]
+    )
+    return int(outcome), int(usage)
+
+
+@pytest.mark.integration
+def test_script_admits_until_org_limit(live_keys):
+    org_key, global_key = live_keys
+
+    assert _run_script(live_keys, "exec-1") == (rl._ACQUIRED, 1)
+    assert _run_script(live_keys, "exec-2") == (rl._ACQUIRED, 2)
+    assert _run_script(live_keys, "exec-3") == (rl._ORG_LIMIT_HIT, 2)
+
+    # A refusal records nothing; admissions land in both ZSETs with a TTL.
+    assert rl.redis_cache.zcard(org_key) == 2
+    assert rl.redis_cache.zcard(global_key) == 2
+    assert 0 < rl.redis_cache.ttl(org_key) <= 60
+
+
+@pytest.mark.integration
+def test_script_refuses_at_global_limit(live_keys):
+    org_key, global_key = live_keys
+    now = time.time()
+    rl.redis_cache.zadd(global_key, {"other-1": now, "other-2": now, "other-3": now})
+
+    assert _run_script(live_keys, "exec-1", now=now) == (rl._GLOBAL_LIMIT_HIT, 3)
+    assert rl.redis_cache.zcard(org_key) == 0
+
+
+@pytest.mark.integration
+def test_script_drops_entries_older_than_cutoff(live_keys):
+    org_key, _ = live_keys
+    now = time.time()
+    rl.redis_cache.zadd(org_key, {"stale-1": now - 120, "stale-2": now - 120})
+
+    assert _run_script(live_keys, "exec-1", now=now) == (rl._ACQUIRED, 1)
+    assert rl.redis_cache.zrange(org_key, 0, -1) == [b"exec-1"]
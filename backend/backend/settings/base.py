@@ -155,12 +155,9 @@ API_DEPLOYMENT_RATE_LIMIT_TTL_HOURS = int(
 API_DEPLOYMENT_RATE_LIMIT_CACHE_TTL = int(
     os.environ.get("API_DEPLOYMENT_RATE_LIMIT_CACHE_TTL", 600)
 )
-# Redis lock timeouts for rate limiting (in seconds)
-API_DEPLOYMENT_RATE_LIMIT_LOCK_TIMEOUT = int(
-    os.environ.get("API_DEPLOYMENT_RATE_LIMIT_LOCK_TIMEOUT", 2)
-)
-API_DEPLOYMENT_RATE_LIMIT_LOCK_BLOCKING_TIMEOUT = int(
-    os.environ.get("API_DEPLOYMENT_RATE_LIMIT_LOCK_BLOCKING_TIMEOUT", 5)
+# In-process TTL for organization rate limits (in seconds); 0 disables it
+API_DEPLOYMENT_RATE_LIMIT_LOCAL_CACHE_TTL = int(
+    os.environ.get("API_DEPLOYMENT_RATE_LIMIT_LOCAL_CACHE_TTL", 30)
 )
 
 
@@ -753,6 +750,10 @@ DASHBOARD_CACHE_TTL_WORKFLOW_USAGE = int(
 DASHBOARD_BUCKET_CACHE_ENABLED = (
     os.environ.get("DASHBOARD_BUCKET_CACHE_ENABLED", "true").lower() == "true"
 )
+# Hours before each source's watermark that aggregation re-reads for late updates
+DASHBOARD_METRICS_LATE_DATA_HOURS = int(
+    os.environ.get("DASHBOARD_METRICS_LATE_DATA_HOURS", 6)
+)
 
 # Always keep this line at the bottom of the file.
 if missing_settings:
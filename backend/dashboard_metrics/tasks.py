@@ -8,12 +8,15 @@ Tasks:
 
 import logging
 import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from account_v2.models import Organization
 from celery import shared_task
+from django.conf import settings
 from django.core.cache import cache
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDay, TruncMonth
 from django.db.utils import DatabaseError, OperationalError
 from django.utils import timezone
 from workflow_manager.workflow_v2.models.execution import WorkflowExecution
@@ -33,6 +36,13 @@ logger = logging.getLogger(__name__)
 DASHBOARD_HOURLY_METRICS_RETENTION_DAYS = 30
 DASHBOARD_DAILY_METRICS_RETENTION_DAYS = 365
 
+# Incremental aggregation
+WATERMARK_CACHE_KEY = "dashboard_metrics:watermarks:{org_id}"
+LLM_COMBINED_SOURCE = "llm_combined"  # Watermark of get_llm_metrics_combined
+DEFAULT_LATE_DATA_HOURS = 6
+INITIAL_LOOKBACK_HOURS = 24
+MAX_CATCH_UP = timedelta(days=7)
+
 
 def _upsert_agg(agg: dict, key: tuple, metric_type: str, value: float) -> None:
     """Add a value to an aggregation dict, creating the entry if needed."""
@@ -272,10 +282,12 @@ def aggregate_metrics_from_sources() -> dict[str, Any]:
     runs. If a previous run was killed without releasing the lock, the next
     run detects the stale lock and reclaims it automatically.
 
-    Aggregation windows:
-    - Hourly: Last 24 hours (rolling window)
-    - Daily: Last 7 days (ensures we capture late-arriving data)
-    - Monthly: Last 2 months (current + previous month)
+    Aggregation is incremental: each source keeps a per-org high-water mark
+    and only hours from the mark (minus a bounded late-data window,
+    DASHBOARD_METRICS_LATE_DATA_HOURS) are re-queried from source tables.
+    Daily rows of the touched days are then rolled up from the hourly table,
+    and monthly rows of the touched months from the daily table, so the cost
+    scales with new events rather than with history.
 
     Returns:
         Dict with aggregation summary for all three tiers
@@ -290,32 +302,76 @@ def aggregate_metrics_from_sources() -> dict[str, Any]:
         cache.delete(AGGREGATION_LOCK_KEY)
 
 
+def _get_late_data_window() -> timedelta:
+    """How far behind a watermark each run re-aggregates, for late updates."""
+    hours = getattr(
+        settings, "DASHBOARD_METRICS_LATE_DATA_HOURS", DEFAULT_LATE_DATA_HOURS
+    )
+    return timedelta(hours=hours)
+
+
+def _get_watermarks(org_id: str) -> dict[str, datetime]:
+    """Get the per-source high-water marks of an organization.
+
+    Args:
+        org_id: Organization PK as string
+
+    Returns:
+        Dict of source name to the end of the last successful aggregation
+    """
+    stored = cache.get(WATERMARK_CACHE_KEY.format(org_id=org_id)) or {}
+    return {source: datetime.fromisoformat(ts) for source, ts in stored.items()}
+
+
+def _set_watermarks(org_id: str, watermarks: dict[str, datetime]) -> None:
+    """Persist the per-source high-water marks of an organization (no expiry)."""
+    cache.set(
+        WATERMARK_CACHE_KEY.format(org_id=org_id),
+        {source: ts.isoformat() for source, ts in watermarks.items()},
+        None,
+    )
+
+
+def _get_source_start(
+    watermark: datetime | None, end_date: datetime, late_window: timedelta
+) -> datetime:
+    """Get the hour from which a source has to be re-aggregated.
+
+    Everything from the watermark on is new; the late-data window before it
+    picks up rows whose status changed after they were first aggregated
+    (e.g. a file execution created earlier that completed since). Without a
+    watermark (first run, or the cache was flushed) the last 24 hours are
+    aggregated. Catch-up after a long outage is capped at MAX_CATCH_UP so the
+    hourly rows being rolled up are always within retention; older gaps need
+    the backfill_metrics command.
+    """
+    if watermark is None:
+        start = end_date - timedelta(hours=INITIAL_LOOKBACK_HOURS)
+    else:
+        start = max(watermark - late_window, end_date - MAX_CATCH_UP)
+    return _truncate_to_hour(start)
+
+
 def _aggregate_single_metric(
     query_method,
     metric_name: str,
     metric_type: str,
     org_id: str,
-    hourly_start: datetime,
-    daily_start: datetime,
-    monthly_start: datetime,
+    start_date: datetime,
     end_date: datetime,
     hourly_agg: dict,
-    daily_agg: dict,
-    monthly_agg: dict,
     extra_kwargs: dict | None = None,
 ) -> None:
-    """Run a single metric query at all 3 granularities and populate agg dicts.
+    """Run a single metric query at hour granularity and populate hourly_agg.
 
-    Uses 2 queries instead of 3: the daily query is widened to monthly_start
-    and its results are split into both daily_agg and monthly_agg in Python.
-    This is the same pattern proven in the backfill management command.
+    start_date is truncated to the hour, so every hour bucket returned is
+    complete and upserting it is idempotent.
     """
     extra_kwargs = extra_kwargs or {}
 
-    # === HOURLY (last 24h) ===
     for row in query_method(
         org_id,
-        hourly_start,
+        start_date,
         end_date,
         granularity=Granularity.HOUR,
         **extra_kwargs,
@@ -324,48 +380,22 @@ def _aggregate_single_metric(
         key = (org_id, hour_ts.isoformat(), metric_name, "default", "")
         _upsert_agg(hourly_agg, key, metric_type, row["value"] or 0)
 
-    # === DAILY + MONTHLY (single query from monthly_start) ===
-    for row in query_method(
-        org_id,
-        monthly_start,
-        end_date,
-        granularity=Granularity.DAY,
-        **extra_kwargs,
-    ):
-        value = row["value"] or 0
-        day_ts = _truncate_to_day(row["period"])
-
-        if day_ts >= daily_start:
-            key = (org_id, day_ts.date().isoformat(), metric_name, "default", "")
-            _upsert_agg(daily_agg, key, metric_type, value)
-
-        month_key = _truncate_to_month(row["period"]).date().isoformat()
-        key = (org_id, month_key, metric_name, "default", "")
-        _upsert_agg(monthly_agg, key, metric_type, value)
-
 
 def _aggregate_llm_combined(
     org_id: str,
-    hourly_start: datetime,
-    daily_start: datetime,
-    monthly_start: datetime,
+    start_date: datetime,
     end_date: datetime,
     hourly_agg: dict,
-    daily_agg: dict,
-    monthly_agg: dict,
     llm_combined_fields: dict,
 ) -> None:
-    """Run the combined LLM metrics query at all granularities.
+    """Run the combined LLM metrics query at hour granularity.
 
-    Issues 2 queries total (hourly + daily/monthly) instead of 3.
-    The DAY-granularity query is widened to monthly_start and results are
-    split into daily_agg (recent rows) and monthly_agg (all rows bucketed
-    by month) in Python. Same pattern as _aggregate_single_metric.
+    One query populates all four LLM metrics. Same pattern as
+    _aggregate_single_metric.
     """
-    # === HOURLY (last 24h) ===
     for row in MetricsQueryService.get_llm_metrics_combined(
         org_id,
-        hourly_start,
+        start_date,
         end_date,
         granularity=Granularity.HOUR,
     ):
@@ -374,25 +404,84 @@ def _aggregate_llm_combined(
             key = (org_id, ts_str, metric_name, "default", "")
             _upsert_agg(hourly_agg, key, metric_type, row[field] or 0)
 
-    # === DAILY + MONTHLY (single query from monthly_start) ===
-    for row in MetricsQueryService.get_llm_metrics_combined(
-        org_id,
-        monthly_start,
-        end_date,
-        granularity=Granularity.DAY,
-    ):
-        day_ts = _truncate_to_day(row["period"])
-        month_key = _truncate_to_month(row["period"]).date().isoformat()
 
-        for field, (metric_name, metric_type) in llm_combined_fields.items():
-            value = row[field] or 0
+def _rollup_daily(org_id: str, first_day: datetime, last_day: datetime) -> dict:
+    """Sum the hourly rows of [first_day, last_day] into daily aggregations.
+
+    Counts follow backfill_metrics: a daily row counts 1 (one day of data),
+    however many hourly rows it was summed from.
 
-            if day_ts >= daily_start:
-                key = (org_id, day_ts.date().isoformat(), metric_name, "default", "")
-                _upsert_agg(daily_agg, key, metric_type, value)
+    Args:
+        org_id: Organization PK as string
+        first_day: Midnight of the first day to roll up
+        last_day: Midnight of the last day to roll up
 
-            key = (org_id, month_key, metric_name, "default", "")
-            _upsert_agg(monthly_agg, key, metric_type, value)
+    Returns:
+        Dict keyed by (org_id, date_str, metric_name, project, tag)
+    """
+    daily_agg: dict[tuple, dict] = {}
+    rows = (
+        EventMetricsHourly._base_manager.filter(
+            organization_id=org_id,
+            timestamp__gte=first_day,
+            timestamp__lt=last_day + timedelta(days=1),
+        )
+        .annotate(day=TruncDay("timestamp"))
+        .values("day", "metric_name", "metric_type", "project", "tag")
+        .annotate(value=Sum("metric_value"))
+    )
+    for row in rows:
+        date_str = _truncate_to_day(row["day"]).date().isoformat()
+        key = (org_id, date_str, row["metric_name"], row["project"], row["tag"])
+        daily_agg[key] = {
+            "metric_type": row["metric_type"],
+            "value": row["value"] or 0,
+            "count": 1,
+        }
+    return daily_agg
+
+
+def _rollup_monthly(org_id: str, first_month: date, last_month: date) -> dict:
+    """Sum the daily rows of [first_month, last_month] into monthly aggregations.
+
+    Rolls up from daily rather than hourly rows, since hourly retention
+    (30 days) does not always cover a whole month. A monthly row counts its
+    daily rows, as in backfill_metrics, so it does not depend on which path
+    wrote those rows.
+
+    Args:
+        org_id: Organization PK as string
+        first_month: First day of the first month to roll up
+        last_month: First day of the last month to roll up
+
+    Returns:
+        Dict keyed by (org_id, month_str, metric_name, project, tag)
+    """
+    monthly_agg: dict[tuple, dict] = {}
+    rows = (
+        EventMetricsDaily._base_manager.filter(
+            organization_id=org_id,
+            date__gte=first_month,
+            date__lt=(last_month + timedelta(days=32)).replace(day=1),
+        )
+        .annotate(month=TruncMonth("date"))
+        .values("month", "metric_name", "metric_type", "project", "tag")
+        .annotate(value=Sum("metric_value"), count=Count("id"))
+    )
+    for row in rows:
+        key = (
+            org_id,
+            row["month"].isoformat(),
+            row["metric_name"],
+            row["project"],
+            row["tag"],
+        )
+        monthly_agg[key] = {
+            "metric_type": row["metric_type"],
+            "value": row["value"] or 0,
+            "count": row["count"] or 0,
+        }
+    return monthly_agg
 
 
 def _run_aggregation() -> dict[str, Any]:
@@ -401,28 +490,7 @@ def _run_aggregation() -> dict[str, Any]:
     Separated from the task function to keep the lock management clean.
     """
     end_date = timezone.now()
-
-    # Query windows for each granularity
-    # - Hourly: Last 24 hours (rolling window, matches retention of 30 days)
-    # - Daily: Last 7 days (ensures we capture late-arriving data)
-    # - Monthly: Last 2 months (current + previous, ensures month transitions are captured)
-    hourly_start = end_date - timedelta(hours=24)
-    daily_start = _truncate_to_day(end_date - timedelta(days=7))
-    # Include previous month to handle month boundaries
-    if end_date.month == 1:
-        monthly_start = end_date.replace(
-            year=end_date.year - 1,
-            month=12,
-            day=1,
-            hour=0,
-            minute=0,
-            second=0,
-            microsecond=0,
-        )
-    else:
-        monthly_start = end_date.replace(
-            month=end_date.month - 1, day=1, hour=0, minute=0, second=0, microsecond=0
-        )
+    late_window = _get_late_data_window()
 
     # Metric definitions: (name, query_method, is_histogram)
     # Note: llm_calls, challenges, summarization_calls, and llm_usage are
@@ -458,16 +526,15 @@ def _run_aggregation() -> dict[str, Any]:
         "errors": 0,
         "orgs_processed": 0,
     }
+    # Overall range re-aggregated in this run, for the summary
+    hourly_start = end_date
+    first_day = _truncate_to_day(end_date)
 
-    # Pre-filter to orgs with recent activity to reduce DB load.
-    # Uses daily_start (7 days) instead of monthly_start (2 months) because:
-    # - Hourly/daily queries only need recent data (24h / 7d windows)
-    # - Monthly totals for dormant orgs were already written by previous
-    #   runs when the org was active — re-running just overwrites same values
-    # - This avoids 28 queries per dormant org that had activity 2-8 weeks ago
+    # Pre-filter to orgs with recent activity to reduce DB load. Orgs idle for
+    # longer than MAX_CATCH_UP have nothing left to catch up on.
     active_org_ids = set(
         WorkflowExecution.objects.filter(
-            created_at__gte=daily_start,
+            created_at__gte=end_date - MAX_CATCH_UP,
         )
         .values_list("workflow__organization_id", flat=True)
         .distinct()
@@ -498,12 +565,17 @@ def _run_aggregation() -> dict[str, Any]:
         org_id = str(org.id)
         org_identifier = org.organization_id  # Pre-resolved for PageUsage queries
         hourly_agg: dict[tuple, dict] = {}
-        daily_agg: dict[tuple, dict] = {}
-        monthly_agg: dict[tuple, dict] = {}
 
         try:
+            watermarks = _get_watermarks(org_id)
+            # Sources aggregated successfully in this run -> their start hour
+            aggregated: dict[str, datetime] = {}
+
             for metric_name, query_method, is_histogram in metric_configs:
                 metric_type = MetricType.HISTOGRAM if is_histogram else MetricType.COUNTER
+                start = _get_source_start(
+                    watermarks.get(metric_name), end_date, late_window
+                )
 
                 # Pass org_identifier to PageUsage-based metrics to
                 # avoid redundant Organization lookups per call.
@@ -517,46 +589,61 @@ def _run_aggregation() -> dict[str, Any]:
                         metric_name,
                         metric_type,
                         org_id,
-                        hourly_start,
-                        daily_start,
-                        monthly_start,
+                        start,
                         end_date,
                         hourly_agg,
-                        daily_agg,
-                        monthly_agg,
                         extra_kwargs,
                     )
+                    aggregated[metric_name] = start
                 except Exception:
                     logger.exception("Error querying %s for org %s", metric_name, org_id)
                     stats["errors"] += 1
 
-            # Combined LLM metrics: 1 query per granularity instead of 4
+            # Combined LLM metrics: 1 query instead of 4
+            start = _get_source_start(
+                watermarks.get(LLM_COMBINED_SOURCE), end_date, late_window
+            )
             try:
                 _aggregate_llm_combined(
                     org_id,
-                    hourly_start,
-                    daily_start,
-                    monthly_start,
+                    start,
                     end_date,
                     hourly_agg,
-                    daily_agg,
-                    monthly_agg,
                     llm_combined_fields,
                 )
+                aggregated[LLM_COMBINED_SOURCE] = start
             except Exception:
                 logger.exception("Error querying combined LLM metrics for org %s", org_id)
                 stats["errors"] += 1
 
-            # Bulk upsert all three tiers (single INSERT...ON CONFLICT each)
+            if not aggregated:
+                continue
+
+            # Complete hour buckets replace what's stored (INSERT...ON CONFLICT)
             if hourly_agg:
                 stats["hourly"]["upserted"] += _bulk_upsert_hourly(hourly_agg)
 
+            # Roll the touched days up from hourly, and their months from daily
+            org_start = min(aggregated.values())
+            org_first_day = _truncate_to_day(org_start)
+            daily_agg = _rollup_daily(org_id, org_first_day, _truncate_to_day(end_date))
             if daily_agg:
                 stats["daily"]["upserted"] += _bulk_upsert_daily(daily_agg)
 
+            monthly_agg = _rollup_monthly(
+                org_id,
+                _truncate_to_month(org_first_day).date(),
+                _truncate_to_month(end_date).date(),
+            )
             if monthly_agg:
                 stats["monthly"]["upserted"] += _bulk_upsert_monthly(monthly_agg)
 
+            # Only sources that were aggregated (and written) advance
+            watermarks.update(dict.fromkeys(aggregated, end_date))
+            _set_watermarks(org_id, watermarks)
+
+            hourly_start = min(hourly_start, org_start)
+            first_day = min(first_day, org_first_day)
             stats["orgs_processed"] += 1
 
         except Exception:
@@ -580,8 +667,11 @@ def _run_aggregation() -> dict[str, Any]:
         "errors": stats["errors"],
         "period": {
             "hourly": {"start": hourly_start.isoformat(), "end": end_date.isoformat()},
-            "daily": {"start": daily_start.isoformat(), "end": end_date.isoformat()},
-            "monthly": {"start": monthly_start.isoformat(), "end": end_date.isoformat()},
+            "daily": {"start": first_day.isoformat(), "end": end_date.isoformat()},
+            "monthly": {
+                "start": _truncate_to_month(first_day).isoformat(),
+                "end": end_date.isoformat(),
+            },
         },
     }
 
@@ -12,6 +12,10 @@ from dashboard_metrics.models import (
     MetricType,
 )
 from dashboard_metrics.tasks import (
+    MAX_CATCH_UP,
+    _get_source_start,
+    _rollup_daily,
+    _rollup_monthly,
     _truncate_to_day,
     _truncate_to_hour,
     _truncate_to_month,
@@ -198,3 +202,121 @@ class TestCleanupTasks(TestCase):
 
         assert result["success"] is True
         assert result["deleted"] == 0
+
+
+class TestIncrementalAggregation(TestCase):
+    """Tests for watermark windows and daily/monthly roll-ups."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.org = Organization.objects.create(
+            organization_id="test-org", name="test-org", display_name="Test Org"
+        )
+        self.end = datetime(2024, 3, 2, 10, 20, tzinfo=timezone.utc)
+
+    def test_source_start_from_watermark(self):
+        """Test that only the late-data window before the watermark is re-read."""
+        watermark = self.end - timedelta(minutes=15)
+
+        start = _get_source_start(watermark, self.end, timedelta(hours=6))
+
+        assert start == datetime(2024, 3, 2, 4, 0, tzinfo=timezone.utc)
+
+    def test_source_start_without_watermark(self):
+        """Test that the first run aggregates the last 24 hours."""
+        start = _get_source_start(None, self.end, timedelta(hours=6))
+
+        assert start == datetime(2024, 3, 1, 10, 0, tzinfo=timezone.utc)
+
+    def test_source_start_caps_catch_up(self):
+        """Test that a stale watermark does not rescan beyond MAX_CATCH_UP."""
+        watermark = self.end - timedelta(days=30)
+
+        start = _get_source_start(watermark, self.end, timedelta(hours=6))
+
+        assert start == _truncate_to_hour(self.end - MAX_CATCH_UP)
+
+    def _hourly(self, timestamp, value):
+        EventMetricsHourly.objects.create(
+            organization=self.org,
+            timestamp=timestamp,
+            metric_name="pages_processed",
+            metric_type=MetricType.HISTOGRAM,
+            metric_value=value,
+            metric_count=1,
+            project="default",
+        )
+
+    def test_rollup_daily_sums_hours_of_each_day(self):
+        """Test that daily rows are summed from the hourly table."""
+        self._hourly(datetime(2024, 3, 1, 23, 0, tzinfo=timezone.utc), 4)
+        self._hourly(datetime(2024, 3, 2, 1, 0, tzinfo=timezone.utc), 2)
+        self._hourly(datetime(2024, 3, 2, 9, 0, tzinfo=timezone.utc), 3)
+
+        daily = _rollup_daily(
+            str(self.org.id),
+            datetime(2024, 3, 2, tzinfo=timezone.utc),
+            datetime(2024, 3, 2, tzinfo=timezone.utc),
+        )
+
+        key = (str(self.org.id), "2024-03-02", "pages_processed", "default", "")
+        assert daily == {
+            key: {"metric_type": MetricType.HISTOGRAM, "value": 5, "count": 1}
+        }
+
+    def test_rollup_monthly_sums_days_of_each_month(self):
+        """Test that monthly rows are summed from the daily table."""
+        for day, value in [(datetime(2024, 2, 29), 1), (datetime(2024, 3, 1), 2)]:
+            EventMetricsDaily.objects.create(
+                organization=self.org,
+                date=day.date(),
+                metric_name="documents_processed",
+                metric_type=MetricType.COUNTER,
+                metric_value=value,
+                metric_count=1,
+                project="default",
+            )
+
+        monthly = _rollup_monthly(
+            str(self.org.id), datetime(2024, 2, 1).date(), datetime(2024, 3, 1).date()
+        )
+
+        org_id = str(self.org.id)
+        assert monthly == {
+            (org_id, "2024-02-01", "documents_processed", "default", ""): {
+                "metric_type": MetricType.COUNTER,
+                "value": 1,
+                "count": 1,
+            },
+            (org_id, "2024-03-01", "documents_processed", "default", ""): {
+                "metric_type": MetricType.COUNTER,
+                "value": 2,
+                "count": 1,
+            },
+        }
+
+    def test_rollup_monthly_counts_days_whatever_wrote_them(self):
+        """Test that a month counts its daily rows, not their metric_count.
+
+        Daily rows from backfill_metrics count 1; rows from earlier aggregation
+        runs may carry larger counts. Either way the month counts its days.
+        """
+        for day, count in [(1, 1), (2, 24), (3, 5)]:
+            EventMetricsDaily.objects.create(
+                organization=self.org,
+                date=datetime(2024, 3, day).date(),
+                metric_name="documents_processed",
+                metric_type=MetricType.COUNTER,
+                metric_value=10,
+                metric_count=count,
+                project="default",
+            )
+
+        monthly = _rollup_monthly(
+            str(self.org.id), datetime(2024, 3, 1).date(), datetime(2024, 3, 1).date()
+        )
+
+        key = (str(self.org.id), "2024-03-01", "documents_processed", "default", "")
+        assert monthly == {
+            key: {"metric_type": MetricType.COUNTER, "value": 30, "count": 3}
+        }
@@ -6,6 +6,7 @@ from account_v2.models import Organization, PlatformKey, User
 from account_v2.organization import OrganizationService
 from django.db import IntegrityError
 from tenant_account_v2.constants import ErrorMessage, PlatformServiceConstants
+from utils.cache_service import CacheService
 from utils.user_context import UserContext
 
 from platform_settings_v2.exceptions import (
@@ -99,6 +100,7 @@ class PlatformAuthenticationService:
         try:
             platform_key: PlatformKey = PlatformKey.objects.get(pk=id)
             platform_key.delete()
+            PlatformAuthenticationService.invalidate_auth_cache(platform_key.key)
             # TODO: Add organization details in logs in possible places once v2 enabled
             logger.info(f"platform_key {id} is deleted for {platform_key.organization}")
         except IntegrityError as error:
@@ -122,9 +124,11 @@ class PlatformAuthenticationService:
         try:
             result: dict[str, Any] = {}
             platform_key: PlatformKey = PlatformKey.objects.get(pk=id)
+            old_key = platform_key.key
             platform_key.key = str(uuid.uuid4())
             platform_key.modified_by = user
             platform_key.save()
+            PlatformAuthenticationService.invalidate_auth_cache(old_key)
             result[PlatformServiceConstants.ID] = platform_key.id
             result[PlatformServiceConstants.KEY_NAME] = platform_key.key_name
             result[PlatformServiceConstants.KEY] = platform_key.key
@@ -166,11 +170,14 @@ class PlatformAuthenticationService:
                 )
                 raise InvalidRequest("Invalid organization")
             platform_key.modified_by = user
+            changed_keys = [platform_key.key]
             if action == PlatformServiceConstants.ACTIVATE:
                 # Deactivate all active keys for the organization
-                PlatformKey.objects.filter(
+                active_keys = PlatformKey.objects.filter(
                     is_active=True, organization=organization
-                ).update(is_active=False, modified_by=user)
+                )
+                changed_keys.extend(active_keys.values_list("key", flat=True))
+                active_keys.update(is_active=False, modified_by=user)
                 # Activate the chosen key
                 platform_key.is_active = True
             elif action == PlatformServiceConstants.DEACTIVATE:
@@ -182,6 +189,7 @@ class PlatformAuthenticationService:
                 )
                 raise InvalidRequest(f"Invalid action: {action}")
             platform_key.save()
+            PlatformAuthenticationService.invalidate_auth_cache(*changed_keys)
         except IntegrityError as error:
             logger.error(
                 f"IntegrityError - Failed to {action} platform key {platform_key.id}"
@@ -189,6 +197,22 @@ class PlatformAuthenticationService:
             )
             raise DuplicateData(f"{ErrorMessage.KEY_EXIST}, {ErrorMessage.DUPLICATE_API}")
 
+    @staticmethod
+    def invalidate_auth_cache(*keys: str) -> None:
+        """Drop platform-service's cached resolution of the given keys so a
+        status change applies to the next request.
+
+        Args:
+            keys (str): Platform key values
+        """
+        for key in keys:
+            try:
+                CacheService.delete_a_key(
+                    f"{PlatformServiceConstants.AUTH_CACHE_KEY_PREFIX}:{key}"
+                )
+            except Exception as error:
+                logger.warning(f"Failed to invalidate cached platform key: {error}")
+
     @staticmethod
     def list_platform_key_ids() -> list[PlatformKey]:
         """Method to fetch list of platform keys unique ids for internal usage.
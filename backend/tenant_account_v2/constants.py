@@ -7,6 +7,8 @@ class PlatformServiceConstants:
     DEACTIVATE = "DEACTIVATE"
     ACTION = "action"
     KEY_NAME = "key_name"
+    # Redis entries platform-service caches resolved keys under
+    AUTH_CACHE_KEY_PREFIX = "platform_key_auth"
 
 
 class ErrorMessage:
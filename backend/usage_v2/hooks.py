@@ -1,7 +1,9 @@
 """Post-write hooks for ``UsageBatchCreateView``.
 
 Hooks fire inside the view's transaction; a failure rolls the batch back
-so Usage rows and any side-table writes stay consistent. Records carry
+so Usage rows and any side-table writes stay consistent. Hooks only see
+the records the batch inserted: rows a retried batch had already stored
+are skipped. Records carry
 an opaque ``cloud_extras`` dict that OSS forwards verbatim — plugins
 read only the keys they own.
 """
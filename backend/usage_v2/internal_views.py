@@ -6,6 +6,7 @@ Mounted under ``/internal/`` and gated by ``InternalAPIAuthMiddleware``.
 import logging
 
 from django.db import transaction
+from django.db.models.constants import OnConflict
 from django.http import JsonResponse
 from rest_framework import status
 from rest_framework.exceptions import APIException, ValidationError
@@ -23,6 +24,8 @@ from .serializers import UsageBatchCreateSerializer
 
 logger = logging.getLogger(__name__)
 
+USAGE_INSERT_BATCH_SIZE = 500
+
 
 class UsagePersistError(APIException):
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -151,6 +154,29 @@ class PagesProcessedInternalView(APIView):
             )
 
 
+def _insert_new_usage(usage_objects: list[Usage]) -> set[str]:
+    """Insert usage rows, skipping ids already stored; returns the inserted ids.
+
+    ``bulk_create(ignore_conflicts=True)`` can't tell inserted rows from
+    skipped ones, so this issues the same ``INSERT ... ON CONFLICT DO NOTHING``
+    with ``RETURNING id``. A conflict with a concurrent, still uncommitted
+    attempt waits for it, so each id is reported by exactly one request.
+    """
+    opts = Usage._meta
+    inserted_ids: set[str] = set()
+    for start in range(0, len(usage_objects), USAGE_INSERT_BATCH_SIZE):
+        rows = Usage.objects._insert(
+            usage_objects[start : start + USAGE_INSERT_BATCH_SIZE],
+            fields=opts.concrete_fields,
+            returning_fields=[opts.pk],
+            using=Usage.objects.db,
+            on_conflict=OnConflict.IGNORE,
+        )
+        # A single skipped row comes back as None
+        inserted_ids.update(str(row[0]) for row in rows if row)
+    return inserted_ids
+
+
 class UsageBatchCreateView(APIView):
     """Bulk create usage records from worker finalization."""
 
@@ -174,6 +200,8 @@ class UsageBatchCreateView(APIView):
 
         usage_objects = [
             Usage(
+                # Explicit None would bypass the model's uuid4 default
+                **({"id": r["id"]} if r.get("id") else {}),
                 organization=organization,
                 workflow_id=r.get("workflow_id", ""),
                 execution_id=r.get("execution_id", ""),
@@ -200,8 +228,18 @@ class UsageBatchCreateView(APIView):
         try:
             # Atomic with hooks: orphan Usage rows are worse than retrying.
             with transaction.atomic():
-                created = Usage.objects.bulk_create(usage_objects, batch_size=500)
-                run_post_write_hooks(records, created)
+                # Flushes are retried; records already stored by an earlier
+                # attempt keep their id and are skipped (ON CONFLICT DO NOTHING)
+                # and left out of the hooks, rather than billed twice.
+                inserted_ids = _insert_new_usage(usage_objects)
+                created = [
+                    (record, obj)
+                    for record, obj in zip(records, usage_objects, strict=True)
+                    if str(obj.id) in inserted_ids
+                ]
+                run_post_write_hooks(
+                    [record for record, _ in created], [obj for _, obj in created]
+                )
         except Exception as e:
             logger.error(
                 "bulk_create failed for %d usage records (org=%s): %s",
@@ -30,6 +30,9 @@ class UsageRecordCreateSerializer(serializers.Serializer):
     model_name = serializers.CharField(required=True, allow_blank=False)
     usage_type = serializers.CharField(required=True, allow_blank=False)
 
+    # Client-generated; a retried batch resends it so stored rows are skipped.
+    id = serializers.UUIDField(required=False, allow_null=True, default=None)
+
     workflow_id = serializers.CharField(required=False, allow_blank=True, default="")
     execution_id = serializers.CharField(required=False, allow_blank=True, default="")
     run_id = serializers.UUIDField(required=False, allow_null=True, default=None)
@@ -0,0 +1,41 @@
+"""``UsageBatchCreateView`` runs post-write hooks only for inserted rows.
+
+A worker retries a usage flush whose response it never got, so part of a
+batch may already be stored. The ``INSERT ... RETURNING`` is mocked to
+report which ids were inserted; no database is needed.
+"""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import usage_v2.internal_views as views_mod
+from usage_v2.internal_views import UsageBatchCreateView
+
+STORED_ID = "11111111-1111-1111-1111-111111111111"
+NEW_ID = "22222222-2222-2222-2222-222222222222"
+
+
+def test_hooks_skip_records_already_stored():
+    records = [{"id": STORED_ID, "run_id": "run"}, {"id": NEW_ID, "run_id": "run"}]
+    usage = MagicMock(side_effect=lambda **kwargs: SimpleNamespace(**kwargs))
+    usage.objects._insert.return_value = [(UUID(NEW_ID),)]
+    serializer = MagicMock()
+    serializer.return_value.validated_data = {"records": records}
+
+    with (
+        patch.object(views_mod, "Usage", usage),
+        patch.object(views_mod, "UsageBatchCreateSerializer", serializer),
+        patch.object(views_mod.UserContext, "get_organization"),
+        patch.object(views_mod.transaction, "atomic", nullcontext),
+        patch.object(views_mod, "run_post_write_hooks") as hooks,
+    ):
+        response = UsageBatchCreateView().post(MagicMock(data={}))
+
+    assert response.data == {"created": 1}
+    hooked_records, hooked_objects = hooks.call_args.args
+    assert hooked_records == [records[1]]
+    assert [obj.id for obj in hooked_objects] == [NEW_ID]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+import uuid
 from datetime import UTC, datetime
 from typing import Any
 
@@ -23,6 +24,7 @@ class LogDataDTO:
         log_type: log type
         data: log data
         file_execution_id: Id for the file execution
+        log_id: Client-generated id for the stored log, if any
     """
 
     def __init__(
@@ -33,6 +35,7 @@ class LogDataDTO:
         log_type: str,
         data: dict[str, Any],
         file_execution_id: str | None = None,
+        log_id: str | None = None,
     ):
         self.execution_id: str = execution_id
         self.file_execution_id: str | None = file_execution_id
@@ -43,6 +46,7 @@ class LogDataDTO:
         )
         self.log_type: LogType = log_type
         self.data: dict[str, Any] = data
+        self.log_id: str | None = log_id
 
     @classmethod
     def from_json(cls, json_data: str) -> LogDataDTO | None:
@@ -54,6 +58,13 @@ class LogDataDTO:
             timestamp = json_data.get(LogFieldName.TIMESTAMP)
             log_type = json_data.get(LogFieldName.TYPE)
             data = json_data.get(LogFieldName.DATA)
+            log_id = json_data.get(LogFieldName.LOG_ID)
+            if log_id is not None:
+                try:
+                    log_id = str(uuid.UUID(str(log_id)))
+                except ValueError:
+                    logger.warning("Ignoring invalid log id: %s", log_id)
+                    log_id = None
             if all((execution_id, organization_id, timestamp, log_type, data)):
                 return cls(
                     execution_id=execution_id,
@@ -62,6 +73,7 @@ class LogDataDTO:
                     timestamp=timestamp,
                     log_type=log_type,
                     data=data,
+                    log_id=log_id,
                 )
         except (json.JSONDecodeError, AttributeError):
             logger.warning("Invalid log data: %s", json_data)
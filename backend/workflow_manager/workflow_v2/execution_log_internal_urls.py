@@ -33,4 +33,9 @@ urlpatterns = [
         execution_log_internal_views.ProcessLogHistoryAPIView.as_view(),
         name="process_log_history",
     ),
+    path(
+        "log-history/bulk/",
+        execution_log_internal_views.StoreLogHistoryAPIView.as_view(),
+        name="store_log_history",
+    ),
 ]
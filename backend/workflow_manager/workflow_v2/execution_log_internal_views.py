@@ -14,6 +14,7 @@ from rest_framework.views import APIView
 from workflow_manager.file_execution.models import WorkflowFileExecution
 from workflow_manager.workflow_v2.execution_log_utils import (
     process_log_history_from_cache,
+    store_log_history,
 )
 from workflow_manager.workflow_v2.models import WorkflowExecution
 
@@ -171,3 +172,38 @@ class ProcessLogHistoryAPIView(APIView):
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class StoreLogHistoryAPIView(APIView):
+    """API view for bulk inserting log history batches.
+
+    Used by the log consumer's drain worker, which pops batches from the Redis
+    log history queue itself and posts them here, so the backend only does the
+    validation and bulk insert.
+    """
+
+    def post(self, request: Request) -> Response:
+        """Store a batch of serialized log history entries.
+
+        Args:
+            request: HTTP request with ``logs``, a list of log entries as
+                stored in the log history queue
+
+        Returns:
+            JSON response with processing results
+        """
+        logs = request.data.get("logs")
+        if not isinstance(logs, list) or not all(isinstance(log, str) for log in logs):
+            return Response(
+                {"error": "logs must be a list of strings"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            return Response(store_log_history(logs))
+
+        except Exception as e:
+            logger.error(f"Error storing log history: {e}", exc_info=True)
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -37,21 +37,39 @@ def process_log_history_from_cache(
         - total_logs: Total number of logs retrieved from cache
         - organizations_processed: Number of organizations affected
     """
-    organization_logs = defaultdict(list)
-    logs_count = 0
-    logs_to_process = []
-    skipped_count = 0
-
-    # Collect logs from cache (batch retrieval)
-    while logs_count < batch_limit:
+    logs = []
+    while len(logs) < batch_limit:
         log = CacheService.lpop(queue_name)
         if not log:
             break
+        logs.append(log)
+
+    if logs:
+        logger.info(f"Processing {len(logs)} logs from queue '{queue_name}'")
+    return store_log_history(logs)
 
+
+def store_log_history(logs: list[str]) -> dict:
+    """Validate serialized log entries and bulk insert them as ExecutionLogs.
+
+    Shared by the cache-draining path above and the bulk insert endpoint the
+    log consumer's drain worker posts already-popped batches to.
+
+    Args:
+        logs: Log entries as stored in the log history queue (JSON strings)
+
+    Returns:
+        Dictionary with processing results, see process_log_history_from_cache()
+    """
+    organization_logs = defaultdict(list)
+    logs_to_process = []
+    skipped_count = 0
+
+    for log in logs:
         log_data: LogDataDTO | None = LogDataDTO.from_json(log)
         if log_data:
             logs_to_process.append(log_data)
-            logs_count += 1
+    logs_count = len(logs_to_process)
 
     if not logs_to_process:
         return {
@@ -61,8 +79,6 @@ def process_log_history_from_cache(
             "organizations_processed": 0,
         }
 
-    logger.info(f"Processing {logs_count} logs from queue '{queue_name}'")
-
     # Preload required WorkflowExecution and WorkflowFileExecution objects
     execution_ids = {log.execution_id for log in logs_to_process}
     file_execution_ids = {
@@ -93,6 +109,10 @@ def process_log_history_from_cache(
             data=log_data.data,
             event_time=log_data.event_time,
         )
+        if log_data.log_id:
+            # Set by the drain worker, so a retried batch conflicts instead
+            # of inserting its logs again
+            execution_log.id = log_data.log_id
 
         if log_data.file_execution_id:
             file_execution = file_execution_map.get(log_data.file_execution_id)
@@ -110,10 +130,10 @@ def process_log_history_from_cache(
 
     # Bulk insert logs for each organization
     processed_count = 0
-    for organization_id, logs in organization_logs.items():
-        logger.info(f"Storing {len(logs)} logs for org: {organization_id}")
-        ExecutionLog.objects.bulk_create(objs=logs, ignore_conflicts=True)
-        processed_count += len(logs)
+    for organization_id, org_logs in organization_logs.items():
+        logger.info(f"Storing {len(org_logs)} logs for org: {organization_id}")
+        ExecutionLog.objects.bulk_create(objs=org_logs, ignore_conflicts=True)
+        processed_count += len(org_logs)
 
     return {
         "processed_count": processed_count,
@@ -70,7 +70,33 @@ function SocketMessages() {
     [logMessagesThrottledUpdate],
   );
 
-  // Socket message handler
+  // Handles a single log/update/progress message
+  const processMessage = useCallback(
+    (msg) => {
+      if (
+        (msg?.type === "LOG" || msg?.type === "COST") &&
+        msg?.service !== "prompt"
+      ) {
+        msg.message = msg?.log;
+        handleLogMessages(msg);
+      } else if (msg?.type === "UPDATE") {
+        pushStagedMessage(msg);
+      } else if (msg?.type === "LOG" && msg?.service === "prompt") {
+        handleLogMessages(msg);
+      } else if (msg?.type === "PROGRESS") {
+        updateCusToolMessages([msg]);
+      }
+
+      if (msg?.type === "LOG" && msg?.service === "usage") {
+        const remainingTokens =
+          msg?.max_token_count_set - msg?.added_token_count;
+        setLLMTokenUsage(Math.max(remainingTokens, 0));
+      }
+    },
+    [handleLogMessages, pushStagedMessage, updateCusToolMessages],
+  );
+
+  // Socket message handler; batching publishers send an array of messages
   const onMessage = useCallback(
     (data) => {
       try {
@@ -83,24 +109,10 @@ function SocketMessages() {
               : JSON.parse(new TextDecoder().decode(msg));
         }
 
-        if (
-          (msg?.type === "LOG" || msg?.type === "COST") &&
-          msg?.service !== "prompt"
-        ) {
-          msg.message = msg?.log;
-          handleLogMessages(msg);
-        } else if (msg?.type === "UPDATE") {
-          pushStagedMessage(msg);
-        } else if (msg?.type === "LOG" && msg?.service === "prompt") {
-          handleLogMessages(msg);
-        } else if (msg?.type === "PROGRESS") {
-          updateCusToolMessages([msg]);
-        }
-
-        if (msg?.type === "LOG" && msg?.service === "usage") {
-          const remainingTokens =
-            msg?.max_token_count_set - msg?.added_token_count;
-          setLLMTokenUsage(Math.max(remainingTokens, 0));
+        if (Array.isArray(msg)) {
+          msg.forEach(processMessage);
+        } else {
+          processMessage(msg);
         }
       } catch (err) {
         setAlertDetails(
@@ -108,7 +120,7 @@ function SocketMessages() {
         );
       }
     },
-    [handleLogMessages, pushStagedMessage, updateCusToolMessages],
+    [processMessage],
   );
 
   // Subscribe/unsubscribe to the socket channel
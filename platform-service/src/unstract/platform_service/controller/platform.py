@@ -1,10 +1,9 @@
 import functools
-import json
 import uuid
 from datetime import datetime
 from typing import Any
 
-from cryptography.fernet import Fernet, InvalidToken
+from cryptography.fernet import InvalidToken
 from flask import Blueprint, Request, jsonify, make_response, request
 from flask import current_app as app
 
@@ -12,11 +11,13 @@ from unstract.core.flask import PluginManager
 from unstract.core.flask.exceptions import APIError
 from unstract.platform_service.constants import DBTable
 from unstract.platform_service.env import Env
-from unstract.platform_service.extensions import db, get_redis_client, safe_cursor
+from unstract.platform_service.extensions import db, get_redis_client
 from unstract.platform_service.helper.adapter_instance import (
     AdapterInstanceRequestHelper,
 )
+from unstract.platform_service.helper.platform_key import resolve_platform_key
 from unstract.platform_service.helper.prompt_studio import PromptStudioRequestHelper
+from unstract.platform_service.helper.usage import MAX_BATCH_RECORDS, UsageRequestHelper
 
 platform_bp = Blueprint("platform", __name__)
 
@@ -57,25 +58,10 @@ def get_organization_from_bearer_token(token: str) -> tuple[int | None, str]:
     Returns:
         tuple[int, str]: organization uid and organization identifier
     """
-    query = f"""
-        SELECT organization_id FROM "{Env.DB_SCHEMA}".{DBTable.PLATFORM_KEY}
-        WHERE key=%s
-    """
-    organization_uid: int = execute_query(query, (token,))
-    query_org = f"""
-        SELECT organization_id FROM "{Env.DB_SCHEMA}".{DBTable.ORGANIZATION}
-        WHERE id=%s
-    """
-    organization_identifier: str = execute_query(query_org, (organization_uid,))
-    return organization_uid, organization_identifier
-
-
-def execute_query(query: str, params: tuple = ()) -> Any:
-    with safe_cursor(query, params) as cursor:
-        result_row = cursor.fetchone()
-        if not result_row or len(result_row) == 0:
-            return None
-        return result_row[0]
+    platform_key = resolve_platform_key(token)
+    if not platform_key:
+        return None, None
+    return platform_key.organization_uid, platform_key.organization_id
 
 
 def validate_bearer_token(token: str | None) -> bool:
@@ -83,29 +69,17 @@ def validate_bearer_token(token: str | None) -> bool:
         app.logger.error("Authentication failed. Empty bearer token")
         return False
 
-    platform_key_table = DBTable.PLATFORM_KEY
-    query = f"""
-        SELECT * FROM \"{Env.DB_SCHEMA}\".{platform_key_table}
-        WHERE key = %s
-    """
-
     try:
-        with safe_cursor(query, (token,)) as cursor:
-            result_row = cursor.fetchone()
-            if not result_row or len(result_row) == 0:
-                app.logger.error(f"Authentication failed. bearer token not found {token}")
-                return False
-            platform_key = str(result_row[1])
-            is_active = bool(result_row[2])
-            if not is_active:
-                app.logger.error(
-                    f"Token is not active. Activate before using it. token {token}"
-                )
-                return False
-            if platform_key != token:
-                app.logger.error(f"Authentication failed. Invalid bearer token: {token}")
-                return False
-            return True
+        platform_key = resolve_platform_key(token)
+        if not platform_key:
+            app.logger.error(f"Authentication failed. bearer token not found {token}")
+            return False
+        if not platform_key.is_active:
+            app.logger.error(
+                f"Token is not active. Activate before using it. token {token}"
+            )
+            return False
+        return True
     except Exception as e:
         app.logger.error(
             f"Error while validating bearer token: {e}",
@@ -266,6 +240,63 @@ def usage() -> Any:
         return make_response(result, 500)
 
 
+@platform_bp.route("/usage/batch", methods=["POST"])
+@authentication_middleware
+def usage_batch() -> Any:
+    """Record many usage entries with one request.
+
+    Records carrying an ``id`` that is already stored are skipped, so a batch
+    can be retried safely.
+
+    Sample Usage:
+    curl -X POST  http://localhost:3001/usage/batch \
+    -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" \
+    -H "Content-Type: application/json" \
+    -d '{
+            "records": [
+                {"id": "<uuid>", "workflow_id": "test", "execution_id": "test", ...},
+                ...
+            ]
+        }'
+    """
+    result: dict[str, Any] = {
+        "status": "ERROR",
+        "error": "",
+        "unique_ids": [],
+        "created": 0,
+    }
+    payload: dict[Any, Any] | None = request.json
+    records = payload.get("records") if isinstance(payload, dict) else None
+    if (
+        not isinstance(records, list)
+        or len(records) > MAX_BATCH_RECORDS
+        or not all(isinstance(record, dict) for record in records)
+    ):
+        result["error"] = Env.INVALID_PAYLOAD
+        return make_response(result, 400)
+    bearer_token = get_token_from_auth_header(request)
+    organization_uid, org_id = get_organization_from_bearer_token(bearer_token)
+    if not records:
+        result["status"] = "OK"
+        return make_response(result, 200)
+
+    try:
+        usage_ids, created = UsageRequestHelper.insert_usage_records(
+            records, organization_uid=organization_uid
+        )
+    except Exception as e:
+        app.logger.error(f"Error while creating usage entries: {e}")
+        result["error"] = "Internal Server Error"
+        return make_response(result, 500)
+    app.logger.info(
+        "Adapter usage recorded for %s: %s records, %s new", org_id, len(records), created
+    )
+    result["status"] = "OK"
+    result["unique_ids"] = usage_ids
+    result["created"] = created
+    return make_response(result, 200)
+
+
 @platform_bp.route("/platform_details", methods=["GET"])
 @authentication_middleware
 def platform_details() -> Any:
@@ -372,13 +403,23 @@ def adapter_instance() -> Any:
             organization_uid=organization_uid,
         )
 
-        f: Fernet = Fernet(Env.ENCRYPTION_KEY.encode("utf-8"))
+        # Clients holding the current version revalidate without the adapter
+        # being decrypted or sent again
+        etag = AdapterInstanceRequestHelper.get_etag(data_dict)
+        if request.if_none_match.contains(etag):
+            response = make_response("", 304)
+            response.set_etag(etag)
+            return response
 
-        data_dict["adapter_metadata"] = json.loads(
-            f.decrypt(bytes(data_dict.pop("adapter_metadata_b")).decode("utf-8"))
+        data_dict["adapter_metadata"] = AdapterInstanceRequestHelper.get_adapter_metadata(
+            data_dict, organization_uid=organization_uid
         )
+        data_dict.pop("adapter_metadata_b")
+        data_dict.pop("modified_at")
 
-        return jsonify(data_dict)
+        response = jsonify(data_dict)
+        response.set_etag(etag)
+        return response
     except InvalidToken:
         msg = (
             "Platform encryption key for storing adapter credentials has "
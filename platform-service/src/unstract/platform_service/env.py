@@ -23,6 +23,20 @@ class Env:
     )
     DB_SCHEMA = EnvManager.get_required_setting("DB_SCHEMA")
     LOG_LEVEL = EnvManager.get_required_setting("LOG_LEVEL", LogLevel.INFO)
+    ADAPTER_CONFIG_CACHE_TTL = int(os.environ.get("ADAPTER_CONFIG_CACHE_TTL", 60))
+    ADAPTER_CONFIG_CACHE_MAX_ENTRIES = int(
+        os.environ.get("ADAPTER_CONFIG_CACHE_MAX_ENTRIES", 256)
+    )
+    PLATFORM_KEY_CACHE_TTL = int(os.environ.get("PLATFORM_KEY_CACHE_TTL", 30))
+    PLATFORM_KEY_CACHE_MAX_ENTRIES = int(
+        os.environ.get("PLATFORM_KEY_CACHE_MAX_ENTRIES", 1024)
+    )
+    PLATFORM_KEY_REDIS_CACHE_ENABLED = (
+        os.environ.get("PLATFORM_KEY_REDIS_CACHE_ENABLED", "false").lower() == "true"
+    )
+    PLATFORM_KEY_REDIS_CACHE_TTL = int(
+        os.environ.get("PLATFORM_KEY_REDIS_CACHE_TTL", 300)
+    )
 
 
 EnvManager.raise_for_missing_envs()
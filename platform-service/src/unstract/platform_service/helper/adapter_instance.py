@@ -1,12 +1,24 @@
+import hashlib
+import json
 from typing import Any
 
+from cryptography.fernet import Fernet
+
 from unstract.core.flask.exceptions import APIError
 from unstract.platform_service.constants import DBTable
+from unstract.platform_service.env import Env
 from unstract.platform_service.extensions import safe_cursor
-from unstract.platform_service.utils import EnvManager
+from unstract.platform_service.utils import EnvManager, TTLCache
 
 DB_SCHEMA = EnvManager.get_required_setting("DB_SCHEMA", "unstract")
 
+# Decrypted adapter metadata keyed by (organization uid, adapter instance id,
+# modified_at). Every write to an adapter bumps modified_at, so an edit is a
+# new key; the short TTL only bounds how long credentials sit in memory.
+_decrypted_metadata_cache = TTLCache(
+    ttl=Env.ADAPTER_CONFIG_CACHE_TTL, max_entries=Env.ADAPTER_CONFIG_CACHE_MAX_ENTRIES
+)
+
 
 class AdapterInstanceRequestHelper:
     @staticmethod
@@ -25,7 +37,8 @@ class AdapterInstanceRequestHelper:
             _type_: _description_
         """
         query = (
-            "SELECT id, adapter_id, adapter_name, adapter_type, adapter_metadata_b"
+            "SELECT id, adapter_id, adapter_name, adapter_type, adapter_metadata_b,"
+            " modified_at"
             f' FROM "{DB_SCHEMA}".{DBTable.ADAPTER_INSTANCE} x '
             f"WHERE id=%s and organization_id=%s"
         )
@@ -38,3 +51,48 @@ class AdapterInstanceRequestHelper:
             columns = [desc[0] for desc in cursor.description]
             data_dict: dict[str, Any] = dict(zip(columns, result_row, strict=False))
             return data_dict
+
+    @staticmethod
+    def get_etag(adapter_instance: dict[str, Any]) -> str:
+        """ETag of an adapter instance row, derived without decrypting it.
+
+        Args:
+            adapter_instance (dict[str, Any]): row from `get_adapter_instance_from_db`
+
+        Returns:
+            str: opaque validator that changes whenever the adapter is saved
+        """
+        version = (
+            f"{adapter_instance['id']}:{adapter_instance['modified_at'].isoformat()}"
+        )
+        return hashlib.sha256(version.encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def get_adapter_metadata(
+        adapter_instance: dict[str, Any], organization_uid: int | None = None
+    ) -> dict[str, Any]:
+        """Decrypt an adapter instance's metadata, cached per adapter version.
+
+        Args:
+            adapter_instance (dict[str, Any]): row from `get_adapter_instance_from_db`
+            organization_uid (int | None): organization the row was fetched for
+
+        Returns:
+            dict[str, Any]: decrypted adapter metadata
+
+        Raises:
+            cryptography.fernet.InvalidToken: platform encryption key changed
+        """
+        cache_key = (
+            organization_uid,
+            str(adapter_instance["id"]),
+            adapter_instance["modified_at"],
+        )
+        adapter_metadata = _decrypted_metadata_cache.get(cache_key)
+        if adapter_metadata is None:
+            f: Fernet = Fernet(Env.ENCRYPTION_KEY.encode("utf-8"))
+            adapter_metadata = json.loads(
+                f.decrypt(bytes(adapter_instance["adapter_metadata_b"]).decode("utf-8"))
+            )
+            _decrypted_metadata_cache.set(cache_key, adapter_metadata)
+        return adapter_metadata
@@ -0,0 +1,105 @@
+"""Platform key resolution for request authentication.
+
+Every request carries a platform key, and most handlers then need the key's
+organization. Both come from one joined query, and the result is cached:
+
+- in-process for ``PLATFORM_KEY_CACHE_TTL`` seconds (0 disables it), bounded
+  to ``PLATFORM_KEY_CACHE_MAX_ENTRIES`` keys
+- in Redis for ``PLATFORM_KEY_REDIS_CACHE_TTL`` seconds when
+  ``PLATFORM_KEY_REDIS_CACHE_ENABLED`` is set, shared by all workers and pods
+
+The backend deletes a key's Redis entry when the key is activated, deactivated,
+refreshed or deleted. So a pod keeps honouring a deactivated key for at most
+the in-process TTL. Unknown keys are never cached.
+"""
+
+import json
+import logging
+from typing import NamedTuple
+
+from unstract.platform_service.constants import DBTable
+from unstract.platform_service.env import Env
+from unstract.platform_service.extensions import get_redis_client, safe_cursor
+from unstract.platform_service.utils import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Must match PlatformServiceConstants.AUTH_CACHE_KEY_PREFIX in
+# backend/tenant_account_v2/constants.py, which the backend invalidates
+REDIS_KEY_PREFIX = "platform_key_auth"
+
+
+class PlatformKeyInfo(NamedTuple):
+    is_active: bool
+    organization_uid: int | None
+    organization_id: str | None
+
+
+_local_cache = TTLCache(
+    ttl=Env.PLATFORM_KEY_CACHE_TTL, max_entries=Env.PLATFORM_KEY_CACHE_MAX_ENTRIES
+)
+
+
+def _redis_key(token: str) -> str:
+    return f"{REDIS_KEY_PREFIX}:{token}"
+
+
+def _get_from_redis(token: str) -> PlatformKeyInfo | None:
+    if not Env.PLATFORM_KEY_REDIS_CACHE_ENABLED:
+        return None
+    try:
+        cached = get_redis_client().get(_redis_key(token))
+        return PlatformKeyInfo(*json.loads(cached)) if cached else None
+    except Exception as e:
+        # Redis is only a shortcut; fall back to the database
+        logger.warning(f"Failed to read platform key from Redis: {e}")
+        return None
+
+
+def _set_in_redis(token: str, info: PlatformKeyInfo) -> None:
+    if not Env.PLATFORM_KEY_REDIS_CACHE_ENABLED:
+        return
+    try:
+        get_redis_client().set(
+            _redis_key(token), json.dumps(info), ex=Env.PLATFORM_KEY_REDIS_CACHE_TTL
+        )
+    except Exception as e:
+        logger.warning(f"Failed to cache platform key in Redis: {e}")
+
+
+def _fetch_from_db(token: str) -> PlatformKeyInfo | None:
+    query = f"""
+        SELECT pk.is_active, pk.organization_id, org.organization_id
+        FROM "{Env.DB_SCHEMA}".{DBTable.PLATFORM_KEY} pk
+        LEFT JOIN "{Env.DB_SCHEMA}".{DBTable.ORGANIZATION} org
+            ON org.id = pk.organization_id
+        WHERE pk.key = %s
+    """
+    with safe_cursor(query, (token,)) as cursor:
+        result_row = cursor.fetchone()
+    if not result_row:
+        return None
+    is_active, organization_uid, organization_id = result_row
+    return PlatformKeyInfo(bool(is_active), organization_uid, organization_id)
+
+
+def resolve_platform_key(token: str) -> PlatformKeyInfo | None:
+    """Look up a platform key, or None if it doesn't exist.
+
+    Database errors are raised so callers can fail closed.
+    """
+    info = _local_cache.get(token)
+    if info is not None:
+        return info
+    info = _get_from_redis(token)
+    if info is None:
+        info = _fetch_from_db(token)
+        if info is None:
+            return None
+        _set_in_redis(token, info)
+    _local_cache.set(token, info)
+    return info
+
+
+def clear_local_cache() -> None:
+    _local_cache.clear()
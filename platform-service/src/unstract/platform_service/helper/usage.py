@@ -0,0 +1,118 @@
+import uuid
+from datetime import datetime
+from typing import Any
+
+from unstract.platform_service.constants import DBTable
+from unstract.platform_service.env import Env
+from unstract.platform_service.extensions import db
+
+USAGE_COLUMNS = (
+    "id",
+    "organization_id",
+    "workflow_id",
+    "execution_id",
+    "adapter_instance_id",
+    "run_id",
+    "usage_type",
+    "llm_usage_reason",
+    "model_name",
+    "embedding_tokens",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "cost_in_dollars",
+    "created_at",
+    "modified_at",
+)
+MAX_BATCH_RECORDS = 5000
+# Rows per INSERT statement; keeps the statement well under the bind
+# parameter limit
+INSERT_CHUNK_SIZE = 500
+
+
+class UsageRequestHelper:
+    @staticmethod
+    def get_usage_id(record: dict[str, Any]) -> str:
+        """Usage ID sent by the client, or a new one.
+
+        Clients that retry a batch send the same IDs again, so rows that were
+        already stored are skipped instead of duplicated.
+
+        Args:
+            record (dict[str, Any]): usage record
+
+        Returns:
+            str: usage ID
+        """
+        usage_id = record.get("id")
+        if usage_id:
+            try:
+                return str(uuid.UUID(str(usage_id)))
+            except ValueError:
+                pass
+        return str(uuid.uuid4())
+
+    @staticmethod
+    def to_row(
+        record: dict[str, Any],
+        usage_id: str,
+        organization_uid: int | None,
+        current_time: datetime,
+    ) -> tuple[Any, ...]:
+        return (
+            usage_id,
+            organization_uid,
+            record.get("workflow_id"),
+            record.get("execution_id", ""),
+            record.get("adapter_instance_id", ""),
+            record.get("run_id"),
+            record.get("usage_type", ""),
+            record.get("llm_usage_reason", ""),
+            record.get("model_name", ""),
+            record.get("embedding_tokens", 0),
+            record.get("prompt_tokens", 0),
+            record.get("completion_tokens", 0),
+            record.get("total_tokens", 0),
+            record.get("cost_in_dollars", 0.0),
+            current_time,
+            current_time,
+        )
+
+    @staticmethod
+    def insert_usage_records(
+        records: list[dict[str, Any]], organization_uid: int | None
+    ) -> tuple[list[str], int]:
+        """Store usage records with one multi-row INSERT per chunk.
+
+        Args:
+            records (list[dict[str, Any]]): usage records
+            organization_uid (int | None): organization the records belong to
+
+        Returns:
+            tuple[list[str], int]: usage IDs of all records and the number of
+                rows inserted, which excludes records already stored
+        """
+        current_time = datetime.now()
+        usage_ids = [UsageRequestHelper.get_usage_id(record) for record in records]
+        rows = [
+            UsageRequestHelper.to_row(record, usage_id, organization_uid, current_time)
+            for record, usage_id in zip(records, usage_ids, strict=True)
+        ]
+        placeholders = "(" + ", ".join(["%s"] * len(USAGE_COLUMNS)) + ")"
+        inserted = 0
+        with db.atomic():
+            for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                chunk = rows[start : start + INSERT_CHUNK_SIZE]
+                query = f"""
+                    INSERT INTO "{Env.DB_SCHEMA}".{DBTable.TOKEN_USAGE}
+                    ({", ".join(USAGE_COLUMNS)})
+                    VALUES {", ".join([placeholders] * len(chunk))}
+                    ON CONFLICT (id) DO NOTHING
+                """
+                params = tuple(value for row in chunk for value in row)
+                cursor = db.execute_sql(query, params)
+                try:
+                    inserted += cursor.rowcount
+                finally:
+                    cursor.close()
+        return usage_ids, inserted
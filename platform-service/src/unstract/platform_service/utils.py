@@ -1,4 +1,8 @@
 import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
 
 
 class EnvManager:
@@ -38,3 +42,41 @@ class EnvManager:
                 cls.missing_settings
             )
             raise ValueError(ERROR_MESSAGE)
+
+
+class TTLCache:
+    """Thread safe in-process cache whose entries expire after ``ttl`` seconds.
+
+    Holds at most ``max_entries``; the least recently stored entry is dropped
+    when full. A ``ttl`` of 0 or less disables it.
+    """
+
+    def __init__(self, ttl: int, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,74 @@
+"""Decrypted adapter metadata is reused until the adapter is modified."""
+
+import json
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from cryptography.fernet import Fernet
+
+from unstract.platform_service.helper import adapter_instance
+from unstract.platform_service.helper.adapter_instance import (
+    AdapterInstanceRequestHelper,
+)
+
+METADATA = {"api_key": "sk-test", "model": "gpt-4o"}
+
+
+@pytest.fixture
+def decrypt_calls(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[bytes]]:
+    key = Fernet.generate_key()
+    monkeypatch.setattr(adapter_instance.Env, "ENCRYPTION_KEY", key.decode())
+    adapter_instance._decrypted_metadata_cache.clear()
+
+    calls: list[bytes] = []
+
+    class _CountingFernet(Fernet):
+        def decrypt(self, token: Any, ttl: int | None = None) -> bytes:
+            calls.append(token)
+            return super().decrypt(token, ttl)
+
+    monkeypatch.setattr(adapter_instance, "Fernet", _CountingFernet)
+    yield calls
+    adapter_instance._decrypted_metadata_cache.clear()
+
+
+def _row(modified_at: datetime) -> dict[str, Any]:
+    encrypted = Fernet(adapter_instance.Env.ENCRYPTION_KEY.encode()).encrypt(
+        json.dumps(METADATA).encode()
+    )
+    return {
+        "id": "adapter-1",
+        "adapter_metadata_b": memoryview(encrypted),
+        "modified_at": modified_at,
+    }
+
+
+def test_metadata_decrypted_once_per_version(decrypt_calls: list[bytes]) -> None:
+    saved_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    for _ in range(3):
+        metadata = AdapterInstanceRequestHelper.get_adapter_metadata(
+            _row(saved_at), organization_uid=1
+        )
+        assert metadata == METADATA
+    assert len(decrypt_calls) == 1
+
+    # Another org, or an edited adapter, never sees the cached entry
+    AdapterInstanceRequestHelper.get_adapter_metadata(_row(saved_at), organization_uid=2)
+    AdapterInstanceRequestHelper.get_adapter_metadata(
+        _row(saved_at + timedelta(seconds=1)), organization_uid=1
+    )
+    assert len(decrypt_calls) == 3
+
+
+def test_etag_follows_modified_at(decrypt_calls: list[bytes]) -> None:
+    saved_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    etag = AdapterInstanceRequestHelper.get_etag(_row(saved_at))
+
+    assert etag == AdapterInstanceRequestHelper.get_etag(_row(saved_at))
+    assert etag != AdapterInstanceRequestHelper.get_etag(
+        _row(saved_at + timedelta(seconds=1))
+    )
@@ -7,29 +7,37 @@ from typing import Any
 import pytest
 from flask import Flask
 from unstract.platform_service.controller import platform
+from unstract.platform_service.helper import platform_key
 
 
 @pytest.fixture
 def app_ctx() -> Iterator[None]:
     """`validate_bearer_token` logs via `flask.current_app`."""
+    platform_key.clear_local_cache()
     with Flask(__name__).app_context():
         yield
+    platform_key.clear_local_cache()
 
 
-def _mock_safe_cursor(monkeypatch: pytest.MonkeyPatch, result_row: Any) -> None:
+def _mock_safe_cursor(monkeypatch: pytest.MonkeyPatch, result_row: Any) -> list[str]:
+    """Returns the list of queries run, one entry per cursor opened."""
+    queries: list[str] = []
+
     class _Cursor:
         def fetchone(self) -> Any:
             return result_row
 
     @contextmanager
     def _safe_cursor(query: str, params: tuple = ()) -> Iterator[_Cursor]:
+        queries.append(query)
         yield _Cursor()
 
-    monkeypatch.setattr(platform, "safe_cursor", _safe_cursor)
+    monkeypatch.setattr(platform_key, "safe_cursor", _safe_cursor)
+    return queries
 
 
 def test_valid_active_token(app_ctx: None, monkeypatch: pytest.MonkeyPatch) -> None:
-    _mock_safe_cursor(monkeypatch, ("id", "test-token", True))
+    _mock_safe_cursor(monkeypatch, (True, 7, "org_abc"))
     assert platform.validate_bearer_token("test-token") is True
 
 
@@ -43,7 +51,7 @@ def test_rejects_unknown_token(app_ctx: None, monkeypatch: pytest.MonkeyPatch) -
 
 
 def test_rejects_inactive_token(app_ctx: None, monkeypatch: pytest.MonkeyPatch) -> None:
-    _mock_safe_cursor(monkeypatch, ("id", "test-token", False))
+    _mock_safe_cursor(monkeypatch, (False, 7, "org_abc"))
     assert platform.validate_bearer_token("test-token") is False
 
 
@@ -54,5 +62,57 @@ def test_db_error_denies_access(app_ctx: None, monkeypatch: pytest.MonkeyPatch)
     def _boom(query: str, params: tuple = ()) -> Any:
         raise RuntimeError("db down")
 
-    monkeypatch.setattr(platform, "safe_cursor", _boom)
+    monkeypatch.setattr(platform_key, "safe_cursor", _boom)
+    assert platform.validate_bearer_token("test-token") is False
+
+
+def test_auth_and_org_lookup_share_one_query(
+    app_ctx: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    queries = _mock_safe_cursor(monkeypatch, (True, 7, "org_abc"))
+
+    for _ in range(3):
+        assert platform.validate_bearer_token("test-token") is True
+        assert platform.get_organization_from_bearer_token("test-token") == (
+            7,
+            "org_abc",
+        )
+
+    assert len(queries) == 1
+
+
+def test_unknown_token_is_not_cached(
+    app_ctx: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    queries = _mock_safe_cursor(monkeypatch, None)
+
     assert platform.validate_bearer_token("test-token") is False
+    assert platform.get_organization_from_bearer_token("test-token") == (None, None)
+    assert len(queries) == 2
+
+
+def test_redis_tier_shared_across_processes(
+    app_ctx: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _Redis:
+        def __init__(self) -> None:
+            self.store: dict[str, bytes] = {}
+
+        def get(self, key: str) -> bytes | None:
+            return self.store.get(key)
+
+        def set(self, key: str, value: str, ex: int) -> None:
+            self.store[key] = value.encode()
+
+    redis = _Redis()
+    monkeypatch.setattr(platform_key.Env, "PLATFORM_KEY_REDIS_CACHE_ENABLED", True)
+    monkeypatch.setattr(platform_key, "get_redis_client", lambda: redis)
+    queries = _mock_safe_cursor(monkeypatch, (True, 7, "org_abc"))
+
+    assert platform.validate_bearer_token("test-token") is True
+    # Another process: cold local cache, warm Redis
+    platform_key.clear_local_cache()
+    assert platform.get_organization_from_bearer_token("test-token") == (7, "org_abc")
+
+    assert len(queries) == 1
+    assert set(redis.store) == {"platform_key_auth:test-token"}
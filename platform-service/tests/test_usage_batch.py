@@ -0,0 +1,69 @@
+"""Usage batches are stored with one multi-row INSERT per chunk."""
+
+import uuid
+from contextlib import nullcontext
+from typing import Any
+
+import pytest
+
+from unstract.platform_service.helper import usage
+from unstract.platform_service.helper.usage import USAGE_COLUMNS, UsageRequestHelper
+
+
+class _Db:
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, tuple]] = []
+
+    def atomic(self) -> nullcontext:
+        return nullcontext()
+
+    def execute_sql(self, query: str, params: tuple = ()) -> Any:
+        self.statements.append((query, params))
+
+        class _Cursor:
+            rowcount = len(params) // len(USAGE_COLUMNS)
+
+            def close(self) -> None:
+                pass
+
+        return _Cursor()
+
+
+@pytest.fixture
+def db(monkeypatch: pytest.MonkeyPatch) -> _Db:
+    db = _Db()
+    monkeypatch.setattr(usage, "db", db)
+    return db
+
+
+def _records(n: int) -> list[dict[str, Any]]:
+    return [
+        {"usage_type": "llm", "model_name": "gpt-4o", "prompt_tokens": i}
+        for i in range(n)
+    ]
+
+
+def test_batch_inserted_in_chunks(db: _Db, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(usage, "INSERT_CHUNK_SIZE", 2)
+
+    usage_ids, created = UsageRequestHelper.insert_usage_records(
+        _records(5), organization_uid=7
+    )
+
+    assert created == 5
+    assert len(set(usage_ids)) == 5
+    assert len(db.statements) == 3
+    query, params = db.statements[0]
+    assert "ON CONFLICT (id) DO NOTHING" in query
+    assert len(params) == 2 * len(USAGE_COLUMNS)
+    assert params[:2] == (usage_ids[0], 7)
+
+
+def test_client_usage_ids_kept(db: _Db) -> None:
+    usage_id = str(uuid.uuid4())
+    records = [{**_records(1)[0], "id": usage_id}, {**_records(1)[0], "id": "bogus"}]
+
+    usage_ids, _ = UsageRequestHelper.insert_usage_records(records, organization_uid=7)
+
+    assert usage_ids[0] == usage_id
+    assert uuid.UUID(usage_ids[1])
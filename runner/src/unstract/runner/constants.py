@@ -44,3 +44,4 @@ class Env:
     CELERY_BROKER_BASE_URL = "CELERY_BROKER_BASE_URL"
     CELERY_BROKER_USER = "CELERY_BROKER_USER"
     CELERY_BROKER_PASS = "CELERY_BROKER_PASS"
+    LOG_PUBLISHER_BATCHING_ENABLED = "LOG_PUBLISHER_BATCHING_ENABLED"
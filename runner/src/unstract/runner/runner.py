@@ -245,6 +245,9 @@ class UnstractRunner:
             "CELERY_BROKER_BASE_URL": os.getenv(Env.CELERY_BROKER_BASE_URL),
             "CELERY_BROKER_USER": os.getenv(Env.CELERY_BROKER_USER),
             "CELERY_BROKER_PASS": os.getenv(Env.CELERY_BROKER_PASS),
+            "LOG_PUBLISHER_BATCHING_ENABLED": os.getenv(
+                Env.LOG_PUBLISHER_BATCHING_ENABLED, "false"
+            ),
             "CONTAINER_NAME": container_name,
         }
         sidecar_config = self.client.get_container_run_config(
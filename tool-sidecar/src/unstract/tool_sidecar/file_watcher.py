@@ -0,0 +1,86 @@
+"""Waits for changes in the shared log directory.
+
+Uses Linux inotify (through libc, no extra dependency) so the sidecar sleeps
+until the tool writes to its log file or creates the ``completed`` marker.
+Where inotify is unavailable (non-Linux, exhausted watches) it falls back to
+sleeping for a short poll interval. Even with inotify, waits are capped so a
+filesystem that doesn't deliver events (e.g. network mounts) degrades to slow
+polling instead of hanging.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import time
+from typing import Self
+
+logger = logging.getLogger(__name__)
+
+# From <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+POLL_INTERVAL_SECONDS = 0.1
+MAX_EVENT_WAIT_SECONDS = 1.0
+
+
+class DirectoryWatcher:
+    """Blocks in :meth:`wait` until something in ``directory`` changes."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._fd: int | None = None
+        try:
+            self._fd = self._add_watch(directory)
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify unavailable, polling {directory} instead: {e}")
+
+    @property
+    def event_driven(self) -> bool:
+        return self._fd is not None
+
+    @staticmethod
+    def _add_watch(directory: str) -> int:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, "inotify_add_watch failed")
+        return fd
+
+    def wait(self) -> None:
+        """Return once the directory changed, or after the fallback interval."""
+        if self._fd is None:
+            time.sleep(POLL_INTERVAL_SECONDS)
+            return
+        readable, _, _ = select.select([self._fd], [], [], MAX_EVENT_WAIT_SECONDS)
+        if readable:
+            self._drain()
+
+    def _drain(self) -> None:
+        # Callers re-read the file and re-check the marker, so the events
+        # themselves don't matter
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
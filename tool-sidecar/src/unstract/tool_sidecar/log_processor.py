@@ -24,9 +24,12 @@ from unstract.core.utilities import redact_sensitive_string
 
 from .constants import Env, LogLevel, LogType
 from .dto import LogLineDTO
+from .file_watcher import DirectoryWatcher
 
 logger = logging.getLogger(__name__)
 
+READ_CHUNK_SIZE = 64 * 1024
+
 
 def _signal_handler(signum: int, _frame: types.FrameType | None):
     """Handle shutdown signals gracefully."""
@@ -93,6 +96,19 @@ class LogProcessor:
         except Exception as e:
             logger.error(f"Failed to update tool execution status: {e}", exc_info=True)
 
+    def _signal_tool_completion(self) -> None:
+        """Wake the worker waiting on this tool, ahead of its status poll."""
+        try:
+            self.tool_execution_tracker.signal_completion(
+                ToolExecutionData(
+                    execution_id=self.execution_id,
+                    file_execution_id=self.file_execution_id,
+                )
+            )
+        except Exception as e:
+            # The worker still notices through its runner status poll
+            logger.error(f"Failed to signal tool completion: {e}", exc_info=True)
+
     def wait_for_log_file(self, timeout: int = 300) -> bool:
         """Wait for the log file to be created by the tool container.
 
@@ -118,18 +134,54 @@ class LogProcessor:
         Returns:
             Optional[Dict]: Parsed JSON if line is a completion signal
         """
+        log_process_status, log_dict = self._parse_log_line(line)
+        if log_dict:
+            # Publish to channel of socket io
+            LogPublisher.publish(self.messaging_channel, log_dict)
+        return log_process_status
+
+    def process_log_lines(self, lines: list[str]) -> LogLineDTO:
+        """Process complete log lines read in one go, publishing them together.
+
+        Lines after the termination marker are ignored.
+
+        Args:
+            lines: Log lines, without line endings
+
+        Returns:
+            LogLineDTO: Combined status of the lines
+        """
+        log_process_status = LogLineDTO()
+        log_dicts = []
+        for line in lines:
+            if not line.strip():
+                continue
+            line_status, log_dict = self._parse_log_line(line)
+            if log_dict:
+                log_dicts.append(log_dict)
+            log_process_status.error = line_status.error or log_process_status.error
+            log_process_status.with_result |= line_status.with_result
+            if line_status.is_terminated:
+                log_process_status.is_terminated = True
+                break
+        if log_dicts:
+            LogPublisher.publish_many(self.messaging_channel, log_dicts)
+        return log_process_status
+
+    def _parse_log_line(self, line: str) -> tuple[LogLineDTO, dict[str, Any] | None]:
+        """Parse a log line into its status and the message to publish, if any."""
         # Stream log to Redis
         if LogFieldName.TOOL_TERMINATION_MARKER in line:
             logger.info(
                 "Tool container terminated with status "
                 f"{LogFieldName.TOOL_TERMINATION_MARKER}"
             )
-            return LogLineDTO(is_terminated=True)
+            return LogLineDTO(is_terminated=True), None
 
         log_dict = self.get_valid_log_message(line)
         if not log_dict:
             logger.info(f"{line}")
-            return LogLineDTO()
+            return LogLineDTO(), None
 
         log_type = log_dict.get("type")
         log_level = log_dict.get("level")
@@ -137,7 +189,7 @@ class LogProcessor:
             logger.warning(
                 f"Received invalid logType: {log_type} with log message: {log_dict}"
             )
-            return LogLineDTO()
+            return LogLineDTO(), None
 
         log_process_status = LogLineDTO()
         if log_type == LogType.LOG:
@@ -152,7 +204,7 @@ class LogProcessor:
         elif log_type == LogType.RESULT:
             logger.info(f"Tool '{self.container_name}' completed running")
             self._update_tool_execution_status(status=ToolExecutionStatus.SUCCESS)
-            return LogLineDTO(with_result=True)
+            return LogLineDTO(with_result=True), None
         elif log_type == LogType.UPDATE:
             logger.info("Pushing UI updates")
             log_dict["component"] = self.tool_instance_id
@@ -161,9 +213,7 @@ class LogProcessor:
         log_dict[LogFieldName.ORGANIZATION_ID] = self.organization_id
         log_dict[LogFieldName.TIMESTAMP] = self.get_log_timestamp(log_dict)
         log_dict[LogFieldName.FILE_EXECUTION_ID] = self.file_execution_id
-        # Publish to channel of socket io
-        LogPublisher.publish(self.messaging_channel, log_dict)
-        return log_process_status
+        return log_process_status, log_dict
 
     def get_log_timestamp(self, log_dict: dict[str, Any]) -> float:
         """Obtains the timestamp from the log dictionary.
@@ -219,38 +269,42 @@ class LogProcessor:
 
     def monitor_logs(self) -> None:
         """Main loop to monitor log file for new content and completion signals.
-        Uses file polling with position tracking to efficiently read new lines.
+
+        Reads whatever the tool has written in large chunks and processes the
+        complete lines together. When caught up, it blocks on inotify events
+        for the log directory (see DirectoryWatcher) and only then checks for
+        the ``completed`` marker. Once the tool is done, the worker polling
+        for it is signalled through the tool execution tracker.
         """
         logger.info("Starting log monitoring...")
         if not self.wait_for_log_file():
             raise TimeoutError("Log file was not created within timeout period")
 
+        log_dir = os.path.dirname(self.log_path)
+        completed_marker = os.path.join(log_dir, "completed")
         # Monitor the file for new content
-        with open(self.log_path) as f:
+        with open(self.log_path) as f, DirectoryWatcher(log_dir) as watcher:
+            partial_line = ""
             while True:
-                # Remember current position
-                where = f.tell()
-                line = f.readline()
-
-                if not line:
-                    # No new data, check if tool container is done
-                    if os.path.exists(
-                        os.path.join(os.path.dirname(self.log_path), "completed")
-                    ):
+                chunk = f.read(READ_CHUNK_SIZE)
+                if chunk:
+                    *lines, partial_line = (partial_line + chunk).split("\n")
+                    if lines and self.process_log_lines(lines).is_terminated:
+                        logger.info("Completion signal received")
                         break
-
-                    # Sleep briefly to avoid CPU spinning
-                    time.sleep(0.1)
-                    # Go back to where we were
-                    f.seek(where)
                     continue
 
-                # Process the log line
-                log_line = self.process_log_line(line)
-                if log_line.is_terminated:
-                    logger.info("Completion signal received")
+                # No new data, check if tool container is done
+                if os.path.exists(completed_marker):
+                    # Anything written right before the marker
+                    lines = (partial_line + f.read()).split("\n")
+                    self.process_log_lines(lines)
                     break
 
+                watcher.wait()
+
+        self._signal_tool_completion()
+
 
 def main():
     """Main entry point for the sidecar container.
@@ -0,0 +1,125 @@
+"""Unit tests for the sidecar's chunked log tailing.
+
+``LogProcessor.monitor_logs`` reads the tool's log file in ``READ_CHUNK_SIZE``
+chunks, carries a partial line over to the next read, and publishes the
+complete lines of a chunk with one ``LogPublisher.publish_many`` call. The
+publisher and the execution tracker are mocked; the log file is real.
+"""
+
+import json
+from unittest import mock
+
+import pytest
+
+from unstract.core.constants import LogFieldName
+from unstract.tool_sidecar import log_processor
+from unstract.tool_sidecar.log_processor import READ_CHUNK_SIZE, LogProcessor
+
+TERMINATION_LINE = f"{LogFieldName.TOOL_TERMINATION_MARKER} with status 0"
+
+
+def _log_line(text: str) -> str:
+    return json.dumps({"type": "LOG", "level": "INFO", "log": text})
+
+
+@pytest.fixture
+def publish_many():
+    with (
+        mock.patch.object(log_processor, "ToolExecutionTracker"),
+        mock.patch.object(log_processor.LogPublisher, "publish_many") as publish_many,
+    ):
+        yield publish_many
+
+
+@pytest.fixture
+def processor(tmp_path, publish_many):
+    return LogProcessor(
+        log_path=str(tmp_path / "logs.txt"),
+        redis_host="localhost",
+        redis_port="6379",
+        redis_user="",
+        redis_password="",
+        tool_instance_id="tool-1",
+        execution_id="exec-1",
+        organization_id="org-1",
+        file_execution_id="file-exec-1",
+        messaging_channel="channel-1",
+    )
+
+
+@pytest.fixture
+def watcher():
+    """Fails the test if monitor_logs has to wait for more data."""
+    watcher = mock.MagicMock()
+    watcher.__enter__.return_value.wait.side_effect = AssertionError(
+        "monitor_logs waited for more data"
+    )
+    with mock.patch.object(log_processor, "DirectoryWatcher", return_value=watcher):
+        yield watcher
+
+
+def _published_logs(publish_many) -> list[str]:
+    return [
+        payload["log"] for call in publish_many.call_args_list for payload in call.args[1]
+    ]
+
+
+def test_lines_of_a_read_published_together(processor, publish_many):
+    status = processor.process_log_lines(
+        [_log_line("one"), "", "not json", _log_line("two")]
+    )
+
+    assert not status.is_terminated
+    publish_many.assert_called_once()
+    channel, payloads = publish_many.call_args.args
+    assert channel == "channel-1"
+    assert [p["log"] for p in payloads] == ["one", "two"]
+    assert all(p[LogFieldName.EXECUTION_ID] == "exec-1" for p in payloads)
+
+
+def test_lines_after_termination_ignored(processor, publish_many):
+    status = processor.process_log_lines(
+        [_log_line("one"), TERMINATION_LINE, _log_line("late")]
+    )
+
+    assert status.is_terminated
+    assert _published_logs(publish_many) == ["one"]
+
+
+def test_line_split_across_chunks_carried_over(processor, publish_many, watcher):
+    # The second line starts just before the first chunk boundary
+    first = _log_line("x" * (READ_CHUNK_SIZE - 100))
+    second = _log_line("y" * 200)
+    with open(processor.log_path, "w") as f:
+        f.write("\n".join([first, second, _log_line("z"), TERMINATION_LINE, ""]))
+
+    processor.monitor_logs()
+
+    assert len(first) < READ_CHUNK_SIZE < len(first) + len(second)
+    assert _published_logs(publish_many) == [
+        "x" * (READ_CHUNK_SIZE - 100),
+        "y" * 200,
+        "z",
+    ]
+    # One publish per chunk read, not per line
+    assert publish_many.call_count == 2
+
+
+def test_stops_at_termination_without_completed_marker(processor, publish_many, watcher):
+    with open(processor.log_path, "w") as f:
+        f.write("\n".join([_log_line("one"), TERMINATION_LINE, _log_line("late"), ""]))
+
+    processor.monitor_logs()
+
+    assert _published_logs(publish_many) == ["one"]
+    processor.tool_execution_tracker.signal_completion.assert_called_once()
+
+
+def test_trailing_partial_line_read_once_completed(processor, publish_many, tmp_path):
+    with open(processor.log_path, "w") as f:
+        f.write("\n".join([_log_line("one"), _log_line("no newline")]))
+    (tmp_path / "completed").touch()
+
+    processor.monitor_logs()
+
+    assert _published_logs(publish_many) == ["one", "no newline"]
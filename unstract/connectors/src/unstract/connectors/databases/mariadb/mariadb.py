@@ -95,6 +95,24 @@ class MariaDB(UnstractDB, MysqlHandler):
             table_name=table_name,
         )
 
+    @staticmethod
+    def can_insert_many() -> bool:
+        return True
+
+    def execute_many_query(
+        self, engine: Any, sql_query: str, sql_values_list: list[Any], **kwargs: Any
+    ) -> None:
+        table_name = kwargs.get("table_name", None)
+        MysqlHandler.execute_query(
+            engine=engine,
+            sql_query=sql_query,
+            sql_values=sql_values_list,
+            database=self.database,
+            host=self.host,
+            table_name=table_name,
+            many=True,
+        )
+
     def get_create_table_base_query(self, table: str) -> str:
         """Function to create a base create table sql query with MySQL specific types.
 
@@ -60,10 +60,13 @@ class MysqlHandler:
         database: Any,
         host: Any,
         table_name: str,
+        many: bool = False,
     ) -> None:
         try:
             with engine.cursor() as cursor:
-                if sql_values:
+                if many:
+                    cursor.executemany(sql_query, sql_values)
+                elif sql_values:
                     cursor.execute(sql_query, sql_values)
                 else:
                     cursor.execute(sql_query)
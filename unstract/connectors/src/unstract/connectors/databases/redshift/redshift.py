@@ -159,3 +159,21 @@ class Redshift(UnstractDB, PsycoPgHandler):
             schema=self.schema,
             table_name=table_name,
         )
+
+    @staticmethod
+    def can_insert_many() -> bool:
+        return True
+
+    def execute_many_query(
+        self, engine: Any, sql_query: str, sql_values_list: list[Any], **kwargs: Any
+    ) -> None:
+        table_name = kwargs.get("table_name", None)
+        PsycoPgHandler.execute_query(
+            engine=engine,
+            sql_query=sql_query,
+            sql_values=sql_values_list,
+            database=self.database,
+            schema=self.schema,
+            table_name=table_name,
+            many=True,
+        )
@@ -61,6 +61,11 @@ class UnstractDB(UnstractConnector, ABC):
     def can_read() -> bool:
         return False
 
+    @staticmethod
+    def can_insert_many() -> bool:
+        """Whether :meth:`execute_many_query` is implemented."""
+        return False
+
     @staticmethod
     def get_connector_mode() -> ConnectorMode:
         return ConnectorMode.DATABASE
@@ -223,6 +228,21 @@ class UnstractDB(UnstractConnector, ABC):
         """
         pass
 
+    def execute_many_query(
+        self, engine: Any, sql_query: str, sql_values_list: list[Any], **kwargs: Any
+    ) -> None:
+        """Executes one insert query for several rows in a single transaction.
+
+        Only implemented by connectors whose :meth:`can_insert_many` is True;
+        either every row is committed or none is.
+
+        Args:
+            engine (Any): database client engine
+            sql_query (str): parameterised insert query shared by all rows
+            sql_values_list (list[Any]): sql values of each row
+        """
+        raise NotImplementedError(f"{self.get_name()} does not support bulk inserts")
+
     def get_information_schema(self, table_name: str) -> dict[str, str]:
         """Function to generate information schema of the corresponding table.
 
@@ -6,12 +6,14 @@ class LogFieldName:
     DATA = "data"
     EVENT_TIME = "event_time"
     FILE_EXECUTION_ID = "file_execution_id"
+    LOG_ID = "log_id"
     TOOL_TERMINATION_MARKER = "TOOL_EXECUTION_COMPLETE"
 
 
 class LogEventArgument:
     EVENT = "event"
     MESSAGE = "message"
+    MESSAGES = "messages"  # Batch of messages for the same event
     USER_SESSION_ID = "user_session_id"
 
 
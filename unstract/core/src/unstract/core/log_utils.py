@@ -116,3 +116,49 @@ def store_execution_log(
 
     except Exception as e:
         logger.error(f"Error storing execution log: {e}")
+
+
+def store_execution_logs(
+    data: list[dict[str, Any]],
+    redis_client: redis.Redis,
+    log_queue_name: str,
+    is_enabled: bool = True,
+) -> None:
+    """Store a batch of execution logs in the Redis queue with one RPUSH.
+
+    Same size protection as :func:`store_execution_log`: logs that don't fit
+    under LOG_QUEUE_MAX_SIZE are dropped.
+
+    Args:
+        data: Execution logs, in publish order
+        redis_client: Redis client instance
+        log_queue_name: Name of the Redis queue to store logs
+        is_enabled: Whether log storage is enabled
+    """
+    if not is_enabled:
+        return
+
+    try:
+        logs = [
+            log_data.to_json()
+            for log_data in map(get_validated_log_data, data)
+            if log_data
+        ]
+        if not logs:
+            return
+
+        max_queue_size = int(os.getenv("LOG_QUEUE_MAX_SIZE", "10000"))
+        capacity = max_queue_size - redis_client.llen(log_queue_name)
+
+        if capacity < len(logs):
+            logger.warning(
+                f"Log queue '{log_queue_name}' at capacity ({max_queue_size}), "
+                f"dropping {len(logs) - max(capacity, 0)} logs - scheduler may be "
+                "falling behind"
+            )
+            logs = logs[: max(capacity, 0)]
+        if logs:
+            redis_client.rpush(log_queue_name, *logs)
+
+    except Exception as e:
+        logger.error(f"Error storing execution logs: {e}")
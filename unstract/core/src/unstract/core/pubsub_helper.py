@@ -1,8 +1,11 @@
+import atexit
 import json
 import logging
 import os
+import threading
 import time
 import traceback
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
@@ -12,6 +15,109 @@ from kombu import Connection
 from unstract.core.cache.redis_client import create_redis_client
 from unstract.core.constants import LogEventArgument, LogProcessingTask
 
+logger = logging.getLogger(__name__)
+
+
+def _batching_enabled() -> bool:
+    return os.getenv("LOG_PUBLISHER_BATCHING_ENABLED", "false").lower() == "true"
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name, "")
+    try:
+        return max(1, int(raw)) if raw else default
+    except ValueError:
+        logger.warning(f"Invalid {name}={raw!r}, using {default}")
+        return default
+
+
+class _LogBatcher:
+    """Buffers log payloads per channel and publishes them as one message.
+
+    A channel is flushed once it holds ``max_lines`` payloads, once its oldest
+    payload is ``interval`` seconds old (from a background thread), or right
+    away for anything other than a ``LOG`` line, so status updates are never
+    delayed. Flushes are serialized, so batches of a channel go out in order.
+    """
+
+    def __init__(
+        self,
+        publish_batch: Callable[[str, list[dict[str, Any]]], bool],
+        max_lines: int,
+        interval: float,
+    ):
+        self._publish_batch = publish_batch
+        self.max_lines = max_lines
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffers: dict[str, list[dict[str, Any]]] = {}
+        self._oldest: dict[str, float] = {}
+        self._wakeup = threading.Event()
+        self._pid = os.getpid()
+        self._thread: threading.Thread | None = None
+
+    def add(self, channel_id: str, payload: dict[str, Any]) -> bool:
+        with self._lock:
+            self._ensure_flusher()
+            buffer = self._buffers.setdefault(channel_id, [])
+            if not buffer:
+                self._oldest[channel_id] = time.monotonic()
+                self._wakeup.set()
+            buffer.append(payload)
+            flush_now = len(buffer) >= self.max_lines or payload.get("type") != "LOG"
+        if flush_now:
+            return self.flush([channel_id])
+        return True
+
+    def flush(self, channel_ids: list[str] | None = None) -> bool:
+        """Publish the buffered payloads of the given (default: all) channels."""
+        success = True
+        with self._flush_lock:
+            with self._lock:
+                channels = list(self._buffers) if channel_ids is None else channel_ids
+                batches = [
+                    (channel_id, self._take(channel_id)) for channel_id in channels
+                ]
+            for channel_id, batch in batches:
+                if batch:
+                    success = self._publish_batch(channel_id, batch) and success
+        return success
+
+    def _take(self, channel_id: str) -> list[dict[str, Any]]:
+        self._oldest.pop(channel_id, None)
+        return self._buffers.pop(channel_id, [])
+
+    def _ensure_flusher(self) -> None:
+        if self._pid != os.getpid():
+            # Forked child: the parent flushes its own buffers
+            self._pid = os.getpid()
+            self._buffers.clear()
+            self._oldest.clear()
+            self._thread = None
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="log-publisher-flush", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            with self._lock:
+                now = time.monotonic()
+                due = [
+                    channel_id
+                    for channel_id, oldest in self._oldest.items()
+                    if now - oldest >= self.interval
+                ]
+                pending = [o + self.interval - now for o in self._oldest.values()]
+            if due:
+                self.flush(due)
+            # Sleep until the next channel is due, or until a channel starts filling
+            wait = min((p for p in pending if p > 0), default=None)
+            self._wakeup.wait(max(wait, 0.001) if wait is not None else None)
+
 
 class LogPublisher:
     broker_url = str(
@@ -22,6 +128,8 @@ class LogPublisher:
     )
     kombu_conn = Connection(broker_url)
     _redis_client: Any = None
+    _batcher: _LogBatcher | None = None
+    _batcher_lock = threading.Lock()
 
     @classmethod
     def _get_redis_client(cls) -> Any:
@@ -134,13 +242,20 @@ class LogPublisher:
 
     @classmethod
     def _get_task_message(
-        cls, user_session_id: str, event: str, message: Any
+        cls,
+        user_session_id: str,
+        event: str,
+        message: Any = None,
+        messages: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         task_kwargs = {
             LogEventArgument.EVENT: event,
-            LogEventArgument.MESSAGE: message,
             LogEventArgument.USER_SESSION_ID: user_session_id,
         }
+        if messages is not None:
+            task_kwargs[LogEventArgument.MESSAGES] = messages
+        else:
+            task_kwargs[LogEventArgument.MESSAGE] = message
         task_message = {
             "args": [],
             "kwargs": task_kwargs,
@@ -155,9 +270,38 @@ class LogPublisher:
             "task": task_name,
         }
 
+    @classmethod
+    def _get_batcher(cls) -> _LogBatcher:
+        if cls._batcher is None:
+            with cls._batcher_lock:
+                if cls._batcher is None:
+                    cls._batcher = _LogBatcher(
+                        publish_batch=cls.publish_batch,
+                        max_lines=_env_int("LOG_PUBLISHER_BATCH_MAX_LINES", 50),
+                        interval=_env_int("LOG_PUBLISHER_BATCH_INTERVAL_MS", 200) / 1000,
+                    )
+                    atexit.register(cls._batcher.flush)
+        return cls._batcher
+
+    @classmethod
+    def flush(cls) -> bool:
+        """Publish any log lines still buffered by batching mode."""
+        if cls._batcher is None:
+            return True
+        return cls._batcher.flush()
+
     @classmethod
     def publish(cls, channel_id: str, payload: dict[str, Any]) -> bool:
-        """Publish a message to the queue."""
+        """Publish a message to the queue.
+
+        With ``LOG_PUBLISHER_BATCHING_ENABLED=true`` log lines are buffered per
+        channel and sent through :meth:`publish_batch` instead, so a chatty run
+        costs one broker message (and one consumer task) per batch rather than
+        per line. A ``False`` return then refers to the flush, if any, that this
+        call triggered.
+        """
+        if _batching_enabled():
+            return cls._get_batcher().add(channel_id, payload)
         try:
             event = f"logs:{channel_id}"
             with cls.kombu_conn.Producer(serializer="json") as producer:
@@ -189,6 +333,59 @@ class LogPublisher:
             return False
         return True
 
+    @classmethod
+    def publish_many(cls, channel_id: str, payloads: list[dict[str, Any]]) -> bool:
+        """Publish messages already collected by the caller, in order.
+
+        Sent as a single batch when batching mode is on, one by one otherwise.
+        """
+        if not _batching_enabled():
+            return all([cls.publish(channel_id, payload) for payload in payloads])
+        # Lines buffered through publish() go first
+        flushed = cls._get_batcher().flush([channel_id])
+        return cls.publish_batch(channel_id, payloads) and flushed
+
+    @classmethod
+    def publish_batch(cls, channel_id: str, payloads: list[dict[str, Any]]) -> bool:
+        """Publish several messages of a channel as batched queue messages.
+
+        Each queue message carries at most ``LOG_PUBLISHER_BATCH_MAX_LINES``
+        messages, so a large read from the sidecar doesn't become one huge task.
+        """
+        max_lines = _env_int("LOG_PUBLISHER_BATCH_MAX_LINES", 50)
+        try:
+            event = f"logs:{channel_id}"
+            headers = cls._get_task_header(LogProcessingTask.TASK_NAME)
+            with cls.kombu_conn.Producer(serializer="json") as producer:
+                for start in range(0, len(payloads), max_lines):
+                    batch = payloads[start : start + max_lines]
+                    task_message = cls._get_task_message(
+                        user_session_id=channel_id,
+                        event=event,
+                        messages=batch,
+                    )
+                    producer.publish(
+                        body=task_message,
+                        exchange="",
+                        headers=headers,
+                        routing_key=LogProcessingTask.QUEUE_NAME,
+                        compression=None,
+                        retry=True,
+                    )
+                    logging.debug(f"Published '{channel_id}' <= {len(batch)} messages")
+
+                    # Persisting messages for unified notification
+                    logs = [p for p in batch if p.get("type") == "LOG"]
+                    if logs:
+                        cls.store_batch_for_unified_notification(event, logs)
+        except Exception as e:
+            logging.error(
+                f"Failed to publish {len(payloads)} messages to '{channel_id}'"
+                f": {e}\n{traceback.format_exc()}"
+            )
+            return False
+        return True
+
     @classmethod
     def store_for_unified_notification(cls, event: str, payload: dict[str, Any]) -> None:
         """Helps persist messages for unified notification.
@@ -213,3 +410,28 @@ class LogPublisher:
                 f"Failed to store unified notification log for '{event}' "
                 f"<= {payload}: {e}\n{traceback.format_exc()}"
             )
+
+    @classmethod
+    def store_batch_for_unified_notification(
+        cls, event: str, payloads: list[dict[str, Any]]
+    ) -> None:
+        """Persist several messages for unified notification in one round trip.
+
+        Args:
+            event (str): User session ID
+            payloads (list[dict[str, Any]]): Messages being sent
+        """
+        try:
+            logs_expiration = os.environ.get(
+                "LOGS_EXPIRATION_TIME_IN_SECOND", "3600"
+            )  # Defaults to 1 hour
+            pipe = cls._get_redis_client().pipeline(transaction=False)
+            for payload in payloads:
+                timestamp = payload.get("timestamp", round(time.time(), 6))
+                pipe.setex(f"{event}:{timestamp}", logs_expiration, json.dumps(payload))
+            pipe.execute()
+        except Exception as e:
+            logging.error(
+                f"Failed to store {len(payloads)} unified notification logs for "
+                f"'{event}': {e}\n{traceback.format_exc()}"
+            )
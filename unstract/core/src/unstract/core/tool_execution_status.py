@@ -1,5 +1,6 @@
 import logging
 import os
+import time
 from dataclasses import dataclass
 from enum import Enum
 
@@ -61,6 +62,10 @@ class ToolExecutionTracker:
         )
     )
 
+    # Kept below the Redis client's 5s socket timeout so a blocking pop
+    # returns before the read times out
+    COMPLETION_WAIT_CHUNK_IN_SECOND = 4
+
     # Lazy singleton — avoids per-instance Sentinel discovery + retry overhead
     _redis_client = None
 
@@ -99,6 +104,58 @@ class ToolExecutionTracker:
     def get_cache_key(self, tool_execution_data: ToolExecutionData) -> str:
         return f"tool_execution:{tool_execution_data.execution_id}:{tool_execution_data.file_execution_id}"
 
+    def get_completion_key(self, tool_execution_data: ToolExecutionData) -> str:
+        return f"tool_execution_completed:{tool_execution_data.execution_id}:{tool_execution_data.file_execution_id}"
+
+    def signal_completion(self, tool_execution_data: ToolExecutionData) -> None:
+        """Signal that the tool has finished running.
+
+        Pushes to a list that ``wait_for_completion`` blocks on, so the waiter
+        doesn't have to poll the runner for the container status.
+
+        Args:
+            tool_execution_data (ToolExecutionData): Status of the tool execution
+        """
+        tool_execution_data.validate()
+        key = self.get_completion_key(tool_execution_data)
+        with self.redis_client.pipeline() as pipe:
+            pipe.rpush(key, "completed")
+            pipe.expire(key, self.CACHE_TTL_IN_SECOND)
+            pipe.execute()
+
+    def clear_completion(self, tool_execution_data: ToolExecutionData) -> None:
+        """Drop a completion signal left over from an earlier run of the file.
+
+        Args:
+            tool_execution_data (ToolExecutionData): Status of the tool execution
+        """
+        tool_execution_data.validate()
+        self.redis_client.delete(self.get_completion_key(tool_execution_data))
+
+    def wait_for_completion(
+        self, tool_execution_data: ToolExecutionData, timeout_in_second: float
+    ) -> bool:
+        """Block until the tool signals completion or the timeout expires.
+
+        Args:
+            tool_execution_data (ToolExecutionData): Status of the tool execution
+            timeout_in_second (float): Maximum time to wait
+
+        Returns:
+            bool: True if completion was signalled
+        """
+        tool_execution_data.validate()
+        key = self.get_completion_key(tool_execution_data)
+        deadline = time.monotonic() + timeout_in_second
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # BLPOP treats 0 as "wait forever"
+            wait = max(min(remaining, self.COMPLETION_WAIT_CHUNK_IN_SECOND), 0.01)
+            if self.redis_client.blpop([key], timeout=wait):
+                return True
+
     def update_status(self, tool_execution_data: ToolExecutionData) -> None:
         """Update the status of a tool execution.
 
@@ -186,7 +243,10 @@ class ToolExecutionTracker:
         """
         try:
             tool_execution_data.validate()
-            self.redis_client.delete(self.get_cache_key(tool_execution_data))
+            self.redis_client.delete(
+                self.get_cache_key(tool_execution_data),
+                self.get_completion_key(tool_execution_data),
+            )
         except ToolExecutionValueException:
             return
         except Exception as e:
@@ -0,0 +1,175 @@
+"""Unit tests for batched log publishing.
+
+``LogPublisher.publish`` can buffer log lines per channel and send them as one
+queue message (``LOG_PUBLISHER_BATCHING_ENABLED``); the log consumer stores the
+batch with a single RPUSH (``store_execution_logs``). Broker and Redis are
+mocked.
+"""
+
+import os
+import time
+import unittest
+from unittest import mock
+
+from unstract.core.constants import LogEventArgument
+from unstract.core.log_utils import store_execution_logs
+from unstract.core.pubsub_helper import LogPublisher, _LogBatcher
+
+
+def _line(n):
+    return {"type": "LOG", "log": f"line {n}"}
+
+
+class TestLogBatcher(unittest.TestCase):
+    def setUp(self):
+        self.published = []
+        self.batcher = _LogBatcher(
+            publish_batch=lambda channel, batch: (
+                self.published.append((channel, batch)) or True
+            ),
+            max_lines=3,
+            interval=60,
+        )
+
+    def test_flushes_full_channel_in_order(self):
+        for n in range(4):
+            self.batcher.add("a", _line(n))
+        self.batcher.add("b", _line(9))
+
+        self.assertEqual(self.published, [("a", [_line(0), _line(1), _line(2)])])
+
+        self.batcher.flush()
+        self.assertEqual(self.published[1:], [("a", [_line(3)]), ("b", [_line(9)])])
+
+    def test_non_log_message_flushes_immediately(self):
+        update = {"type": "UPDATE", "state": "SUCCESS"}
+        self.batcher.add("a", _line(0))
+        self.batcher.add("a", update)
+
+        self.assertEqual(self.published, [("a", [_line(0), update])])
+
+    def test_flushes_after_interval(self):
+        self.batcher.interval = 0.02
+        self.batcher.add("a", _line(0))
+
+        deadline = time.monotonic() + 2
+        while not self.published and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(self.published, [("a", [_line(0)])])
+
+
+class TestLogPublisherBatching(unittest.TestCase):
+    def setUp(self):
+        self.producer = mock.MagicMock()
+        self.redis = mock.MagicMock()
+        patches = [
+            mock.patch.object(LogPublisher, "kombu_conn"),
+            mock.patch.object(LogPublisher, "_redis_client", self.redis),
+            mock.patch.object(LogPublisher, "_batcher", None),
+            mock.patch.dict(
+                os.environ,
+                {
+                    "LOG_PUBLISHER_BATCHING_ENABLED": "true",
+                    "LOG_PUBLISHER_BATCH_MAX_LINES": "2",
+                },
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        LogPublisher.kombu_conn.Producer.return_value.__enter__.return_value = (
+            self.producer
+        )
+
+    def test_lines_sent_as_one_message(self):
+        self.assertTrue(LogPublisher.publish("session", _line(0)))
+        self.producer.publish.assert_not_called()
+
+        self.assertTrue(LogPublisher.publish("session", _line(1)))
+
+        self.producer.publish.assert_called_once()
+        kwargs = self.producer.publish.call_args.kwargs["body"]["kwargs"]
+        self.assertEqual(kwargs[LogEventArgument.MESSAGES], [_line(0), _line(1)])
+        self.assertNotIn(LogEventArgument.MESSAGE, kwargs)
+        # Both lines persisted for unified notification in one pipeline
+        pipe = self.redis.pipeline.return_value
+        self.assertEqual(pipe.setex.call_count, 2)
+        pipe.execute.assert_called_once()
+
+    def test_flush_sends_remaining_lines(self):
+        LogPublisher.publish("session", _line(0))
+
+        self.assertTrue(LogPublisher.flush())
+
+        kwargs = self.producer.publish.call_args.kwargs["body"]["kwargs"]
+        self.assertEqual(kwargs[LogEventArgument.MESSAGES], [_line(0)])
+
+    def test_disabled_publishes_each_line(self):
+        with mock.patch.dict(os.environ, {"LOG_PUBLISHER_BATCHING_ENABLED": "false"}):
+            LogPublisher.publish("session", _line(0))
+
+        kwargs = self.producer.publish.call_args.kwargs["body"]["kwargs"]
+        self.assertEqual(kwargs[LogEventArgument.MESSAGE], _line(0))
+
+    def _published_batches(self):
+        return [
+            call.kwargs["body"]["kwargs"][LogEventArgument.MESSAGES]
+            for call in self.producer.publish.call_args_list
+        ]
+
+    def test_publish_many_sends_buffered_lines_first(self):
+        LogPublisher.publish("session", _line(0))
+
+        self.assertTrue(LogPublisher.publish_many("session", [_line(1), _line(2)]))
+
+        self.assertEqual(self._published_batches(), [[_line(0)], [_line(1), _line(2)]])
+
+    def test_publish_batch_split_at_max_lines(self):
+        lines = [_line(n) for n in range(5)]
+
+        self.assertTrue(LogPublisher.publish_batch("session", lines))
+
+        self.assertEqual(self._published_batches(), [lines[:2], lines[2:4], lines[4:]])
+        pipe = self.redis.pipeline.return_value
+        self.assertEqual(pipe.execute.call_count, 3)
+
+    def test_publish_many_disabled_publishes_each_line(self):
+        with mock.patch.dict(os.environ, {"LOG_PUBLISHER_BATCHING_ENABLED": "false"}):
+            self.assertTrue(LogPublisher.publish_many("session", [_line(0), _line(1)]))
+
+        messages = [
+            call.kwargs["body"]["kwargs"][LogEventArgument.MESSAGE]
+            for call in self.producer.publish.call_args_list
+        ]
+        self.assertEqual(messages, [_line(0), _line(1)])
+
+
+class TestStoreExecutionLogs(unittest.TestCase):
+    def _log(self, n):
+        return {
+            "type": "LOG",
+            "execution_id": "exec-1",
+            "organization_id": "org-1",
+            "timestamp": 1700000000.0 + n,
+        }
+
+    def test_single_rpush_capped_at_queue_size(self):
+        redis_client = mock.MagicMock()
+        redis_client.llen.return_value = 8
+
+        with mock.patch.dict(os.environ, {"LOG_QUEUE_MAX_SIZE": "10"}):
+            store_execution_logs(
+                [self._log(n) for n in range(3)] + [{"type": "UPDATE"}],
+                redis_client=redis_client,
+                log_queue_name="log_history_queue",
+            )
+
+        redis_client.rpush.assert_called_once()
+        queue, *logs = redis_client.rpush.call_args.args
+        self.assertEqual(queue, "log_history_queue")
+        self.assertEqual(len(logs), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Unit tests for the tool completion signal.
+
+The tool sidecar pushes to a per-file Redis list when the tool exits, and the
+worker blocks on it (``ToolExecutionTracker.wait_for_completion``) between
+runner status polls. Redis is mocked.
+"""
+
+import unittest
+from unittest import mock
+
+from unstract.core.tool_execution_status import (
+    ToolExecutionData,
+    ToolExecutionTracker,
+)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.lists = {}
+        self.blpop_timeouts = []
+
+    def pipeline(self):
+        return mock.MagicMock(
+            __enter__=lambda pipe: pipe,
+            __exit__=lambda *args: None,
+            rpush=lambda key, value: self.lists.setdefault(key, []).append(value),
+        )
+
+    def delete(self, *keys):
+        for key in keys:
+            self.lists.pop(key, None)
+
+    def blpop(self, keys, timeout):
+        self.blpop_timeouts.append(timeout)
+        for key in keys:
+            if self.lists.get(key):
+                return key, self.lists[key].pop(0)
+        return None
+
+
+class TestToolCompletionSignal(unittest.TestCase):
+    def setUp(self):
+        self.redis = _FakeRedis()
+        patcher = mock.patch.object(
+            ToolExecutionTracker, "_get_redis_client", return_value=self.redis
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tracker = ToolExecutionTracker()
+        self.data = ToolExecutionData(execution_id="exec-1", file_execution_id="file-1")
+
+    def test_signal_wakes_waiter(self):
+        self.tracker.signal_completion(self.data)
+
+        self.assertTrue(self.tracker.wait_for_completion(self.data, 10))
+        # The signal is consumed by the waiter
+        self.assertFalse(self.tracker.wait_for_completion(self.data, 0.05))
+
+    def test_wait_split_below_socket_timeout(self):
+        with mock.patch("unstract.core.tool_execution_status.time.monotonic") as clock:
+            clock.side_effect = [0, 0, 4, 8, 10]
+
+            self.assertFalse(self.tracker.wait_for_completion(self.data, 10))
+
+        self.assertEqual(self.redis.blpop_timeouts, [4, 4, 2])
+
+    def test_stale_signal_cleared(self):
+        self.tracker.signal_completion(self.data)
+
+        self.tracker.clear_completion(self.data)
+
+        self.assertFalse(self.tracker.wait_for_completion(self.data, 0.05))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ from urllib.parse import quote_plus
 
 import psycopg2
 from llama_index.vector_stores.postgres import PGVectorStore
+from psycopg2 import errors, sql
 from unstract.sdk1.adapters.exceptions import AdapterError
 from unstract.sdk1.adapters.vectordb.constants import VectorDbConstants
 from unstract.sdk1.adapters.vectordb.helper import VectorDBHelper
@@ -122,6 +123,28 @@ class Postgres(VectorDBAdapter):
 
         return test_result
 
+    def doc_exists(self, doc_id: str) -> bool | None:
+        if self._client is None:
+            return None
+        # PGVectorStore lower-cases the table name and keeps node metadata in
+        # the ``metadata_`` JSON column. Nodes of an indexed document carry its
+        # doc_id as ``ref_doc_id``, which PGVectorStore indexes (btree on
+        # ``metadata_->>'ref_doc_id'``, also used by delete), so this is an
+        # index probe rather than a scan of the shared collection table.
+        query = sql.SQL(
+            "SELECT 1 FROM {}.{} WHERE metadata_->>'ref_doc_id' = %s LIMIT 1"
+        ).format(
+            sql.Identifier(self._schema_name),
+            sql.Identifier(f"data_{self._collection_name}".lower()),
+        )
+        try:
+            with self._client, self._client.cursor() as cursor:
+                cursor.execute(query, (doc_id,))
+                return cursor.fetchone() is not None
+        except errors.UndefinedTable:
+            # Nothing has been indexed into this collection yet
+            return False
+
     def close(self, **kwargs: object) -> None:
         if self._client:
             self._client.close()
@@ -4,6 +4,7 @@ import os
 from llama_index.core.vector_stores.types import BasePydanticVectorStore
 from llama_index.vector_stores.qdrant import QdrantVectorStore
 from qdrant_client import QdrantClient
+from qdrant_client.http import models
 from qdrant_client.http.exceptions import UnexpectedResponse
 from unstract.sdk1.adapters.vectordb.constants import VectorDbConstants
 from unstract.sdk1.adapters.vectordb.helper import VectorDBHelper
@@ -92,6 +93,26 @@ class Qdrant(VectorDBAdapter):
         except Exception as e:
             raise self.parse_vector_db_err(e) from e
 
+    def doc_exists(self, doc_id: str) -> bool | None:
+        if self._client is None:
+            return None
+        if not self._client.collection_exists(self._collection_name):
+            return False
+        points, _ = self._client.scroll(
+            collection_name=self._collection_name,
+            scroll_filter=models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key="doc_id", match=models.MatchValue(value=doc_id)
+                    )
+                ]
+            ),
+            limit=1,
+            with_payload=False,
+            with_vectors=False,
+        )
+        return len(points) > 0
+
     def close(self, **kwargs: object) -> None:
         if self._client:
             self._client.close(**kwargs)
@@ -98,3 +98,14 @@ class VectorDBAdapter(Adapter, ABC):
 
     def add(self, ref_doc_id: str, nodes: list[BaseNode]) -> list[str]:
         return self._vector_db_instance.add(nodes=nodes)
+
+    def doc_exists(self, doc_id: str) -> bool | None:
+        """Whether any node of ``doc_id`` is stored, via a metadata-only lookup.
+
+        Returns:
+            bool | None: None when the store has no cheap way to tell, in which
+                case callers fall back to a filtered similarity query
+        """
+        # Overriding implementations look ``doc_id`` up by payload / metadata
+        # without embedding a query
+        return None
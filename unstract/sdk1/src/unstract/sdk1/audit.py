@@ -1,4 +1,8 @@
+import atexit
 import logging
+import os
+import threading
+import uuid
 from typing import Any
 
 import requests
@@ -11,6 +15,59 @@ from unstract.sdk1.utils.common import TokenCounterCompat
 
 logger = logging.getLogger(__name__)
 
+# Usage records buffered per platform key before they are sent to
+# ``/usage/batch`` together; 1 (default) posts each record to ``/usage``.
+USAGE_BATCH_SIZE_ENV = "PLATFORM_USAGE_BATCH_SIZE"
+# Records kept across failed flushes before the oldest are dropped
+_MAX_BUFFERED_USAGE = 10000
+
+
+def _usage_batch_size() -> int:
+    raw = os.environ.get(USAGE_BATCH_SIZE_ENV, "")
+    try:
+        return max(1, int(raw)) if raw.strip() else 1
+    except ValueError:
+        logger.warning(f"Invalid {USAGE_BATCH_SIZE_ENV}={raw!r}, ignoring")
+        return 1
+
+
+class _UsageBuffer:
+    """Process-level write-behind buffer of usage records.
+
+    Keyed by platform URL and bearer token (i.e. org). Every record carries
+    an ``id``; a batch whose flush failed is put back and sent again with
+    the next one, and platform service skips ids it already stored.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: dict[tuple[str, str], list[dict[str, Any]]] = {}
+
+    def add(self, key: tuple[str, str], record: dict[str, Any]) -> int:
+        with self._lock:
+            records = self._records.setdefault(key, [])
+            records.append(record)
+            return len(records)
+
+    def take(self) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        with self._lock:
+            taken, self._records = self._records, {}
+        return taken
+
+    def put_back(self, key: tuple[str, str], records: list[dict[str, Any]]) -> None:
+        with self._lock:
+            merged = records + self._records.get(key, [])
+            if len(merged) > _MAX_BUFFERED_USAGE:
+                logger.error(
+                    "Dropping %d unsent usage records",
+                    len(merged) - _MAX_BUFFERED_USAGE,
+                )
+                merged = merged[-_MAX_BUFFERED_USAGE:]
+            self._records[key] = merged
+
+
+_usage_buffer = _UsageBuffer()
+
 
 class Audit(StreamMixin):
     """The 'Audit' class is responsible for pushing usage data to the platform service.
@@ -40,6 +97,9 @@ class Audit(StreamMixin):
     ) -> None:
         """Pushes the usage data to the platform service.
 
+        With ``PLATFORM_USAGE_BATCH_SIZE`` above 1, the record is buffered and
+        sent along with others, see :meth:`flush_usage_data`.
+
         Args:
             platform_api_key (str): The platform API key.
             token_counter (TokenCountingHandler, optional): The token counter
@@ -92,24 +152,13 @@ class Audit(StreamMixin):
 
         # Compute cost using the full model name (e.g. "azure/gpt-4o")
         # before stripping the provider prefix for DB storage.
-        cost_in_dollars = 0.0
-        if model_name:
-            try:
-                prompt_cost, completion_cost = cost_per_token(
-                    model=model_name,
-                    prompt_tokens=input_tokens,
-                    completion_tokens=completion_tokens,
-                )
-                cost_in_dollars = prompt_cost + completion_cost
-            except Exception:
-                logger.debug(
-                    "Cost lookup failed for model %s, defaulting to 0", model_name
-                )
+        cost_in_dollars = self._get_cost(model_name, input_tokens, completion_tokens)
 
         # Strip provider prefix for DB storage (e.g. "azure/gpt-4o" -> "gpt-4o")
         display_model_name = model_name.split("/", 1)[-1] if model_name else ""
 
         data = {
+            "id": str(uuid.uuid4()),
             "workflow_id": workflow_id,
             "execution_id": execution_id,
             "adapter_instance_id": adapter_instance_id,
@@ -129,6 +178,9 @@ class Audit(StreamMixin):
         headers = {"Authorization": f"Bearer {bearer_token}"}
 
         try:
+            if _usage_batch_size() > 1:
+                self._buffer_usage_data((base_url, bearer_token), data)
+                return
             response = requests.post(url, headers=headers, json=data, timeout=30)
             if response.status_code != 200:
                 self.stream_log(
@@ -153,6 +205,55 @@ class Audit(StreamMixin):
             if isinstance(token_counter, TokenCountingHandler):
                 token_counter.reset_counts()
 
+    @staticmethod
+    def _get_cost(model_name: str, input_tokens: int, completion_tokens: int) -> float:
+        if not model_name:
+            return 0.0
+        try:
+            prompt_cost, completion_cost = cost_per_token(
+                model=model_name,
+                prompt_tokens=input_tokens,
+                completion_tokens=completion_tokens,
+            )
+            return prompt_cost + completion_cost
+        except Exception:
+            logger.debug("Cost lookup failed for model %s, defaulting to 0", model_name)
+            return 0.0
+
+    def _buffer_usage_data(self, key: tuple[str, str], data: dict[str, Any]) -> None:
+        if _usage_buffer.add(key, data) >= _usage_batch_size():
+            self.flush_usage_data()
+
+    def flush_usage_data(self) -> None:
+        """Send usage records buffered by :meth:`push_usage_data`.
+
+        Only needed with ``PLATFORM_USAGE_BATCH_SIZE`` above 1. ToolExecutor
+        calls it after each run, i.e. once a file is processed; buffered
+        records are also flushed at exit. Records of a failed flush stay
+        buffered for the next one.
+        """
+        for (base_url, bearer_token), records in _usage_buffer.take().items():
+            url = f"{base_url}/usage/batch"
+            headers = {"Authorization": f"Bearer {bearer_token}"}
+            try:
+                response = requests.post(
+                    url, headers=headers, json={"records": records}, timeout=30
+                )
+                if response.status_code != 200:
+                    raise requests.RequestException(
+                        f"{response.status_code} {response.reason}"
+                    )
+                self.stream_log(
+                    f"Successfully pushed {len(records)} usage records",
+                    level=LogLevel.DEBUG,
+                )
+            except requests.RequestException as e:
+                _usage_buffer.put_back((base_url, bearer_token), records)
+                self.stream_log(
+                    log=f"Error while pushing usage details, will retry: {e}",
+                    level=LogLevel.ERROR,
+                )
+
     def push_page_usage_data(
         self,
         platform_api_key: str,
@@ -202,3 +303,11 @@ class Audit(StreamMixin):
                 log=f"Error while pushing page usage details: {e}",
                 level=LogLevel.ERROR,
             )
+
+
+@atexit.register
+def _flush_usage_at_exit() -> None:
+    try:
+        Audit().flush_usage_data()
+    except Exception:
+        logger.exception("Failed to flush buffered usage records at exit")
@@ -274,6 +274,10 @@ class EmbeddingCompat(BaseEmbedding):
     def get_query_embedding(self, query: str) -> list[float]:
         return self._get_query_embedding(query)
 
+    def get_query_embeddings(self, queries: list[str]) -> list[list[float]]:
+        """Embed several queries in a single provider call."""
+        return self._embedding_instance.get_embeddings(queries, input_type="query")
+
     async def _aget_query_embedding(self, query: str) -> list[float]:
         return await self._embedding_instance.get_aembedding(query, input_type="query")
 
@@ -291,30 +291,39 @@ class Index:
         )
 
         try:
-            # Checking if document is already indexed against doc_id
-            doc_id_eq_filter = MetadataFilter.from_dict(
-                {"key": "doc_id", "operator": FilterOperator.EQ, "value": doc_id}
-            )
-            filters = MetadataFilters(filters=[doc_id_eq_filter])
-            q = VectorStoreQuery(
-                query_embedding=embedding.get_query_embedding(" "),
-                doc_ids=[doc_id],
-                filters=filters,
-            )
-
-            doc_id_found = False
-            try:
-                n: VectorStoreQueryResult = vector_db.query(query=q)
-                if len(n.nodes) > 0:
-                    doc_id_found = True
-                    self.tool.stream_log(f"Found {len(n.nodes)} nodes for {doc_id}")
-                else:
-                    self.tool.stream_log(f"No nodes found for {doc_id}")
-            except Exception as e:
+            # Checking if document is already indexed against doc_id. A
+            # metadata-only lookup avoids embedding a blank query; stores that
+            # can't answer it fall back to the filtered query below.
+            doc_id_found = vector_db.doc_exists(doc_id)
+            if doc_id_found is not None:
                 self.tool.stream_log(
-                    f"Error querying {vector_db_instance_id}: {e}, proceeding to index",
-                    level=LogLevel.ERROR,
+                    f"Nodes {'found' if doc_id_found else 'not found'} for {doc_id}"
                 )
+            else:
+                doc_id_found = False
+                doc_id_eq_filter = MetadataFilter.from_dict(
+                    {"key": "doc_id", "operator": FilterOperator.EQ, "value": doc_id}
+                )
+                filters = MetadataFilters(filters=[doc_id_eq_filter])
+                q = VectorStoreQuery(
+                    query_embedding=embedding.get_query_embedding(" "),
+                    doc_ids=[doc_id],
+                    filters=filters,
+                )
+                try:
+                    n: VectorStoreQueryResult = vector_db.query(query=q)
+                    if len(n.nodes) > 0:
+                        doc_id_found = True
+                        vector_db.record_indexed(doc_id)
+                        self.tool.stream_log(f"Found {len(n.nodes)} nodes for {doc_id}")
+                    else:
+                        self.tool.stream_log(f"No nodes found for {doc_id}")
+                except Exception as e:
+                    self.tool.stream_log(
+                        f"Error querying {vector_db_instance_id}: {e}, "
+                        "proceeding to index",
+                        level=LogLevel.ERROR,
+                    )
 
             if doc_id_found and not reindex:
                 self.tool.stream_log(f"File was indexed already under {doc_id}")
@@ -1,6 +1,8 @@
+import copy
 import logging
 import os
 import re
+import uuid
 from collections.abc import Callable, Generator, Mapping, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
@@ -280,6 +282,26 @@ class LLM:
         self._metrics: dict[str, object] = {}
         self._pending_usage: list[dict] = []
 
+    def fork(self, tool: BaseTool | None = None) -> "LLM":
+        """Return a copy sharing this LLM's resolved adapter, with fresh usage state.
+
+        Skips the adapter-config fetch and metadata validation of a new
+        ``LLM(...)``, but the copy keeps its own metrics and pending usage
+        records, so callers running many calls against one adapter can still
+        attribute usage per unit of work (e.g. one fork per prompt).
+
+        Args:
+            tool: Optional tool to bind the copy to (defaults to this LLM's tool).
+        """
+        clone = copy.copy(self)
+        clone.kwargs = dict(self.kwargs)
+        clone.platform_kwargs = dict(self.platform_kwargs)
+        clone._metrics = {}
+        clone._pending_usage = []
+        if tool is not None:
+            clone._tool = tool
+        return clone
+
     def _get_adapter_info(self) -> str:
         """Build a display string identifying this adapter for errors."""
         provider = self.adapter.get_provider()
@@ -828,6 +850,29 @@ class LLM:
             )
             cost = 0.0
 
+        self._append_usage_record(
+            model, prompt_tokens, completion_tokens, total_tokens, cost, "SUCCESS"
+        )
+
+    def record_skipped_completion(self) -> None:
+        """Record a completion answered without calling the provider.
+
+        Used when the answer is served from a cache: the call still shows up
+        in usage, as a SKIPPED row with no tokens or cost.
+        """
+        self._append_usage_record(
+            self._cost_model or self.kwargs["model"], 0, 0, 0, 0.0, "SKIPPED"
+        )
+
+    def _append_usage_record(
+        self,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        total_tokens: int,
+        cost: float,
+        status: str,
+    ) -> None:
         # Trailing segment matches legacy Audit semantics (e.g. bedrock/anthropic/claude).
         display_model = model.rsplit("/", 1)[-1] if model else model
 
@@ -835,6 +880,8 @@ class LLM:
         self._pending_usage.append(
             {
                 **self._usage_kwargs,
+                # Lets a retried flush skip rows already stored
+                "id": str(uuid.uuid4()),
                 "usage_type": "llm",
                 "model_name": display_model,
                 "provider": self.adapter.get_provider(),
@@ -851,7 +898,7 @@ class LLM:
                 "total_tokens": total_tokens,
                 "embedding_tokens": 0,
                 "cost_in_dollars": cost,
-                "status": "SUCCESS",
+                "status": status,
             }
         )
 
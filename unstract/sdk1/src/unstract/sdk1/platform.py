@@ -1,10 +1,16 @@
+import copy
 import json
 import logging
+import os
+import threading
+import time
 from typing import Any, Self
 
+import redis
 import requests
 from requests import RequestException, Response
 from requests.exceptions import ConnectionError, HTTPError
+from unstract.core.cache.redis_client import create_redis_client
 from unstract.sdk1.constants import (
     AdapterKeys,
     Common,
@@ -23,6 +29,171 @@ from unstract.sdk1.utils.retry_utils import retry_platform_service_call
 
 logger = logging.getLogger(__name__)
 
+# Seconds a fetched adapter config is reused within this process; 0 disables.
+ADAPTER_CONFIG_CACHE_TTL_ENV = "ADAPTER_CONFIG_CACHE_TTL"
+_DEFAULT_ADAPTER_CONFIG_CACHE_TTL = 30.0
+_ADAPTER_CONFIG_CACHE_MAX_ENTRIES = 1024
+# Redis counter bumped by the backend whenever an adapter is saved or deleted
+ADAPTER_CONFIG_VERSION_KEY = "adapter_config_version:{adapter_instance_id}"
+_ADAPTER_CONFIG_VERSION_RETRY_AFTER = 30.0
+
+
+class _AdapterConfigVersions:
+    """Per-adapter version counters shared through Redis.
+
+    Adapters are edited in the backend, a different process, which bumps the
+    adapter's counter on every save or delete. A cached config remembers the
+    counter it was fetched under and is dropped as soon as the counter moves.
+    Without Redis (``REDIS_HOST`` unset or unreachable) configs are only
+    refreshed once their TTL lapses.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._client: redis.Redis | None = None
+        self._retry_at = 0.0
+
+    def _redis(self) -> redis.Redis | None:
+        if not os.environ.get("REDIS_HOST"):
+            return None
+        with self._lock:
+            if self._client is None and self._retry_at <= time.monotonic():
+                try:
+                    self._client = create_redis_client(
+                        db=1, socket_connect_timeout=1, socket_timeout=1
+                    )
+                except Exception as e:
+                    self._unavailable(e)
+            return self._client
+
+    def _unavailable(self, error: Exception) -> None:
+        logger.warning(
+            f"Adapter config versions unavailable, caching by TTL only: {error}"
+        )
+        self._client = None
+        self._retry_at = time.monotonic() + _ADAPTER_CONFIG_VERSION_RETRY_AFTER
+
+    def get(self, adapter_instance_id: str) -> str | None:
+        client = self._redis()
+        if client is None:
+            return None
+        try:
+            return client.get(
+                ADAPTER_CONFIG_VERSION_KEY.format(adapter_instance_id=adapter_instance_id)
+            )
+        except redis.RedisError as e:
+            with self._lock:
+                self._unavailable(e)
+            return None
+
+    def bump(self, adapter_instance_id: str) -> None:
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.incr(
+                ADAPTER_CONFIG_VERSION_KEY.format(adapter_instance_id=adapter_instance_id)
+            )
+        except redis.RedisError as e:
+            with self._lock:
+                self._unavailable(e)
+
+
+class _AdapterConfigCache:
+    """Process-level TTL cache of adapter configs fetched from platform service.
+
+    Keyed by platform URL, bearer token (i.e. org) and adapter instance ID, so
+    orgs never share entries. Callers mutate the returned config (pop the
+    adapter name, strip keys before hashing), hence copies in and out.
+
+    Each entry keeps the adapter version (see :class:`_AdapterConfigVersions`)
+    it was fetched under; a lookup with a different version misses. Expired
+    entries that came with an ETag are kept so the next fetch can revalidate
+    them with ``If-None-Match`` instead of downloading them again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[
+            tuple[str, str, str],
+            tuple[float, dict[str, Any], str | None, str | None],
+        ] = {}
+
+    @staticmethod
+    def ttl() -> float:
+        raw = os.environ.get(ADAPTER_CONFIG_CACHE_TTL_ENV, "")
+        try:
+            return float(raw) if raw.strip() else _DEFAULT_ADAPTER_CONFIG_CACHE_TTL
+        except ValueError:
+            logger.warning(f"Invalid {ADAPTER_CONFIG_CACHE_TTL_ENV}={raw!r}, ignoring")
+            return _DEFAULT_ADAPTER_CONFIG_CACHE_TTL
+
+    def get(
+        self, key: tuple[str, str, str], version: str | None = None
+    ) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, config, etag, cached_version = entry
+            if cached_version != version:
+                # Updated since it was cached, the ETag is stale too
+                del self._entries[key]
+                return None
+            if expires_at <= time.monotonic():
+                if etag is None:
+                    del self._entries[key]
+                return None
+        return copy.deepcopy(config)
+
+    def etag(self, key: tuple[str, str, str]) -> str | None:
+        """ETag of the (possibly expired) entry to revalidate with."""
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry[2] if entry else None
+
+    def renew(self, key: tuple[str, str, str], ttl: float) -> dict[str, Any] | None:
+        """Extend an entry the platform service reported as unchanged."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            _, config, etag, version = entry
+            self._entries[key] = (time.monotonic() + ttl, config, etag, version)
+        return copy.deepcopy(config)
+
+    def put(
+        self,
+        key: tuple[str, str, str],
+        config: dict[str, Any],
+        ttl: float,
+        etag: str | None = None,
+        version: str | None = None,
+    ) -> None:
+        entry = (time.monotonic() + ttl, copy.deepcopy(config), etag, version)
+        with self._lock:
+            if (
+                key not in self._entries
+                and len(self._entries) >= _ADAPTER_CONFIG_CACHE_MAX_ENTRIES
+            ):
+                # Drop whichever entry expires first; the cache is a latency
+                # optimisation, not a store
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = entry
+
+    def invalidate(self, adapter_instance_id: str | None = None) -> None:
+        with self._lock:
+            if adapter_instance_id is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[2] == adapter_instance_id]:
+                del self._entries[key]
+
+
+_adapter_versions = _AdapterConfigVersions()
+_adapter_config_cache = _AdapterConfigCache()
+
 
 class PlatformHelper:
     """Helper to interact with platform service.
@@ -98,12 +269,32 @@ class PlatformHelper:
             return False
 
     @classmethod
-    @retry_platform_service_call
     def _get_adapter_configuration(
         cls: type[Self],
         tool: BaseTool | StreamMixin,
         adapter_instance_id: str,
     ) -> dict[str, Any]:
+        """Get the adapter config from platform service.
+
+        See :meth:`_fetch_adapter_configuration`.
+
+        Args:
+            adapter_instance_id (str): Adapter instance ID
+
+        Returns:
+            dict[str, Any]: Config stored for the adapter
+        """
+        adapter_data, _ = cls._fetch_adapter_configuration(tool, adapter_instance_id)
+        return adapter_data
+
+    @classmethod
+    @retry_platform_service_call
+    def _fetch_adapter_configuration(
+        cls: type[Self],
+        tool: BaseTool | StreamMixin,
+        adapter_instance_id: str,
+        etag: str | None = None,
+    ) -> tuple[dict[str, Any] | None, str | None]:
         """Get Adapter.
 
         Get the adapter config from platform service
@@ -118,9 +309,11 @@ class PlatformHelper:
 
         Args:
             adapter_instance_id (str): Adapter instance ID
+            etag (str | None): ETag of a cached config to revalidate
 
         Returns:
-            dict[str, Any]: Config stored for the adapter
+            tuple[dict[str, Any] | None, str | None]: Config stored for the
+                adapter, or None if it still matches ``etag``; and its ETag
         """
         platform_host = tool.get_env_or_die(ToolEnv.PLATFORM_HOST)
         platform_port = tool.get_env_or_die(ToolEnv.PLATFORM_PORT)
@@ -131,8 +324,12 @@ class PlatformHelper:
         )
         query_params = {AdapterKeys.ADAPTER_INSTANCE_ID: adapter_instance_id}
         headers = {"Authorization": f"Bearer {bearer_token}"}
+        if etag:
+            headers["If-None-Match"] = etag
         try:
             response = requests.get(url, headers=headers, params=query_params)
+            if etag and response.status_code == 304:
+                return None, etag
             response.raise_for_status()
             adapter_data: dict[str, Any] = response.json()
 
@@ -164,7 +361,7 @@ class PlatformHelper:
                 err=e, message_key="error", default_err=default_err
             )
             raise SdkError(f"Error retrieving adapter. {msg}") from e
-        return adapter_data
+        return adapter_data, response.headers.get("ETag")
 
     @classmethod
     def get_adapter_config(
@@ -177,6 +374,12 @@ class PlatformHelper:
         is fetched from environment variables. Otherwise, it connects to the
         platform service to retrieve the configuration.
 
+        Fetched configs are cached per process for ``ADAPTER_CONFIG_CACHE_TTL``
+        seconds (default 30, 0 disables). Updating an adapter invalidates its
+        cached configs in every process, see :meth:`invalidate_adapter_config`.
+        An expired config is revalidated with its ETag and only downloaded
+        again if the adapter changed.
+
         Args:
             tool (AbstractTool): Instance of AbstractTool
             adapter_instance_id (str): ID of the adapter instance
@@ -192,17 +395,71 @@ class PlatformHelper:
             adapter_metadata = json.loads(adapter_metadata_config)
             return adapter_metadata
 
+        ttl = _adapter_config_cache.ttl()
+        cache_key = (
+            cls.get_platform_base_url(
+                tool.get_env_or_die(ToolEnv.PLATFORM_HOST),
+                tool.get_env_or_die(ToolEnv.PLATFORM_PORT),
+            ),
+            tool.get_env_or_die(ToolEnv.PLATFORM_API_KEY),
+            adapter_instance_id,
+        )
+        etag = version = None
+        if ttl > 0:
+            # Read before fetching: an update landing mid-fetch then leaves the
+            # entry under the old version and the next lookup refetches it
+            version = _adapter_versions.get(adapter_instance_id)
+            cached = _adapter_config_cache.get(cache_key, version)
+            if cached is not None:
+                return cached
+            etag = _adapter_config_cache.etag(cache_key)
+
         tool.stream_log(
             "Retrieving adapter configuration from platform service",
             level=LogLevel.DEBUG,
         )
 
         try:
-            return cls._get_adapter_configuration(tool, adapter_instance_id)
+            adapter_config, etag = cls._fetch_adapter_configuration(
+                tool, adapter_instance_id, etag=etag
+            )
+            if adapter_config is None:
+                # Not modified since it was cached
+                adapter_config = _adapter_config_cache.renew(cache_key, ttl)
+                if adapter_config is not None:
+                    return adapter_config
+                # Evicted meanwhile
+                adapter_config, etag = cls._fetch_adapter_configuration(
+                    tool, adapter_instance_id
+                )
         except ConnectionError as e:
             raise SdkError(
                 "Unable to connect to platform service, please contact the admin."
             ) from e
+        if ttl > 0:
+            _adapter_config_cache.put(
+                cache_key, adapter_config, ttl, etag=etag, version=version
+            )
+        return adapter_config
+
+    @classmethod
+    def invalidate_adapter_config(
+        cls: type[Self], adapter_instance_id: str | None = None
+    ) -> None:
+        """Drop cached configs of an adapter after it was updated or deleted.
+
+        Drops this process's entries and bumps the adapter's version in Redis,
+        which makes every other process refetch the config on its next lookup.
+        The backend calls this whenever an adapter instance is saved or
+        deleted.
+
+        Args:
+            adapter_instance_id (str | None): Adapter to drop, or None to drop
+                every entry of this process only
+        """
+        _adapter_config_cache.invalidate(adapter_instance_id)
+        if adapter_instance_id is not None:
+            _adapter_versions.bump(adapter_instance_id)
 
     def _get_headers(self: Self, headers: dict[str, str] | None = None) -> dict[str, str]:
         """Get default headers for requests.
@@ -5,6 +5,7 @@ from json import loads
 from pathlib import Path
 from typing import Any
 
+from unstract.sdk1.audit import Audit
 from unstract.sdk1.constants import Command
 from unstract.sdk1.tool.base import BaseTool
 from unstract.sdk1.tool.validator import ToolValidator
@@ -79,5 +80,9 @@ class ToolExecutor:
             msg = f"Error while running tool '{tool_name}': {str(e)}"
             logger.error(msg, stack_info=True, exc_info=True)
             self.tool.stream_error_and_exit(msg)
+        finally:
+            # A run processes one file; send its buffered usage records now
+            # rather than at process exit
+            Audit(log_level=self.tool.log_level).flush_usage_data()
 
         # TODO: Call tool method to validate if output was written
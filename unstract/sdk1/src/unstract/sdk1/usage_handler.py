@@ -1,4 +1,6 @@
 import logging
+import threading
+import uuid
 from typing import Any
 
 import litellm
@@ -61,6 +63,8 @@ class UsageHandler(StreamMixin, BaseCallbackHandler):
         self.token_counter = token_counter
         self.embed_model = embed_model
         self._pending_usage: list[dict] = []
+        # One embedding instance can be shared by concurrently running prompts
+        self._usage_lock = threading.Lock()
         self.platform_api_key = platform_api_key
         super().__init__(
             log_level=log_level,  # StreamMixin's args
@@ -114,7 +118,7 @@ class UsageHandler(StreamMixin, BaseCallbackHandler):
                 )
                 return
             model_name = self.embed_model.model_name
-            embedding_tokens = self.token_counter.total_embedding_token_count
+            embedding_tokens = self._take_embedding_tokens(event_id)
             self.stream_log(
                 log=f"Recording embedding usage for model {model_name}",
                 level=LogLevel.DEBUG,
@@ -139,26 +143,46 @@ class UsageHandler(StreamMixin, BaseCallbackHandler):
             # the trailing segment to match legacy Audit semantics.
             display_model = model_name.rsplit("/", 1)[-1] if model_name else model_name
 
-            self._pending_usage.append(
-                {
-                    "usage_type": "embedding",
-                    "model_name": display_model,
-                    "adapter_instance_id": self.kwargs.get("adapter_instance_id", ""),
-                    # run_id lands in a UUIDField — "" fails the cast; keep None.
-                    "run_id": self.kwargs.get("run_id") or None,
-                    "execution_id": self.kwargs.get("execution_id", ""),
-                    "embedding_tokens": embedding_tokens,
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "total_tokens": 0,
-                    "cost_in_dollars": cost,
-                    "status": "SUCCESS",
-                }
-            )
-            self.token_counter.reset_counts()
+            record = {
+                # Lets a retried flush skip rows already stored
+                "id": str(uuid.uuid4()),
+                "usage_type": "embedding",
+                "model_name": display_model,
+                "adapter_instance_id": self.kwargs.get("adapter_instance_id", ""),
+                # run_id lands in a UUIDField — "" fails the cast; keep None.
+                "run_id": self.kwargs.get("run_id") or None,
+                "execution_id": self.kwargs.get("execution_id", ""),
+                "embedding_tokens": embedding_tokens,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "total_tokens": 0,
+                "cost_in_dollars": cost,
+                "status": "SUCCESS",
+            }
+            with self._usage_lock:
+                self._pending_usage.append(record)
+
+    def _take_embedding_tokens(self, event_id: str) -> int:
+        """Sum and remove the token counter's entries for this embedding call.
+
+        Entries of other calls stay put, so concurrent calls on a shared
+        embedding instance each record only their own tokens. The counter's
+        list is only changed in place, which is safe next to its appends.
+        """
+        if not event_id:
+            with self._usage_lock:
+                tokens = self.token_counter.total_embedding_token_count
+                self.token_counter.reset_counts()
+            return tokens
+        counts = self.token_counter.embedding_token_counts
+        with self._usage_lock:
+            mine = [count for count in list(counts) if count.event_id == event_id]
+            for count in mine:
+                counts.remove(count)
+        return sum(count.total_token_count for count in mine)
 
     def flush_pending_usage(self) -> list[dict]:
         """Return and clear all pending usage records."""
-        records = self._pending_usage
-        self._pending_usage = []
+        with self._usage_lock:
+            records, self._pending_usage = self._pending_usage, []
         return records
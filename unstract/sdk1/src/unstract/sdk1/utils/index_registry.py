@@ -0,0 +1,71 @@
+"""Local, persisted record of the documents this host has indexed.
+
+Fallback for vector stores that can't answer "is ``doc_id`` indexed?" with a
+metadata-only lookup (see :meth:`VectorDBAdapter.doc_exists`). Without it such
+stores need a blank-query embedding plus a filtered similarity query for every
+re-run of an already-indexed file.
+
+Entries are empty marker files ``<root>/<namespace digest>/<doc_id>``: the
+namespace identifies the vector store collection (adapter instance, collection
+name, embedding dimension) and ``doc_id`` is the ``generate_index_key`` hash, so
+a hit means "this exact file + adapter config + chunking was indexed into this
+collection". Creating / removing a file is atomic, so concurrent workers on one
+host need no locking.
+
+Opt-in via ``UNSTRACT_INDEX_REGISTRY_DIR``. The registry only knows what went
+through this host's :class:`VectorDB`; nodes deleted directly in the store are
+not seen, so only enable it where the store is managed through Unstract.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INDEX_REGISTRY_DIR_ENV = "UNSTRACT_INDEX_REGISTRY_DIR"
+
+
+def _safe_name(value: str) -> str:
+    # Index keys are sha256 hex digests; anything else is digested so it can
+    # never escape the registry directory.
+    if value and value.isalnum():
+        return value
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+class IndexRegistry:
+    def __init__(self, root: str | Path) -> None:
+        """Use ``root`` as the registry directory (created lazily on record)."""
+        self._root = Path(root)
+
+    @classmethod
+    def from_env(cls) -> IndexRegistry | None:
+        """The registry at ``UNSTRACT_INDEX_REGISTRY_DIR``, or None if unset."""
+        root = os.environ.get(INDEX_REGISTRY_DIR_ENV, "").strip()
+        return cls(root) if root else None
+
+    def _marker(self, namespace: str, doc_id: str) -> Path:
+        digest = hashlib.sha256(namespace.encode()).hexdigest()[:32]
+        return self._root / digest / _safe_name(doc_id)
+
+    def contains(self, namespace: str, doc_id: str) -> bool:
+        return self._marker(namespace, doc_id).exists()
+
+    def record(self, namespace: str, doc_id: str) -> None:
+        """Mark ``doc_id`` as indexed; failures are logged, never raised."""
+        marker = self._marker(namespace, doc_id)
+        try:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch(exist_ok=True)
+        except OSError:
+            logger.warning("Could not record %s in the index registry", doc_id)
+
+    def forget(self, namespace: str, doc_id: str) -> None:
+        try:
+            self._marker(namespace, doc_id).unlink(missing_ok=True)
+        except OSError:
+            logger.warning("Could not remove %s from the index registry", doc_id)
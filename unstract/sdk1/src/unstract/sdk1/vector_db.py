@@ -19,6 +19,7 @@ from unstract.sdk1.embedding import EmbeddingCompat
 from unstract.sdk1.exceptions import SdkError, VectorDBError
 from unstract.sdk1.platform import PlatformHelper
 from unstract.sdk1.tool.base import BaseTool
+from unstract.sdk1.utils.index_registry import IndexRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,8 @@ class VectorDB:
         self._vector_db_instance = None
         self._embedding_instance = None
         self._embedding_dimension = VectorDB.DEFAULT_EMBEDDING_DIMENSION
+        self._index_registry = IndexRegistry.from_env()
+        self._registry_namespace = ""
         self._initialise(embedding)
 
     def _initialise(self, embedding: EmbeddingCompat | None = None) -> None:
@@ -106,6 +109,15 @@ class VectorDB:
             vector_db_metadata[VectorDbConstants.EMBEDDING_DIMENSION] = (
                 self._embedding_dimension
             )
+            # Same inputs that pick the collection, so registry entries never
+            # leak across orgs or embedding dimensions
+            self._registry_namespace = ":".join(
+                [
+                    self._adapter_instance_id,
+                    str(vector_db_metadata.get(VectorDbConstants.VECTOR_DB_NAME, "")),
+                    str(self._embedding_dimension),
+                ]
+            )
 
             self.vector_db_adapter_class = vector_db_adapter(vector_db_metadata)
             return self.vector_db_adapter_class.get_vector_db_instance()
@@ -147,7 +159,7 @@ class VectorDB:
         if callback_manager is not None:
             index_kwargs_with_callback["callback_manager"] = callback_manager
 
-        return VectorStoreIndex.from_documents(
+        index = VectorStoreIndex.from_documents(
             documents,
             storage_context=storage_context,
             show_progress=show_progress,
@@ -155,6 +167,9 @@ class VectorDB:
             transformations=[parser],
             **index_kwargs_with_callback,
         )
+        for doc_id in {document.doc_id for document in documents}:
+            self.record_indexed(doc_id)
+        return index
 
     def get_vector_store_index(self, **kwargs: object) -> VectorStoreIndex:
         if not self._embedding_instance:
@@ -188,6 +203,8 @@ class VectorDB:
         self.vector_db_adapter_class.delete(
             ref_doc_id=ref_doc_id, delete_kwargs=delete_kwargs
         )
+        if self._index_registry:
+            self._index_registry.forget(self._registry_namespace, ref_doc_id)
 
     def add(
         self,
@@ -200,6 +217,40 @@ class VectorDB:
             ref_doc_id=ref_doc_id,
             nodes=nodes,
         )
+        self.record_indexed(ref_doc_id)
+
+    def doc_exists(self, doc_id: str) -> bool | None:
+        """Checks if nodes of ``doc_id`` are stored, without embedding a query.
+
+        Asks the adapter for a metadata-only lookup first, then the local
+        index registry (``UNSTRACT_INDEX_REGISTRY_DIR``) if one is configured.
+
+        Args:
+            doc_id (str): Index key the document's nodes were stored under
+
+        Returns:
+            bool | None: None if neither source can tell; callers then fall
+                back to a ``doc_id`` filtered query
+        """
+        try:
+            exists = self.vector_db_adapter_class.doc_exists(doc_id)
+        except Exception as e:
+            logger.warning(f"Metadata lookup for {doc_id} failed: {e}")
+            exists = None
+        if exists is not None:
+            if self._index_registry and not exists:
+                self._index_registry.forget(self._registry_namespace, doc_id)
+            return exists
+        if self._index_registry and self._index_registry.contains(
+            self._registry_namespace, doc_id
+        ):
+            return True
+        return None
+
+    def record_indexed(self, doc_id: str) -> None:
+        """Records ``doc_id`` in the local index registry, if one is configured."""
+        if self._index_registry and self._registry_namespace:
+            self._index_registry.record(self._registry_namespace, doc_id)
 
     def close(self, **kwargs: object) -> None:
         if not self.vector_db_adapter_class:
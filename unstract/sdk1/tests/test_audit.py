@@ -0,0 +1,96 @@
+"""Tests for buffered usage pushes in Audit."""
+
+import argparse
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from requests.exceptions import ConnectionError
+from unstract.sdk1 import audit
+from unstract.sdk1.audit import Audit
+from unstract.sdk1.constants import LogLevel
+from unstract.sdk1.tool import executor as tool_executor
+from unstract.sdk1.tool.executor import ToolExecutor
+
+
+class TestUsageBuffer:
+    """Usage records are sent to /usage/batch once a batch is full."""
+
+    @pytest.fixture(autouse=True)
+    def _env(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("PLATFORM_SERVICE_HOST", "http://localhost")
+        monkeypatch.setenv("PLATFORM_SERVICE_PORT", "3001")
+        monkeypatch.setenv("PLATFORM_USAGE_BATCH_SIZE", "3")
+        monkeypatch.setattr(audit, "_usage_buffer", audit._UsageBuffer())
+
+    @staticmethod
+    def _push(n: int) -> None:
+        token_counter = MagicMock(
+            prompt_llm_token_count=10,
+            completion_llm_token_count=5,
+            total_llm_token_count=15,
+            total_embedding_token_count=0,
+        )
+        for _ in range(n):
+            Audit().push_usage_data(
+                platform_api_key="org-key",
+                token_counter=token_counter,
+                event_type="llm",
+                kwargs={"run_id": "run-1"},
+            )
+
+    def test_records_sent_once_batch_is_full(self) -> None:
+        with patch("requests.post", return_value=Mock(status_code=200)) as mock_post:
+            self._push(2)
+            assert mock_post.call_count == 0
+
+            self._push(1)
+
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.args[0] == "http://localhost:3001/usage/batch"
+        records = mock_post.call_args.kwargs["json"]["records"]
+        assert len(records) == 3
+        assert len({record["id"] for record in records}) == 3
+
+    def test_failed_flush_resent_with_same_ids(self) -> None:
+        with patch("requests.post", side_effect=ConnectionError("down")):
+            self._push(3)
+
+        with patch("requests.post", return_value=Mock(status_code=200)) as mock_post:
+            Audit().flush_usage_data()
+            Audit().flush_usage_data()
+
+        assert mock_post.call_count == 1
+        assert len(mock_post.call_args.kwargs["json"]["records"]) == 3
+
+    def test_unbuffered_by_default(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.delenv("PLATFORM_USAGE_BATCH_SIZE")
+        with patch("requests.post", return_value=Mock(status_code=200)) as mock_post:
+            self._push(2)
+
+        assert mock_post.call_count == 2
+        assert mock_post.call_args.args[0] == "http://localhost:3001/usage"
+
+    @pytest.mark.parametrize("run_error", [None, RuntimeError("boom")])
+    def test_tool_run_flushes_buffered_records(
+        self, monkeypatch: MonkeyPatch, run_error: Exception | None
+    ) -> None:
+        monkeypatch.setattr(tool_executor, "ToolValidator", MagicMock())
+        tool = MagicMock(log_level=LogLevel.INFO)
+        tool.properties = {"displayName": "Test Tool", "toolVersion": "1.0"}
+        args = argparse.Namespace(command="RUN", settings=json.dumps({}))
+
+        def run(**_: object) -> None:
+            self._push(2)
+            if run_error:
+                raise run_error
+
+        tool.run.side_effect = run
+        with patch("requests.post", return_value=Mock(status_code=200)) as mock_post:
+            ToolExecutor(tool=tool).execute(args)
+
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.args[0] == "http://localhost:3001/usage/batch"
+        assert len(mock_post.call_args.kwargs["json"]["records"]) == 2
+        assert tool.stream_error_and_exit.called is bool(run_error)
@@ -0,0 +1,66 @@
+"""Tests for LLM.fork — shared adapter, per-fork usage state."""
+
+from typing import Self
+from unittest.mock import MagicMock
+
+from unstract.sdk1.llm import LLM
+
+
+def _resolved_llm() -> LLM:
+    """An LLM as left by __init__, without the adapter-config fetch."""
+    llm = LLM.__new__(LLM)
+    llm.adapter = MagicMock()
+    llm.kwargs = {"model": "gpt-4o", "temperature": 0}
+    llm.platform_kwargs = {"run_id": "run-1", "llm_usage_reason": "extraction"}
+    llm._tool = MagicMock(name="tool")
+    llm._metrics = {"time_taken(s)": 1.5}
+    llm._pending_usage = [{"total_tokens": 7}]
+    return llm
+
+
+class TestLLMFork:
+    def test_fork_shares_adapter_with_fresh_usage(self: Self) -> None:
+        llm = _resolved_llm()
+        fork = llm.fork()
+
+        assert fork is not llm
+        assert fork.adapter is llm.adapter
+        assert fork.kwargs == llm.kwargs and fork.kwargs is not llm.kwargs
+        assert fork.platform_kwargs == llm.platform_kwargs
+        assert fork.get_metrics() == {}
+        assert fork.flush_pending_usage() == []
+        # The original's state is untouched.
+        assert llm.get_metrics() == {"time_taken(s)": 1.5}
+        assert llm.flush_pending_usage() == [{"total_tokens": 7}]
+
+    def test_fork_usage_does_not_leak_back(self: Self) -> None:
+        llm = _resolved_llm()
+        fork = llm.fork()
+        fork._pending_usage.append({"total_tokens": 3})
+        fork.platform_kwargs["run_id"] = "other"
+
+        assert llm._pending_usage == [{"total_tokens": 7}]
+        assert llm.platform_kwargs["run_id"] == "run-1"
+
+    def test_fork_rebinds_tool(self: Self) -> None:
+        llm = _resolved_llm()
+        tool = MagicMock(name="prompt-tool")
+        assert llm.fork(tool=tool)._tool is tool
+        assert llm.fork()._tool is llm._tool
+
+
+class TestSkippedCompletionUsage:
+    def test_records_skipped_row_without_tokens(self: Self) -> None:
+        llm = _resolved_llm()
+        llm._usage_kwargs = {}
+        llm._cost_model = None
+        llm._pending_usage = []
+
+        llm.record_skipped_completion()
+
+        (record,) = llm.flush_pending_usage()
+        assert record["status"] == "SKIPPED"
+        assert record["model_name"] == "gpt-4o"
+        assert record["llm_usage_reason"] == "extraction"
+        assert record["total_tokens"] == 0
+        assert record["cost_in_dollars"] == 0.0
@@ -1,12 +1,14 @@
 """Integration tests for platform module with retry logic."""
 
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+import redis
 from _pytest.monkeypatch import MonkeyPatch
 from requests.exceptions import ConnectionError, HTTPError
 from unstract.sdk1.exceptions import SdkError
-from unstract.sdk1.platform import PlatformHelper
+from unstract.sdk1.platform import PlatformHelper, _adapter_versions
 
 
 class TestPlatformHelperRetry:
@@ -231,3 +233,125 @@ class TestPlatformHelperRetry:
             mock_tool.stream_log.assert_called()
             log_calls = [str(c) for c in mock_tool.stream_log.call_args_list]
             assert any("retry" in call.lower() for call in log_calls)
+
+
+class TestAdapterConfigCache:
+    """Tests for the process-level adapter config cache."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.delenv("ADAPTER_CONFIG_CACHE_TTL", raising=False)
+        monkeypatch.delenv("REDIS_HOST", raising=False)
+        monkeypatch.setattr(_adapter_versions, "_client", None)
+        monkeypatch.setattr(_adapter_versions, "_retry_at", 0.0)
+        PlatformHelper.invalidate_adapter_config()
+        yield
+        PlatformHelper.invalidate_adapter_config()
+
+    @pytest.fixture
+    def mock_tool(self) -> MagicMock:
+        tool = MagicMock()
+        tool.get_env_or_die.side_effect = lambda key: {
+            "PLATFORM_SERVICE_HOST": "http://localhost",
+            "PLATFORM_SERVICE_PORT": "3001",
+            "PLATFORM_SERVICE_API_KEY": "org-key",
+        }[key]
+        return tool
+
+    @staticmethod
+    def _response() -> Mock:
+        response = Mock()
+        response.json.side_effect = lambda: {
+            "adapter_id": "openai|x",
+            "adapter_name": "gpt",
+            "adapter_metadata": {"model": "gpt-4o"},
+        }
+        return response
+
+    def test_config_fetched_once_and_copied(self, mock_tool: MagicMock) -> None:
+        with patch("requests.get", return_value=self._response()) as mock_get:
+            first = PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            first["adapter_metadata"]["model"] = "mutated"
+            second = PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+
+        assert mock_get.call_count == 1
+        assert second["adapter_metadata"]["model"] == "gpt-4o"
+
+    def test_invalidate_and_ttl_zero_refetch(
+        self, mock_tool: MagicMock, monkeypatch: MonkeyPatch
+    ) -> None:
+        with patch("requests.get", return_value=self._response()) as mock_get:
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            PlatformHelper.invalidate_adapter_config("adapter-1")
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            assert mock_get.call_count == 2
+
+            monkeypatch.setenv("ADAPTER_CONFIG_CACHE_TTL", "0")
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            assert mock_get.call_count == 3
+
+    def test_update_elsewhere_refetched_before_ttl(self, mock_tool: MagicMock) -> None:
+        versions: dict[str, int] = {}
+        shared_redis = Mock()
+        shared_redis.get.side_effect = lambda key: (
+            str(versions[key]) if key in versions else None
+        )
+        shared_redis.incr.side_effect = lambda key: versions.update(
+            {key: versions.get(key, 0) + 1}
+        )
+
+        with (
+            patch.object(_adapter_versions, "_redis", return_value=shared_redis),
+            patch("requests.get", return_value=self._response()) as mock_get,
+        ):
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            assert mock_get.call_count == 1
+
+            # Another process (the backend) saved the adapter
+            _adapter_versions.bump("adapter-1")
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            assert mock_get.call_count == 2
+
+        assert versions == {"adapter_config_version:adapter-1": 1}
+
+    def test_unreachable_redis_falls_back_to_ttl(
+        self, mock_tool: MagicMock, monkeypatch: MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        broken_redis = Mock()
+        broken_redis.get.side_effect = redis.ConnectionError("refused")
+
+        with (
+            patch(
+                "unstract.sdk1.platform.create_redis_client", return_value=broken_redis
+            ) as create_client,
+            patch("requests.get", return_value=self._response()) as mock_get,
+        ):
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+
+        assert mock_get.call_count == 1
+        # Not retried on every lookup while Redis is down
+        assert create_client.call_count == 1
+        assert broken_redis.get.call_count == 1
+
+    def test_expired_config_revalidated_with_etag(
+        self, mock_tool: MagicMock, monkeypatch: MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ADAPTER_CONFIG_CACHE_TTL", "0.001")
+        fetched = self._response()
+        fetched.status_code = 200
+        fetched.headers = {"ETag": '"v1"'}
+        not_modified = Mock(status_code=304)
+
+        with patch("requests.get", side_effect=[fetched, not_modified]) as mock_get:
+            first = PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            time.sleep(0.01)
+            second = PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+
+        assert second == first
+        assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        not_modified.json.assert_not_called()
@@ -0,0 +1,43 @@
+"""Tests for embedding usage rows recorded by UsageHandler."""
+
+import threading
+import uuid
+from unittest.mock import MagicMock, patch
+
+from llama_index.core.callbacks import CBEventType, EventPayload, TokenCountingHandler
+from unstract.sdk1.usage_handler import UsageHandler
+
+
+def test_concurrent_embedding_calls_count_each_token_once() -> None:
+    # Both handlers are shared, as for an embedding instance pooled across the
+    # concurrently running prompts of one answer_prompt run.
+    token_counter = TokenCountingHandler(tokenizer=str.split)
+    handler = UsageHandler(
+        platform_api_key="org-key",
+        token_counter=token_counter,
+        embed_model=MagicMock(model_name="openai/text-embedding-3-small"),
+        kwargs={"run_id": "run-1"},
+    )
+    threads, calls = 8, 50
+    payload = {EventPayload.CHUNKS: ["one two three", "four five"]}
+    flushed: list[dict] = []
+    start = threading.Barrier(threads)
+
+    def embed() -> None:
+        start.wait()
+        for _ in range(calls):
+            event_id = str(uuid.uuid4())
+            token_counter.on_event_end(CBEventType.EMBEDDING, payload, event_id)
+            handler.on_event_end(CBEventType.EMBEDDING, payload, event_id)
+            flushed.extend(handler.flush_pending_usage())
+
+    with patch("litellm.cost_per_token", return_value=(0.0, 0.0)):
+        workers = [threading.Thread(target=embed) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    flushed.extend(handler.flush_pending_usage())
+    assert [r["embedding_tokens"] for r in flushed] == [5] * (threads * calls)
+    assert token_counter.embedding_token_counts == []
@@ -0,0 +1,81 @@
+"""Tests for VectorDB.doc_exists and the local index registry fallback."""
+
+from pathlib import Path
+from typing import Self
+from unittest.mock import MagicMock
+
+import pytest
+from unstract.sdk1.utils.index_registry import (
+    INDEX_REGISTRY_DIR_ENV,
+    IndexRegistry,
+)
+from unstract.sdk1.vector_db import VectorDB
+
+
+def _vector_db(adapter_exists: bool | None, registry: IndexRegistry | None) -> VectorDB:
+    """A VectorDB as left by __init__, without the adapter-config fetch."""
+    vector_db = VectorDB.__new__(VectorDB)
+    vector_db.vector_db_adapter_class = MagicMock()
+    vector_db.vector_db_adapter_class.doc_exists.return_value = adapter_exists
+    vector_db._index_registry = registry
+    vector_db._registry_namespace = "vdb-1:org-1:1536"
+    return vector_db
+
+
+class TestIndexRegistry:
+    def test_record_contains_forget(self: Self, tmp_path: Path) -> None:
+        registry = IndexRegistry(tmp_path)
+        assert not registry.contains("ns", "abc123")
+
+        registry.record("ns", "abc123")
+        assert registry.contains("ns", "abc123")
+        assert not registry.contains("other-ns", "abc123")
+
+        registry.forget("ns", "abc123")
+        assert not registry.contains("ns", "abc123")
+
+    def test_unsafe_doc_id_stays_inside_root(self: Self, tmp_path: Path) -> None:
+        registry = IndexRegistry(tmp_path / "registry")
+        registry.record("ns", "../../escape")
+        assert registry.contains("ns", "../../escape")
+        assert not (tmp_path / "escape").exists()
+
+    def test_from_env(
+        self: Self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv(INDEX_REGISTRY_DIR_ENV, raising=False)
+        assert IndexRegistry.from_env() is None
+        monkeypatch.setenv(INDEX_REGISTRY_DIR_ENV, str(tmp_path))
+        assert isinstance(IndexRegistry.from_env(), IndexRegistry)
+
+
+class TestVectorDBDocExists:
+    @pytest.mark.parametrize("exists", [True, False])
+    def test_adapter_lookup_wins(self: Self, tmp_path: Path, exists: bool) -> None:
+        registry = IndexRegistry(tmp_path)
+        vector_db = _vector_db(exists, registry)
+        registry.record(vector_db._registry_namespace, "doc-1")
+
+        assert vector_db.doc_exists("doc-1") is exists
+        # A negative answer from the store drops the stale registry entry
+        assert registry.contains(vector_db._registry_namespace, "doc-1") is exists
+
+    def test_registry_fallback(self: Self, tmp_path: Path) -> None:
+        vector_db = _vector_db(None, IndexRegistry(tmp_path))
+        assert vector_db.doc_exists("doc-1") is None
+
+        vector_db.record_indexed("doc-1")
+        assert vector_db.doc_exists("doc-1") is True
+
+    def test_lookup_error_is_unknown(self: Self) -> None:
+        vector_db = _vector_db(None, None)
+        vector_db.vector_db_adapter_class.doc_exists.side_effect = RuntimeError("down")
+        assert vector_db.doc_exists("doc-1") is None
+
+    def test_delete_forgets(self: Self, tmp_path: Path) -> None:
+        vector_db = _vector_db(None, IndexRegistry(tmp_path))
+        vector_db.record_indexed("doc-1")
+
+        vector_db.delete(ref_doc_id="doc-1")
+
+        assert vector_db.doc_exists("doc-1") is None
@@ -131,9 +131,11 @@ class ToolSandboxHelper:
                 execution_id=self.execution_id, file_execution_id=file_execution_id
             )
 
-        # Configurable polling values
+        # Configurable polling values. Between runner polls we block on the
+        # completion signal from the tool sidecar, so the runner poll is only
+        # a backstop for tools that exit without signalling.
         max_wait_seconds = int(os.getenv("MAX_RUNNER_POLLING_WAIT_SECONDS", 60 * 60 * 3))
-        interval_seconds = int(os.getenv("RUNNER_POLLING_INTERVAL_SECONDS", 2))
+        interval_seconds = int(os.getenv("RUNNER_POLLING_INTERVAL_SECONDS", 10))
         start_time = datetime.now(UTC)
         end_time = start_time + timedelta(seconds=max_wait_seconds)
         response: RunnerContainerRunResponse | None = None
@@ -224,22 +226,20 @@ class ToolSandboxHelper:
                     not_found_first_seen = None
 
             if status and status.get("status") in COMPLETED_FINAL_STATUSES:
-                error = self._handle_tool_execution_status(
-                    execution_id=self.execution_id,
+                response = self._create_completed_run_response(
                     file_execution_id=file_execution_id,
                     container_name=file_execution_data.tool_container_name,
                 )
-                if error:
-                    response = self._create_run_response(
-                        status=RunnerContainerRunStatus.ERROR,
-                        error=error,
-                    )
-                    break
-                response = self._create_run_response(
-                    status=RunnerContainerRunStatus.SUCCESS,
+                break
+            if self._wait_for_tool_completion(file_execution_id, interval_seconds):
+                logger.info(
+                    f"Tool completion signalled for execution_id: {self.execution_id} and file_execution_id: {file_execution_id}"
+                )
+                response = self._create_completed_run_response(
+                    file_execution_id=file_execution_id,
+                    container_name=file_execution_data.tool_container_name,
                 )
                 break
-            time.sleep(interval_seconds)
 
         if not response:
             logger.error(
@@ -257,6 +257,59 @@ class ToolSandboxHelper:
             )
         return response
 
+    def _wait_for_tool_completion(
+        self, file_execution_id: str, timeout_seconds: float
+    ) -> bool:
+        """Wait up to timeout_seconds for the sidecar's completion signal.
+
+        Falls back to sleeping if the signal can't be read, so the runner poll
+        keeps its pace.
+        """
+        start = time.monotonic()
+        try:
+            return ToolExecutionTracker().wait_for_completion(
+                ToolExecutionData(
+                    execution_id=self.execution_id,
+                    file_execution_id=file_execution_id,
+                ),
+                timeout_in_second=timeout_seconds,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to wait for tool completion signal for execution_id: {self.execution_id}, file_execution_id: {file_execution_id}: {e}"
+            )
+            time.sleep(max(timeout_seconds - (time.monotonic() - start), 0))
+            return False
+
+    def _clear_tool_completion(self, file_execution_id: str) -> None:
+        """Drop a completion signal left by an earlier run of this file."""
+        try:
+            ToolExecutionTracker().clear_completion(
+                ToolExecutionData(
+                    execution_id=self.execution_id,
+                    file_execution_id=file_execution_id,
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to clear tool completion signal for execution_id: {self.execution_id}, file_execution_id: {file_execution_id}: {e}"
+            )
+
+    def _create_completed_run_response(
+        self, file_execution_id: str, container_name: str
+    ) -> RunnerContainerRunResponse:
+        error = self._handle_tool_execution_status(
+            execution_id=self.execution_id,
+            file_execution_id=file_execution_id,
+            container_name=container_name,
+        )
+        if error:
+            return self._create_run_response(
+                status=RunnerContainerRunStatus.ERROR,
+                error=error,
+            )
+        return self._create_run_response(status=RunnerContainerRunStatus.SUCCESS)
+
     def call_tool_handler(
         self,
         file_execution_id: str,
@@ -594,6 +647,7 @@ class ToolSandboxHelper:
         data = self.create_tool_request_data(
             file_execution_id, image_name, image_tag, settings, retry_count
         )
+        self._clear_tool_completion(file_execution_id)
 
         response: Response = Response()
         try:
@@ -0,0 +1,188 @@
+"""Per-execution adapter pool for the answer_prompt path.
+
+Every prompt of an ``answer_prompt`` run used to build its own ``LLM``,
+``EmbeddingCompat`` and ``VectorDB``: each construction fetches the adapter
+config from the platform service, ``EmbeddingCompat`` additionally embeds a
+test snippet (a paid call), and ``VectorDB`` opens a fresh vector-store client.
+Prompts of one project almost always share adapter IDs, so the pool builds each
+adapter once per ``ExecutionContext`` and hands it out again:
+
+- ``EmbeddingCompat`` / ``VectorDB`` are shared as-is. Their usage rows are
+  tagged with the run's ``run_id`` / ``execution_id`` (identical for every
+  prompt), so flushing after each prompt still drains every row exactly once.
+  The embedding usage handler attributes tokens per call, so concurrent
+  prompts sharing one instance don't lose or double-count them.
+- ``LLM`` carries per-prompt metrics and pending usage, so every request after
+  the first gets an ``LLM.fork()``: the same resolved adapter, its own usage.
+
+The pool also memoizes each prompt's index key (doc_id): deriving it fetches
+three adapter configs and may hash the whole input file, yet it only depends on
+the file and the (vector DB, embedding, x2text, chunking) combination.
+
+Keys include the platform API key (i.e. the org) and the usage kwargs, so two
+contexts can never share an instance by accident. The pool is deliberately not
+worker-wide: adapter configs can change between runs and vector-store clients
+are org-scoped. :meth:`AdapterPool.close` closes every vector DB it opened.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _freeze(kwargs: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((str(k), repr(v)) for k, v in kwargs.items()))
+
+
+class AdapterPool:
+    """Adapter instances shared by the prompts of one ``ExecutionContext``.
+
+    Thread-safe: concurrent prompts asking for the same adapter wait for a
+    single build instead of each constructing their own. A failed build is not
+    cached, so the next prompt retries it.
+    """
+
+    def __init__(
+        self,
+        llm_cls: Any,
+        embedding_compat_cls: Any,
+        vector_db_cls: Any,
+        platform_api_key: str = "",
+    ) -> None:
+        self._llm_cls = llm_cls
+        self._embedding_compat_cls = embedding_compat_cls
+        self._vector_db_cls = vector_db_cls
+        self._platform_api_key = platform_api_key
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple, threading.Lock] = {}
+        self._instances: dict[tuple, Any] = {}
+        self._vector_dbs: list[Any] = []
+
+    def _get_or_build(self, key: tuple, build: Callable[[], Any]) -> tuple[Any, bool]:
+        """Return ``(instance, built_now)`` for ``key``, building it at most once."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key in self._instances:
+                return self._instances[key], False
+            instance = build()
+            self._instances[key] = instance
+            return instance, True
+
+    def llm(
+        self,
+        adapter_instance_id: str,
+        tool: Any,
+        usage_kwargs: dict[str, Any],
+    ) -> Any:
+        """An LLM for one prompt: the pooled instance's first use, else a fork."""
+        key = ("llm", adapter_instance_id, self._platform_api_key, _freeze(usage_kwargs))
+        llm, built = self._get_or_build(
+            key,
+            lambda: self._llm_cls(
+                adapter_instance_id=adapter_instance_id,
+                tool=tool,
+                usage_kwargs=usage_kwargs,
+                capture_metrics=True,
+            ),
+        )
+        return llm if built else llm.fork(tool=tool)
+
+    def embedding(
+        self,
+        adapter_instance_id: str,
+        tool: Any,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        key = ("embedding", adapter_instance_id, self._platform_api_key, _freeze(kwargs))
+        embedding, _ = self._get_or_build(
+            key,
+            lambda: self._embedding_compat_cls(
+                adapter_instance_id=adapter_instance_id, tool=tool, kwargs=kwargs
+            ),
+        )
+        return embedding
+
+    def vector_db(
+        self,
+        adapter_instance_id: str,
+        embedding_instance_id: str,
+        tool: Any,
+        embedding: Any,
+    ) -> Any:
+        """A shared vector DB; keyed on the embedding too (it fixes the dimension)."""
+        key = (
+            "vector_db",
+            adapter_instance_id,
+            embedding_instance_id,
+            self._platform_api_key,
+        )
+        vector_db, built = self._get_or_build(
+            key,
+            lambda: self._vector_db_cls(
+                tool=tool,
+                adapter_instance_id=adapter_instance_id,
+                embedding=embedding,
+            ),
+        )
+        if built:
+            with self._lock:
+                self._vector_dbs.append(vector_db)
+        return vector_db
+
+    def index_key(
+        self,
+        tool: Any,
+        *,
+        vector_db: str,
+        embedding: str,
+        x2text: str,
+        chunk_size: str,
+        chunk_overlap: str,
+        file_hash: str | None = None,
+        file_path: str | None = None,
+    ) -> str:
+        """``IndexingUtils.generate_index_key``, computed once per combination."""
+        from unstract.sdk1.utils.indexing import IndexingUtils
+
+        key = (
+            "index_key",
+            self._platform_api_key,
+            vector_db,
+            embedding,
+            x2text,
+            str(chunk_size),
+            str(chunk_overlap),
+            file_hash or "",
+            # Only identifies the file when there's no hash; it can't change
+            # within one execution
+            "" if file_hash else (file_path or ""),
+        )
+        doc_id, _ = self._get_or_build(
+            key,
+            lambda: IndexingUtils.generate_index_key(
+                vector_db=vector_db,
+                embedding=embedding,
+                x2text=x2text,
+                chunk_size=str(chunk_size),
+                chunk_overlap=str(chunk_overlap),
+                tool=tool,
+                file_hash=file_hash,
+                file_path=file_path,
+            ),
+        )
+        return doc_id
+
+    def close(self) -> None:
+        """Close every vector DB the pool opened (best-effort, each guarded)."""
+        with self._lock:
+            vector_dbs, self._vector_dbs = self._vector_dbs, []
+            self._instances.clear()
+        for vector_db in vector_dbs:
+            try:
+                vector_db.close()
+            except Exception:
+                logger.warning("Failed to close pooled vector DB", exc_info=True)
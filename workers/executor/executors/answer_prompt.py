@@ -115,6 +115,8 @@ class AnswerPromptService:
         file_path: str = "",
         execution_source: str | None = "ide",
         process_text: Any = None,
+        completion_cache: Any = None,
+        doc_id: str | None = None,
     ) -> str:
         """Construct the full prompt and run LLM completion.
 
@@ -129,6 +131,8 @@ class AnswerPromptService:
             execution_source: "ide" or "tool".
             process_text: Optional callback for text processing during
                 completion (e.g. highlight-data plugin's ``run`` method).
+            completion_cache: Optional ``CompletionCache`` of the org.
+            doc_id: Index key of the document, part of the cache key.
 
         Returns:
             The LLM answer string.
@@ -170,6 +174,8 @@ class AnswerPromptService:
             file_path=file_path,
             execution_source=execution_source,
             process_text=process_text,
+            completion_cache=completion_cache,
+            doc_id=doc_id,
         )
 
     @staticmethod
@@ -230,6 +236,8 @@ class AnswerPromptService:
         file_path: str = "",
         execution_source: str | None = None,
         process_text: Any = None,
+        completion_cache: Any = None,
+        doc_id: str | None = None,
     ) -> str:
         """Run LLM completion and extract the answer.
 
@@ -238,6 +246,10 @@ class AnswerPromptService:
                 completion (e.g. highlight-data plugin's ``run`` method).
                 When provided, the SDK passes LLM response text through
                 this callback, enabling source attribution.
+            completion_cache: Optional ``CompletionCache``; a cached answer
+                for the same document, prompt and LLM config is returned
+                without calling the provider.
+            doc_id: Index key of the document, part of the cache key.
         """
         try:
             from unstract.sdk1.exceptions import RateLimitError as _sdk_rate_limit_error
@@ -246,32 +258,45 @@ class AnswerPromptService:
             _sdk_rate_limit_error = Exception
             _sdk_error = Exception
 
+        extract_json = prompt_type.lower() != PSKeys.TEXT
+        cache_key = None
+        if completion_cache is not None:
+            cache_key = completion_cache.build_key(
+                doc_id,
+                prompt,
+                llm,
+                extract_json=extract_json,
+                enable_highlight=enable_highlight,
+                enable_word_confidence=enable_word_confidence,
+            )
+            cached = completion_cache.lookup(cache_key)
+            if cached is not None:
+                llm.record_skipped_completion()
+                AnswerPromptService._record_completion_metadata(
+                    cached, metadata, prompt_key, enable_word_confidence
+                )
+                return cached[PSKeys.RESPONSE]
+
         try:
             completion = llm.complete(
                 prompt=prompt,
                 process_text=process_text,
-                extract_json=prompt_type.lower() != PSKeys.TEXT,
+                extract_json=extract_json,
             )
             answer: str = completion[PSKeys.RESPONSE].text
-            highlight_data = completion.get(PSKeys.HIGHLIGHT_DATA, [])
-            confidence_data = completion.get(PSKeys.CONFIDENCE_DATA)
-            word_confidence_data = completion.get(PSKeys.WORD_CONFIDENCE_DATA)
-            line_numbers = completion.get(PSKeys.LINE_NUMBERS, [])
-            whisper_hash = completion.get(PSKeys.WHISPER_HASH, "")
-            if metadata is not None and prompt_key:
-                metadata.setdefault(PSKeys.HIGHLIGHT_DATA, {})[prompt_key] = (
-                    highlight_data
-                )
-                metadata.setdefault(PSKeys.LINE_NUMBERS, {})[prompt_key] = line_numbers
-                metadata[PSKeys.WHISPER_HASH] = whisper_hash
-                if confidence_data:
-                    metadata.setdefault(PSKeys.CONFIDENCE_DATA, {})[prompt_key] = (
-                        confidence_data
-                    )
-                if enable_word_confidence and word_confidence_data:
-                    metadata.setdefault(PSKeys.WORD_CONFIDENCE_DATA, {})[prompt_key] = (
-                        word_confidence_data
-                    )
+            result = {
+                PSKeys.RESPONSE: answer,
+                PSKeys.HIGHLIGHT_DATA: completion.get(PSKeys.HIGHLIGHT_DATA, []),
+                PSKeys.CONFIDENCE_DATA: completion.get(PSKeys.CONFIDENCE_DATA),
+                PSKeys.WORD_CONFIDENCE_DATA: completion.get(PSKeys.WORD_CONFIDENCE_DATA),
+                PSKeys.LINE_NUMBERS: completion.get(PSKeys.LINE_NUMBERS, []),
+                PSKeys.WHISPER_HASH: completion.get(PSKeys.WHISPER_HASH, ""),
+            }
+            AnswerPromptService._record_completion_metadata(
+                result, metadata, prompt_key, enable_word_confidence
+            )
+            if completion_cache is not None:
+                completion_cache.store(cache_key, result)
             return answer
         except _sdk_rate_limit_error as e:
             raise RateLimitError(f"Rate limit error. {str(e)}") from e
@@ -280,6 +305,32 @@ class AnswerPromptService:
             status_code = getattr(e, "status_code", None) or 500
             raise LegacyExecutorError(message=str(e), code=status_code) from e
 
+    @staticmethod
+    def _record_completion_metadata(
+        result: dict[str, Any],
+        metadata: dict[str, Any] | None,
+        prompt_key: str | None,
+        enable_word_confidence: bool,
+    ) -> None:
+        """Copy a completion's highlight / confidence data into ``metadata``."""
+        if metadata is None or not prompt_key:
+            return
+        metadata.setdefault(PSKeys.HIGHLIGHT_DATA, {})[prompt_key] = result[
+            PSKeys.HIGHLIGHT_DATA
+        ]
+        metadata.setdefault(PSKeys.LINE_NUMBERS, {})[prompt_key] = result[
+            PSKeys.LINE_NUMBERS
+        ]
+        metadata[PSKeys.WHISPER_HASH] = result[PSKeys.WHISPER_HASH]
+        if result[PSKeys.CONFIDENCE_DATA]:
+            metadata.setdefault(PSKeys.CONFIDENCE_DATA, {})[prompt_key] = result[
+                PSKeys.CONFIDENCE_DATA
+            ]
+        if enable_word_confidence and result[PSKeys.WORD_CONFIDENCE_DATA]:
+            metadata.setdefault(PSKeys.WORD_CONFIDENCE_DATA, {})[prompt_key] = result[
+                PSKeys.WORD_CONFIDENCE_DATA
+            ]
+
     @staticmethod
     def _run_webhook_postprocess(
         parsed_data: Any,
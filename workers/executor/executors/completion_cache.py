@@ -0,0 +1,187 @@
+"""Org-scoped cache of prompt completions for the answer_prompt path.
+
+Re-running a Prompt Studio project, or re-processing an unchanged document in
+an API deployment, used to repeat every LLM call although nothing that goes
+into the call had changed. :class:`CompletionCache` stores the answer (and the
+highlight / confidence metadata that came with it) in Redis, keyed on a hash
+of:
+
+- the document's index key (``doc_id``: file hash, x2text, embedding, vector
+  DB and chunking),
+- the full combined prompt, which includes the retrieved context,
+- the LLM adapter's resolved parameters and system prompt,
+- the output mode (JSON extraction, highlight, word confidence).
+
+A hit skips the provider. The call is still recorded: the LLM gets a SKIPPED
+usage row without tokens or cost, and the prompt's metrics carry
+``completion_cache: "hit"``.
+
+Opt-in (``EXECUTOR_COMPLETION_CACHE_ENABLED``). Calls whose sampling isn't
+close to deterministic bypass the cache: a temperature above
+``EXECUTOR_COMPLETION_CACHE_MAX_TEMPERATURE`` (defaults to the platform's
+default temperature, 0.1; set 0 to only cache greedy decoding) or more than
+one choice requested. Entries expire after
+``EXECUTOR_COMPLETION_CACHE_TTL_SECONDS``; each org keeps at most
+``EXECUTOR_COMPLETION_CACHE_MAX_ENTRIES``, oldest evicted first, and answers
+over ``EXECUTOR_COMPLETION_CACHE_MAX_ENTRY_BYTES`` are not cached.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from shared.cache.cache_backends import RedisCacheBackend
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "prompt_completion"
+_DEFAULT_TTL_SECONDS = 7 * 86400
+_DEFAULT_MAX_ENTRIES = 10000
+_DEFAULT_MAX_ENTRY_BYTES = 256 * 1024
+_DEFAULT_MAX_TEMPERATURE = 0.1
+
+HIT = "hit"
+MISS = "miss"
+BYPASS = "bypass"
+
+
+def completion_cache_enabled() -> bool:
+    return os.getenv("EXECUTOR_COMPLETION_CACHE_ENABLED", "false").lower() == "true"
+
+
+def _int_env(name: str, default: int) -> int:
+    raw = os.getenv(name, "")
+    try:
+        return max(1, int(raw)) if raw else default
+    except ValueError:
+        logger.warning(f"Invalid {name}={raw!r}, using {default}")
+        return default
+
+
+def _float_env(name: str, default: float) -> float:
+    raw = os.getenv(name, "")
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        logger.warning(f"Invalid {name}={raw!r}, using {default}")
+        return default
+
+
+_backend: RedisCacheBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def _get_backend() -> RedisCacheBackend:
+    """One Redis backend per process; building it pings Redis."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = RedisCacheBackend()
+    return _backend
+
+
+class CompletionCache:
+    """Completion cache of one org, used for one prompt's LLM call.
+
+    ``outcome`` is set by :meth:`lookup` to ``"hit"``, ``"miss"`` or
+    ``"bypass"`` so the caller can report it in the prompt's metrics.
+    """
+
+    def __init__(self, organization_id: str, cache: Any):
+        self.organization_id = organization_id
+        self._cache = cache
+        self.ttl = _int_env("EXECUTOR_COMPLETION_CACHE_TTL_SECONDS", _DEFAULT_TTL_SECONDS)
+        self.max_entries = _int_env(
+            "EXECUTOR_COMPLETION_CACHE_MAX_ENTRIES", _DEFAULT_MAX_ENTRIES
+        )
+        self.max_entry_bytes = _int_env(
+            "EXECUTOR_COMPLETION_CACHE_MAX_ENTRY_BYTES", _DEFAULT_MAX_ENTRY_BYTES
+        )
+        self.max_temperature = _float_env(
+            "EXECUTOR_COMPLETION_CACHE_MAX_TEMPERATURE", _DEFAULT_MAX_TEMPERATURE
+        )
+        self.outcome: str | None = None
+
+    @classmethod
+    def for_org(
+        cls, organization_id: str | None, cache: Any = None
+    ) -> "CompletionCache | None":
+        """The org's cache, or None when disabled, unscoped or Redis is down."""
+        if not completion_cache_enabled() or not organization_id:
+            return None
+        cache = cache if cache is not None else _get_backend()
+        if not cache.available:
+            return None
+        return cls(organization_id, cache)
+
+    @property
+    def _index_key(self) -> str:
+        return f"{_KEY_PREFIX}:{self.organization_id}:index"
+
+    def build_key(
+        self, doc_id: str | None, prompt: str, llm: Any, **mode: Any
+    ) -> str | None:
+        """Key for this call, or None when it must not be cached."""
+        params = getattr(llm, "kwargs", None)
+        if not doc_id or not isinstance(params, dict):
+            return None
+        temperature = params.get("temperature")
+        if temperature is not None and temperature > self.max_temperature:
+            return None
+        if (params.get("n") or 1) > 1:
+            return None
+        scope = {
+            "doc_id": doc_id,
+            "prompt": prompt,
+            "llm": params,
+            "system_prompt": getattr(llm, "_system_prompt", ""),
+            "mode": mode,
+        }
+        digest = hashlib.sha256(
+            json.dumps(scope, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{_KEY_PREFIX}:{self.organization_id}:{digest}"
+
+    def lookup(self, key: str | None) -> dict[str, Any] | None:
+        if key is None:
+            self.outcome = BYPASS
+            return None
+        cached = self._cache.get(key)
+        entry = cached.get("data") if cached else None
+        self.outcome = HIT if entry else MISS
+        return entry
+
+    def store(self, key: str | None, entry: dict[str, Any]) -> None:
+        if key is None:
+            return
+        try:
+            size = len(json.dumps(entry))
+        except (TypeError, ValueError):
+            logger.debug("Completion not JSON serializable, not caching")
+            return
+        if size > self.max_entry_bytes:
+            return
+        if self._cache.set(key, entry, self.ttl):
+            self._evict_oldest(key)
+
+    def _evict_oldest(self, key: str) -> None:
+        """Track the entry in the org's index and trim the index to size."""
+        try:
+            client = self._cache.redis_client.redis_client
+            pipe = client.pipeline()
+            pipe.zadd(self._index_key, {key: time.time()})
+            pipe.expire(self._index_key, self.ttl)
+            pipe.zcard(self._index_key)
+            size = pipe.execute()[-1]
+            overflow = size - self.max_entries
+            if overflow > 0:
+                evicted = [k for k, _ in client.zpopmin(self._index_key, overflow)]
+                if evicted:
+                    client.delete(*evicted)
+        except Exception as e:
+            logger.warning(f"Failed to bound completion cache of org: {e}")
@@ -97,6 +97,12 @@ class PromptServiceConstants:
     COMBINED_PROMPT = "combined_prompt"
     TOOL = "tool"
     JSON_POSTAMBLE = "JSON_POSTAMBLE"
+    # Env: max prompts of one answer_prompt run executed concurrently (1 = serial)
+    PROMPT_CONCURRENCY = "EXECUTOR_PROMPT_CONCURRENCY"
+    # Env: how the keyword_table retriever extracts node keywords (KeywordExtractor)
+    KEYWORD_EXTRACTOR = "EXECUTOR_KEYWORD_EXTRACTOR"
+    # Env: vector queries of a batched retrieval run at once (0 = no batching)
+    RETRIEVAL_CONCURRENCY = "EXECUTOR_RETRIEVAL_CONCURRENCY"
     DEFAULT_JSON_POSTAMBLE = "Wrap the final JSON result inbetween §§§ like below example:\n§§§\n<FINAL_JSON_RESULT>\n§§§"
     DOCUMENT_TYPE = "document_type"
     # Webhook postprocessing settings
@@ -167,6 +173,15 @@ class RetrievalStrategy(str, Enum):
     AUTOMERGING = "automerging"
 
 
+class KeywordExtractor(str, Enum):
+    """How the keyword_table retriever extracts keywords from document nodes."""
+
+    # LLM call per node (llama_index KeywordTableIndex)
+    LLM = "llm"
+    # Regex word tokens minus stopwords, no LLM (SimpleKeywordTableIndex)
+    SIMPLE = "simple"
+
+
 class VariableConstants:
     """Constants for variable extraction."""
 
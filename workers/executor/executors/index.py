@@ -95,7 +95,11 @@ class Index:
         embedding: Embedding,
         vector_db: VectorDB,
     ) -> bool:
-        """Check if nodes are already present in the vector DB for a doc_id."""
+        """Check if nodes are already present in the vector DB for a doc_id.
+
+        Uses the vector DB's metadata-only existence check (no embedding call)
+        and only embeds a blank query for stores that can't answer it.
+        """
         from llama_index.core.vector_stores import (
             FilterOperator,
             MetadataFilter,
@@ -104,6 +108,15 @@ class Index:
             VectorStoreQueryResult,
         )
 
+        exists = vector_db.doc_exists(doc_id)
+        if exists is not None:
+            self.tool.stream_log(
+                f"Nodes {'found' if exists else 'not found'} for {doc_id}"
+            )
+            if exists and not self.processing_options.reindex:
+                self.tool.stream_log(f"File was indexed already under {doc_id}")
+            return exists
+
         doc_id_eq_filter = MetadataFilter.from_dict(
             {"key": "doc_id", "operator": FilterOperator.EQ, "value": doc_id}
         )
@@ -119,6 +132,7 @@ class Index:
             n: VectorStoreQueryResult = vector_db.query(query=q)
             if len(n.nodes) > 0:
                 doc_id_found = True
+                vector_db.record_indexed(doc_id)
                 self.tool.stream_log(f"Found {len(n.nodes)} nodes for {doc_id}")
             else:
                 self.tool.stream_log(f"No nodes found for {doc_id}")
@@ -6,11 +6,16 @@ extraction, summarisation, and usage tracking.
 """
 
 import logging
+import os
+import threading
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from executor.executor_tool_shim import ExecutorToolShim
+from executor.executors.adapter_pool import AdapterPool
+from executor.executors.completion_cache import CompletionCache
 from executor.executors.constants import ExecutionSource
 from executor.executors.constants import IndexingConstants as IKeys
 from executor.executors.constants import PromptServiceConstants as PSKeys
@@ -26,6 +31,7 @@ from executor.executors.lookup_enrichment import (
     run_lookup_enrichment,
     run_webhook_postprocessing,
 )
+from shared.parallel_map import parallel_map
 
 from unstract.sdk1.adapters.exceptions import AdapterError
 from unstract.sdk1.adapters.x2text.constants import X2TextConstants
@@ -42,6 +48,23 @@ from unstract.sdk1.x2txt import TextExtractionResult, X2Text
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _PromptRun:
+    """One prompt's outcome in concurrent ``answer_prompt`` mode.
+
+    Each prompt writes into its own ``structured_output`` / ``metadata`` /
+    ``metrics`` / ``context_retrieval_metrics``; the handler folds them into
+    the shared dicts in prompt order, so the result matches the serial loop.
+    """
+
+    structured_output: dict[str, Any]
+    metadata: dict[str, Any]
+    metrics: dict[str, Any] = field(default_factory=dict)
+    context_retrieval_metrics: dict[str, Any] = field(default_factory=dict)
+    usage_records: list[dict[str, Any]] = field(default_factory=list)
+    error: Exception | None = None
+
+
 @ExecutorRegistry.register
 class LegacyExecutor(BaseExecutor):
     """Executor that wraps the full prompt-service extraction pipeline.
@@ -1224,6 +1247,12 @@ class LegacyExecutor(BaseExecutor):
             shim.stream_log(
                 "Re-indexing document" if doc_id_found else "Indexing document"
             )
+            from executor.executors.retrievers.keyword_table import KeywordTableStore
+
+            # Keyword tables hold the nodes about to be replaced
+            KeywordTableStore.invalidate(
+                fs=fs_instance, file_path=file_path, doc_id=doc_id
+            )
             index.perform_indexing(
                 vector_db=vector_db,
                 doc_id=doc_id,
@@ -1454,26 +1483,65 @@ class LegacyExecutor(BaseExecutor):
             embedding_compat_cls,
             vector_db_cls,
         )
+        # One adapter build per distinct adapter for the whole run (see AdapterPool).
+        adapter_pool = AdapterPool(
+            llm_cls,
+            embedding_compat_cls,
+            vector_db_cls,
+            platform_api_key=platform_api_key,
+        )
         usage_records: list[dict[str, Any]] = []
+        concurrency = self._prompt_concurrency()
         try:
-            for output in prompts:
-                usage_records.extend(
-                    self._execute_single_prompt(
-                        output=output,
-                        context=context,
-                        structured_output=structured_output,
-                        metadata=metadata,
-                        metrics=metrics,
-                        variable_names=variable_names,
-                        context_retrieval_metrics=context_retrieval_metrics,
-                        deps=_deps,
-                        tool_settings=tool_settings,
-                        process_text_fn=process_text_fn,
-                    )
+            retrieved_context = self._prefetch_retrieval(
+                prompts=prompts,
+                context=context,
+                variable_names=variable_names,
+                context_retrieval_metrics=context_retrieval_metrics,
+                deps=_deps,
+                adapter_pool=adapter_pool,
+                shim=pipeline_shim,
+            )
+            if concurrency > 1 and len(prompts) > 1:
+                usage_records = self._execute_prompts_concurrently(
+                    prompts=prompts,
+                    max_workers=concurrency,
+                    context=context,
+                    structured_output=structured_output,
+                    metadata=metadata,
+                    metrics=metrics,
+                    variable_names=variable_names,
+                    context_retrieval_metrics=context_retrieval_metrics,
+                    deps=_deps,
+                    adapter_pool=adapter_pool,
+                    tool_settings=tool_settings,
+                    process_text_fn=process_text_fn,
+                    retrieved_context=retrieved_context,
                 )
-        except LegacyExecutorError as e:
-            e.partial_usage_records = usage_records + e.partial_usage_records
-            raise
+            else:
+                try:
+                    for output in prompts:
+                        usage_records.extend(
+                            self._execute_single_prompt(
+                                output=output,
+                                context=context,
+                                structured_output=structured_output,
+                                metadata=metadata,
+                                metrics=metrics,
+                                variable_names=variable_names,
+                                context_retrieval_metrics=context_retrieval_metrics,
+                                deps=_deps,
+                                adapter_pool=adapter_pool,
+                                tool_settings=tool_settings,
+                                process_text_fn=process_text_fn,
+                                retrieved_context=retrieved_context,
+                            )
+                        )
+                except LegacyExecutorError as e:
+                    e.partial_usage_records = usage_records + e.partial_usage_records
+                    raise
+        finally:
+            adapter_pool.close()
 
         pipeline_shim.stream_log(f"All {len(prompts)} prompts processed successfully")
         logger.info(
@@ -1496,6 +1564,289 @@ class LegacyExecutor(BaseExecutor):
             metadata={"usage_records": usage_records},
         )
 
+    @staticmethod
+    def _prompt_concurrency() -> int:
+        """Max prompts run at once (``EXECUTOR_PROMPT_CONCURRENCY``, default 1)."""
+        raw = os.environ.get(PSKeys.PROMPT_CONCURRENCY, "1")
+        try:
+            return max(int(raw), 1)
+        except ValueError:
+            logger.warning(
+                "Invalid %s=%r; running prompts serially",
+                PSKeys.PROMPT_CONCURRENCY,
+                raw,
+            )
+            return 1
+
+    @staticmethod
+    def _retrieval_concurrency() -> int:
+        """Concurrent vector queries of a batched retrieval (0 = don't batch)."""
+        raw = os.environ.get(PSKeys.RETRIEVAL_CONCURRENCY, "4")
+        try:
+            return max(int(raw), 0)
+        except ValueError:
+            logger.warning(
+                "Invalid %s=%r; not batching retrieval",
+                PSKeys.RETRIEVAL_CONCURRENCY,
+                raw,
+            )
+            return 0
+
+    def _prefetch_retrieval(
+        self,
+        prompts: list[dict[str, Any]],
+        context: ExecutionContext,
+        variable_names: list[str],
+        context_retrieval_metrics: dict[str, Any],
+        deps: tuple,
+        adapter_pool: AdapterPool,
+        shim: Any,
+    ) -> dict[str, list[str]]:
+        """Retrieve context for every batchable prompt up front.
+
+        Prompts using the simple strategy whose text is fixed (no variables, no
+        other prompt's answer) and that share a document index are retrieved
+        together via ``RetrievalService.run_batch_retrieval``: one embedding call
+        for all their texts and concurrent vector queries. Returns chunks keyed
+        by prompt name; prompts not covered — including every prompt of a batch
+        that failed — retrieve on their own in ``_execute_single_prompt``.
+        """
+        from executor.executors.constants import RetrievalStrategy
+
+        max_workers = self._retrieval_concurrency()
+        if max_workers < 1 or len(prompts) < 2:
+            return {}
+        _, retrieval_svc, variable_replacement_svc, *_ = deps
+        params = context.executor_params
+        usage_kwargs = {
+            "run_id": context.run_id,
+            "execution_id": params.get(PSKeys.EXECUTION_ID, ""),
+        }
+
+        groups: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for output in prompts:
+            prompt_text = output[PSKeys.PROMPT]
+            if (
+                output.get(PSKeys.RETRIEVAL_STRATEGY) != RetrievalStrategy.SIMPLE.value
+                or output[PSKeys.CHUNK_SIZE] <= 0
+                or output.get(PSKeys.TYPE)
+                in (PSKeys.TABLE, PSKeys.RECORD, PSKeys.LINE_ITEM)
+                or variable_replacement_svc.is_variables_present(prompt_text=prompt_text)
+                or any(f"%{name}%" in prompt_text for name in variable_names)
+            ):
+                continue
+            key = (output[PSKeys.EMBEDDING], output[PSKeys.VECTOR_DB])
+            groups.setdefault(key, []).append(output)
+
+        retrieved: dict[str, list[str]] = {}
+        for (embedding_id, vector_db_id), outputs in groups.items():
+            if len(outputs) < 2:
+                continue
+            by_doc: dict[str, list[dict[str, Any]]] = {}
+            try:
+                for output in outputs:
+                    doc_id = adapter_pool.index_key(
+                        shim,
+                        vector_db=vector_db_id,
+                        embedding=embedding_id,
+                        x2text=output[PSKeys.X2TEXT_ADAPTER],
+                        chunk_size=str(output[PSKeys.CHUNK_SIZE]),
+                        chunk_overlap=str(output[PSKeys.CHUNK_OVERLAP]),
+                        file_hash=params.get(PSKeys.FILE_HASH),
+                        file_path=params.get(PSKeys.FILE_PATH),
+                    )
+                    by_doc.setdefault(doc_id, []).append(
+                        {**output, PSKeys.PROMPTX: output[PSKeys.PROMPT]}
+                    )
+                embedding = adapter_pool.embedding(
+                    embedding_id, tool=shim, kwargs={**usage_kwargs}
+                )
+                vector_db = adapter_pool.vector_db(
+                    vector_db_id,
+                    embedding_instance_id=embedding_id,
+                    tool=shim,
+                    embedding=embedding,
+                )
+                for doc_id, doc_outputs in by_doc.items():
+                    if len(doc_outputs) < 2:
+                        continue
+                    retrieved.update(
+                        retrieval_svc.run_batch_retrieval(
+                            outputs=doc_outputs,
+                            doc_id=doc_id,
+                            llm=None,  # the simple strategy makes no LLM calls
+                            vector_db=vector_db,
+                            embedding=embedding,
+                            max_workers=max_workers,
+                            context_retrieval_metrics=context_retrieval_metrics,
+                        )
+                    )
+            except Exception:
+                # Each prompt retrieves (and reports errors) on its own instead
+                logger.warning(
+                    "Batched retrieval failed; prompts will retrieve individually",
+                    exc_info=True,
+                )
+        if retrieved:
+            logger.info(
+                "Batched retrieval covered %d of %d prompts", len(retrieved), len(prompts)
+            )
+        return retrieved
+
+    @staticmethod
+    def _prompt_dependency_levels(prompts: list[dict[str, Any]]) -> list[int]:
+        """Assign each prompt the wave it can run in.
+
+        A prompt that reads no earlier prompt's answer is level 0; otherwise it
+        runs one level after the deepest earlier prompt it reads. References to
+        a *later* prompt are ignored — in the serial loop that answer does not
+        exist yet either, so the prompt sees the same (missing) value.
+        """
+        from executor.executors.variable_replacement import (
+            VariableReplacementService,
+        )
+
+        names = [output[PSKeys.NAME] for output in prompts]
+        levels: list[int] = []
+        for idx, output in enumerate(prompts):
+            earlier = names[:idx]
+            referenced = VariableReplacementService.referenced_prompt_names(
+                output[PSKeys.PROMPT], earlier
+            )
+            levels.append(
+                max(
+                    (
+                        levels[j] + 1
+                        for j, name in enumerate(earlier)
+                        if name in referenced
+                    ),
+                    default=0,
+                )
+            )
+        return levels
+
+    def _execute_prompts_concurrently(
+        self,
+        prompts: list[dict[str, Any]],
+        max_workers: int,
+        structured_output: dict[str, Any],
+        metadata: dict[str, Any],
+        metrics: dict[str, Any],
+        context_retrieval_metrics: dict[str, Any],
+        process_text_fn: Any,
+        **prompt_kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """Run prompts wave by wave with bounded concurrency; return usage rows.
+
+        Prompts of one dependency level (see ``_prompt_dependency_levels``) run
+        together through ``parallel_map``; a prompt that reads another prompt's
+        answer waits for the wave that produces it. Every prompt works on its own
+        copies of the shared dicts, seeded with the answers of the earlier prompts
+        in lower waves, and the copies are folded back in prompt order — so
+        ``structured_output``, ``metadata`` and usage rows come out in the same
+        order as the serial loop. A failing wave stops later waves; the first
+        failure in prompt order is raised with the usage rows of every prompt
+        that ran (their LLM calls were billed either way).
+        """
+        levels = self._prompt_dependency_levels(prompts)
+        runs: list[_PromptRun | None] = [None] * len(prompts)
+        if process_text_fn is not None:
+            # The highlight plugin is not known to be thread-safe — serialise it;
+            # only its post-processing is affected, the LLM calls still overlap.
+            process_text_fn = self._serialized(process_text_fn)
+
+        def run_prompt(idx: int) -> _PromptRun:
+            prompt_name = prompts[idx][PSKeys.NAME]
+            run = _PromptRun(
+                structured_output={
+                    key: value
+                    for j in range(idx)
+                    if levels[j] < levels[idx]
+                    for key, value in runs[j].structured_output.items()
+                },
+                metadata={**metadata, PSKeys.CONTEXT: {}},
+                # Carry over the timing of a batched (prefetched) retrieval, which
+                # was recorded in the shared dict before the prompts started.
+                context_retrieval_metrics={
+                    name: value
+                    for name, value in context_retrieval_metrics.items()
+                    if name == prompt_name
+                },
+            )
+            seeded = dict(run.structured_output)
+            try:
+                run.usage_records = self._execute_single_prompt(
+                    output=prompts[idx],
+                    structured_output=run.structured_output,
+                    metadata=run.metadata,
+                    metrics=run.metrics,
+                    context_retrieval_metrics=run.context_retrieval_metrics,
+                    process_text_fn=process_text_fn,
+                    **prompt_kwargs,
+                )
+            except Exception as e:
+                run.error = e
+            # Keep only this prompt's own writes for the merge / later seeds.
+            run.structured_output = {
+                key: value
+                for key, value in run.structured_output.items()
+                if key not in seeded or value is not seeded[key]
+            }
+            return run
+
+        for level in range(max(levels) + 1):
+            wave = [idx for idx, lv in enumerate(levels) if lv == level]
+            for idx, run in zip(
+                wave,
+                parallel_map(
+                    wave,
+                    run_prompt,
+                    max_workers=max_workers,
+                    label=f"answer_prompt wave {level}",
+                ),
+                strict=True,
+            ):
+                runs[idx] = run
+            if any(runs[idx].error is not None for idx in wave):
+                break
+
+        usage_records: list[dict[str, Any]] = []
+        for run in runs:
+            if run is not None:
+                usage_records.extend(run.usage_records)
+        for run in runs:
+            if run is None or run.error is None:
+                continue
+            if isinstance(run.error, LegacyExecutorError):
+                run.error.partial_usage_records = (
+                    usage_records + run.error.partial_usage_records
+                )
+            raise run.error
+
+        for run in runs:
+            structured_output.update(run.structured_output)
+            for key, value in run.metadata.items():
+                if value is metadata.get(key):
+                    continue  # untouched shared entry (run id, required fields)
+                if isinstance(value, dict):
+                    metadata.setdefault(key, {}).update(value)
+                else:
+                    metadata[key] = value
+            for prompt_name, prompt_metrics in run.metrics.items():
+                metrics.setdefault(prompt_name, {}).update(prompt_metrics)
+            context_retrieval_metrics.update(run.context_retrieval_metrics)
+        return usage_records
+
+    @staticmethod
+    def _serialized(fn: Any) -> Any:
+        lock = threading.Lock()
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            with lock:
+                return fn(*args, **kwargs)
+
+        return call
+
     @staticmethod
     def _convert_number_answer(answer: str, llm: Any, answer_prompt_svc: Any) -> Any:
         """Run LLM number extraction and return float or None."""
@@ -1636,15 +1987,19 @@ class LegacyExecutor(BaseExecutor):
         variable_names: list[str],
         context_retrieval_metrics: dict[str, Any],
         deps: tuple,
+        adapter_pool: AdapterPool,
         tool_settings: dict[str, Any],
         process_text_fn: Any,
+        retrieved_context: dict[str, list[str]] | None = None,
     ) -> list[dict[str, Any]]:
-        """Run one prompt end-to-end; return its usage rows."""
+        """Run one prompt end-to-end; return its usage rows.
+
+        ``retrieved_context`` holds chunks already fetched by
+        ``_prefetch_retrieval``; other prompts run their own retrieval.
+        """
         from executor.executors.constants import PromptServiceConstants as PSKeys
         from executor.executors.constants import RetrievalStrategy
 
-        from unstract.sdk1.utils.indexing import IndexingUtils
-
         (
             answer_prompt_svc,
             retrieval_svc,
@@ -1704,13 +2059,13 @@ class LegacyExecutor(BaseExecutor):
             structured_output, variable_names, output, prompt_text
         )
 
-        doc_id = IndexingUtils.generate_index_key(
+        doc_id = adapter_pool.index_key(
+            shim,
             vector_db=output[PSKeys.VECTOR_DB],
             embedding=output[PSKeys.EMBEDDING],
             x2text=output[PSKeys.X2TEXT_ADAPTER],
             chunk_size=str(output[PSKeys.CHUNK_SIZE]),
             chunk_overlap=str(output[PSKeys.CHUNK_OVERLAP]),
-            tool=shim,
             file_hash=file_hash,
             file_path=file_path,
         )
@@ -1758,9 +2113,7 @@ class LegacyExecutor(BaseExecutor):
             output=output,
             shim=shim,
             chunk_size=chunk_size,
-            llm_cls=llm_cls,
-            embedding_compat_cls=embedding_compat_cls,
-            vector_db_cls=vector_db_cls,
+            adapter_pool=adapter_pool,
             usage_kwargs=usage_kwargs,
             prompt_name=prompt_name,
         )
@@ -1787,6 +2140,8 @@ class LegacyExecutor(BaseExecutor):
                         context_retrieval_metrics=context_retrieval_metrics,
                         prompt_key=prompt_name,
                     )
+                elif retrieved_context and prompt_name in retrieved_context:
+                    context_list = retrieved_context[prompt_name]
                 else:
                     context_list = retrieval_svc.run_retrieval(
                         output=output,
@@ -1795,6 +2150,8 @@ class LegacyExecutor(BaseExecutor):
                         vector_db=vector_db,
                         retrieval_type=retrieval_strategy,
                         context_retrieval_metrics=context_retrieval_metrics,
+                        execution_source=execution_source,
+                        file_path=file_path,
                     )
                 metadata[PSKeys.CONTEXT][prompt_name] = context_list
                 if chunk_size > 0:
@@ -1808,6 +2165,7 @@ class LegacyExecutor(BaseExecutor):
                     prompt_name,
                 )
                 shim.stream_log(f"Running LLM completion for: `{prompt_name}`")
+                completion_cache = CompletionCache.for_org(self._organization_id)
                 answer = answer_prompt_svc.construct_and_run_prompt(
                     tool_settings=tool_settings,
                     output=output,
@@ -1818,7 +2176,13 @@ class LegacyExecutor(BaseExecutor):
                     execution_source=execution_source,
                     file_path=file_path,
                     process_text=process_text_fn,
+                    completion_cache=completion_cache,
+                    doc_id=doc_id,
                 )
+                if completion_cache is not None:
+                    metrics.setdefault(prompt_name, {})["completion_cache"] = (
+                        completion_cache.outcome
+                    )
             else:
                 logger.warning(
                     "Skipping retrieval: invalid strategy=%s for prompt=%s",
@@ -1896,7 +2260,6 @@ class LegacyExecutor(BaseExecutor):
                 prompt_name=prompt_name,
                 llm=llm,
                 embedding=embedding,
-                vector_db=vector_db,
                 chunk_size=chunk_size,
             )
             e.partial_usage_records = records + flushed + e.partial_usage_records
@@ -1908,7 +2271,6 @@ class LegacyExecutor(BaseExecutor):
                 prompt_name=prompt_name,
                 llm=llm,
                 embedding=embedding,
-                vector_db=vector_db,
                 chunk_size=chunk_size,
             )
         )
@@ -1919,32 +2281,28 @@ class LegacyExecutor(BaseExecutor):
         output: dict[str, Any],
         shim: Any,
         chunk_size: int,
-        llm_cls: Any,
-        embedding_compat_cls: Any,
-        vector_db_cls: Any,
+        adapter_pool: AdapterPool,
         usage_kwargs: dict[str, Any],
         prompt_name: str,
     ) -> tuple[Any, Any, Any]:
         from executor.executors.constants import PromptServiceConstants as PSKeys
 
         try:
-            llm = llm_cls(
-                adapter_instance_id=output[PSKeys.LLM],
+            llm = adapter_pool.llm(
+                output[PSKeys.LLM],
                 tool=shim,
                 usage_kwargs={**usage_kwargs, PSKeys.LLM_USAGE_REASON: PSKeys.EXTRACTION},
-                capture_metrics=True,
             )
             embedding = None
             vector_db = None
             if chunk_size > 0:
-                embedding = embedding_compat_cls(
-                    adapter_instance_id=output[PSKeys.EMBEDDING],
-                    tool=shim,
-                    kwargs={**usage_kwargs},
+                embedding = adapter_pool.embedding(
+                    output[PSKeys.EMBEDDING], tool=shim, kwargs={**usage_kwargs}
                 )
-                vector_db = vector_db_cls(
+                vector_db = adapter_pool.vector_db(
+                    output[PSKeys.VECTOR_DB],
+                    embedding_instance_id=output[PSKeys.EMBEDDING],
                     tool=shim,
-                    adapter_instance_id=output[PSKeys.VECTOR_DB],
                     embedding=embedding,
                 )
             shim.log_adapter_once("LLM", output[PSKeys.LLM], llm)
@@ -1970,10 +2328,12 @@ class LegacyExecutor(BaseExecutor):
         prompt_name: str,
         llm: Any,
         embedding: Any,
-        vector_db: Any,
         chunk_size: int,
     ) -> list[dict[str, Any]]:
-        """Flush LLM + embedding usage rows and return them."""
+        """Flush LLM + embedding usage rows and return them.
+
+        The vector DB is pooled for the whole run and closed by the handler.
+        """
         metrics.setdefault(prompt_name, {}).update(
             {
                 "context_retrieval": context_retrieval_metrics.get(prompt_name, {}),
@@ -1995,8 +2355,6 @@ class LegacyExecutor(BaseExecutor):
                         type(handler).__name__,
                         exc_info=True,
                     )
-        if vector_db:
-            vector_db.close()
         return records
 
     def _run_table_extraction(
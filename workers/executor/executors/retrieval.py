@@ -39,6 +39,17 @@ class RetrievalService:
             RetrievalStrategy.AUTOMERGING.value: AutomergingRetriever,
         }
 
+    @staticmethod
+    def _get_keyword_table_store(
+        execution_source: str, file_path: str, llm_id: str
+    ) -> Any:
+        """Lazy-build the persisted keyword table store for a document."""
+        from executor.executors.file_utils import FileUtils
+        from executor.executors.retrievers.keyword_table import KeywordTableStore
+
+        fs = FileUtils.get_fs_instance(execution_source=execution_source)
+        return KeywordTableStore(fs=fs, file_path=file_path, llm_id=llm_id)
+
     @staticmethod
     def run_retrieval(
         output: dict[str, Any],
@@ -47,8 +58,17 @@ class RetrievalService:
         vector_db: Any,
         retrieval_type: str,
         context_retrieval_metrics: dict[str, Any] | None = None,
+        execution_source: str | None = None,
+        file_path: str | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[str]:
-        """Factory: instantiate and execute the retriever for the given strategy."""
+        """Factory: instantiate and execute the retriever for the given strategy.
+
+        ``execution_source`` and ``file_path`` let the keyword table strategy
+        persist its table next to the document; without them it's rebuilt.
+        ``query_embedding`` is a precomputed embedding of the prompt, used by
+        the simple strategy (see ``run_batch_retrieval``).
+        """
         from executor.executors.constants import PromptServiceConstants as PSKeys
 
         prompt = output[PSKeys.PROMPTX]
@@ -61,12 +81,30 @@ class RetrievalService:
         if not retriever_class:
             raise ValueError(f"Unknown retrieval type: {retrieval_type}")
 
+        extra_kwargs: dict[str, Any] = {}
+        if (
+            retrieval_type == RetrievalStrategy.SIMPLE.value
+            and query_embedding is not None
+        ):
+            extra_kwargs["query_embedding"] = query_embedding
+        llm_id = output.get(PSKeys.LLM)
+        if (
+            retrieval_type == RetrievalStrategy.KEYWORD_TABLE.value
+            and execution_source
+            and file_path
+            and llm_id
+        ):
+            extra_kwargs["store"] = RetrievalService._get_keyword_table_store(
+                execution_source=execution_source, file_path=file_path, llm_id=llm_id
+            )
+
         retriever = retriever_class(
             vector_db=vector_db,
             doc_id=doc_id,
             prompt=prompt,
             top_k=top_k,
             llm=llm,
+            **extra_kwargs,
         )
         context = retriever.retrieve()
 
@@ -86,6 +124,60 @@ class RetrievalService:
         )
         return list(context)
 
+    @staticmethod
+    def run_batch_retrieval(
+        outputs: list[dict[str, Any]],
+        doc_id: str,
+        llm: Any,
+        vector_db: Any,
+        embedding: Any,
+        max_workers: int,
+        context_retrieval_metrics: dict[str, Any] | None = None,
+    ) -> dict[str, list[str]]:
+        """Simple-strategy retrieval for several prompts on one document.
+
+        Embeds every prompt text in one ``get_query_embeddings`` call, then runs
+        the vector queries concurrently. Returns chunks keyed by prompt name; a
+        prompt whose query failed is left out so the caller can retry it alone.
+        """
+        from executor.executors.constants import PromptServiceConstants as PSKeys
+        from shared.parallel_map import parallel_map
+
+        start = datetime.datetime.now()
+        query_embeddings = embedding.get_query_embeddings(
+            [output[PSKeys.PROMPTX] for output in outputs]
+        )
+        logger.info(
+            "[Retrieval] doc_id=%s embedded %d prompts in one call time=%.3fs",
+            doc_id,
+            len(outputs),
+            (datetime.datetime.now() - start).total_seconds(),
+        )
+
+        def retrieve(idx: int) -> list[str] | None:
+            return RetrievalService.run_retrieval(
+                output=outputs[idx],
+                doc_id=doc_id,
+                llm=llm,
+                vector_db=vector_db,
+                retrieval_type=RetrievalStrategy.SIMPLE.value,
+                context_retrieval_metrics=context_retrieval_metrics,
+                query_embedding=query_embeddings[idx],
+            )
+
+        results = parallel_map(
+            list(range(len(outputs))),
+            retrieve,
+            max_workers=max_workers,
+            on_error=lambda _idx, _item, _exc: None,
+            label=f"batch retrieval {doc_id}",
+        )
+        return {
+            output[PSKeys.NAME]: chunks
+            for output, chunks in zip(outputs, results, strict=True)
+            if chunks is not None
+        }
+
     @staticmethod
     def retrieve_complete_context(
         execution_source: str,
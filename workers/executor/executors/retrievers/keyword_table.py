@@ -1,16 +1,185 @@
+import hashlib
+import json
 import logging
+import os
+import threading
+from typing import Any
 
+from executor.executors.constants import KeywordExtractor
+from executor.executors.constants import PromptServiceConstants as PSKeys
 from executor.executors.exceptions import RetrievalError
 from executor.executors.retrievers.base_retriever import BaseRetriever
-from llama_index.core import VectorStoreIndex
-from llama_index.core.indices.keyword_table import KeywordTableIndex
+from llama_index.core import StorageContext, VectorStoreIndex
+from llama_index.core.data_structs.data_structs import KeywordTable
+from llama_index.core.indices.keyword_table import (
+    KeywordTableIndex,
+    SimpleKeywordTableIndex,
+)
+from llama_index.core.storage.docstore import SimpleDocumentStore
 from llama_index.core.vector_stores import ExactMatchFilter, MetadataFilters
 
 logger = logging.getLogger(__name__)
 
 
+def keyword_extractor() -> KeywordExtractor:
+    """The configured extractor (``EXECUTOR_KEYWORD_EXTRACTOR``, default llm)."""
+    raw = os.environ.get(PSKeys.KEYWORD_EXTRACTOR, "").strip().lower()
+    try:
+        return KeywordExtractor(raw) if raw else KeywordExtractor.LLM
+    except ValueError:
+        logger.warning(f"Unknown {PSKeys.KEYWORD_EXTRACTOR}={raw!r}, using llm")
+        return KeywordExtractor.LLM
+
+
+def _index_cls(extractor: KeywordExtractor) -> type:
+    if extractor == KeywordExtractor.SIMPLE:
+        return SimpleKeywordTableIndex
+    return KeywordTableIndex
+
+
+class KeywordTableStore:
+    """Persists built keyword tables next to the source document.
+
+    A table is a function of ``doc_id`` (file hash + adapter configs +
+    chunking), the extractor and, for LLM keywords, the LLM adapter, so it's
+    built once and reused by every prompt and execution that can see the
+    document's directory in file storage. Re-indexing the document drops its
+    tables (:meth:`invalidate`).
+    """
+
+    DIR_NAME = "keyword_table"
+
+    # Striped rather than one lock per table, so a long-lived worker doesn't
+    # accumulate a lock for every document it has seen. Two tables sharing a
+    # stripe only serialise their first build.
+    _LOCK_STRIPES = 64
+    _locks = tuple(threading.Lock() for _ in range(_LOCK_STRIPES))
+
+    def __init__(self, fs: Any, file_path: str, llm_id: str):
+        self._fs = fs
+        self._dir = self.table_dir(file_path)
+        self._llm_id = llm_id
+
+    @classmethod
+    def table_dir(cls, file_path: str) -> str:
+        return os.path.join(os.path.dirname(file_path), cls.DIR_NAME)
+
+    @classmethod
+    def invalidate(cls, fs: Any, file_path: str, doc_id: str) -> None:
+        """Drop every table built for ``doc_id``, whatever its extractor or LLM."""
+        pattern = os.path.join(cls.table_dir(file_path), f"{doc_id}.*.json")
+        try:
+            for path in fs.glob(pattern):
+                fs.rm(path, recursive=False)
+        except Exception as e:
+            logger.warning(f"Failed to drop keyword tables for {doc_id}: {e}")
+
+    def path(self, doc_id: str, extractor: KeywordExtractor) -> str:
+        name = f"{doc_id}.{extractor.value}"
+        if extractor == KeywordExtractor.LLM:
+            # LLM keywords depend on the model that extracted them
+            name = f"{name}.{self._llm_id}"
+        return os.path.join(self._dir, f"{name}.json")
+
+    def lock(self, doc_id: str, extractor: KeywordExtractor) -> threading.Lock:
+        """Per-table lock, so concurrent prompts of a run build it only once."""
+        digest = hashlib.sha256(self.path(doc_id, extractor).encode()).digest()
+        return self._locks[int.from_bytes(digest[:4], "big") % self._LOCK_STRIPES]
+
+    def load(self, doc_id: str, extractor: KeywordExtractor) -> dict[str, Any] | None:
+        path = self.path(doc_id, extractor)
+        try:
+            if not self._fs.exists(path):
+                return None
+            return json.loads(self._fs.read(path=path, mode="r"))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable keyword table {path}: {e}")
+            return None
+
+    def save(
+        self, doc_id: str, extractor: KeywordExtractor, payload: dict[str, Any]
+    ) -> None:
+        path = self.path(doc_id, extractor)
+        try:
+            self._fs.mkdir(self._dir)
+            self._fs.write(path=path, mode="w", data=json.dumps(payload))
+        except Exception as e:
+            # Only costs a rebuild next time
+            logger.warning(f"Failed to persist keyword table {path}: {e}")
+
+
 class KeywordTableRetriever(BaseRetriever):
-    """Keyword table retrieval using LlamaIndex's native KeywordTableIndex."""
+    """Keyword table retrieval using LlamaIndex's native KeywordTableIndex.
+
+    The table is built lazily on first use and, when a
+    :class:`KeywordTableStore` is given, persisted and reused afterwards.
+    """
+
+    def __init__(self, *args: Any, store: KeywordTableStore | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.store = store
+
+    def _build_index(self, extractor: KeywordExtractor, llm: Any) -> Any:
+        """Build the keyword index from all nodes of the document."""
+        # Get documents from vector index for keyword indexing
+        vector_store_index: VectorStoreIndex = self.vector_db.get_vector_store_index()
+
+        # Get all nodes for the document
+        all_retriever = vector_store_index.as_retriever(
+            similarity_top_k=1000,  # Get all nodes
+            filters=MetadataFilters(
+                filters=[
+                    ExactMatchFilter(key="doc_id", value=self.doc_id),
+                ],
+            ),
+        )
+
+        # Retrieve all nodes to build keyword index
+        all_nodes = all_retriever.retrieve(" ")
+
+        if not all_nodes:
+            logger.warning(f"No nodes found for doc_id: {self.doc_id}")
+            return None
+
+        nodes = [node.node for node in all_nodes]
+        for node in nodes:
+            # Not needed for keyword lookup; keeps the persisted table small
+            node.embedding = None
+        # Create the keyword index using our provided LLM
+        return _index_cls(extractor)(nodes=nodes, show_progress=True, llm=llm)
+
+    @staticmethod
+    def _load_index(
+        payload: dict[str, Any], extractor: KeywordExtractor, llm: Any
+    ) -> Any:
+        storage_context = StorageContext.from_defaults(
+            docstore=SimpleDocumentStore.from_dict(payload["docstore"])
+        )
+        return _index_cls(extractor)(
+            index_struct=KeywordTable.from_dict(payload["index_struct"]),
+            storage_context=storage_context,
+            llm=llm,
+        )
+
+    def _get_index(self, extractor: KeywordExtractor, llm: Any) -> Any:
+        if self.store is None:
+            return self._build_index(extractor, llm)
+        with self.store.lock(self.doc_id, extractor):
+            payload = self.store.load(self.doc_id, extractor)
+            if payload is not None:
+                logger.info(f"Reusing persisted keyword table for {self.doc_id}")
+                return self._load_index(payload, extractor, llm)
+            index = self._build_index(extractor, llm)
+            if index is not None:
+                self.store.save(
+                    self.doc_id,
+                    extractor,
+                    {
+                        "index_struct": index.index_struct.to_dict(),
+                        "docstore": index.docstore.to_dict(),
+                    },
+                )
+            return index
 
     def retrieve(self) -> set[str]:
         """Retrieve text chunks using LlamaIndex's native KeywordTableIndex.
@@ -20,39 +189,22 @@ class KeywordTableRetriever(BaseRetriever):
         """
         try:
             llm = self.require_llm()
+            extractor = keyword_extractor()
             logger.info(
-                f"Retrieving chunks for {self.doc_id} using LlamaIndex KeywordTableIndex."
+                f"Retrieving chunks for {self.doc_id} using LlamaIndex "
+                f"KeywordTableIndex ({extractor.value} keywords)."
             )
 
-            # Get documents from vector index for keyword indexing
-            vector_store_index: VectorStoreIndex = self.vector_db.get_vector_store_index()
-
-            # Get all nodes for the document
-            all_retriever = vector_store_index.as_retriever(
-                similarity_top_k=1000,  # Get all nodes
-                filters=MetadataFilters(
-                    filters=[
-                        ExactMatchFilter(key="doc_id", value=self.doc_id),
-                    ],
-                ),
-            )
-
-            # Retrieve all nodes to build keyword index
-            all_nodes = all_retriever.retrieve(" ")
-
-            if not all_nodes:
-                logger.warning(f"No nodes found for doc_id: {self.doc_id}")
+            keyword_index = self._get_index(extractor, llm)
+            if keyword_index is None:
                 return set()
 
-            # Create KeywordTableIndex from nodes using our provided LLM
-            keyword_index = KeywordTableIndex(
-                nodes=[node.node for node in all_nodes],
-                show_progress=True,
-                llm=llm,  # Use the provided LLM instead of defaulting to OpenAI
-            )
-
-            # Create retriever from keyword index
+            # Create retriever from keyword index; the simple extractor also
+            # matches query keywords without an LLM call
             keyword_retriever = keyword_index.as_retriever(
+                retriever_mode=(
+                    "simple" if extractor == KeywordExtractor.SIMPLE else "default"
+                ),
                 similarity_top_k=self.top_k,
             )
 
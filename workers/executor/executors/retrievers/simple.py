@@ -1,14 +1,25 @@
 import logging
 import time
+from typing import Any
 
 from executor.executors.retrievers.base_retriever import BaseRetriever
-from llama_index.core import VectorStoreIndex
+from llama_index.core import QueryBundle, VectorStoreIndex
 from llama_index.core.vector_stores import ExactMatchFilter, MetadataFilters
 
 logger = logging.getLogger(__name__)
 
 
 class SimpleRetriever(BaseRetriever):
+    def __init__(
+        self,
+        *args: Any,
+        query_embedding: list[float] | None = None,
+        **kwargs: Any,
+    ):
+        """``query_embedding`` skips embedding the prompt (batched retrieval)."""
+        super().__init__(*args, **kwargs)
+        self.query_embedding = query_embedding
+
     def retrieve(self) -> set[str]:
         context = self._simple_retrieval()
         if not context:
@@ -37,7 +48,9 @@ class SimpleRetriever(BaseRetriever):
                 ],
             ),
         )
-        nodes = retriever.retrieve(self.prompt)
+        nodes = retriever.retrieve(
+            QueryBundle(query_str=self.prompt, embedding=self.query_embedding)
+        )
         context: set[str] = set()
         for node in nodes:
             # May have to fine-tune this value for node score or keep it
@@ -195,6 +195,29 @@ class VariableReplacementService:
             len(VariableReplacementHelper.extract_variables_from_prompt(prompt_text))
         )
 
+    @staticmethod
+    def referenced_prompt_names(prompt_text: str, prompt_names: list[str]) -> set[str]:
+        """Return the names in ``prompt_names`` whose output ``prompt_text`` reads.
+
+        Covers every way a prompt consumes another prompt's answer: a static
+        ``{{name}}``, a dynamic ``{{url[name]}}`` and the legacy ``%name%``
+        substitution in ``AnswerPromptService.extract_variable``. Custom-data
+        variables read no prompt output.
+        """
+        referenced: set[str] = set()
+        for variable in VariableReplacementHelper.extract_variables_from_prompt(
+            prompt_text
+        ):
+            variable_type = VariableReplacementHelper.identify_variable_type(variable)
+            if variable_type == VariableType.STATIC:
+                referenced.add(variable)
+            elif variable_type == VariableType.DYNAMIC:
+                referenced.update(
+                    re.findall(VariableConstants.DYNAMIC_VARIABLE_DATA_REGEX, variable)
+                )
+        referenced.update(name for name in prompt_names if f"%{name}%" in prompt_text)
+        return referenced.intersection(prompt_names)
+
     @staticmethod
     def replace_variables_in_prompt(
         prompt: dict[str, Any],
@@ -28,6 +28,11 @@ from shared.enums import ErrorType
 from shared.enums.task_enums import TaskName
 from shared.infrastructure import create_api_client
 from shared.infrastructure.context import StateStore
+from shared.infrastructure.database.destination_pool import (
+    DestinationWriteBatch,
+    buffered_destination_writes,
+    current_destination_batch,
+)
 from shared.infrastructure.logging import (
     WorkerLogger,
     WorkerWorkflowLogger,
@@ -354,8 +359,11 @@ def _run_batch_stages(
     # Step 4: Pre-create file executions
     context = _refactored_pre_create_file_executions(context)
 
-    # Step 5: Process individual files
-    context = _process_individual_files(context)
+    # Step 5: Process individual files. Database-destination rows are buffered
+    # and written together once every file of the batch has been processed
+    with buffered_destination_writes() as destination_writes:
+        context = _process_individual_files(context)
+        _flush_destination_writes(context, destination_writes)
 
     # Step 7: Compile and return final result
     return _compile_batch_result(context)
@@ -710,6 +718,7 @@ def _process_individual_files(context: WorkflowContextData) -> WorkflowContextDa
     ]
     celery_task_id = context.get_setting("celery_task_id", "unknown")
     total_files = context.metadata["total_files"]
+    deferred_file_results: list[tuple[Any, ...]] = []
 
     # Process each file - handle list, tuple, and dictionary formats
     for file_number, file_item in enumerate(files, 1):
@@ -878,8 +887,9 @@ def _process_individual_files(context: WorkflowContextData) -> WorkflowContextDa
             transport=context.transport,  # Drives the PG-only destination guard
         )
 
-        # Handle file processing result
-        _handle_file_processing_result(
+        # Handle file processing result; a file whose destination row is
+        # still buffered is finalised once the batch's rows are written
+        handler_args = (
             file_execution_result,
             file_name,
             file_start_time,
@@ -897,16 +907,57 @@ def _process_individual_files(context: WorkflowContextData) -> WorkflowContextDa
             ),  # Pass existing API workflow detection
             skipped_already_completed,  # Pass list to track duplicate skips
         )
+        destination_writes = current_destination_batch()
+        if destination_writes and destination_writes.is_pending(
+            workflow_file_execution_id
+        ):
+            deferred_file_results.append(
+                (workflow_file_execution_id, time.time(), handler_args)
+            )
+        else:
+            _handle_file_processing_result(*handler_args)
 
     # Update metadata with results
     context.metadata["result"] = result
     context.metadata["successful_files_for_manual_review"] = (
         successful_files_for_manual_review
     )
+    context.metadata["deferred_file_results"] = deferred_file_results
 
     return context
 
 
+def _flush_destination_writes(
+    context: WorkflowContextData, destination_writes: DestinationWriteBatch
+) -> None:
+    """Write the batch's buffered destination rows, then finalise their files.
+
+    A file whose row failed to write is finalised as a destination error.
+    """
+    deferred_file_results = context.metadata.get("deferred_file_results", [])
+    write_errors = destination_writes.flush()
+    workflow_logger = context.metadata.get("workflow_logger")
+    for file_execution_id, deferred_at, handler_args in deferred_file_results:
+        file_execution_result, file_name, file_start_time, *rest = handler_args
+        write_error = write_errors.get(file_execution_id)
+        if write_error is not None:
+            file_execution_result.success = False
+            file_execution_result.destination_error = (
+                f"Failed to insert data into database: {write_error}"
+            )
+        elif workflow_logger:
+            log_file_info(
+                workflow_logger,
+                file_execution_id,
+                "📥 Data successfully inserted into the destination database",
+            )
+        # Time spent waiting for the rest of the batch isn't this file's
+        file_start_time += time.time() - deferred_at
+        _handle_file_processing_result(
+            file_execution_result, file_name, file_start_time, *rest
+        )
+
+
 def _handle_file_processing_result(
     file_execution_result: FileProcessingResult,
     file_name: str,
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Continuously drain the log history queue into the database.
+
+Long-running alternative to process_log_history.py, started by scheduler.sh
+when ``LOG_HISTORY_DRAIN_MODE=true``. Instead of checking the queue on a
+fixed tick and asking the backend to LPOP one small batch, this process:
+
+1. Blocks on the Redis list (BLPOP) until a log arrives, so bursts are picked
+   up immediately and an idle queue costs nothing
+2. Takes up to ``LOG_HISTORY_DRAIN_BATCH_SIZE`` logs at once with an atomic
+   LRANGE + LTRIM
+3. Posts the batch to the backend's bulk insert endpoint, which only
+   validates and bulk creates
+
+Backpressure: only one batch is in flight, and the next one is popped only
+after the previous insert returned. A failed insert puts the batch back at
+the head of the queue and the drainer backs off exponentially, so logs keep
+accumulating in Redis (bounded by ``LOG_QUEUE_MAX_SIZE`` on the producer side)
+rather than in memory while the backend is unavailable.
+
+Each log is given an id before its first insert attempt and is requeued with
+it, so a batch that timed out after the backend committed it is not stored a
+second time on retry.
+
+Queue depth, insert rate and failures are logged every
+``LOG_HISTORY_DRAIN_STATS_INTERVAL`` seconds.
+
+Usage:
+    python drain_log_history.py
+"""
+
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+
+import httpx
+
+from unstract.core.cache.redis_queue_client import RedisQueueClient
+from unstract.core.constants import LogFieldName
+
+logger = logging.getLogger(__name__)
+
+# Endpoint must match the URL registered in
+# backend/workflow_manager/workflow_v2/execution_log_internal_urls.py
+STORE_LOG_HISTORY_ENDPOINT = "v1/execution-logs/log-history/bulk/"
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_LINGER_MS = 200
+DEFAULT_STATS_INTERVAL = 60
+DEFAULT_INSERT_TIMEOUT = 60
+# Kept below the Redis client's socket timeout so BLPOP never trips it
+BLOCK_TIMEOUT_SECONDS = 2
+MAX_BACKOFF_SECONDS = 30.0
+
+
+class InsertRejectedError(Exception):
+    """The backend refused the batch as malformed; retrying won't help."""
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name, "")
+    try:
+        return max(1, int(raw)) if raw else default
+    except ValueError:
+        logger.warning(f"Invalid {name}={raw!r}, using {default}")
+        return default
+
+
+@dataclass
+class DrainStats:
+    """Counters for the periodic stats line, reset after each report."""
+
+    inserted: int = 0
+    skipped: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    dropped: int = 0
+    since: float = field(default_factory=time.monotonic)
+
+    def report(self, queue_depth: int) -> None:
+        elapsed = max(time.monotonic() - self.since, 1e-6)
+        logger.info(
+            "Log history drain: queue_depth=%s inserted=%s (%.1f/s) skipped=%s "
+            "batches=%s failed_batches=%s dropped=%s",
+            queue_depth,
+            self.inserted,
+            self.inserted / elapsed,
+            self.skipped,
+            self.batches,
+            self.failed_batches,
+            self.dropped,
+        )
+
+
+class LogHistoryDrainer:
+    """Moves logs from the Redis log history queue to the backend in batches."""
+
+    def __init__(
+        self,
+        redis_client: RedisQueueClient,
+        http_client: httpx.Client,
+        queue_name: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        linger_seconds: float = DEFAULT_LINGER_MS / 1000,
+        stats_interval: float = DEFAULT_STATS_INTERVAL,
+    ):
+        self.redis_client = redis_client
+        self.http_client = http_client
+        self.queue_name = queue_name
+        self.batch_size = batch_size
+        self.linger_seconds = linger_seconds
+        self.stats_interval = stats_interval
+        self.stats = DrainStats()
+        self.stop_event = threading.Event()
+        self._backoff = 0.0
+        self._last_batch_full = False
+        self._last_report = time.monotonic()
+
+    def run(self) -> None:
+        logger.info(
+            f"Draining log history queue '{self.queue_name}' "
+            f"(batch size {self.batch_size})"
+        )
+        while not self.stop_event.is_set():
+            try:
+                self.drain_once()
+            except Exception:
+                # Redis unavailable; nothing was popped, so nothing is lost
+                logger.exception("Error draining log history queue")
+                self._wait_backoff()
+            self._maybe_report()
+        logger.info("Log history drain stopped")
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    def drain_once(self) -> int:
+        """Pop and store one batch; returns the number of logs popped."""
+        batch = self.pop_batch()
+        if not batch:
+            return 0
+        batch = self.assign_ids(batch)
+        try:
+            result = self.store(batch)
+        except InsertRejectedError as e:
+            logger.error(f"Dropping {len(batch)} logs rejected by backend: {e}")
+            self.stats.dropped += len(batch)
+            return len(batch)
+        except Exception as e:
+            logger.warning(f"Failed to store {len(batch)} logs, requeueing: {e}")
+            self.requeue(batch)
+            self.stats.failed_batches += 1
+            self._wait_backoff()
+            return len(batch)
+
+        self._backoff = 0.0
+        self.stats.batches += 1
+        self.stats.inserted += result.get("processed_count", 0)
+        self.stats.skipped += result.get("skipped_count", 0)
+        return len(batch)
+
+    def pop_batch(self) -> list[str]:
+        """Block for the first log, then take up to a full batch atomically."""
+        popped = self.redis_client.blpop(self.queue_name, timeout=BLOCK_TIMEOUT_SECONDS)
+        if not popped:
+            return []
+        batch = [popped[1]]
+        if self.batch_size == 1:
+            return batch
+
+        if self.linger_seconds and not self._last_batch_full:
+            # Trickle of logs: give the queue a moment to fill up so we
+            # don't make one backend call per log line
+            self.stop_event.wait(self.linger_seconds)
+
+        pipe = self.redis_client.redis_client.pipeline(transaction=True)
+        pipe.lrange(self.queue_name, 0, self.batch_size - 2)
+        pipe.ltrim(self.queue_name, self.batch_size - 1, -1)
+        rest, _ = pipe.execute()
+        batch.extend(rest)
+        self._last_batch_full = len(batch) == self.batch_size
+        return batch
+
+    def assign_ids(self, batch: list[str]) -> list[str]:
+        """Give logs without one a client-generated id.
+
+        The backend inserts with ``ignore_conflicts``, so with the id kept
+        across requeues a retried log can't be stored twice.
+        """
+        with_ids = []
+        for log in batch:
+            try:
+                payload = json.loads(log)
+            except json.JSONDecodeError:
+                payload = None  # Left for the backend to skip
+            if isinstance(payload, dict) and LogFieldName.LOG_ID not in payload:
+                payload[LogFieldName.LOG_ID] = str(uuid.uuid4())
+                log = json.dumps(payload)
+            with_ids.append(log)
+        return with_ids
+
+    def store(self, batch: list[str]) -> dict:
+        response = self.http_client.post(STORE_LOG_HISTORY_ENDPOINT, json={"logs": batch})
+        if response.status_code == 400:
+            raise InsertRejectedError(response.text[:500])
+        response.raise_for_status()
+        return response.json()
+
+    def requeue(self, batch: list[str]) -> None:
+        # LPUSH prepends one value at a time, so push in reverse to restore
+        # the original order at the head of the queue
+        self.redis_client.lpush(self.queue_name, *reversed(batch))
+
+    def _wait_backoff(self) -> None:
+        self._backoff = min(max(self._backoff * 2, 1.0), MAX_BACKOFF_SECONDS)
+        self.stop_event.wait(self._backoff)
+
+    def _maybe_report(self) -> None:
+        now = time.monotonic()
+        if now - self._last_report < self.stats_interval:
+            return
+        self._last_report = now
+        try:
+            queue_depth = self.redis_client.llen(self.queue_name)
+        except Exception:
+            queue_depth = "unknown"
+        self.stats.report(queue_depth)
+        self.stats = DrainStats()
+
+
+def main() -> bool:
+    internal_api_base_url = os.getenv("INTERNAL_API_BASE_URL")
+    internal_api_key = os.getenv("INTERNAL_SERVICE_API_KEY")
+    queue_name = os.getenv("LOG_HISTORY_QUEUE_NAME")
+
+    if not internal_api_base_url:
+        logger.error("INTERNAL_API_BASE_URL environment variable not set")
+        return False
+    if not internal_api_key:
+        logger.error("INTERNAL_SERVICE_API_KEY environment variable not set")
+        return False
+    if not queue_name:
+        logger.error("LOG_HISTORY_QUEUE_NAME environment variable not set")
+        return False
+
+    http_client = httpx.Client(
+        base_url=f"{internal_api_base_url.rstrip('/')}/",
+        headers={"Authorization": f"Bearer {internal_api_key}"},
+        timeout=float(_env_int("LOG_HISTORY_DRAIN_TIMEOUT", DEFAULT_INSERT_TIMEOUT)),
+        transport=httpx.HTTPTransport(retries=3),
+    )
+    drainer = LogHistoryDrainer(
+        redis_client=RedisQueueClient.from_env(),
+        http_client=http_client,
+        queue_name=queue_name,
+        batch_size=_env_int("LOG_HISTORY_DRAIN_BATCH_SIZE", DEFAULT_BATCH_SIZE),
+        linger_seconds=_env_int("LOG_HISTORY_DRAIN_LINGER_MS", DEFAULT_LINGER_MS) / 1000,
+        stats_interval=_env_int(
+            "LOG_HISTORY_DRAIN_STATS_INTERVAL", DEFAULT_STATS_INTERVAL
+        ),
+    )
+
+    # Finish (or requeue) the batch in flight, then exit
+    signal.signal(signal.SIGTERM, lambda *_: drainer.stop())
+    signal.signal(signal.SIGINT, lambda *_: drainer.stop())
+    with http_client:
+        drainer.run()
+    return True
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    sys.exit(0 if main() else 1)
@@ -6,6 +6,13 @@ set -uo pipefail
 LOG_HISTORY_INTERVAL="${LOG_HISTORY_CONSUMER_INTERVAL:-5}"
 DEFAULT_LOG_HISTORY_CMD="/app/.venv/bin/python /app/log_consumer/process_log_history.py"
 LOG_HISTORY_CMD="${TASK_TRIGGER_COMMAND:-$DEFAULT_LOG_HISTORY_CMD}"
+# With LOG_HISTORY_DRAIN_MODE=true the periodic trigger above is replaced by a
+# long-running drainer that blocks on the queue and bulk inserts in batches.
+# It is restarted on the next tick if it exits.
+LOG_HISTORY_DRAIN_MODE="${LOG_HISTORY_DRAIN_MODE:-false}"
+DEFAULT_DRAIN_CMD="/app/.venv/bin/python /app/log_consumer/drain_log_history.py"
+DRAIN_CMD="${LOG_HISTORY_DRAIN_COMMAND:-$DEFAULT_DRAIN_CMD}"
+drain_pid=""
 
 # Task 2: notification buffer flush (clubbed dispatch).
 # Polls on its OWN cadence (NOTIFICATION_BUFFER_POLL_INTERVAL), decoupled from
@@ -31,7 +38,11 @@ echo "=========================================="
 echo "Log Consumer Scheduler Starting"
 echo "=========================================="
 echo "Log history interval: ${LOG_HISTORY_INTERVAL}s  |  Buffer flush interval: ${NOTIFICATION_BUFFER_INTERVAL}s"
-echo "Task 1 (log history): ${LOG_HISTORY_CMD}"
+if [[ "${LOG_HISTORY_DRAIN_MODE}" == "true" ]]; then
+    echo "Task 1 (log history, drain mode): ${DRAIN_CMD}"
+else
+    echo "Task 1 (log history): ${LOG_HISTORY_CMD}"
+fi
 echo "Task 2 (notification buffer flush): ${BUFFER_FLUSH_CMD}"
 echo "=========================================="
 
@@ -41,6 +52,11 @@ cleanup() {
     echo "Scheduler received shutdown signal"
     echo "Exiting gracefully..."
     echo "=========================================="
+    if [[ -n "${drain_pid}" ]]; then
+        # The drainer finishes or requeues its in-flight batch on SIGTERM
+        kill -TERM "${drain_pid}" 2>/dev/null
+        wait "${drain_pid}" 2>/dev/null
+    fi
     return 0
 }
 
@@ -73,7 +89,15 @@ last_buffer_run=0
 while true; do
     now=$(date '+%s')
 
-    if [[ $((now - last_log_run)) -ge "${LOG_HISTORY_INTERVAL}" ]]; then
+    if [[ "${LOG_HISTORY_DRAIN_MODE}" == "true" ]]; then
+        if [[ -z "${drain_pid}" ]] || ! kill -0 "${drain_pid}" 2>/dev/null; then
+            [[ -n "${drain_pid}" ]] && echo "[$(date '+%Y-%m-%d %H:%M:%S')] ✗ log history drainer exited, restarting"
+            # exec so $! is the drainer itself and receives the SIGTERM
+            eval "exec ${DRAIN_CMD}" 2>&1 &
+            drain_pid=$!
+            echo "[$(date '+%Y-%m-%d %H:%M:%S')] Started log history drainer (pid ${drain_pid})"
+        fi
+    elif [[ $((now - last_log_run)) -ge "${LOG_HISTORY_INTERVAL}" ]]; then
         run_count=$((run_count + 1))
         run_task "process_log_history" "${LOG_HISTORY_CMD}" "${run_count}"
         last_log_run="${now}"
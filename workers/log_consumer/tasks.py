@@ -16,7 +16,7 @@ from shared.utils.api_client_singleton import get_singleton_api_client
 
 from unstract.core.cache.redis_queue_client import RedisQueueClient
 from unstract.core.constants import LogEventArgument, LogProcessingTask
-from unstract.core.log_utils import store_execution_log
+from unstract.core.log_utils import store_execution_log, store_execution_logs
 
 logger = WorkerLogger.get_logger(__name__)
 
@@ -83,10 +83,17 @@ def logs_consumer(**kwargs: Any) -> None:
             USER_SESSION_ID: The room to be processed.
             EVENT: The event to be processed Ex: logs:{session_id}.
             MESSAGE: The message to be processed Ex: execution log.
+            MESSAGES: Batch of messages, sent instead of MESSAGE by a
+                batching LogPublisher. Emitted as a single WebSocket event.
     """
-    log_message = kwargs.get(LogEventArgument.MESSAGE)
     room = kwargs.get(LogEventArgument.USER_SESSION_ID)
     event = kwargs.get(LogEventArgument.EVENT)
+    log_messages = kwargs.get(LogEventArgument.MESSAGES)
+    if log_messages is not None:
+        _consume_batch(log_messages, room, event)
+        return
+
+    log_message = kwargs.get(LogEventArgument.MESSAGE)
 
     logger.debug(f"[{os.getpid()}] Log message received: {log_message} for room {room}")
 
@@ -118,6 +125,34 @@ def logs_consumer(**kwargs: Any) -> None:
         logger.error(f"Failed to emit WebSocket event: {e}")
 
 
+def _consume_batch(log_messages: list[Any], room: str | None, event: str | None) -> None:
+    """Store a batch of logs and emit it as one WebSocket event."""
+    logger.debug(
+        f"[{os.getpid()}] {len(log_messages)} log messages received for room {room}"
+    )
+
+    if not room or not event:
+        logger.warning(f"Messages received without room and event: {log_messages}")
+        return
+
+    try:
+        store_execution_logs(
+            data=log_messages,
+            redis_client=redis_client.redis_client,
+            log_queue_name=log_queue_name,
+            is_enabled=log_storage_enabled,
+        )
+    except Exception as e:
+        logger.error(f"Failed to store execution logs: {e}")
+
+    try:
+        safe_messages = json.loads(json.dumps(log_messages, default=str))
+        sio.emit(event, data={"data": safe_messages}, room=room)
+        logger.debug(f"WebSocket batch event emitted successfully for room {room}")
+    except Exception as e:
+        logger.error(f"Failed to emit WebSocket event: {e}")
+
+
 # Health check task for monitoring
 @worker_task(name="log_consumer_health_check")
 def health_check() -> dict[str, Any]:
@@ -30,7 +30,7 @@ from celery import current_app
 
 from .fairness import DEFAULT_PRIORITY, FairnessKey
 from .handle import DispatchHandle
-from .pg_queue import PgQueueClient, to_payload
+from .pg_queue import OutboundMessage, PgQueueClient, to_payload
 from .routing import QueueBackend, resolve_backend
 
 logger = logging.getLogger(__name__)
@@ -112,17 +112,19 @@ def dispatch(
     )
 
 
-def _enqueue_pg(
+def pg_message(
     task_name: str,
     args: Sequence[Any] | None,
     kwargs: Mapping[str, Any] | None,
     queue: str | None,
     fairness: FairnessKey | None,
-) -> PgDispatchHandle:
-    """Serialise + enqueue a PG-routed task to ``pg_queue_message``.
+) -> OutboundMessage:
+    """Serialise a PG-routed task into the row :func:`_enqueue_pg` would write.
 
-    A PG enqueue failure raises (no silent Celery fallback — that would
-    hide the failure or risk double-dispatch).
+    Shared with the PG barrier's bulk header fan-out, which inserts a whole batch
+    of these in one statement (:func:`~queue_backend.pg_queue.client.insert_messages`)
+    instead of one :func:`dispatch` per header — so both paths write identical
+    payloads, queue defaults and org/priority columns.
     """
     pg_queue = queue or _DEFAULT_PG_QUEUE
     if task_name not in _pg_routing_logged:
@@ -143,27 +145,49 @@ def _enqueue_pg(
             task_name,
             pg_queue,
         )
-    payload = to_payload(
-        task_name, args=args, kwargs=kwargs, queue=queue, fairness=fairness
+    # Carry org_id + L3 priority onto the row so the dequeue can order by
+    # priority. A bare dispatch (fairness=None) writes the neutral defaults
+    # (org_id None → "" / DEFAULT_PRIORITY).
+    return OutboundMessage(
+        queue_name=pg_queue,
+        message=to_payload(
+            task_name, args=args, kwargs=kwargs, queue=queue, fairness=fairness
+        ),
+        org_id=fairness.org_id if fairness is not None else None,
+        priority=(
+            fairness.pipeline_priority if fairness is not None else DEFAULT_PRIORITY
+        ),
     )
+
+
+def _enqueue_pg(
+    task_name: str,
+    args: Sequence[Any] | None,
+    kwargs: Mapping[str, Any] | None,
+    queue: str | None,
+    fairness: FairnessKey | None,
+) -> PgDispatchHandle:
+    """Serialise + enqueue a PG-routed task to ``pg_queue_message``.
+
+    A PG enqueue failure raises (no silent Celery fallback — that would
+    hide the failure or risk double-dispatch).
+    """
+    message = pg_message(task_name, args, kwargs, queue, fairness)
     try:
-        # Carry org_id + L3 priority onto the row so the dequeue can order by
-        # priority. A bare dispatch (fairness=None) writes the neutral defaults
-        # (org_id None → "" / DEFAULT_PRIORITY).
         msg_id = _get_pg_client().send(
-            pg_queue,
-            payload,
-            org_id=fairness.org_id if fairness is not None else None,
-            priority=(
-                fairness.pipeline_priority if fairness is not None else DEFAULT_PRIORITY
-            ),
+            message.queue_name,
+            message.message,
+            org_id=message.org_id,
+            priority=message.priority,
         )
     except Exception:
         # Re-raise with a breadcrumb (raw psycopg2.Error / a json.dumps
         # TypeError on a non-serialisable arg would otherwise propagate with
         # no "this was a PG-routed dispatch" context). No Celery fallback.
         logger.exception(
-            "PG-queue: failed to enqueue task=%r to queue=%r", task_name, pg_queue
+            "PG-queue: failed to enqueue task=%r to queue=%r",
+            task_name,
+            message.queue_name,
         )
         raise
     return PgDispatchHandle(id=str(msg_id))
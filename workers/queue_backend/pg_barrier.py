@@ -22,7 +22,9 @@ for the fan-in. The transport for the header tasks themselves is unchanged
    state from a prior run reusing the same ``execution_id``. Each header task is
    dispatched with
    ``.link(barrier_pg_decr_and_check)`` (success) and
-   ``.link_error(barrier_pg_abort)`` (failure).
+   ``.link_error(barrier_pg_abort)`` (failure). On the ``pg_queue`` transport the
+   headers are instead inserted into ``pg_queue_message`` by ONE multi-row INSERT
+   in the same transaction as the UPSERT, so the fan-out is all-or-nothing.
 2. Per-task success: ``barrier_pg_decr_and_check`` runs ONE atomic statement —
    ``UPDATE … SET remaining = remaining - 1, results = results ||
    jsonb_build_array(result) … RETURNING remaining, results``. The row lock
@@ -97,8 +99,10 @@ from .fairness import (
     WorkloadType,
 )
 from .handle import BarrierHandle
+from .pg_queue.client import OutboundMessage, insert_messages
 from .pg_queue.connection import CONN_DEAD_ERRORS as _CONN_DEAD_ERRORS
 from .pg_queue.connection import create_pg_connection
+from .pg_queue.notify import notify_enabled_from_env
 from .pg_queue.schema import qualified
 
 if TYPE_CHECKING:
@@ -292,6 +296,28 @@ def _run_returning_claim_with_reconnect(
     RETURNING claim is non-idempotent.) ``what`` is a caller-formatted log label,
     e.g. ``[exec:<id>] claim_batch(<n>)``.
     """
+    return _run_phase_split_write(
+        operation,
+        what=what,
+        commit_failure_note=(
+            "a re-run could flip the claim → the caller skips and the barrier "
+            "strands; if the row persisted, the redelivery skips and the reaper "
+            "recovers at expiry"
+        ),
+    )
+
+
+def _run_phase_split_write[T](
+    operation: Callable[[PgCursor], T], *, what: str, commit_failure_note: str
+) -> T:
+    """Run ``operation(cur)`` in one transaction, retrying ONCE only on an
+    execute-phase failure of a cached connection; never on commit (ambiguous).
+
+    The engine behind :func:`_run_returning_claim_with_reconnect` and the atomic
+    PG header fan-out in :meth:`PgBarrier.enqueue` — both are non-idempotent, so
+    only the provably-uncommitted phase may be re-run. ``commit_failure_note``
+    says what an ambiguous commit means for the caller (logged, then re-raised).
+    """
     # Only a CACHED handle can be a stale idle-reap; sample before _get_conn()
     # materialises one, so a fresh-conn failure isn't misread as a reap.
     reused = getattr(_local, "conn", None) is not None and not _local.conn.closed
@@ -299,13 +325,13 @@ def _run_returning_claim_with_reconnect(
         conn = _get_conn()
         try:
             with conn.cursor() as cur:
-                won = operation(cur)
+                result = operation(cur)
         except Exception as exc:
             conn_dead = _recover_after_error(conn, exc)
             if conn_dead and reused and attempt < _BARRIER_WRITE_ATTEMPTS:
                 logger.warning(
                     "%s: execute failed on a cached connection (%s) — reconnecting "
-                    "and retrying once (attempt %d/%d); the INSERT never committed.",
+                    "and retrying once (attempt %d/%d); the write never committed.",
                     what,
                     type(exc).__name__,
                     attempt,
@@ -326,17 +352,16 @@ def _run_returning_claim_with_reconnect(
             _recover_after_error(conn, exc)
             logger.warning(
                 "%s: commit failed (%s) — NOT retrying (the server may already have "
-                "committed; a re-run could flip the claim → the caller skips and the "
-                "barrier strands; if the row persisted, the redelivery skips and the "
-                "reaper recovers at expiry). Propagating.",
+                "committed; %s). Propagating.",
                 what,
                 type(exc).__name__,
+                commit_failure_note,
                 exc_info=True,
             )
             raise
-        return won
+        return result
     # Unreachable: the loop either returns or raises.
-    raise AssertionError(f"{what}: claim loop fell through")
+    raise AssertionError(f"{what}: write loop fell through")
 
 
 def claim_batch(execution_id: str, batch_index: int) -> bool:
@@ -520,11 +545,12 @@ def _dispatch_pg(
     """Enqueue a task onto the PG queue (the one place that owns the cycle-avoiding
     local imports + the ``backend=QueueBackend.PG`` argument).
 
-    Both the header fan-out (:meth:`PgBarrier._dispatch_header_pg`) and the
-    self-chained callback (:func:`_fire_barrier_callback`) route through here.
-    Returns the ``dispatch`` handle. ``queue`` is required (may be ``None`` only
-    if the caller has already logged the fallback) — a ``None`` queue makes
-    ``dispatch`` fall back to its default PG queue.
+    The self-chained callback (:func:`_fire_barrier_callback`) routes through
+    here; the header fan-out bulk-inserts its rows instead
+    (:meth:`PgBarrier._enqueue_headers_pg`). Returns the ``dispatch`` handle.
+    ``queue`` is required (may be ``None`` only if the caller has already logged
+    the fallback) — a ``None`` queue makes ``dispatch`` fall back to its default
+    PG queue.
     """
     # Local import: dispatch/routing pull in queue plumbing that imports the
     # barrier package — importing at module load would be a cycle.
@@ -668,20 +694,26 @@ class PgBarrier:
                     (execution_id,),
                 )
 
-            # Idempotent + pre-dispatch → safe to retry; see
-            # _run_idempotent_pre_dispatch_write.
-            _run_idempotent_pre_dispatch_write(
-                _reset_barrier, what=f"enqueue exec={execution_id}"
-            )
-
-            self._dispatch_headers(
-                header_tasks,
-                is_pg=is_pg,
-                execution_id=execution_id,
-                callback_descriptor=callback_descriptor,
-                fairness=fairness,
-                fairness_headers=fairness_headers,
-            )
+            if is_pg:
+                self._enqueue_headers_pg(
+                    header_tasks,
+                    reset_barrier=_reset_barrier,
+                    execution_id=execution_id,
+                    callback_descriptor=callback_descriptor,
+                    fairness=fairness,
+                )
+            else:
+                # Idempotent + pre-dispatch → safe to retry; see
+                # _run_idempotent_pre_dispatch_write.
+                _run_idempotent_pre_dispatch_write(
+                    _reset_barrier, what=f"enqueue exec={execution_id}"
+                )
+                self._dispatch_headers_celery(
+                    header_tasks,
+                    execution_id=execution_id,
+                    callback_descriptor=callback_descriptor,
+                    fairness_headers=fairness_headers,
+                )
 
             logger.info(
                 f"Barrier enqueued via PgBarrier ({transport}) — "
@@ -700,25 +732,71 @@ class PgBarrier:
             )
             raise
 
-    def _dispatch_headers(
+    def _enqueue_headers_pg(
         self,
         header_tasks: list[Signature],
         *,
-        is_pg: bool,
+        reset_barrier: Callable[[PgCursor], None],
         execution_id: str,
         callback_descriptor: CallbackDescriptor,
         fairness: FairnessKey | None,
+    ) -> None:
+        """PG fan-out: reset the barrier AND enqueue all N headers in ONE
+        transaction, with one multi-row INSERT.
+
+        Atomic, so the fan-out is all-or-nothing: there is no "header ``i`` of N
+        never reached the queue" state for the counter to strand on, and the
+        enqueue costs one statement instead of N ``send`` round trips. The
+        payloads are serialised before the transaction opens (a non-JSON arg
+        fails before anything is written).
+
+        Not idempotent (a re-run would enqueue the headers twice), so it retries
+        only the provably-uncommitted execute phase
+        (:func:`_run_phase_split_write`). An ambiguous commit failure may have
+        committed the batch, so — as the old per-header cleanup did — the barrier
+        row and any dedup markers are deleted before re-raising: headers that did
+        land then find no row and abandon instead of firing a callback for an
+        execution the caller has already failed.
+        """
+        messages = [
+            self._header_message(task, i, execution_id, callback_descriptor, fairness)
+            for i, task in enumerate(header_tasks)
+        ]
+        notify = notify_enabled_from_env()
+
+        def _reset_and_enqueue(cur: PgCursor) -> None:
+            reset_barrier(cur)
+            insert_messages(cur, messages, notify=notify)
+
+        try:
+            _run_phase_split_write(
+                _reset_and_enqueue,
+                what=f"[exec:{execution_id}] enqueue {len(messages)} PG header(s)",
+                commit_failure_note=(
+                    "the headers may be on the queue, so the barrier row is deleted "
+                    "and any landed header abandons at its decrement"
+                ),
+            )
+        except Exception:
+            with contextlib.suppress(Exception):
+                _delete_barrier(execution_id)
+            with contextlib.suppress(Exception):
+                clear_execution_batches(execution_id)
+            raise
+
+    def _dispatch_headers_celery(
+        self,
+        header_tasks: list[Signature],
+        *,
+        execution_id: str,
+        callback_descriptor: CallbackDescriptor,
         fairness_headers: dict[str, Any] | None,
     ) -> None:
-        """Dispatch the N header tasks, one transport or the other.
-
-        PG path (``is_pg``) → fire-and-forget onto the PG queue via
-        :meth:`_dispatch_header_pg` (no ``.link``). Celery path → ``.link`` /
-        ``.link_error`` chord-style. On any mid-loop dispatch failure, ``i`` of N
-        never reached the queue so the counter can't reach 0 — delete the barrier
-        row (and, on the PG path, reclaim dedup markers an earlier header may have
-        committed, since the in-flight ``barrier_pg_abort`` is a no-op once the row
-        is gone) so an in-flight decrement finds nothing, then re-raise.
+        """Dispatch the N header tasks chord-style (``.link`` / ``.link_error``).
+
+        On any mid-loop dispatch failure, ``i`` of N never reached the queue so the
+        counter can't reach 0 — delete the barrier row so an in-flight decrement
+        finds nothing, then re-raise.
         """
         link_signature = barrier_pg_decr_and_check.s(
             execution_id=execution_id, callback_descriptor=callback_descriptor
@@ -726,23 +804,15 @@ class PgBarrier:
         link_error_signature = barrier_pg_abort.s(execution_id=execution_id)
         for i, task in enumerate(header_tasks):
             try:
-                if is_pg:
-                    self._dispatch_header_pg(
-                        task, i, execution_id, callback_descriptor, fairness
-                    )
-                else:
-                    cloned = task.clone()
-                    if fairness_headers:
-                        cloned.set(headers=fairness_headers)
-                    cloned.link(link_signature)
-                    cloned.link_error(link_error_signature)
-                    cloned.apply_async()
+                cloned = task.clone()
+                if fairness_headers:
+                    cloned.set(headers=fairness_headers)
+                cloned.link(link_signature)
+                cloned.link_error(link_error_signature)
+                cloned.apply_async()
             except Exception:
                 with contextlib.suppress(Exception):
                     _delete_barrier(execution_id)
-                if is_pg:
-                    with contextlib.suppress(Exception):
-                        clear_execution_batches(execution_id)
                 logger.exception(
                     f"[exec:{execution_id}] header dispatch failed at task "
                     f"{i}/{len(header_tasks)}; barrier row deleted to prevent "
@@ -751,23 +821,28 @@ class PgBarrier:
                 raise
 
     @staticmethod
-    def _dispatch_header_pg(
+    def _header_message(
         task: Signature,
         batch_index: int,
         execution_id: str,
         callback_descriptor: CallbackDescriptor,
         fairness: FairnessKey | None,
-    ) -> None:
-        """Dispatch one header task onto the PG queue (fire-and-forget mode).
+    ) -> OutboundMessage:
+        """Build one header task's PG queue row (fire-and-forget mode).
 
         Unpacks the Celery ``Signature`` (the fan-out built it as
         ``app.signature(name, kwargs={batch_files, batch_index, total_batches},
-        queue=...)`` — the batch payload is in ``kwargs``) and re-dispatches it via
-        :func:`_dispatch_pg` with an added ``_barrier_context`` kwarg. The PG
-        consumer runs the task; it claims ``(execution_id, batch_index)`` and runs
-        the decrement in-body (no ``.link``). ``fairness`` carries org/priority
-        onto the row exactly as the bare-dispatch sites do.
+        queue=...)`` — the batch payload is in ``kwargs``) into the same row
+        :func:`~queue_backend.dispatch.dispatch` would write, plus an added
+        ``_barrier_context`` kwarg. The PG consumer runs the task; it claims
+        ``(execution_id, batch_index)`` and runs the decrement in-body (no
+        ``.link``). ``fairness`` carries org/priority onto the row exactly as the
+        bare-dispatch sites do.
         """
+        # Local import: dispatch pulls in queue plumbing that imports the barrier
+        # package — importing at module load would be a cycle.
+        from .dispatch import pg_message
+
         barrier_context: BarrierContext = {
             "execution_id": execution_id,
             "batch_index": batch_index,
@@ -785,12 +860,12 @@ class PgBarrier:
                 f"{batch_index}) has no queue option — falling back to the default "
                 f"PG queue; the consumer for the intended queue won't see it."
             )
-        _dispatch_pg(
+        return pg_message(
             task.task,
-            args=list(task.args or ()),
-            kwargs=header_kwargs,
-            queue=queue,
-            fairness=fairness,
+            list(task.args or ()),
+            header_kwargs,
+            queue,
+            fairness,
         )
 
 
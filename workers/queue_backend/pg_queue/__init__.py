@@ -20,7 +20,7 @@ Default-empty ``WORKER_PG_QUEUE_ENABLED_TASKS`` → everything still routes to
 Celery, so this is inert unless a task is explicitly opted in.
 """
 
-from .client import PgQueueClient, QueueMessage
+from .client import OutboundMessage, PgQueueClient, QueueMessage
 from .connection import create_pg_connection
 from .leader_election import LeaderLease, default_worker_id, lease_seconds_from_env
 from .liveness import LivenessServer
@@ -38,6 +38,7 @@ __all__ = [
     "LeaderLease",
     "LeaderLeaseLike",
     "LivenessServer",
+    "OutboundMessage",
     "PgQueueClient",
     "PgReaper",
     "QueueMessage",
@@ -34,7 +34,7 @@ import contextlib
 import json
 import logging
 import time
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, Self
 
@@ -43,6 +43,7 @@ from unstract.core.data_models import QueueMessageState
 from ..fairness import DEFAULT_PRIORITY, MAX_PRIORITY, MIN_PRIORITY
 from .connection import CONN_DEAD_ERRORS as _CONN_DEAD_ERRORS
 from .connection import create_pg_connection
+from .notify import emit_notify, notify_enabled_from_env
 from .schema import qualified
 
 if TYPE_CHECKING:
@@ -154,6 +155,12 @@ class QueueMessage:
     read_ct: int
 
 
+# Columns every enqueue writes (the single-row and batch INSERTs below).
+_INSERT_COLUMNS: Final = (
+    "queue_name, message, org_id, priority, enqueued_at, vt, read_ct, state"
+)
+
+
 # The whole enqueue contract (columns + their defaults) in one place. `send()`
 # appends ``RETURNING msg_id``; the PG scheduler (pg_scheduler.py) executes this
 # verbatim inside its own transaction so the enqueue + next_run advance commit
@@ -165,11 +172,103 @@ class QueueMessage:
 def insert_message_sql() -> str:
     return (
         f"INSERT INTO {qualified('pg_queue_message')} "
-        "(queue_name, message, org_id, priority, enqueued_at, vt, read_ct, state) "
+        f"({_INSERT_COLUMNS}) "
         f"VALUES (%s, %s::jsonb, %s, %s, now(), now(), 0, '{_READY}')"
     )
 
 
+# Batch form of the enqueue contract used by :func:`insert_messages`. The rows
+# arrive as four parallel arrays unnested ``WITH ORDINALITY``, and each row's
+# ``msg_id`` is drawn from the column's sequence in the ``batch`` CTE next to
+# its ordinal — so the ids map back onto the inputs by ``ord``, not by the
+# order of ``RETURNING`` (which Postgres does not guarantee for a multi-row
+# INSERT). The data-modifying CTE runs even though the outer SELECT only reads
+# ``batch``. A fixed statement with array parameters, so the batch size does not
+# change the SQL text.
+def _insert_messages_sql() -> str:
+    table = qualified("pg_queue_message")
+    return (
+        "WITH batch AS MATERIALIZED ("
+        " SELECT nextval(pg_get_serial_sequence(%s, 'msg_id')) AS msg_id, r.*"
+        " FROM unnest(%s::text[], %s::jsonb[], %s::text[], %s::smallint[])"
+        " WITH ORDINALITY AS r(queue_name, message, org_id, priority, ord)"
+        "), inserted AS ("
+        f" INSERT INTO {table} (msg_id, {_INSERT_COLUMNS})"
+        " SELECT msg_id, queue_name, message, org_id, priority,"
+        f" now(), now(), 0, '{_READY}' FROM batch"
+        ") "
+        "SELECT msg_id, ord FROM batch"
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class OutboundMessage:
+    """One message for :meth:`PgQueueClient.send_many` / :func:`insert_messages`.
+
+    Same fields (and the same ``org_id`` / ``priority`` defaults) as the keyword
+    arguments of :meth:`PgQueueClient.send`.
+    """
+
+    queue_name: str
+    message: dict[str, Any]
+    org_id: str | None = None
+    priority: int = DEFAULT_PRIORITY
+
+
+def _check_priority(priority: int) -> None:
+    if not MIN_PRIORITY <= priority <= MAX_PRIORITY:
+        raise ValueError(
+            f"priority out of range [{MIN_PRIORITY}, {MAX_PRIORITY}]: {priority!r}"
+        )
+
+
+def _row_params(
+    queue_name: str, message: dict[str, Any], org_id: str | None, priority: int
+) -> tuple[str, str, str, int]:
+    # "" rather than NULL for "no org" — the column is non-null
+    # (string fields shouldn't have two empty values; Django S6553).
+    return (
+        queue_name,
+        json.dumps(message),
+        org_id if org_id is not None else "",
+        priority,
+    )
+
+
+def insert_messages(
+    cur: Any, messages: Sequence[OutboundMessage], *, notify: bool = False
+) -> list[int]:
+    """Enqueue ``messages`` with ONE statement on ``cur``; returns their
+    ``msg_id`` s in input order.
+
+    Runs inside the caller's transaction and does not commit — so a fan-out can
+    make the enqueue atomic with its own bookkeeping (the PG barrier resets its
+    ``pg_barrier_state`` row in the same transaction). :meth:`PgQueueClient.send_many`
+    is the self-committing wrapper. ``notify`` emits one wake-up NOTIFY per
+    distinct queue (delivered at the caller's commit).
+
+    The ids are paired with the inputs by the ordinal the statement returns next
+    to each one (see :func:`_insert_messages_sql`), never by row position.
+    """
+    if not messages:
+        return []
+    columns: tuple[list[Any], ...] = ([], [], [], [])
+    for m in messages:
+        _check_priority(m.priority)
+        for column, value in zip(
+            columns,
+            _row_params(m.queue_name, m.message, m.org_id, m.priority),
+            strict=True,
+        ):
+            column.append(value)
+    cur.execute(_insert_messages_sql(), (qualified("pg_queue_message"), *columns))
+    by_ordinal = {int(ordinal): int(msg_id) for msg_id, ordinal in cur.fetchall()}
+    if notify:
+        for queue_name in dict.fromkeys(m.queue_name for m in messages):
+            emit_notify(cur, queue_name)
+    return [by_ordinal[i] for i in range(1, len(messages) + 1)]
+
+
 # Pause duration before send()'s single reconnect-retry (see send()). This is
 # the length of the pause, NOT the retry count — the one-shot bound is enforced
 # structurally by send()'s single ``except`` + single retry call, not by this
@@ -184,18 +283,25 @@ _SEND_RETRY_BACKOFF_SECONDS: Final = 0.5
 
 
 class PgQueueClient:
-    """``send`` / ``read`` / ``delete`` over ``pg_queue_message``.
+    """``send`` / ``send_many`` / ``read`` / ``delete`` over ``pg_queue_message``.
 
     A connection may be injected (tests); otherwise one is created lazily
     from the backend ``DB_*`` env on first use and owned by this client
     (closed by :meth:`close`, recovered automatically after a connection
     error). Usable as a context manager.
+
+    ``notify`` makes :meth:`send` emit the per-queue wake-up NOTIFY in the
+    INSERT's transaction (see :mod:`queue_backend.pg_queue.notify`); ``None``
+    reads ``WORKER_PG_QUEUE_NOTIFY_ENABLED``.
     """
 
-    def __init__(self, conn: PgConnection | None = None) -> None:
+    def __init__(
+        self, conn: PgConnection | None = None, *, notify: bool | None = None
+    ) -> None:
         self._conn = conn
         # Injected connections belong to the caller — never close/recycle them.
         self._owns_conn = conn is None
+        self._notify = notify_enabled_from_env() if notify is None else notify
 
     @property
     def conn(self) -> PgConnection:
@@ -290,10 +396,7 @@ class PgQueueClient:
         this ``send()`` via dispatch.py) — so it does not absorb every duplicate,
         only batch-header ones.
         """
-        if not MIN_PRIORITY <= priority <= MAX_PRIORITY:
-            raise ValueError(
-                f"priority out of range [{MIN_PRIORITY}, {MAX_PRIORITY}]: {priority!r}"
-            )
+        _check_priority(priority)
         # Capture BEFORE the attempt: a fresh conn has self._conn is None here.
         reused = self._conn is not None and self._owns_conn
         try:
@@ -342,18 +445,57 @@ class PgQueueClient:
         with self._cursor() as cur:
             cur.execute(
                 insert_message_sql() + " RETURNING msg_id",
-                # "" rather than NULL for "no org" — the column is non-null
-                # (string fields shouldn't have two empty values; Django S6553).
-                (
-                    queue_name,
-                    json.dumps(message),
-                    org_id if org_id is not None else "",
-                    priority,
-                ),
+                _row_params(queue_name, message, org_id, priority),
             )
             msg_id = cur.fetchone()[0]
+            if self._notify:
+                # Same transaction as the INSERT: delivered only on commit.
+                emit_notify(cur, queue_name)
         return int(msg_id)
 
+    def send_many(self, messages: Sequence[OutboundMessage]) -> list[int]:
+        """Enqueue a batch with one multi-row INSERT + one commit; returns the
+        ``msg_id`` s in input order.
+
+        All-or-nothing: the batch commits as one transaction, so a fan-out can
+        never be left half-enqueued. Priorities are validated up front (before
+        any row is written). Same one-shot reconnect-retry — and the same
+        at-least-once caveat for a post-commit connection death — as
+        :meth:`send`, applied to the whole batch.
+        """
+        if not messages:
+            return []
+        reused = self._conn is not None and self._owns_conn
+        try:
+            return self._insert_many(messages)
+        except _CONN_DEAD_ERRORS as exc:
+            if not reused:
+                raise
+            logger.warning(
+                "PG-queue: send_many(%d messages) failed with a connection-level "
+                "error on a reused cached connection (%s: %s); dropping it and "
+                "retrying the batch once (stale reap or DB unavailable)",
+                len(messages),
+                type(exc).__name__,
+                exc,
+                exc_info=True,
+            )
+            time.sleep(_SEND_RETRY_BACKOFF_SECONDS)
+            msg_ids = self._insert_many(messages)
+            logger.info(
+                "PG-queue: send_many(%d messages) succeeded on reconnect "
+                "(msg_ids=%s..%s)",
+                len(msg_ids),
+                msg_ids[0],
+                msg_ids[-1],
+            )
+            return msg_ids
+
+    def _insert_many(self, messages: Sequence[OutboundMessage]) -> list[int]:
+        """One multi-row INSERT in its own transaction (see :meth:`send_many`)."""
+        with self._cursor() as cur:
+            return insert_messages(cur, messages, notify=self._notify)
+
     def read(
         self, queue_name: str, *, vt_seconds: int = 30, qty: int = 1
     ) -> list[QueueMessage]:
@@ -404,6 +546,30 @@ class PgQueueClient:
             )
             return cur.rowcount == 1
 
+    def set_vt_many(self, msg_ids: Sequence[int], vt_seconds: int) -> list[int]:
+        """Extend the lease of every message in ``msg_ids`` with one ``UPDATE``.
+
+        The batch form of :meth:`set_vt`, used by the consumer's batch lease (one
+        renewal thread keeping a whole claimed batch alive). Returns the ids that
+        were actually renewed — an id missing from the result is already gone
+        (acked, or reclaimed + acked elsewhere).
+
+        Never shortens a lease: a vt already further out (a poison re-park that
+        raced the renewal tick) is kept.
+        """
+        if vt_seconds <= 0:
+            raise ValueError(f"vt_seconds must be positive, got {vt_seconds}")
+        if not msg_ids:
+            return []
+        with self._cursor() as cur:
+            cur.execute(
+                f"UPDATE {qualified('pg_queue_message')} "
+                "SET vt = GREATEST(vt, now() + make_interval(secs => %s)) "
+                "WHERE msg_id = ANY(%s) RETURNING msg_id",
+                (vt_seconds, list(msg_ids)),
+            )
+            return [int(r[0]) for r in cur.fetchall()]
+
     def delete(self, msg_id: int) -> bool:
         """Ack a processed message. Returns ``True`` if a row was removed.
 
@@ -461,6 +627,44 @@ class PgQueueClient:
             )
         return deleted == 1
 
+    def delete_many(self, msg_ids: Sequence[int]) -> list[int]:
+        """Ack a group of processed messages with one ``DELETE … = ANY``; returns
+        the ids actually removed (a missing id was already gone — see :meth:`delete`).
+
+        Same one-shot reconnect-retry as :meth:`delete`, and safe for the same
+        reason: the DELETE is idempotent, so a re-run after an ambiguous commit
+        can only return fewer ids, never remove something twice.
+        """
+        if not msg_ids:
+            return []
+        reused = self._conn is not None and self._owns_conn
+        try:
+            return self._delete_rows(msg_ids)
+        except _CONN_DEAD_ERRORS as exc:
+            if not reused:
+                raise
+            logger.warning(
+                "PG-queue: delete_many(%d msg_ids) failed with a connection-level "
+                "error on a reused cached connection (%s: %s); dropping it and "
+                "retrying the grouped ack once",
+                len(msg_ids),
+                type(exc).__name__,
+                exc,
+                exc_info=True,
+            )
+            time.sleep(_SEND_RETRY_BACKOFF_SECONDS)
+            return self._delete_rows(msg_ids)
+
+    def _delete_rows(self, msg_ids: Sequence[int]) -> list[int]:
+        """One grouped DELETE by ``msg_id`` (see :meth:`delete_many`)."""
+        with self._cursor() as cur:
+            cur.execute(
+                f"DELETE FROM {qualified('pg_queue_message')} "
+                "WHERE msg_id = ANY(%s) RETURNING msg_id",
+                (list(msg_ids),),
+            )
+            return [int(r[0]) for r in cur.fetchall()]
+
     def close(self) -> None:
         """Close the connection if this client owns it (no-op if injected)."""
         if self._owns_conn and self._conn is not None:
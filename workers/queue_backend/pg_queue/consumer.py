@@ -30,7 +30,7 @@ import os
 import signal
 import threading
 import time
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from enum import Enum
 from typing import TYPE_CHECKING, Any, TypeVar
 
@@ -43,6 +43,7 @@ from ..fairness import FAIRNESS_HEADER_NAME
 from .client import PgQueueClient
 from .connection import CONN_DEAD_ERRORS
 from .liveness import LivenessServer as _BaseLivenessServer
+from .notify import QueueWaker
 from .result_backend import PgResultBackend
 from .task_payload import to_payload
 
@@ -69,11 +70,23 @@ _DEFAULT_VT_SECONDS = 30
 # redelivery in minutes instead of the full VT. VT_SECONDS is now the drain /
 # max-runtime bound (grace, health-stale), NOT the claim window.
 _DEFAULT_LEASE_SECONDS = 120
+# Batch lease: ONE renewal thread keeps the whole claimed batch alive (``set_vt_many``)
+# and completed messages are acked with one grouped DELETE at the end of the batch —
+# so a short-task queue can claim 50-100 per round trip without the tail lapsing.
+# Opt-in; with it off a batch > 1 is still forced to 1 under the renewable lease.
+_DEFAULT_BATCH_LEASE = False
 # Bounded join so a wedged renewal thread can't block the ack — it's a daemon and
 # dies with the process regardless.
 _LEASE_JOIN_TIMEOUT_SECONDS = 10.0
 _DEFAULT_POLL_INTERVAL = 0.1
 _DEFAULT_BACKOFF_MAX = 2.0
+# Idle wake strategy. ``poll`` sleeps the backoff between empty claims; ``listen``
+# blocks on a LISTEN connection for the same backoff and wakes as soon as a
+# producer NOTIFYs (see notify.py) — the backoff is then only the backstop, so
+# BACKOFF_MAX can be raised well above 2s to cut idle claim traffic.
+WAKE_MODE_POLL = "poll"
+WAKE_MODE_LISTEN = "listen"
+_WAKE_MODES = (WAKE_MODE_POLL, WAKE_MODE_LISTEN)
 # A task claimed more than this many times keeps failing — drop it (poison)
 # rather than redeliver forever.
 _DEFAULT_MAX_ATTEMPTS = 5
@@ -128,6 +141,51 @@ class _PoisonMarkOutcome(Enum):
     TRANSIENT = "transient"  # backend down / client build failed → re-park
 
 
+class _InFlightBatch:
+    """The claimed ids of one batch-lease cycle (see ``batch_lease``).
+
+    ``leased`` is shared with the renewal thread (guarded by a lock); ``acks`` —
+    completed ids awaiting the grouped DELETE — is only touched by the main thread.
+    The lock only covers the in-memory set, never a renewal's round trip, so acks
+    and releases don't wait on the DB.
+    """
+
+    def __init__(self, msg_ids: Iterable[int]) -> None:
+        self._lock = threading.Lock()
+        self._leased = set(msg_ids)
+        self.size = len(self._leased)
+        self.acks: list[int] = []
+
+    def release(self, msg_id: int) -> None:
+        self.release_many((msg_id,))
+
+    def release_many(self, msg_ids: Iterable[int]) -> None:
+        with self._lock:
+            self._leased.difference_update(msg_ids)
+
+    def renew(self, set_vt_many: Callable[[list[int]], Iterable[int]]) -> list[int]:
+        """Renew every leased id with ``set_vt_many``; return (and drop) the lost ones.
+
+        The ids are snapshotted under the lock and renewed outside it. An id
+        released while the renewal is in flight may still get one more lease; a
+        poison re-park's long vt survives that because ``set_vt_many`` only ever
+        extends vt. Ids released meanwhile are not reported as lost.
+        """
+        with self._lock:
+            if not self._leased:
+                return []
+            leased = sorted(self._leased)
+        renewed = set(set_vt_many(leased))
+        with self._lock:
+            lost = [
+                msg_id
+                for msg_id in leased
+                if msg_id not in renewed and msg_id in self._leased
+            ]
+            self._leased.difference_update(lost)
+        return lost
+
+
 # Fire-and-forget tasks that carry their identity POSITIONALLY (in ``args``, not
 # ``kwargs`` / ``_barrier_context``), mapped to ``(execution_id_index,
 # organization_id_index)``. ``async_execute_bin`` is dispatched
@@ -278,6 +336,9 @@ class PgQueueConsumer:
         max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
         poison_repark_vt_seconds: int = _DEFAULT_POISON_REPARK_VT_SECONDS,
         poison_repark_budget: int = _DEFAULT_POISON_REPARK_BUDGET,
+        wake_mode: str = WAKE_MODE_POLL,
+        listen_env_prefix: str = "DB_",
+        batch_lease: bool = _DEFAULT_BATCH_LEASE,
     ) -> None:
         # Validate at construction so a misconfigured consumer fails here
         # rather than batch-after-batch once the loop starts.
@@ -301,6 +362,8 @@ class PgQueueConsumer:
             )
         if not queue_names:
             raise ValueError("queue_names must be a non-empty list")
+        if wake_mode not in _WAKE_MODES:
+            raise ValueError(f"wake_mode must be one of {_WAKE_MODES}, got {wake_mode!r}")
         # One process can drain several queues (9f) — e.g. a file_processing
         # consumer drains both file_processing and api_file_processing. Each is
         # read once per cycle in list order (poll_once): this prevents starvation
@@ -333,11 +396,16 @@ class PgQueueConsumer:
                 self.lease_seconds,
             )
         self._lease_renew_interval = max(1, self.lease_seconds // 3)
-        # The renewal only extends the IN-FLIGHT message; a batch tail sits claimed but
-        # unrenewed, so with batch>1 a slow head lets the tail's lease lapse and another
-        # consumer double-runs it. Force serial claims whenever the lease is the short
-        # (renewed) claim window; batch>1 stays available when lease == vt (no renewal).
-        if self.batch_size > 1 and self.lease_seconds < vt_seconds:
+        # The per-message renewal only extends the IN-FLIGHT message; a batch tail sits
+        # claimed but unrenewed, so with batch>1 a slow head lets the tail's lease lapse
+        # and another consumer double-runs it. Force serial claims whenever the lease is
+        # the short (renewed) claim window; batch>1 stays available when lease == vt (no
+        # renewal) or under ``batch_lease``, which renews every claimed id together.
+        self.batch_lease = batch_lease
+        # The batch currently being processed in batch-lease mode (None otherwise):
+        # its ids are renewed as a group and its acks deferred to one grouped DELETE.
+        self._batch: _InFlightBatch | None = None
+        if self.batch_size > 1 and self.lease_seconds < vt_seconds and not batch_lease:
             logger.warning(
                 "WORKER_PG_QUEUE_CONSUMER_BATCH_SIZE=%s forced to 1: the renewable lease "
                 "only covers the in-flight message, so a batch tail could lapse and "
@@ -350,6 +418,19 @@ class PgQueueConsumer:
         self.max_attempts = max_attempts
         self._poison_repark_vt_seconds = poison_repark_vt_seconds
         self._poison_repark_budget = poison_repark_budget
+        self.wake_mode = wake_mode
+        # Listen mode: one extra session connection per consumer, opened lazily on
+        # the first idle wait (after fork, in a prefork child). The sleep is routed
+        # through this module's ``time`` so a degraded wait shares the loop's clock.
+        self._waker: QueueWaker | None = (
+            QueueWaker(
+                self.queue_names,
+                env_prefix=listen_env_prefix,
+                sleep=lambda secs: time.sleep(secs),
+            )
+            if wake_mode == WAKE_MODE_LISTEN
+            else None
+        )
         self._running = False
         # Request-reply (executor RPC) result store — lazily created the first
         # time a message carries a ``reply_key``; fire-and-forget consumers
@@ -378,8 +459,11 @@ class PgQueueConsumer:
                 messages = self._client.read(
                     queue_name, vt_seconds=self.lease_seconds, qty=self.batch_size
                 )
-                for message in messages:
-                    self._handle(message)
+                if self.batch_lease and messages:
+                    self._handle_batch(messages)
+                else:
+                    for message in messages:
+                        self._handle(message)
                 total += len(messages)
             except Exception:
                 logger.exception(
@@ -389,6 +473,65 @@ class PgQueueConsumer:
                 )
         return total
 
+    def _handle_batch(self, messages: list[QueueMessage]) -> None:
+        """Run a claimed batch under one batch-wide lease, then ack it in one DELETE.
+
+        Every claimed id is renewed together by a single thread for as long as any of
+        the batch is unfinished, so the tail can't lapse behind a slow head (the reason
+        batch > 1 is otherwise forced to 1). Acks issued while the batch runs are
+        buffered (see :meth:`_ack`) and flushed with one ``delete_many`` — also on the
+        way out of an unexpected error, so finished work is not redelivered.
+        """
+        batch = _InFlightBatch(m.msg_id for m in messages)
+        self._batch = batch
+        try:
+            with self._batch_lease_renewal(batch):
+                try:
+                    for message in messages:
+                        self._handle(message)
+                finally:
+                    self._flush_acks(batch)
+        finally:
+            self._batch = None
+
+    def _ack(self, msg_id: int) -> bool:
+        """Ack ``msg_id`` — immediately, or deferred to the batch's grouped DELETE.
+
+        Returns :meth:`PgQueueClient.delete`'s result when acking immediately. A
+        deferred ack returns ``True``; a row found already gone at flush time is
+        reported by :meth:`_flush_acks` instead.
+        """
+        if self._batch is None:
+            return self._client.delete(msg_id)
+        self._batch.acks.append(msg_id)
+        return True
+
+    def _release_lease(self, msg_id: int) -> None:
+        """Stop renewing ``msg_id`` under the batch lease (no-op outside one).
+
+        For a message deliberately left claimed — a fire-and-forget failure awaiting
+        vt-expiry redelivery, or a re-parked poison message — so the batch renewal
+        doesn't keep it hidden. A renewal tick already in flight can still extend
+        it once; that never shortens a re-park vt (``set_vt_many`` only extends).
+        """
+        if self._batch is not None:
+            self._batch.release(msg_id)
+
+    def _flush_acks(self, batch: _InFlightBatch) -> None:
+        if not batch.acks:
+            return
+        acked = batch.acks
+        batch.acks = []
+        deleted = set(self._client.delete_many(acked))
+        batch.release_many(acked)
+        missing = [msg_id for msg_id in acked if msg_id not in deleted]
+        if missing:
+            logger.warning(
+                "PG-queue consumer: grouped ack found no row for msg_ids=%s — they "
+                "likely exceeded the lease and were re-claimed (possible double-run)",
+                missing,
+            )
+
     @contextlib.contextmanager
     def _lease_renewal(self, msg_id: int) -> Iterator[None]:
         """Keep ``msg_id``'s claim alive while a task runs.
@@ -402,13 +545,45 @@ class PgQueueConsumer:
         stalled ``set_vt``) is logged and abandoned — it owns its own connection (see
         the loop), so it can't corrupt the ack path, and a late ``set_vt`` on the
         about-to-be-acked row is a benign no-op.
+
+        A no-op under the batch lease: the batch-wide thread already renews
+        ``msg_id`` along with the rest of its batch.
         """
+        if self._batch is not None:
+            yield
+            return
+        with self._renewal_thread(
+            self._renew_lease_loop,
+            msg_id,
+            name=f"pg-lease-{msg_id}",
+            what=f"msg_id={msg_id}",
+        ):
+            yield
+
+    def _batch_lease_renewal(
+        self, batch: _InFlightBatch
+    ) -> contextlib.AbstractContextManager[None]:
+        """:meth:`_lease_renewal` for a whole batch: one thread, ``set_vt_many``."""
+        return self._renewal_thread(
+            self._renew_batch_lease_loop,
+            batch,
+            name="pg-lease-batch",
+            what=f"a batch of {batch.size} messages",
+        )
+
+    @contextlib.contextmanager
+    def _renewal_thread(
+        self,
+        loop: Callable[[Any, threading.Event], None],
+        subject: Any,
+        *,
+        name: str,
+        what: str,
+    ) -> Iterator[None]:
+        """Run ``loop(subject, stop)`` on a daemon thread for the ``with`` body."""
         stop = threading.Event()
         thread = threading.Thread(
-            target=self._renew_lease_loop,
-            args=(msg_id, stop),
-            name=f"pg-lease-{msg_id}",
-            daemon=True,
+            target=loop, args=(subject, stop), name=name, daemon=True
         )
         thread.start()
         try:
@@ -418,10 +593,10 @@ class PgQueueConsumer:
             thread.join(timeout=_LEASE_JOIN_TIMEOUT_SECONDS)
             if thread.is_alive():
                 logger.error(
-                    "PG-queue consumer: lease-renewal thread for msg_id=%s did not "
-                    "stop within %ss — proceeding to ack; its connection is abandoned "
+                    "PG-queue consumer: lease-renewal thread for %s did not stop "
+                    "within %ss — proceeding to ack; its connection is abandoned "
                     "until the process exits",
-                    msg_id,
+                    what,
                     _LEASE_JOIN_TIMEOUT_SECONDS,
                 )
 
@@ -432,15 +607,62 @@ class PgQueueConsumer:
     def _renew_lease_loop(self, msg_id: int, stop: threading.Event) -> None:
         """Renew ``msg_id``'s claim every ``_lease_renew_interval`` until ``stop``.
 
+        A ``False`` from ``set_vt`` means the row was already deleted — and since the
+        ack runs only after this thread is joined, that means another consumer
+        reclaimed + acked it, i.e. this task is double-running: logged, then stop.
+        The tick / connection / failure handling is :meth:`_renew_until_stopped`.
+        """
+
+        def renew(client: PgQueueClient) -> bool:
+            if client.set_vt(msg_id, self.lease_seconds):
+                return True
+            logger.warning(
+                "PG-queue consumer: lease for msg_id=%s lost (row already "
+                "gone) — it was reclaimed and this task may double-run",
+                msg_id,
+            )
+            return False
+
+        self._renew_until_stopped(stop, f"msg_id={msg_id}", renew)
+
+    def _renew_batch_lease_loop(
+        self, batch: _InFlightBatch, stop: threading.Event
+    ) -> None:
+        """Renew every still-leased id of ``batch`` with one ``set_vt_many`` per tick.
+
+        Ids already acked by the grouped DELETE or released (see
+        :meth:`_release_lease`) drop out of the set; an id missing from the renewal's
+        result was reclaimed + acked elsewhere (possible double-run) — logged and
+        dropped, while the rest of the batch keeps its lease.
+        """
+
+        def renew(client: PgQueueClient) -> bool:
+            lost = batch.renew(lambda ids: client.set_vt_many(ids, self.lease_seconds))
+            if lost:
+                logger.warning(
+                    "PG-queue consumer: batch lease for msg_ids=%s lost (rows "
+                    "already gone) — they were reclaimed and may double-run",
+                    lost,
+                )
+            return True
+
+        self._renew_until_stopped(stop, f"a batch of {batch.size} messages", renew)
+
+    def _renew_until_stopped(
+        self,
+        stop: threading.Event,
+        what: str,
+        renew: Callable[[PgQueueClient], bool],
+    ) -> None:
+        """Call ``renew(client)`` every ``_lease_renew_interval`` until ``stop``.
+
         Waits *then* renews (the initial claim already set the lease), so a task
         shorter than the interval never renews and opens no second connection. Owns its
         connection start-to-finish (closed on exit) — never shared with the main
         thread's claim/ack client. Best-effort: a connection death is retried next tick
         (the interval leaves ~2x slack before expiry), but if it keeps failing past
         ``lease_seconds`` the lease is genuinely lost (the row can be reclaimed) and it
-        escalates to ERROR. A ``False`` return means the row was already deleted — and
-        since the ack runs only after this thread is joined, that means another consumer
-        reclaimed + acked it, i.e. this task is double-running: logged, then stop. A
+        escalates to ERROR. ``renew`` returning ``False`` stops the loop. A
         non-connection error is left to propagate (fail loud, not swallowed forever).
         """
         client: PgQueueClient | None = None
@@ -452,31 +674,26 @@ class PgQueueConsumer:
                     # shorter than the interval opens no second connection.
                     if client is None:
                         client = self._make_renew_client()
-                    if not client.set_vt(msg_id, self.lease_seconds):
-                        logger.warning(
-                            "PG-queue consumer: lease for msg_id=%s lost (row already "
-                            "gone) — it was reclaimed and this task may double-run",
-                            msg_id,
-                        )
+                    if not renew(client):
                         return
                     last_ok = time.monotonic()
                 except CONN_DEAD_ERRORS:
                     down_for = time.monotonic() - last_ok
                     if down_for >= self.lease_seconds:
                         logger.exception(
-                            "PG-queue consumer: lease renewal for msg_id=%s failing for "
+                            "PG-queue consumer: lease renewal for %s failing for "
                             "%.0fs (>= lease %ss) — the lease has likely expired and "
                             "this task may double-run",
-                            msg_id,
+                            what,
                             down_for,
                             self.lease_seconds,
                         )
                     else:
                         logger.warning(
-                            "PG-queue consumer: lease renewal for msg_id=%s failed "
+                            "PG-queue consumer: lease renewal for %s failed "
                             "(retry in %ss; %.0fs of %ss slack used) — a dead "
                             "connection self-heals on the next tick",
-                            msg_id,
+                            what,
                             self._lease_renew_interval,
                             down_for,
                             self.lease_seconds,
@@ -507,7 +724,7 @@ class PgQueueConsumer:
                 payload,
             )
             self._fail_dispatch(payload, error="malformed message: missing task_name")
-            self._client.delete(message.msg_id)
+            self._ack(message.msg_id)
             return None
 
         # Poison message: a task re-claimed past the cap keeps failing. Drop
@@ -526,7 +743,7 @@ class PgQueueConsumer:
                 message.msg_id,
             )
             self._fail_dispatch(payload, error=f"unknown task {task_name}")
-            self._client.delete(message.msg_id)
+            self._ack(message.msg_id)
             return None
 
         return task
@@ -594,7 +811,7 @@ class PgQueueConsumer:
                 # executor (the LLM double-spend this path exists to avoid).
                 # _fail_dispatch is best-effort, so the ack never wedges.
                 self._fail_dispatch(payload, error=f"{type(exc).__name__}: {exc}")
-                self._client.delete(message.msg_id)  # ack
+                self._ack(message.msg_id)  # ack
                 logger.exception(
                     "PG-queue consumer: dispatch %r (msg_id=%s) failed — surfaced "
                     "via reply/on_error + acked",
@@ -604,6 +821,7 @@ class PgQueueConsumer:
                 return
             # Fire-and-forget: leave the row — its vt expires and it is
             # redelivered (bounded by max_attempts above).
+            self._release_lease(message.msg_id)
             logger.exception(
                 "PG-queue consumer: task %r (msg_id=%s, read_ct=%s) failed — "
                 "leaving for vt-expiry redelivery",
@@ -652,7 +870,7 @@ class PgQueueConsumer:
                     payload, error="result delivery failed; see worker logs"
                 )
 
-        if not self._client.delete(message.msg_id):  # ack
+        if not self._ack(message.msg_id):  # ack
             logger.warning(
                 "PG-queue consumer: ack found no row for task %r (msg_id=%s) — "
                 "it likely exceeded vt and was re-claimed (possible double-run)",
@@ -880,24 +1098,24 @@ class PgQueueConsumer:
                 payload,
                 error=f"task {task_name} exceeded max_attempts={self.max_attempts}",
             )
-            self._client.delete(message.msg_id)
+            self._ack(message.msg_id)
             return
         # No failure channel and not a pipeline message → nothing to mark; drop.
         if execution_id is None:
-            self._client.delete(message.msg_id)
+            self._ack(message.msg_id)
             return
         # Pipeline strand: mark ERROR so the failure is visible and re-runnable.
         outcome = self._mark_poison_execution_error(
             execution_id, organization_id, task_name
         )
         if outcome is _PoisonMarkOutcome.CONFIRMED:
-            self._client.delete(message.msg_id)  # terminal → safe to drop
+            self._ack(message.msg_id)  # terminal → safe to drop
             return
         if outcome is _PoisonMarkOutcome.UNMARKABLE:
             # Permanent (no org): re-parking can never change the outcome, so drop
             # now rather than burn the whole budget. The full payload was logged
             # above for manual recovery.
-            self._client.delete(message.msg_id)
+            self._ack(message.msg_id)
             return
         # TRANSIENT (backend down / client build failed): re-park rather than
         # delete into a void, bounded so a permanently-stuck message can't re-park
@@ -917,8 +1135,9 @@ class PgQueueConsumer:
                 message.msg_id,
                 message.read_ct,
             )
-            self._client.delete(message.msg_id)
+            self._ack(message.msg_id)
             return
+        self._release_lease(message.msg_id)
         if not self._client.set_vt(message.msg_id, self._poison_repark_vt_seconds):
             # Row already gone (vt expired and another reader deleted it) — nothing
             # to re-park; don't log a re-park that didn't happen.
@@ -1019,6 +1238,10 @@ class PgQueueConsumer:
     def run(self, *, install_signals: bool = True, require_tasks: bool = True) -> None:
         """Poll loop with empty-queue backoff and graceful shutdown.
 
+        In ``listen`` wake mode the idle wait blocks on the LISTEN connection for
+        the backoff instead of sleeping it, and a notification resets the backoff
+        so the next claim runs immediately.
+
         Refuses to start if no application tasks are registered — a strong
         signal the worker app wasn't bootstrapped, in which case *every*
         message would be dropped as "unknown task". This makes a
@@ -1045,33 +1268,46 @@ class PgQueueConsumer:
             name for name in self._app.tasks if not name.startswith("celery.")
         )
         logger.info(
-            "PG-queue consumer started (queues=%r, batch=%s, lease=%ss, vt=%ss) — "
-            "%d application task(s) registered: %s",
+            "PG-queue consumer started (queues=%r, batch=%s, lease=%ss, vt=%ss, "
+            "wake=%s) — %d application task(s) registered: %s",
             self.queue_names,
             self.batch_size,
             self.lease_seconds,
             self.vt_seconds,
+            self.wake_mode,
             len(app_tasks),
             ", ".join(app_tasks) or "(none)",
         )
         backoff = self.poll_interval
-        while self._running:
-            try:
-                claimed = self.poll_once()
-            except Exception:
-                # A transient read/DB blip must not tear down the loop — the
-                # client self-recovers its connection, so log and back off.
-                logger.exception(
-                    "PG-queue consumer: poll cycle failed; backing off and continuing"
-                )
-                claimed = 0
-            if claimed:
-                backoff = self.poll_interval
-            else:
-                time.sleep(backoff)
-                backoff = min(backoff * 2, self.backoff_max)
+        try:
+            while self._running:
+                try:
+                    claimed = self.poll_once()
+                except Exception:
+                    # A transient read/DB blip must not tear down the loop — the
+                    # client self-recovers its connection, so log and back off.
+                    logger.exception(
+                        "PG-queue consumer: poll cycle failed; backing off and continuing"
+                    )
+                    claimed = 0
+                if claimed:
+                    backoff = self.poll_interval
+                elif self._idle_wait(backoff):
+                    backoff = self.poll_interval
+                else:
+                    backoff = min(backoff * 2, self.backoff_max)
+        finally:
+            if self._waker is not None:
+                self._waker.close()
         logger.info("PG-queue consumer stopped (queues=%r)", self.queue_names)
 
+    def _idle_wait(self, timeout: float) -> bool:
+        """Wait out an empty poll; ``True`` if an enqueue notification woke us."""
+        if self._waker is None:
+            time.sleep(timeout)
+            return False
+        return self._waker.wait(timeout)
+
     def stop(self, *_: object) -> None:
         """Request a graceful stop after the current batch."""
         self._running = False
@@ -1108,6 +1344,10 @@ def _parse_queue_list(raw: str) -> list[str]:
     return queues
 
 
+def _parse_bool(raw: str) -> bool:
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
 def consumer_env(suffix: str, default: _T, cast: Callable[[str], _T]) -> _T:
     """Read ``WORKER_PG_QUEUE_CONSUMER_<suffix>`` with a typed default.
 
@@ -1141,6 +1381,9 @@ def build_consumer_from_env() -> PgQueueConsumer:
         poll_interval=consumer_env("POLL_INTERVAL", _DEFAULT_POLL_INTERVAL, float),
         backoff_max=consumer_env("BACKOFF_MAX", _DEFAULT_BACKOFF_MAX, float),
         max_attempts=consumer_env("MAX_ATTEMPTS", _DEFAULT_MAX_ATTEMPTS, int),
+        wake_mode=consumer_env("WAKE_MODE", WAKE_MODE_POLL, str.strip),
+        listen_env_prefix=consumer_env("LISTEN_ENV_PREFIX", "DB_", str.strip),
+        batch_lease=consumer_env("BATCH_LEASE", _DEFAULT_BATCH_LEASE, _parse_bool),
     )
 
 
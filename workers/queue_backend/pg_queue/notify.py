@@ -0,0 +1,169 @@
+"""LISTEN/NOTIFY wake-up for the PG-queue consumer (opt-in).
+
+An idle consumer otherwise sleeps with exponential backoff up to
+``BACKOFF_MAX`` between empty claims, so the first message after a quiet spell
+waits up to that long to be picked up, and every idle child keeps issuing the
+claim statement. With the wake mode on:
+
+- **Producers** (:meth:`PgQueueClient.send` and the PG scheduler's
+  ``insert_message_sql`` path) issue ``pg_notify(<channel>, '')`` in the SAME
+  transaction as the INSERT. Postgres delivers a notification only at commit,
+  so a listener can never be woken for a row it can't yet see. NOTIFY is a
+  plain statement — it works through the PgBouncer transaction pool unchanged.
+- **Consumers** hold one extra session-level ``LISTEN`` connection
+  (:class:`QueueWaker`) and block on its socket instead of sleeping. The
+  existing poll cadence stays as the backstop: the wait is bounded by the same
+  backoff, so a lost notification (listener reconnecting, producer with the
+  flag off) costs at most the old latency, never a stuck queue.
+
+``LISTEN`` is **session** state, so the listener must NOT go through a
+PgBouncer transaction pool (the session would be handed to another client
+between statements and the notifications lost). It therefore connects via its
+own env prefix (``WORKER_PG_QUEUE_CONSUMER_LISTEN_ENV_PREFIX``, default
+``DB_``) — point it at a direct / session-pooled ``{prefix}HOST`` in cloud.
+
+Channels are per (schema, queue), so two deployments sharing one database
+don't wake each other. Every child listening on a queue is woken by each
+NOTIFY (one claims, the rest find it empty and wait again) — a bounded
+thundering herd, still far cheaper than every child polling on a timer.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import select
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Final
+
+from .connection import create_pg_connection
+from .schema import queue_schema
+
+if TYPE_CHECKING:
+    from psycopg2.extensions import connection as PgConnection
+
+logger = logging.getLogger(__name__)
+
+# Producer-side switch. Off by default: a NOTIFY nobody LISTENs to is cheap but
+# not free (it takes the global notify-queue lock at commit).
+NOTIFY_ENABLED_ENV: Final = "WORKER_PG_QUEUE_NOTIFY_ENABLED"
+
+_CHANNEL_PREFIX: Final = "pg_queue"
+# Postgres truncates/rejects identifiers past NAMEDATALEN-1 bytes; pg_notify()
+# raises "channel name too long" — so long names are folded to a stable digest.
+_MAX_CHANNEL_BYTES: Final = 63
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def notify_enabled_from_env() -> bool:
+    """Whether producers should emit a per-queue NOTIFY (``WORKER_PG_QUEUE_NOTIFY_ENABLED``)."""
+    return os.getenv(NOTIFY_ENABLED_ENV, "").strip().lower() in _TRUTHY
+
+
+def notify_channel(queue_name: str) -> str:
+    """The LISTEN/NOTIFY channel for ``queue_name`` in the live ``DB_SCHEMA``.
+
+    Passed as a *parameter* to ``pg_notify`` and quoted for ``LISTEN``, so any
+    queue name is safe; names that would overflow the identifier limit are
+    replaced by a digest (stable across processes, so both sides agree).
+    """
+    channel = f"{_CHANNEL_PREFIX}.{queue_schema()}.{queue_name}"
+    if len(channel.encode()) <= _MAX_CHANNEL_BYTES:
+        return channel
+    digest = hashlib.sha1(channel.encode(), usedforsecurity=False).hexdigest()
+    return f"{_CHANNEL_PREFIX}.{digest}"
+
+
+def notify_sql() -> str:
+    """The NOTIFY statement (function form, so the channel is a bound param)."""
+    return "SELECT pg_notify(%s, '')"
+
+
+def emit_notify(cur: Any, queue_name: str) -> None:
+    """Issue the wake-up NOTIFY for ``queue_name`` on ``cur``'s transaction.
+
+    Must run inside the enqueue's transaction — Postgres holds the notification
+    until that transaction commits and drops it on rollback.
+    """
+    cur.execute(notify_sql(), (notify_channel(queue_name),))
+
+
+class QueueWaker:
+    """A dedicated ``LISTEN`` connection the consumer blocks on when idle.
+
+    :meth:`wait` returns ``True`` as soon as a notification for any listened
+    queue arrives (or one is already pending), ``False`` on timeout. Never
+    raises: a broken listener is dropped, the wait degrades to a plain sleep
+    for that cycle, and the next :meth:`wait` reconnects — so the poll backstop
+    keeps the consumer correct while the listener is down.
+    """
+
+    def __init__(
+        self,
+        queue_names: list[str],
+        *,
+        env_prefix: str = "DB_",
+        connect: Callable[[], PgConnection] | None = None,
+        sleep: Callable[[float], None] | None = None,
+    ) -> None:
+        self._channels = [notify_channel(q) for q in queue_names]
+        self._connect = connect or (lambda: create_pg_connection(env_prefix))
+        # Injected for tests; the consumer passes its own ``time.sleep`` so the
+        # degraded path shares the run loop's patch point.
+        self._sleep = sleep or time.sleep
+        self._conn: PgConnection | None = None
+
+    def _listening_conn(self) -> PgConnection:
+        if self._conn is None:
+            from psycopg2.extensions import quote_ident
+
+            conn = self._connect()
+            # LISTEN takes effect at commit; autocommit also keeps the session
+            # out of an idle-in-transaction state while it blocks.
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                for channel in self._channels:
+                    cur.execute(f"LISTEN {quote_ident(channel, cur)}")
+            self._conn = conn
+            logger.info(
+                "PG-queue consumer: listening for enqueue notifications on %s",
+                ", ".join(self._channels),
+            )
+        return self._conn
+
+    def wait(self, timeout: float) -> bool:
+        """Block up to ``timeout`` seconds for an enqueue notification."""
+        try:
+            conn = self._listening_conn()
+            # Notifications that arrived while the consumer was busy are already
+            # buffered on the connection — consume them without blocking.
+            conn.poll()
+            if conn.notifies:
+                conn.notifies.clear()
+                return True
+            ready, _, _ = select.select([conn], [], [], timeout)
+            if not ready:
+                return False
+            conn.poll()
+            woke = bool(conn.notifies)
+            conn.notifies.clear()
+            return woke
+        except Exception:
+            logger.warning(
+                "PG-queue consumer: LISTEN connection failed; falling back to a "
+                "timed poll and reconnecting on the next idle wait",
+                exc_info=True,
+            )
+            self.close()
+            self._sleep(timeout)
+            return False
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with contextlib.suppress(Exception):
+                self._conn.close()
+            self._conn = None
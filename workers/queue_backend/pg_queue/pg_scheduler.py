@@ -42,6 +42,7 @@ from unstract.core.data_models import TaskPayload
 
 from ..fairness import DEFAULT_PRIORITY
 from .client import insert_message_sql
+from .notify import emit_notify, notify_enabled_from_env
 from .schema import qualified
 from .task_payload import to_payload
 
@@ -158,6 +159,7 @@ def dispatch_due_schedules(conn: PgConnection) -> int:
             conn.rollback()
         raise
 
+    notify = notify_enabled_from_env()
     fired = 0
     for schedule in due:
         try:
@@ -208,6 +210,8 @@ def dispatch_due_schedules(conn: PgConnection) -> int:
                     "SET last_run_at = %s, next_run_at = %s WHERE pipeline_id = %s",
                     (base, nxt, schedule.pipeline_id),
                 )
+                if notify:
+                    emit_notify(cur, SCHEDULER_QUEUE_NAME)
             conn.commit()
         except Exception:
             # A row-level failure (constraint, serialization, socket) must not
@@ -9,6 +9,7 @@ from .cache_decorator import with_cache
 from .cache_keys import CacheKeyGenerator
 from .cache_manager import CacheManager
 from .cached_client_mixin import CachedAPIClientMixin
+from .local_cache import LocalCache
 
 # Backward compatibility alias
 APIClientCache = CacheManager
@@ -20,5 +21,6 @@ __all__ = [
     "RedisCacheBackend",
     "CacheKeyGenerator",
     "CachedAPIClientMixin",
+    "LocalCache",
     "with_cache",
 ]
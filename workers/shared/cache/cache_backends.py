@@ -2,7 +2,8 @@
 
 This module provides abstract and concrete cache backend implementations:
 - BaseCacheBackend: Abstract interface for cache backends
-- RedisCacheBackend: Redis-based cache implementation
+- RedisCacheBackend: Redis-based cache implementation (also carries the
+  pub/sub channel used to invalidate in-process L1 caches)
 """
 
 import json
@@ -352,3 +353,19 @@ class RedisCacheBackend(BaseCacheBackend):
         except Exception as e:
             logger.error(f"Error batch setting cache keys: {e}")
             return 0
+
+    def publish(self, channel: str, message: str) -> bool:
+        """Publish a message on a Redis pub/sub channel."""
+        if not self.available:
+            return False
+
+        try:
+            self.redis_client.redis_client.publish(channel, message)
+            return True
+        except Exception as e:
+            logger.error(f"Error publishing to channel {channel}: {e}")
+            return False
+
+    def pubsub(self) -> Any:
+        """New pub/sub handle on the cache Redis (subscribe messages skipped)."""
+        return self.redis_client.redis_client.pubsub(ignore_subscribe_messages=True)
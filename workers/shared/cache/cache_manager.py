@@ -3,14 +3,20 @@
 This module provides a high-level caching interface for managing API response data.
 It handles cache operations with statistics tracking, TTL management, and automatic
 serialization/deserialization of cached data.
+
+Reads go through the process-wide L1 (``local_cache.py``) before Redis; deletes
+are broadcast so every worker process drops its L1 copy.
 """
 
 import logging
 import time
+from datetime import UTC, datetime
 from typing import Any
 
 from .cache_backends import BaseCacheBackend, RedisCacheBackend
+from .cache_types import CacheConfig, CacheType
 from .cache_utils import make_json_serializable, reconstruct_from_cache
+from .local_cache import LocalCache, get_local_cache, local_cache_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -25,17 +31,59 @@ class CacheManager:
             backend: Cache backend to use. Defaults to RedisCacheBackend.
             config: WorkerConfig instance for configuration
         """
-        from .cache_types import CacheConfig
-
         self.backend = backend or RedisCacheBackend(config)
         self.cache_config = CacheConfig
-        self.stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0, "errors": 0}
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "deletes": 0,
+            "errors": 0,
+            "l1_hits": 0,
+        }
+
+        # L1 needs the backend's pub/sub to hear about deletes in other processes
+        self.local_cache: LocalCache | None = None
+        if (
+            self.backend.available
+            and local_cache_enabled()
+            and callable(getattr(self.backend, "pubsub", None))
+        ):
+            self.local_cache = get_local_cache()
+            self.local_cache.ensure_listening(self.backend)
 
         if self.backend.available:
-            logger.info("CacheManager initialized with Redis backend")
+            logger.info(
+                f"CacheManager initialized with Redis backend "
+                f"(L1 {'enabled' if self.local_cache else 'disabled'})"
+            )
         else:
             logger.warning("CacheManager initialized with disabled backend")
 
+    @staticmethod
+    def _cache_type(operation_type: Any) -> CacheType:
+        if isinstance(operation_type, CacheType):
+            return operation_type
+        try:
+            return CacheType(operation_type)
+        except ValueError:
+            return CacheType.CUSTOM
+
+    def _live_local_cache(self) -> LocalCache | None:
+        if self.local_cache is not None and self.local_cache.live:
+            return self.local_cache
+        return None
+
+    @staticmethod
+    def _remaining_ttl(cached_data: dict[str, Any]) -> float | None:
+        """Seconds left on a Redis entry, from the metadata stored with it."""
+        try:
+            cached_at = datetime.fromisoformat(cached_data["cached_at"])
+            age = (datetime.now(UTC) - cached_at).total_seconds()
+            return float(cached_data["ttl"]) - age
+        except (KeyError, TypeError, ValueError):
+            return None
+
     def get(self, key: str, operation_type: str = "default") -> Any | None:
         """Get value from cache.
 
@@ -49,6 +97,14 @@ class CacheManager:
         if not self.backend.available:
             return None
 
+        local_cache = self._live_local_cache()
+        if local_cache is not None:
+            found, raw_data = local_cache.get(key)
+            if found:
+                self.stats["hits"] += 1
+                self.stats["l1_hits"] += 1
+                return reconstruct_from_cache(raw_data)
+
         try:
             start_time = time.time()
             cached_data = self.backend.get(key)
@@ -62,7 +118,16 @@ class CacheManager:
                 # Reconstruct objects from cached data with fallback handling
                 raw_data = cached_data.get("data")
                 try:
-                    return reconstruct_from_cache(raw_data)
+                    value = reconstruct_from_cache(raw_data)
+                    if local_cache is not None:
+                        local_ttl = CacheConfig.get_local_ttl(
+                            self._cache_type(operation_type)
+                        )
+                        remaining = self._remaining_ttl(cached_data)
+                        if remaining is not None:
+                            local_ttl = min(local_ttl, remaining)
+                        local_cache.set(key, raw_data, local_ttl)
+                    return value
                 except Exception as e:
                     # Cache reconstruction failed - invalidate corrupted entry and fallback to API
                     logger.warning(
@@ -104,16 +169,8 @@ class CacheManager:
             return False
 
         try:
-            from .cache_types import CacheConfig, CacheType
-
             # Convert string to enum if needed
-            if isinstance(operation_type, str):
-                try:
-                    cache_type = CacheType(operation_type)
-                except ValueError:
-                    cache_type = CacheType.CUSTOM
-            else:
-                cache_type = operation_type
+            cache_type = self._cache_type(operation_type)
 
             # Convert value to JSON-serializable format before caching
             serializable_value = self._make_json_serializable(value)
@@ -123,6 +180,13 @@ class CacheManager:
 
             if success:
                 self.stats["sets"] += 1
+                local_cache = self._live_local_cache()
+                if local_cache is not None:
+                    local_cache.set(
+                        key,
+                        serializable_value,
+                        min(CacheConfig.get_local_ttl(cache_type), effective_ttl),
+                    )
                 logger.debug(
                     f"Cached {key} (type: {cache_type.value}) with TTL {effective_ttl}s"
                 )
@@ -135,7 +199,7 @@ class CacheManager:
             return False
 
     def delete(self, key: str) -> bool:
-        """Delete key from cache."""
+        """Delete key from cache, including every worker process's L1 copy."""
         if not self.backend.available:
             return False
 
@@ -143,6 +207,10 @@ class CacheManager:
             success = self.backend.delete(key)
             if success:
                 self.stats["deletes"] += 1
+            # Only once Redis no longer holds the value: a peer dropping its L1
+            # copy earlier could re-read it and keep it for the full local TTL.
+            if self.local_cache is not None:
+                self.local_cache.publish_invalidation(self.backend, [key])
             return success
         except Exception as e:
             self.stats["errors"] += 1
@@ -171,11 +239,33 @@ class CacheManager:
             (self.stats["hits"] / total_requests * 100) if total_requests > 0 else 0
         )
 
+        l1_hits = self.stats["l1_hits"]
+        redis_requests = total_requests - l1_hits
+        redis_hits = self.stats["hits"] - l1_hits
+        tiers: dict[str, Any] = {
+            "redis": {
+                "hits": redis_hits,
+                "misses": self.stats["misses"],
+                "hit_rate": _hit_rate(redis_hits, redis_requests),
+            }
+        }
+        if self.local_cache is not None:
+            tiers["l1"] = {
+                "hits": l1_hits,
+                "misses": redis_requests,
+                "hit_rate": _hit_rate(l1_hits, total_requests),
+                "live": self.local_cache.live,
+                "entries": len(self.local_cache),
+                "max_entries": self.local_cache.max_entries,
+                "process": dict(self.local_cache.stats),
+            }
+
         return {
             **self.stats,
             "hit_rate": f"{hit_rate:.1f}%",
             "total_requests": total_requests,
             "backend_available": self.backend.available,
+            "tiers": tiers,
         }
 
     def clear_stats(self):
@@ -188,3 +278,7 @@ class CacheManager:
         Delegates to the common serialization utility.
         """
         return make_json_serializable(obj)
+
+
+def _hit_rate(hits: int, requests: int) -> str:
+    return f"{(hits / requests * 100) if requests > 0 else 0:.1f}%"
@@ -60,6 +60,23 @@ class CacheConfig:
         CacheType.CUSTOM: 30,  # Default for custom operations
     }
 
+    # TTLs of the in-process L1 copies (see local_cache.py); never above the
+    # Redis TTL, 0 keeps the type out of L1
+    LOCAL_TTLS: dict[CacheType, int] = {
+        CacheType.WORKFLOW: 30,
+        CacheType.WORKFLOW_ENDPOINTS: 30,
+        CacheType.WORKFLOW_DEFINITION: 30,
+        CacheType.API_DEPLOYMENT: 15,
+        CacheType.TOOL_INSTANCES: 10,
+        CacheType.PIPELINE: 30,
+        CacheType.PIPELINE_DATA: 15,
+        CacheType.CONFIGURATION: 60,
+        CacheType.PLATFORM_SETTINGS: 120,
+        CacheType.FILE_BATCH: 0,  # Too dynamic to hold per process
+        CacheType.EXECUTION_DATA: 0,
+        CacheType.CUSTOM: 10,
+    }
+
     @classmethod
     def get_ttl(cls, cache_type: CacheType) -> int:
         """Get TTL for a cache type.
@@ -72,6 +89,19 @@ class CacheConfig:
         """
         return cls.DEFAULT_TTLS.get(cache_type, cls.DEFAULT_TTLS[CacheType.CUSTOM])
 
+    @classmethod
+    def get_local_ttl(cls, cache_type: CacheType) -> int:
+        """Get the in-process (L1) TTL for a cache type, capped by its Redis TTL.
+
+        Args:
+            cache_type: The cache type enum value
+
+        Returns:
+            TTL in seconds; 0 means the type is not kept in L1
+        """
+        local_ttl = cls.LOCAL_TTLS.get(cache_type, cls.LOCAL_TTLS[CacheType.CUSTOM])
+        return min(local_ttl, cls.get_ttl(cache_type))
+
     @classmethod
     def set_ttl(cls, cache_type: CacheType, ttl: int):
         """Update TTL for a cache type.
@@ -0,0 +1,186 @@
+"""In-process L1 cache in front of the Redis cache
+
+Every cached lookup (workflow definitions, endpoints, API deployments, pipeline
+data) used to cost a Redis round trip plus a JSON decode. ``LocalCache`` keeps
+recently used entries in a bounded, per-process LRU with a per-type TTL
+(``CacheConfig.LOCAL_TTLS``, always capped by the Redis TTL), so hot-path reads
+don't leave the process.
+
+Entries are stored in their JSON-serializable form and rebuilt on every hit, so
+callers never share mutable objects.
+
+Deletes through ``CacheManager`` (``invalidate_workflow``,
+``invalidate_pipeline_cache``, ...) are published on a Redis pub/sub channel
+and every worker process drops those keys from its L1. A listener that loses
+its connection clears the L1 and bypasses it until it has resubscribed, since
+messages may have been missed. Publishing ``"*"`` on the channel clears every
+L1.
+
+Set ``WORKER_CACHE_L1_ENABLED=false`` to go straight to Redis again.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "worker_cache:invalidate"
+_CLEAR_ALL = "*"
+_DEFAULT_MAX_ENTRIES = 2048
+_RESUBSCRIBE_DELAY_SECONDS = 5.0
+
+
+def local_cache_enabled() -> bool:
+    return os.getenv("WORKER_CACHE_L1_ENABLED", "true").lower() == "true"
+
+
+def _max_entries() -> int:
+    raw = os.getenv("WORKER_CACHE_L1_MAX_ENTRIES", "")
+    try:
+        return max(1, int(raw)) if raw else _DEFAULT_MAX_ENTRIES
+    except ValueError:
+        logger.warning(
+            f"Invalid WORKER_CACHE_L1_MAX_ENTRIES={raw!r}, using {_DEFAULT_MAX_ENTRIES}"
+        )
+        return _DEFAULT_MAX_ENTRIES
+
+
+class LocalCache:
+    """Thread-safe LRU of serialized cache values with per-entry expiry."""
+
+    def __init__(self, max_entries: int | None = None):
+        self.max_entries = max_entries or _max_entries()
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        self._listener: _InvalidationListener | None = None
+        self._pid = os.getpid()
+
+    @property
+    def live(self) -> bool:
+        """Whether remote invalidations reach this process right now."""
+        listener = self._listener
+        return (
+            listener is not None
+            and self._pid == os.getpid()
+            and listener.subscribed.is_set()
+        )
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return ``(found, value)``; expired entries count as misses."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.stats["misses"] += 1
+            return False, None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stats["invalidations"] += len(self._entries)
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ensure_listening(self, backend: Any) -> None:
+        """Start (once per process) the listener applying remote invalidations."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked child: the parent's listener thread and entries are not ours
+                self._pid = os.getpid()
+                self._listener = None
+                self._entries.clear()
+            if self._listener is not None:
+                return
+            self._listener = _InvalidationListener(self, backend)
+        self._listener.start()
+
+    def publish_invalidation(self, backend: Any, keys: list[str]) -> None:
+        """Drop keys here and tell every other worker process to drop them."""
+        self.delete(keys)
+        if not backend.publish(INVALIDATION_CHANNEL, json.dumps(keys)):
+            logger.warning(f"Failed to publish cache invalidation for {keys}")
+
+    def apply_invalidation(self, message: str) -> None:
+        try:
+            keys = json.loads(message)
+        except ValueError:
+            logger.warning(f"Ignoring malformed cache invalidation: {message!r}")
+            return
+        if keys == _CLEAR_ALL:
+            self.clear()
+        else:
+            self.delete(keys)
+
+
+class _InvalidationListener:
+    """Daemon thread subscribed to :data:`INVALIDATION_CHANNEL`."""
+
+    def __init__(self, cache: LocalCache, backend: Any):
+        self._cache = cache
+        self._backend = backend
+        self.subscribed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="worker-cache-invalidation", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                pubsub = self._backend.pubsub()
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                self.subscribed.set()
+                logger.debug("Subscribed to worker cache invalidations")
+                for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._cache.apply_invalidation(message["data"])
+            except Exception as e:
+                logger.warning(f"Worker cache invalidation listener failed: {e}")
+            # Invalidations may have been missed while disconnected
+            self.subscribed.clear()
+            self._cache.clear()
+            time.sleep(_RESUBSCRIBE_DELAY_SECONDS)
+
+
+_local_cache: LocalCache | None = None
+_local_cache_lock = threading.Lock()
+
+
+def get_local_cache() -> LocalCache:
+    """The process-wide L1 cache shared by every CacheManager."""
+    global _local_cache
+    if _local_cache is None:
+        with _local_cache_lock:
+            if _local_cache is None:
+                _local_cache = LocalCache()
+    return _local_cache
@@ -0,0 +1,492 @@
+"""Process-level pool of database-destination writers.
+
+``WorkerDestinationConnector`` is built per file, and each ``insert_into_db``
+used to resolve the connector class, read ``information_schema`` twice, run
+``CREATE TABLE IF NOT EXISTS`` and open + close a fresh connection — all for a
+single-row INSERT. For ETL pipelines writing thousands of files to one table
+that setup dwarfs the insert itself.
+
+:class:`DestinationTablePool` keeps one :class:`PooledTable` per (connector,
+connector settings, table) alive in the worker process:
+
+- the connector instance and its engine are reused across writes; an engine
+  idle longer than ``WORKER_DB_DESTINATION_POOL_IDLE_SECONDS`` is reopened
+  rather than trusted, and a reused engine is probed with ``SELECT 1`` once
+  per checkout, before its first INSERT, and reopened if the probe fails (it
+  may have been dropped server-side). An INSERT itself is never retried: the
+  connector commits inside ``execute_query``, so a failure there may come
+  after the rows were committed and a retry could write them twice;
+- the table is checked / migrated / created once and its column types cached;
+  any write failure drops the cache so the next write re-checks the table.
+
+Inside :func:`buffered_destination_writes` (one file batch) rows are not
+written per file but buffered in a :class:`DestinationWriteBatch` and flushed
+at the end of the batch: rows of one table go out as a single ``executemany``
+in one transaction where the connector supports it (``can_insert_many``), and
+one INSERT per row otherwise. Whatever depends on a row being committed — file
+history, the file's final status — is deferred to the flush as well, so a file
+is still only reported written after its row is committed.
+
+Entries are keyed by a digest of the connector settings, so orgs never share
+an engine. Set ``WORKER_DB_DESTINATION_POOL_ENABLED=false`` to fall back to a
+fresh connection and table check per write.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from .utils import WorkerDatabaseUtils
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_IDLE_SECONDS = 60.0
+_MAX_POOLED_TABLES = 16
+
+
+def _pool_enabled() -> bool:
+    return os.getenv("WORKER_DB_DESTINATION_POOL_ENABLED", "true").lower() == "true"
+
+
+def _idle_seconds() -> float:
+    raw = os.getenv("WORKER_DB_DESTINATION_POOL_IDLE_SECONDS", "")
+    try:
+        return float(raw) if raw else _DEFAULT_IDLE_SECONDS
+    except ValueError:
+        logger.warning(
+            f"Invalid WORKER_DB_DESTINATION_POOL_IDLE_SECONDS={raw!r}, "
+            f"using {_DEFAULT_IDLE_SECONDS}"
+        )
+        return _DEFAULT_IDLE_SECONDS
+
+
+def _settings_digest(connector_settings: dict[str, Any]) -> str:
+    encoded = json.dumps(connector_settings, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _close_quietly(engine: Any) -> None:
+    if engine is None:
+        return
+    try:
+        engine.close()
+    except Exception as e:
+        logger.warning(f"Failed to close pooled destination engine: {e}")
+
+
+class PooledTable:
+    """A destination table with a reusable connector, engine and schema."""
+
+    def __init__(
+        self, connector_id: str, connector_settings: dict[str, Any], table_name: str
+    ):
+        self.connector_id = connector_id
+        self.table_name = table_name
+        self._connector_settings = connector_settings
+        self._lock = threading.Lock()
+        self._db_class: Any = None
+        self._engine: Any = None
+        self._engine_used_at = time.monotonic()
+        self._column_types: dict[str, str] | None = None
+
+    @property
+    def last_used(self) -> float:
+        return self._engine_used_at
+
+    def _get_db_class(self) -> Any:
+        if self._db_class is None:
+            self._db_class = WorkerDatabaseUtils.get_db_class(
+                connector_id=self.connector_id,
+                connector_settings=self._connector_settings,
+            )
+        return self._db_class
+
+    def _get_engine(self, idle_seconds: float) -> tuple[Any, bool]:
+        """Return ``(engine, reused)``, reopening an engine idle for too long."""
+        if self._engine is not None:
+            if time.monotonic() - self._engine_used_at <= idle_seconds:
+                return self._engine, True
+            self._drop_engine()
+        self._engine = self._get_db_class().get_engine()
+        return self._engine, False
+
+    @staticmethod
+    def _is_alive(engine: Any) -> bool:
+        """Probe a reused DB-API engine; nothing is written, so failing is safe."""
+        if not hasattr(engine, "cursor"):
+            return True
+        try:
+            cursor = engine.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.warning(f"Pooled destination connection is unusable ({e})")
+            return False
+        return True
+
+    def _drop_engine(self) -> None:
+        engine, self._engine = self._engine, None
+        _close_quietly(engine)
+
+    def _ensure_table(
+        self, engine: Any, values: dict[str, Any], single_column_name: str
+    ) -> dict[str, str]:
+        if self._column_types is not None:
+            return self._column_types
+        db_class = self._get_db_class()
+        table_info = db_class.get_information_schema(table_name=self.table_name)
+        logger.info(
+            f"destination connector table_name: {self.table_name} "
+            f"with table_info: {table_info}"
+        )
+        if table_info and db_class.has_no_metadata(table_info=table_info):
+            WorkerDatabaseUtils.migrate_table_to_v2(
+                db_class=db_class,
+                engine=engine,
+                table_name=self.table_name,
+                column_name=single_column_name,
+            )
+        logger.info(f"Creating table {self.table_name} if not exists")
+        WorkerDatabaseUtils.create_table_if_not_exists(
+            db_class=db_class,
+            engine=engine,
+            table_name=self.table_name,
+            database_entry=values,
+        )
+        self._column_types = WorkerDatabaseUtils.get_column_types(
+            conn_cls=db_class, table_name=self.table_name
+        )
+        return self._column_types
+
+    def _checkout(self, idle_seconds: float) -> Any:
+        """Engine for the next statement, probing a reused one first."""
+        engine, reused = self._get_engine(idle_seconds)
+        if reused and not self._is_alive(engine):
+            self._column_types = None
+            self._drop_engine()
+            engine, _ = self._get_engine(idle_seconds)
+        return engine
+
+    def _insert(self, engine: Any, rows: list[dict[str, Any]]) -> None:
+        db_class = self._get_db_class()
+        sql_keys = list(rows[0])
+        if len(rows) == 1:
+            WorkerDatabaseUtils.execute_write_query(
+                db_class=db_class,
+                engine=engine,
+                table_name=self.table_name,
+                sql_keys=sql_keys,
+                sql_values=list(rows[0].values()),
+            )
+            return
+        WorkerDatabaseUtils.execute_write_many_query(
+            db_class=db_class,
+            engine=engine,
+            table_name=self.table_name,
+            sql_keys=sql_keys,
+            sql_values_list=[list(row.values()) for row in rows],
+        )
+
+    def write_many(
+        self,
+        rows: list[dict[str, Any]],
+        single_column_name: str,
+        idle_seconds: float | None = None,
+    ) -> list[Exception | None]:
+        """Insert rows, setting the table up on first use.
+
+        Rows with the same columns share one statement and transaction if the
+        connector supports it, otherwise each row is inserted on its own.
+
+        Returns:
+            The error each row failed with, or None once it is committed
+        """
+        if not rows:
+            return []
+        idle_seconds = _idle_seconds() if idle_seconds is None else idle_seconds
+        errors: list[Exception | None] = [None] * len(rows)
+        with self._lock:
+            try:
+                engine = self._checkout(idle_seconds)
+                column_types = self._ensure_table(engine, rows[0], single_column_name)
+            except Exception as e:
+                self._column_types = None
+                self._drop_engine()
+                return [e] * len(rows)
+
+            db_class = self._get_db_class()
+            statements: dict[tuple[Any, ...], list[int]] = {}
+            prepared: list[dict[str, Any]] = []
+            for index, values in enumerate(rows):
+                # Remove None values from INSERT to let database handle as NULL
+                # Table schema already created with all columns (including data column)
+                # Removing None values prevents "invalid JSON" errors when inserting error records
+                values = {k: v for k, v in values.items() if v is not None}
+                sql_columns_and_values = WorkerDatabaseUtils.get_sql_values_for_query(
+                    conn_cls=db_class,
+                    values=values,
+                    column_types=column_types,
+                )
+                prepared.append(sql_columns_and_values)
+                shape = (
+                    tuple(sql_columns_and_values)
+                    if db_class.can_insert_many()
+                    else (index,)
+                )
+                statements.setdefault(shape, []).append(index)
+
+            logger.info(
+                f"Inserting {len(rows)} row(s) into {self.table_name} "
+                f"with {len(statements)} statement(s)"
+            )
+            for indexes in statements.values():
+                try:
+                    if engine is None:
+                        engine = self._checkout(idle_seconds)
+                    self._insert(engine, [prepared[i] for i in indexes])
+                except Exception as e:
+                    # Not retried, see the module docstring
+                    self._column_types = None
+                    self._drop_engine()
+                    engine = None
+                    for i in indexes:
+                        errors[i] = e
+                else:
+                    self._engine_used_at = time.monotonic()
+        return errors
+
+    def write(
+        self,
+        values: dict[str, Any],
+        single_column_name: str,
+        idle_seconds: float | None = None,
+    ) -> None:
+        """Insert one row, setting the table up on first use."""
+        (error,) = self.write_many([values], single_column_name, idle_seconds)
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        with self._lock:
+            self._drop_engine()
+            self._column_types = None
+
+
+class DestinationTablePool:
+    """Bounded LRU of :class:`PooledTable` entries for this process."""
+
+    def __init__(self, max_tables: int = _MAX_POOLED_TABLES):
+        self._max_tables = max_tables
+        self._lock = threading.Lock()
+        self._tables: OrderedDict[tuple[str, str, str], PooledTable] = OrderedDict()
+
+    def table(
+        self, connector_id: str, connector_settings: dict[str, Any], table_name: str
+    ) -> PooledTable:
+        key = (connector_id, _settings_digest(connector_settings), table_name)
+        evicted: list[PooledTable] = []
+        idle_cutoff = time.monotonic() - _idle_seconds()
+        with self._lock:
+            table = self._tables.get(key)
+            if table is None:
+                table = PooledTable(connector_id, connector_settings, table_name)
+                self._tables[key] = table
+            self._tables.move_to_end(key)
+            # Release connections of destinations this worker stopped writing to
+            for other_key, other in list(self._tables.items()):
+                if other_key != key and (
+                    len(self._tables) - len(evicted) > self._max_tables
+                    or other.last_used < idle_cutoff
+                ):
+                    evicted.append(self._tables.pop(other_key))
+        for stale in evicted:
+            stale.close()
+        return table
+
+    def close_all(self) -> None:
+        with self._lock:
+            tables = list(self._tables.values())
+            self._tables.clear()
+        for table in tables:
+            table.close()
+
+
+_pool = DestinationTablePool()
+atexit.register(_pool.close_all)
+
+
+@dataclass
+class _BufferedRow:
+    connector_id: str
+    connector_settings: dict[str, Any]
+    table_name: str
+    values: dict[str, Any]
+    single_column_name: str
+    key: str
+    callbacks: list[Callable[[Exception | None], None]] = field(default_factory=list)
+
+
+class DestinationWriteBatch:
+    """Destination rows buffered until the end of a file batch.
+
+    Rows are added under a key (the file execution ID) so that callers can
+    defer whatever needs the row committed with :meth:`after_write`.
+    """
+
+    def __init__(self) -> None:
+        self._rows: list[_BufferedRow] = []
+
+    def add(
+        self,
+        key: str,
+        connector_id: str,
+        connector_settings: dict[str, Any],
+        table_name: str,
+        values: dict[str, Any],
+        single_column_name: str,
+    ) -> None:
+        self._rows.append(
+            _BufferedRow(
+                connector_id=connector_id,
+                connector_settings=connector_settings,
+                table_name=table_name,
+                values=values,
+                single_column_name=single_column_name,
+                key=key,
+            )
+        )
+
+    def is_pending(self, key: str) -> bool:
+        return any(row.key == key for row in self._rows)
+
+    def after_write(self, key: str, callback: Callable[[Exception | None], None]) -> None:
+        """Run ``callback(error)`` once the rows buffered under ``key`` are flushed.
+
+        ``error`` is None if every row was committed.
+        """
+        for row in self._rows:
+            if row.key == key:
+                row.callbacks.append(callback)
+                return
+        raise KeyError(f"No destination row buffered for {key}")
+
+    def flush(self) -> dict[str, Exception | None]:
+        """Write the buffered rows, one ``write_many`` per destination table.
+
+        Returns:
+            Per key, the error one of its rows failed with, or None
+        """
+        rows, self._rows = self._rows, []
+        tables: dict[tuple[str, str, str], list[_BufferedRow]] = {}
+        for row in rows:
+            table_key = (
+                row.connector_id,
+                _settings_digest(row.connector_settings),
+                row.table_name,
+            )
+            tables.setdefault(table_key, []).append(row)
+
+        results: dict[str, Exception | None] = {}
+        for table_rows in tables.values():
+            first = table_rows[0]
+            values = [row.values for row in table_rows]
+            if _pool_enabled():
+                errors = _pool.table(
+                    first.connector_id, first.connector_settings, first.table_name
+                ).write_many(values, first.single_column_name)
+            else:
+                table = PooledTable(
+                    first.connector_id, first.connector_settings, first.table_name
+                )
+                try:
+                    errors = table.write_many(values, first.single_column_name)
+                finally:
+                    table.close()
+            for row, error in zip(table_rows, errors, strict=True):
+                if results.get(row.key) is None:
+                    results[row.key] = error
+
+        for row in rows:
+            for callback in row.callbacks:
+                try:
+                    callback(results[row.key])
+                except Exception:
+                    logger.exception(f"Destination write callback failed for {row.key}")
+        return results
+
+
+_current_batch: contextvars.ContextVar[DestinationWriteBatch | None] = (
+    contextvars.ContextVar("destination_write_batch", default=None)
+)
+
+
+@contextmanager
+def buffered_destination_writes() -> Iterator[DestinationWriteBatch]:
+    """Buffer :func:`write_destination_row` calls until the batch is flushed.
+
+    Rows still buffered when the block exits without a flush (the batch
+    failed) are dropped; nothing was reported written for them.
+    """
+    batch = DestinationWriteBatch()
+    token = _current_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        _current_batch.reset(token)
+        if batch._rows:
+            logger.warning(f"Dropping {len(batch._rows)} unflushed destination row(s)")
+
+
+def current_destination_batch() -> DestinationWriteBatch | None:
+    """The batch :func:`write_destination_row` currently buffers into, if any."""
+    return _current_batch.get()
+
+
+def write_destination_row(
+    connector_id: str,
+    connector_settings: dict[str, Any],
+    table_name: str,
+    values: dict[str, Any],
+    single_column_name: str,
+    key: str | None = None,
+) -> bool:
+    """Insert one destination row, through the process pool unless disabled.
+
+    Inside :func:`buffered_destination_writes` a row with a ``key`` is only
+    buffered, to be written when the batch is flushed.
+
+    Returns:
+        True if the row was buffered rather than written
+    """
+    batch = _current_batch.get()
+    if batch is not None and key:
+        batch.add(
+            key, connector_id, connector_settings, table_name, values, single_column_name
+        )
+        return True
+    if _pool_enabled():
+        _pool.table(connector_id, connector_settings, table_name).write(
+            values, single_column_name
+        )
+        return False
+    table = PooledTable(connector_id, connector_settings, table_name)
+    try:
+        table.write(values, single_column_name)
+    finally:
+        table.close()
+    return False
@@ -463,6 +463,44 @@ class WorkerDatabaseUtils:
 
         logger.debug(f"Successfully inserted into table {table_name} with: {sql} query")
 
+    @staticmethod
+    def execute_write_many_query(
+        db_class: UnstractDB,
+        engine: Any,
+        table_name: str,
+        sql_keys: list[str],
+        sql_values_list: list[list[Any]],
+    ) -> None:
+        """Execute one Insert Query for several rows in a single transaction.
+
+        Only for connectors whose ``can_insert_many()`` is True.
+
+        Args:
+            db_class (UnstractDB): Database connection class
+            engine (Any): Database engine
+            table_name (str): table name
+            sql_keys (list[str]): columns, the same for every row
+            sql_values_list (list[list[Any]]): values of each row
+
+        """
+        sql = db_class.get_sql_insert_query(table_name=table_name, sql_keys=sql_keys)
+
+        logger.debug(
+            f"Inserting {len(sql_values_list)} rows into table {table_name} "
+            f"with: {sql} query"
+        )
+
+        try:
+            db_class.execute_many_query(
+                engine=engine,
+                sql_query=sql,
+                sql_values_list=sql_values_list,
+                table_name=table_name,
+                sql_keys=sql_keys,
+            )
+        except UnstractDBConnectorException as e:
+            raise WorkerDBException(detail=e.detail) from e
+
     @staticmethod
     def get_db_class(connector_id: str, connector_settings: dict[str, Any]) -> UnstractDB:
         """Get database class instance for the given connector.
@@ -0,0 +1,200 @@
+"""Incremental source discovery checkpoints.
+
+Every scheduled ETL run walks the configured source directories and asks the
+backend (``get_files_history_batch``) about each listed file, although almost
+all of them were settled by earlier runs. A :class:`DiscoveryCheckpoint` keeps a
+per-pipeline *modified-time watermark* in Redis: every listed file modified
+before it is known to be settled and is dropped right after listing — before
+hashing, filtering and any backend call.
+
+A file is *settled* once file history marks it COMPLETED on the same path (or
+it has exhausted its execution limit). After a run that looked at every
+candidate — no listing error, not cut short by the file limit — the watermark
+moves to ``min(walk start - skew, oldest unsettled candidate)``. Files picked by
+this run, running elsewhere or failed (and so retried) keep it back until file
+history settles them; new files uploaded during the walk are covered by the
+skew.
+
+Object stores have no server-side "modified since" listing, so directories are
+still walked; what the checkpoint saves is the per-file work and the history
+lookups for everything already settled.
+
+The checkpoint is opt-in (``WORKER_DISCOVERY_CHECKPOINT_ENABLED``) because it
+relies on modification times: a file copied in with an old, preserved mtime is
+only picked up by the next full rescan. A full rescan ignores the watermark; it
+happens every ``WORKER_DISCOVERY_FULL_RESCAN_SECONDS``, whenever the source
+configuration changes (new key) and on demand via :meth:`DiscoveryCheckpoint.reset`.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import UTC
+from typing import Any
+
+from ..cache.cache_backends import RedisCacheBackend
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "discovery_checkpoint"
+_DEFAULT_SKEW_SECONDS = 300.0
+_DEFAULT_FULL_RESCAN_SECONDS = 86400.0
+# Losing a checkpoint only costs one full scan; keep idle ones for a month
+_CHECKPOINT_TTL_SECONDS = 30 * 86400
+
+
+def checkpoint_enabled() -> bool:
+    return os.getenv("WORKER_DISCOVERY_CHECKPOINT_ENABLED", "false").lower() == "true"
+
+
+def _float_env(name: str, default: float) -> float:
+    raw = os.getenv(name, "")
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        logger.warning(f"Invalid {name}={raw!r}, using {default}")
+        return default
+
+
+class DiscoveryCheckpoint:
+    """Watermark of one source configuration, and the state of the current scan.
+
+    Create one per discovery run with :meth:`load`, ask :meth:`skips` for every
+    listed file, report candidates that stay unsettled with
+    :meth:`note_unsettled`, flag anything that cut the scan short with
+    :meth:`mark_incomplete`, then call :meth:`save`.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        source_fs: Any,
+        state: dict[str, Any] | None,
+        cache: Any,
+        force_full_rescan: bool = False,
+    ):
+        self.key = key
+        self._source_fs = source_fs
+        self._cache = cache
+        self.started_at = time.time()
+        self._skew = _float_env(
+            "WORKER_DISCOVERY_CHECKPOINT_SKEW_SECONDS", _DEFAULT_SKEW_SECONDS
+        )
+        state = state or {}
+        self._rescanned_at: float | None = state.get("rescanned_at")
+        rescan_due = self._rescanned_at is None or (
+            self.started_at - self._rescanned_at
+            > _float_env(
+                "WORKER_DISCOVERY_FULL_RESCAN_SECONDS", _DEFAULT_FULL_RESCAN_SECONDS
+            )
+        )
+        self.full_rescan = force_full_rescan or rescan_due or "watermark" not in state
+        self.watermark: float | None = (
+            None if self.full_rescan else float(state["watermark"])
+        )
+        self._oldest_unsettled: float | None = None
+        self._incomplete_reason: str | None = None
+        self.skipped = 0
+
+    @staticmethod
+    def build_key(organization_id: str, workflow_id: str, *scope: Any) -> str:
+        """Key per pipeline and source configuration (connector, dirs, patterns)."""
+        digest = hashlib.sha256(
+            json.dumps(scope, sort_keys=True, default=str).encode()
+        ).hexdigest()[:32]
+        return f"{_KEY_PREFIX}:{organization_id}:{workflow_id}:{digest}"
+
+    @classmethod
+    def load(
+        cls,
+        source_fs: Any,
+        organization_id: str,
+        workflow_id: str,
+        *scope: Any,
+        force_full_rescan: bool = False,
+        cache: Any = None,
+    ) -> "DiscoveryCheckpoint | None":
+        """The checkpoint for this source, or None when disabled / unavailable."""
+        if not checkpoint_enabled():
+            return None
+        cache = cache if cache is not None else RedisCacheBackend()
+        if not cache.available:
+            logger.warning("Discovery checkpoint disabled: Redis cache unavailable")
+            return None
+        key = cls.build_key(organization_id, workflow_id, *scope)
+        cached = cache.get(key)
+        state = cached.get("data") if cached else None
+        checkpoint = cls(key, source_fs, state, cache, force_full_rescan)
+        if checkpoint.full_rescan:
+            logger.info(f"[DiscoveryCheckpoint] Full rescan for {key}")
+        else:
+            logger.info(
+                f"[DiscoveryCheckpoint] Listing files modified since "
+                f"{checkpoint.watermark:.0f} for {key}"
+            )
+        return checkpoint
+
+    @classmethod
+    def reset(cls, organization_id: str, workflow_id: str, cache: Any = None) -> int:
+        """Drop every checkpoint of a workflow; its next run rescans fully."""
+        cache = cache if cache is not None else RedisCacheBackend()
+        return cache.delete_pattern(f"{_KEY_PREFIX}:{organization_id}:{workflow_id}:*")
+
+    def modified_at(self, fs_metadata: dict[str, Any]) -> float | None:
+        try:
+            modified = self._source_fs.extract_modified_date(fs_metadata)
+        except Exception:
+            return None
+        if modified is None:
+            return None
+        if modified.tzinfo is None:
+            modified = modified.replace(tzinfo=UTC)
+        return modified.timestamp()
+
+    def skips(self, fs_metadata: dict[str, Any]) -> bool:
+        """Whether a listed file is settled and needs no further work."""
+        if self.watermark is None:
+            return False
+        modified = self.modified_at(fs_metadata)
+        if modified is None or modified >= self.watermark:
+            return False
+        self.skipped += 1
+        return True
+
+    def note_unsettled(self, fs_metadata: dict[str, Any]) -> None:
+        """A candidate this run did not see settled; the watermark stays below it."""
+        modified = self.modified_at(fs_metadata)
+        if modified is not None and (
+            self._oldest_unsettled is None or modified < self._oldest_unsettled
+        ):
+            self._oldest_unsettled = modified
+
+    def mark_incomplete(self, reason: str) -> None:
+        """The scan did not look at every candidate; keep the old watermark."""
+        if self._incomplete_reason is None:
+            self._incomplete_reason = reason
+
+    def save(self) -> bool:
+        """Advance and persist the watermark if the scan was complete."""
+        if self._incomplete_reason is not None:
+            logger.info(
+                f"[DiscoveryCheckpoint] Keeping watermark for {self.key}: "
+                f"{self._incomplete_reason}"
+            )
+            return False
+        watermark = self.started_at - self._skew
+        if self._oldest_unsettled is not None:
+            watermark = min(watermark, self._oldest_unsettled)
+        state = {
+            "watermark": watermark,
+            "rescanned_at": self.started_at if self.full_rescan else self._rescanned_at,
+        }
+        saved = self._cache.set(self.key, state, _CHECKPOINT_TTL_SECONDS)
+        if saved:
+            logger.info(
+                f"[DiscoveryCheckpoint] Watermark for {self.key} now {watermark:.0f} "
+                f"({self.skipped} settled files skipped this run)"
+            )
+        return saved
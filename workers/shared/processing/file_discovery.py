@@ -4,8 +4,12 @@ This module provides the StreamingFileDiscovery service, moved to shared/process
 to avoid circular imports and provide clean separation of concerns.
 """
 
+import heapq
+import os
 import time
 from collections.abc import Collection
+from contextlib import closing
+from datetime import UTC
 from typing import Any
 
 from unstract.connectors.filesystems.unstract_file_system import UnstractFileSystem
@@ -13,11 +17,89 @@ from unstract.core.data_models import ConnectionType, FileHashData, FileOperatio
 from unstract.core.file_operations import FileOperations
 
 from ..infrastructure.logging import WorkerLogger
+from .directory_walker import DirectoryWalker
+from .discovery_checkpoint import DiscoveryCheckpoint
 from .filter_pipeline import FilterPipeline
 
 logger = WorkerLogger.get_logger(__name__)
 
 
+def _listing_error_count(source_fs: UnstractFileSystem) -> int:
+    # list_files() reports walk errors only through the connector's user errors
+    return len(getattr(source_fs, "_user_errors", None) or [])
+
+
+def _note_unsettled(
+    checkpoint: DiscoveryCheckpoint,
+    filter_pipeline: FilterPipeline,
+    metadata_by_path: dict[str, dict[str, Any]],
+    candidates: dict[str, FileHashData],
+) -> None:
+    """Tell the checkpoint about candidates file history did not settle."""
+    settled = filter_pipeline.settled_paths()
+    if settled is None:
+        checkpoint.mark_incomplete("no file history to settle files")
+        return
+    for file_path in candidates:
+        if file_path not in settled and file_path in metadata_by_path:
+            checkpoint.note_unsettled(metadata_by_path[file_path])
+
+
+def _top_k_enabled() -> bool:
+    return os.getenv("WORKER_ORDERED_DISCOVERY_TOP_K", "true").lower() == "true"
+
+
+def _modified_timestamp(source_fs: UnstractFileSystem, metadata: dict[str, Any]) -> float:
+    """Sort key of sort_files_by_modified_date(): UTC timestamp, epoch if unknown."""
+    try:
+        modified = source_fs.extract_modified_date(metadata)
+    except Exception as e:
+        logger.warning(
+            f"[OrderedDiscovery] Failed to extract modified date for "
+            f"{metadata.get('name', 'unknown file')}, using epoch: {e}"
+        )
+        return 0.0
+    if modified is None:
+        return 0.0
+    if modified.tzinfo is None:
+        modified = modified.replace(tzinfo=UTC)
+    return modified.timestamp()
+
+
+class _TopFiles:
+    """The ``limit`` best-ranked accepted files seen so far (lowest rank wins).
+
+    Ranks are ``(sort key, listing sequence)``, so ties keep listing order just
+    like the stable sort of the collect-then-sort path.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        # Max-heap on rank via negation; the root is the worst file kept
+        self._heap: list[tuple[float, int, FileHashData]] = []
+
+    def admits(self, rank: tuple[float, int]) -> bool:
+        """Whether a file of this rank could still make the final selection."""
+        if len(self._heap) < self._limit:
+            return True
+        return self._limit > 0 and rank < (-self._heap[0][0], -self._heap[0][1])
+
+    def push(self, rank: tuple[float, int], file_hash: FileHashData) -> None:
+        if not self.admits(rank):
+            return
+        entry = (-rank[0], -rank[1], file_hash)
+        if len(self._heap) < self._limit:
+            heapq.heappush(self._heap, entry)
+        else:
+            heapq.heapreplace(self._heap, entry)
+
+    def ordered(self) -> dict[str, FileHashData]:
+        return {
+            file_hash.file_path: file_hash
+            for _, _, file_hash in sorted(self._heap, reverse=True)
+        }
+
+
 class StreamingFileDiscovery:
     """Streams files from directories with early filtering and termination.
 
@@ -64,6 +146,7 @@ class StreamingFileDiscovery:
         file_hard_limit: int,
         filter_pipeline: FilterPipeline,
         batch_size: int = 100,
+        checkpoint: DiscoveryCheckpoint | None = None,
     ) -> tuple[dict[str, FileHashData], int]:
         """Discover files using streaming with early filtering.
 
@@ -77,6 +160,7 @@ class StreamingFileDiscovery:
             file_hard_limit: Maximum files to return (hard stop)
             filter_pipeline: Pipeline of filters to apply
             batch_size: Size of batches for processing
+            checkpoint: Optional watermark; settled files are skipped after listing
 
         Returns:
             Tuple of (matched_files, count)
@@ -93,6 +177,8 @@ class StreamingFileDiscovery:
             "files_after_filtering": 0,
             "batches_processed": 0,
             "directories_walked": 0,
+            "listing_calls": 0,
+            "files_skipped_by_checkpoint": 0,
         }
 
         # Calculate max depth for recursive search
@@ -105,30 +191,29 @@ class StreamingFileDiscovery:
         )
 
         try:
-            for directory in directories:
-                # Check if we've reached the limit
-                if len(matched_files) >= file_hard_limit:
-                    logger.info(
-                        f"[StreamingDiscovery] Reached file limit ({file_hard_limit}), "
-                        f"stopping discovery early"
-                    )
-                    break
 
-                logger.info(f"[StreamingDiscovery] Processing directory: {directory}")
+            def _on_walk_error(error: Exception) -> None:
+                logger.warning(f"[StreamingDiscovery] Failed to list directory: {error}")
+                if checkpoint:
+                    checkpoint.mark_incomplete(f"listing error: {error}")
 
-                def _on_walk_error(error: Exception) -> None:
-                    logger.warning(
-                        f"[StreamingDiscovery] Failed to list directory: {error}"
-                    )
+            walker = DirectoryWalker(self.fs_fsspec, max_depth, on_error=_on_walk_error)
+            logger.info(
+                f"[StreamingDiscovery] Walking directories {directories} with up to "
+                f"{walker.concurrency} listings in flight"
+            )
 
-                # Walk directory with max depth control
-                for _root, dirs, files in self.fs_fsspec.walk(
-                    directory, maxdepth=max_depth, detail=True, on_error=_on_walk_error
-                ):
+            # Closing the walk on early termination stops further listings
+            with closing(walker.walk(directories)) as walk:
+                for _root, dirs, files in walk:
                     metrics["directories_walked"] += 1
 
                     # Check limit before processing directory
                     if len(matched_files) >= file_hard_limit:
+                        logger.info(
+                            f"[StreamingDiscovery] Reached file limit ({file_hard_limit}), "
+                            f"stopping discovery early"
+                        )
                         break
 
                     fs_metadata_list: list[dict[str, Any]] = list(files.values())
@@ -180,6 +265,11 @@ class StreamingFileDiscovery:
                         )
                         metrics["files_pattern_matched"] += 1
 
+                        # Settled by an earlier run: no hashing, no history lookup
+                        if checkpoint and checkpoint.skips(fs_metadata):
+                            metrics["files_skipped_by_checkpoint"] += 1
+                            continue
+
                         # Add to batch buffer
                         batch_buffer.append((file_path, fs_metadata))
                         logger.info(
@@ -193,6 +283,7 @@ class StreamingFileDiscovery:
                                 matched_files,
                                 filter_pipeline,
                                 file_hard_limit,
+                                checkpoint,
                             )
                             metrics["batches_processed"] += 1
                             batch_buffer = []
@@ -204,10 +295,17 @@ class StreamingFileDiscovery:
                                 )
                                 break
 
+            listing = walker.stats
+            metrics["listing_calls"] = listing.listings
+
             # Process remaining files in buffer
             if batch_buffer and len(matched_files) < file_hard_limit:
                 self._process_batch(
-                    batch_buffer, matched_files, filter_pipeline, file_hard_limit
+                    batch_buffer,
+                    matched_files,
+                    filter_pipeline,
+                    file_hard_limit,
+                    checkpoint,
                 )
                 metrics["batches_processed"] += 1
 
@@ -222,6 +320,11 @@ class StreamingFileDiscovery:
             metrics["files_after_filtering"] = final_count
             elapsed_time = time.time() - start_time
 
+            if checkpoint:
+                if final_count >= file_hard_limit:
+                    checkpoint.mark_incomplete("file limit reached")
+                checkpoint.save()
+
             # Log comprehensive metrics
             logger.info(
                 f"[StreamingDiscovery] 🎯 Discovery complete in {elapsed_time:.2f}s:\n"
@@ -230,6 +333,7 @@ class StreamingFileDiscovery:
                 f"  • Files matching patterns: {metrics['files_pattern_matched']}\n"
                 f"  • Files after all filters: {metrics['files_after_filtering']}\n"
                 f"  • Batches processed: {metrics['batches_processed']}\n"
+                f"  • Skipped by checkpoint: {metrics['files_skipped_by_checkpoint']}\n"
                 f"  • Hard limit: {file_hard_limit}\n"
                 f"  • Early termination: {'Yes' if final_count >= file_hard_limit else 'No'}"
             )
@@ -245,7 +349,10 @@ class StreamingFileDiscovery:
                     f"[StreamingDiscovery] 📊 Performance metrics:\n"
                     f"  • Filter efficiency: {filter_efficiency:.1f}% files filtered out\n"
                     f"  • Discovery rate: {metrics['total_files_discovered'] / elapsed_time:.0f} files/sec\n"
-                    f"  • Final rate: {final_count / elapsed_time:.0f} accepted files/sec"
+                    f"  • Final rate: {final_count / elapsed_time:.0f} accepted files/sec\n"
+                    f"  • Listing throughput: {listing.files_per_second:.0f} files/sec over "
+                    f"{listing.listings} listings ({listing.avg_listing_ms:.0f} ms avg, "
+                    f"{listing.peak_in_flight} in flight at peak)"
                 )
 
             # Create cache entries for files that will be processed to prevent race conditions
@@ -286,6 +393,7 @@ class StreamingFileDiscovery:
         matched_files: dict[str, FileHashData],
         filter_pipeline: FilterPipeline,
         file_hard_limit: int,
+        checkpoint: DiscoveryCheckpoint | None = None,
     ) -> None:
         """Process a batch of files through the filter pipeline.
 
@@ -294,6 +402,7 @@ class StreamingFileDiscovery:
             matched_files: Dictionary to add accepted files to
             filter_pipeline: Pipeline of filters to apply
             file_hard_limit: Maximum number of files to collect
+            checkpoint: Optional checkpoint told about candidates left unsettled
         """
         if not batch_buffer:
             return
@@ -361,12 +470,17 @@ class StreamingFileDiscovery:
                     f"[StreamingDiscovery] FileHashData creation failed for '{file_path}': {ve}"
                 )
                 logger.info(f"DEBUG: [StreamingDiscovery] File metadata: {fs_metadata}")
+                # Not a candidate this run, so nothing settles it either
+                if checkpoint:
+                    checkpoint.note_unsettled(fs_metadata)
                 continue
             except Exception as e:
                 logger.error(
                     f"[StreamingDiscovery] Unexpected error processing '{file_path}': {e}",
                     exc_info=True,
                 )
+                if checkpoint:
+                    checkpoint.note_unsettled(fs_metadata)
                 continue
 
         # Apply filter pipeline to batch
@@ -382,6 +496,11 @@ class StreamingFileDiscovery:
             f"[StreamingDiscovery] Batch processing complete: {len(batch_buffer)} raw → {len(file_hash_batch)} valid → {len(filtered_batch)} filtered"
         )
 
+        if checkpoint:
+            _note_unsettled(
+                checkpoint, filter_pipeline, dict(batch_buffer), file_hash_batch
+            )
+
         # Add filtered files to results (respecting limit)
         added_count = 0
         for file_path, file_hash in filtered_batch.items():
@@ -509,13 +628,16 @@ class StreamingFileDiscovery:
 class OrderedFileDiscovery:
     """Ordered file discovery with sorting and chunked filtering.
 
-    This class handles ORDERED file processing (FIFO/LIFO) by:
-    1. Loading all file metadata into memory (up to MAX_FILES_FOR_SORTING)
-    2. Sorting by modification time (oldest/newest first)
-    3. Filtering in chunks using FilterPipeline to avoid overwhelming backend APIs
+    This class handles ORDERED file processing (FIFO/LIFO). By default it keeps
+    a bounded top-K selection while walking:
+    1. Streaming the listing, filtering candidates in chunks using FilterPipeline
+    2. Keeping only the ``file_hard_limit`` best accepted files in a heap keyed
+       on modification time, so memory stays O(limit) and files that can no
+       longer make the cut are dropped before any backend call
 
-    This provides the same memory behavior as backend source.py while maintaining
-    clean architecture separation.
+    With ``WORKER_ORDERED_DISCOVERY_TOP_K=false`` it falls back to the backend
+    source.py behavior: load all file metadata (up to MAX_FILES_FOR_SORTING),
+    sort it, then filter in chunks.
     """
 
     def __init__(
@@ -556,11 +678,13 @@ class OrderedFileDiscovery:
         file_hard_limit: int,
         file_processing_order: str,  # FileProcessingOrder enum value
         batch_size: int = 100,
+        checkpoint: DiscoveryCheckpoint | None = None,
     ) -> tuple[dict[str, FileHashData], int]:
         """Discover files with ordering (OLDEST_FIRST/NEWEST_FIRST).
 
-        Memory behavior: Load all files → Sort → Filter in chunks
-        This mirrors the backend logic exactly.
+        Memory behavior: Stream → Filter in chunks → Keep top ``file_hard_limit``
+        (or Load all files → Sort → Filter in chunks, mirroring the backend,
+        when top-K selection is disabled).
 
         Args:
             directories: List of directories to search
@@ -569,6 +693,7 @@ class OrderedFileDiscovery:
             file_hard_limit: Maximum files to return (hard stop)
             file_processing_order: Order to process files (OLDEST_FIRST/NEWEST_FIRST)
             batch_size: Size of filter processing chunks
+            checkpoint: Optional watermark; settled files are skipped after listing
 
         Returns:
             Tuple of (matched_files, count)
@@ -584,6 +709,7 @@ class OrderedFileDiscovery:
             "batches_processed": 0,
             "collection_time": 0.0,
             "filtering_time": 0.0,
+            "files_skipped_by_checkpoint": 0,
         }
 
         logger.info(
@@ -593,42 +719,70 @@ class OrderedFileDiscovery:
         )
 
         try:
-            # Step 1: Collect and sort all files (load into memory)
-            collection_start = time.time()
-            sorted_files = self._collect_and_sort_files(
-                directories, recursive, file_processing_order, metrics
-            )
-            metrics["collection_time"] = time.time() - collection_start
-
-            logger.info(
-                f"[OrderedDiscovery] Collected {len(sorted_files)} files for ordered processing "
-                f"in {metrics['collection_time']:.2f}s"
-            )
+            if _top_k_enabled():
+                # Listing and filtering overlap, so collection_time covers both
+                collection_start = time.time()
+                matched_files, total_processed = self._select_top_files(
+                    directories,
+                    patterns,
+                    recursive,
+                    file_hard_limit,
+                    file_processing_order,
+                    batch_size,
+                    metrics,
+                    checkpoint,
+                )
+                metrics["collection_time"] = time.time() - collection_start
+            else:
+                # Step 1: Collect and sort all files (load into memory)
+                collection_start = time.time()
+                sorted_files = self._collect_and_sort_files(
+                    directories, recursive, file_processing_order, metrics, checkpoint
+                )
+                metrics["collection_time"] = time.time() - collection_start
 
-            if not sorted_files:
-                # Log comprehensive metrics even for empty results
-                elapsed_time = time.time() - start_time
                 logger.info(
-                    f"[OrderedDiscovery] 🎯 Discovery complete in {elapsed_time:.2f}s:\n"
-                    f"  • Directories processed: {metrics['directories_processed']}\n"
-                    f"  • Total files collected: {metrics['total_files_collected']}\n"
-                    f"  • Files matching patterns: 0\n"
-                    f"  • Files after all filters: 0\n"
-                    f"  • Batches processed: 0\n"
-                    f"  • Hard limit: {file_hard_limit}\n"
-                    f"  • Processing order: {file_processing_order}\n"
-                    f"  • Early termination: No"
+                    f"[OrderedDiscovery] Collected {len(sorted_files)} files for ordered processing "
+                    f"in {metrics['collection_time']:.2f}s"
                 )
-                return {}, 0
 
-            # Step 2: Process in chunks with FilterPipeline
-            filtering_start = time.time()
-            matched_files, total_processed = self._process_sorted_files_in_chunks(
-                sorted_files, patterns, file_hard_limit, batch_size, metrics
-            )
-            metrics["filtering_time"] = time.time() - filtering_start
+                if not sorted_files:
+                    # Log comprehensive metrics even for empty results
+                    elapsed_time = time.time() - start_time
+                    logger.info(
+                        f"[OrderedDiscovery] 🎯 Discovery complete in {elapsed_time:.2f}s:\n"
+                        f"  • Directories processed: {metrics['directories_processed']}\n"
+                        f"  • Total files collected: {metrics['total_files_collected']}\n"
+                        f"  • Files matching patterns: 0\n"
+                        f"  • Files after all filters: 0\n"
+                        f"  • Batches processed: 0\n"
+                        f"  • Hard limit: {file_hard_limit}\n"
+                        f"  • Processing order: {file_processing_order}\n"
+                        f"  • Early termination: No"
+                    )
+                    if checkpoint:
+                        checkpoint.save()
+                    return {}, 0
+
+                # Step 2: Process in chunks with FilterPipeline
+                filtering_start = time.time()
+                matched_files, total_processed = self._process_sorted_files_in_chunks(
+                    sorted_files,
+                    patterns,
+                    file_hard_limit,
+                    batch_size,
+                    metrics,
+                    checkpoint,
+                )
+                metrics["filtering_time"] = time.time() - filtering_start
+
             final_count = total_processed
 
+            if checkpoint:
+                if final_count >= file_hard_limit:
+                    checkpoint.mark_incomplete("file limit reached")
+                checkpoint.save()
+
             # Update final metrics
             elapsed_time = time.time() - start_time
             metrics["files_after_filtering"] = final_count
@@ -641,6 +795,7 @@ class OrderedFileDiscovery:
                 f"  • Files matching patterns: {metrics['files_matching_patterns']}\n"
                 f"  • Files after all filters: {metrics['files_after_filtering']}\n"
                 f"  • Batches processed: {metrics['batches_processed']}\n"
+                f"  • Skipped by checkpoint: {metrics['files_skipped_by_checkpoint']}\n"
                 f"  • Hard limit: {file_hard_limit}\n"
                 f"  • Processing order: {file_processing_order}\n"
                 f"  • Early termination: {'Yes' if final_count >= file_hard_limit else 'No'}"
@@ -680,12 +835,146 @@ class OrderedFileDiscovery:
             # Return partial results if available
             return {}, 0
 
+    def _select_top_files(
+        self,
+        directories: list[str],
+        patterns: list[str],
+        recursive: bool,
+        file_hard_limit: int,
+        file_processing_order: str,
+        batch_size: int,
+        metrics: dict[str, Any],
+        checkpoint: DiscoveryCheckpoint | None = None,
+    ) -> tuple[dict[str, FileHashData], int]:
+        """Select the first ``file_hard_limit`` accepted files in order, streaming.
+
+        Candidates are filtered in chunks while the listing is still running and
+        accepted ones go into a heap bounded at ``file_hard_limit``. Once the
+        heap is full, a listed file ranked after its worst entry can no longer
+        be selected and is dropped before hashing and filtering. This orders
+        arbitrarily large directories correctly in O(limit + batch_size) memory.
+
+        Args:
+            directories: List of directories to search
+            patterns: File patterns for filtering
+            recursive: Whether to search recursively
+            file_hard_limit: Maximum files to return
+            file_processing_order: Order to select files in
+            batch_size: Size of each filter chunk
+            metrics: Metrics dictionary to populate
+            checkpoint: Optional watermark; settled files are skipped after listing
+
+        Returns:
+            Tuple of (matched_files, total_count)
+        """
+        from .filter_pipeline import create_standard_pipeline
+
+        filter_pipeline = create_standard_pipeline(
+            use_file_history=self.use_file_history,
+            enable_active_filtering=True,  # Always enable for ordered processing
+        )
+        max_depth = FileOperationConstants.MAX_RECURSIVE_DEPTH if recursive else 1
+        ascending = file_processing_order == "oldest_first"
+        top_files = _TopFiles(file_hard_limit)
+        pending: list[tuple[tuple[float, int], dict[str, Any]]] = []
+        listed = 0
+
+        def _filter_pending() -> None:
+            # The heap may have filled up since these were listed
+            candidates = [
+                (rank, metadata) for rank, metadata in pending if top_files.admits(rank)
+            ]
+            pending.clear()
+            if not candidates:
+                return
+            metrics["batches_processed"] += 1
+            chunk_file_dict: dict[str, FileHashData] = {}
+            ranks: dict[str, tuple[float, int]] = {}
+            for rank, metadata in candidates:
+                file_path = metadata["name"]
+                chunk_file_dict[file_path] = self._create_file_hash_from_metadata(
+                    file_path, metadata
+                )
+                ranks[file_path] = rank
+
+            filtered_chunk = filter_pipeline.apply_filters(
+                files=chunk_file_dict,
+                workflow_id=self.workflow_id,
+                execution_id=self.execution_id,
+                api_client=self.api_client,
+                organization_id=self.organization_id,
+            )
+            if checkpoint:
+                _note_unsettled(
+                    checkpoint,
+                    filter_pipeline,
+                    {metadata["name"]: metadata for _, metadata in candidates},
+                    chunk_file_dict,
+                )
+            for file_path, file_hash_data in filtered_chunk.items():
+                top_files.push(ranks[file_path], file_hash_data)
+
+        def _on_walk_error(error: Exception) -> None:
+            logger.warning(f"[OrderedDiscovery] Failed to list directory: {error}")
+            # Reported to the user like list_files() walk errors
+            self.source_fs._store_user_error(f"Could not access directory: {error}")
+            if checkpoint:
+                checkpoint.mark_incomplete(f"listing error: {error}")
+
+        walker = DirectoryWalker(self.fs_fsspec, max_depth, on_error=_on_walk_error)
+        metrics["directories_processed"] = len(directories)
+        try:
+            with closing(walker.walk(directories)) as walk:
+                for _root, _dirs, files in walk:
+                    for metadata in files.values():
+                        file_path = metadata.get("name")
+                        if not file_path or self.source_fs.is_dir_by_metadata(metadata):
+                            continue
+                        listed += 1
+                        if checkpoint and checkpoint.skips(metadata):
+                            metrics["files_skipped_by_checkpoint"] += 1
+                            continue
+                        if not self._should_process_file(file_path, patterns):
+                            continue
+                        metrics["files_matching_patterns"] += 1
+
+                        modified = _modified_timestamp(self.source_fs, metadata)
+                        rank = (modified if ascending else -modified, listed)
+                        if not top_files.admits(rank):
+                            continue
+                        pending.append((rank, metadata))
+                        if len(pending) >= batch_size:
+                            _filter_pending()
+        except Exception as e:
+            error_msg = f"Failed to collect files from {directories}"
+            logger.error(f"[OrderedDiscovery] {error_msg}: {e}")
+            if checkpoint:
+                checkpoint.mark_incomplete(f"{error_msg}: {e}")
+
+        _filter_pending()
+        metrics["total_files_collected"] = listed
+
+        matched_files = top_files.ordered()
+        order_desc = "FIFO (oldest first)" if ascending else "LIFO (newest first)"
+        listing = walker.stats
+        logger.info(
+            f"[OrderedDiscovery] Top-K selection complete: {listed} → "
+            f"{metrics['files_matching_patterns']} → {len(matched_files)} files "
+            f"matched in {order_desc} order; listed {listing.files_per_second:.0f} "
+            f"files/sec over {listing.listings} listings "
+            f"({listing.peak_in_flight} in flight at peak)"
+        )
+
+        self._reserve_files(matched_files)
+        return matched_files, len(matched_files)
+
     def _collect_and_sort_files(
         self,
         directories: list[str],
         recursive: bool,
         file_processing_order: str,
         metrics: dict[str, Any],
+        checkpoint: DiscoveryCheckpoint | None = None,
     ) -> list[dict[str, Any]]:
         """Collect files from all directories and sort globally.
 
@@ -696,6 +985,7 @@ class OrderedFileDiscovery:
             recursive: Whether to search recursively
             file_processing_order: Order to sort files
             metrics: Metrics dictionary to populate
+            checkpoint: Optional watermark; settled files are dropped before sorting
 
         Returns:
             List of file metadata dictionaries sorted by modified date
@@ -719,12 +1009,23 @@ class OrderedFileDiscovery:
                 break
 
             try:
+                errors_before = _listing_error_count(self.source_fs)
                 files_metadata = self.source_fs.list_files(
                     directory=directory,
                     max_depth=max_depth,
                     include_dirs=False,
                     limit=remaining_limit,
                 )
+                if checkpoint:
+                    if _listing_error_count(self.source_fs) > errors_before:
+                        checkpoint.mark_incomplete(f"listing error in {directory}")
+                    listed = len(files_metadata)
+                    files_metadata = [
+                        metadata
+                        for metadata in files_metadata
+                        if not checkpoint.skips(metadata)
+                    ]
+                    metrics["files_skipped_by_checkpoint"] += listed - len(files_metadata)
                 all_files_metadata.extend(files_metadata)
                 total_collected += len(files_metadata)
 
@@ -735,6 +1036,8 @@ class OrderedFileDiscovery:
 
                 # Check if we've hit the limit
                 if total_collected >= max_files_for_sorting:
+                    if checkpoint:
+                        checkpoint.mark_incomplete("sorting limit reached")
                     logger.warning(
                         f"[OrderedDiscovery] File collection limit of '{max_files_for_sorting}' reached. "
                         "Ordering may not reflect all available files."
@@ -744,6 +1047,8 @@ class OrderedFileDiscovery:
             except Exception as e:
                 error_msg = f"Failed to collect files from {directory}"
                 logger.error(f"[OrderedDiscovery] {error_msg}: {e}")
+                if checkpoint:
+                    checkpoint.mark_incomplete(f"{error_msg}: {e}")
                 continue
 
         # Update metrics with collection results
@@ -774,6 +1079,7 @@ class OrderedFileDiscovery:
         file_hard_limit: int,
         batch_size: int,
         metrics: dict[str, Any],
+        checkpoint: DiscoveryCheckpoint | None = None,
     ) -> tuple[dict[str, FileHashData], int]:
         """Process sorted files in chunks using FilterPipeline.
 
@@ -786,6 +1092,7 @@ class OrderedFileDiscovery:
             file_hard_limit: Maximum files to return
             batch_size: Size of each processing chunk
             metrics: Metrics dictionary to populate
+            checkpoint: Optional checkpoint told about candidates left unsettled
 
         Returns:
             Tuple of (matched_files, total_count)
@@ -864,6 +1171,14 @@ class OrderedFileDiscovery:
                 organization_id=self.organization_id,
             )
 
+            if checkpoint:
+                _note_unsettled(
+                    checkpoint,
+                    filter_pipeline,
+                    {metadata.get("name"): metadata for metadata in chunk_files},
+                    chunk_file_dict,
+                )
+
             # Add filtered files to results (respecting hard limit)
             chunk_accepted = 0
             for file_path, file_hash_data in filtered_chunk.items():
@@ -885,7 +1200,11 @@ class OrderedFileDiscovery:
             f"[OrderedDiscovery] Ordered processing complete: {len(sorted_files)} → {files_pattern_matched} → {total_processed} files matched"
         )
 
-        # Create cache entries for files that will be processed to prevent race conditions
+        self._reserve_files(matched_files)
+        return matched_files, total_processed
+
+    def _reserve_files(self, matched_files: dict[str, FileHashData]) -> None:
+        """Create cache entries for files that will be processed to prevent race conditions."""
         try:
             from ..workflow.execution.active_file_manager import ActiveFileManager
 
@@ -901,14 +1220,10 @@ class OrderedFileDiscovery:
                 f"for race condition prevention"
             )
 
-            # Return original matched_files since FilterPipeline already applied all filtering
-            return matched_files, total_processed
-
         except Exception as cache_error:
             logger.warning(
                 f"[OrderedDiscovery] Cache creation failed (proceeding anyway): {cache_error}"
             )
-            return matched_files, total_processed
 
     def _create_file_hash_from_metadata(
         self, file_path: str, file_metadata: dict[str, Any]
@@ -89,6 +89,9 @@ class FileHistoryFilter(FileFilter):
     def __init__(self, use_file_history: bool = True):
         self.use_file_history = use_file_history
         self._cache: dict[str, bool] = {}  # Cache results to avoid duplicate API calls
+        # Paths history will keep skipping for good (completed on this path, or
+        # out of executions) — unlike EXECUTING/PENDING or failed files
+        self.settled_paths: set[str] = set()
 
     @staticmethod
     def _create_file_identifier(provider_file_uuid: str, file_path: str) -> str:
@@ -261,6 +264,9 @@ class FileHistoryFilter(FileFilter):
                     file_path=file_path,
                 )
 
+                if is_processed and self._is_settled(file_result, file_path):
+                    self.settled_paths.add(file_path)
+
                 # Cache result using composite key helper method
                 cache_key = self._create_cache_key(workflow_id, uuid, file_path)
                 self._cache[cache_key] = is_processed
@@ -276,6 +282,17 @@ class FileHistoryFilter(FileFilter):
             )
             raise e
 
+    @staticmethod
+    def _is_settled(file_result: dict[str, Any], file_path: str) -> bool:
+        """Whether a skipped file stays skipped on every later run."""
+        file_history = file_result.get("file_history") or {}
+        if file_history.get("has_exceeded_limit") is True:
+            return True
+        return (
+            file_history.get("status") == ExecutionStatus.COMPLETED.value
+            and file_history.get("file_path") == file_path
+        )
+
     def _evaluate_file_history(
         self,
         history_response,
@@ -815,6 +832,16 @@ class FilterPipeline:
 
         return filtered
 
+    def settled_paths(self) -> set[str] | None:
+        """Paths file history reports as settled, or None without a history filter."""
+        for file_filter in self.filters:
+            if (
+                isinstance(file_filter, FileHistoryFilter)
+                and file_filter.use_file_history
+            ):
+                return file_filter.settled_paths
+        return None
+
 
 def create_standard_pipeline(
     use_file_history: bool = True,
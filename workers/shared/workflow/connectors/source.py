@@ -5,7 +5,7 @@ that matches the exact logic from backend/workflow_manager/endpoint_v2/source.py
 """
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from unstract.connectors.filesystems.unstract_file_system import UnstractFileSystem
 from unstract.core.data_models import (
@@ -23,6 +23,9 @@ from ...api.internal_client import InternalAPIClient
 from ...enums.file_types import FileProcessingOrder
 from .utils import get_connector_instance
 
+if TYPE_CHECKING:
+    from ...processing.discovery_checkpoint import DiscoveryCheckpoint
+
 logger = logging.getLogger(__name__)
 
 
@@ -225,6 +228,15 @@ class WorkerSourceConnector:
             logger.warning("No valid directories found to process")
             return {}, 0
 
+        checkpoint = self._load_discovery_checkpoint(
+            source_fs=source_fs,
+            connector_config=connector_config,
+            root_dir_path=root_dir_path,
+            valid_directories=valid_directories,
+            patterns=patterns,
+            recursive=recursive,
+        )
+
         if file_processing_order == FileProcessingOrder.UNORDERED:
             # Use existing StreamingFileDiscovery for unordered processing
             logger.info(
@@ -236,6 +248,7 @@ class WorkerSourceConnector:
                 patterns=patterns,
                 recursive=recursive,
                 limit=limit,
+                checkpoint=checkpoint,
             )
         else:
             # Use new sorting-based processing for OLDEST_FIRST/NEWEST_FIRST
@@ -249,6 +262,7 @@ class WorkerSourceConnector:
                 recursive=recursive,
                 limit=limit,
                 file_processing_order=file_processing_order,
+                checkpoint=checkpoint,
             )
 
         logger.info(
@@ -258,6 +272,40 @@ class WorkerSourceConnector:
 
         return matched_files, total_count
 
+    def _load_discovery_checkpoint(
+        self,
+        source_fs: UnstractFileSystem,
+        connector_config: ConnectorInstanceData | None,
+        root_dir_path: str,
+        valid_directories: list[str],
+        patterns: list[str],
+        recursive: bool,
+    ) -> "DiscoveryCheckpoint | None":
+        """Watermark of this exact source configuration, if enabled.
+
+        Only with file history: the watermark moves past files once history
+        marks them completed, and without history every file is reprocessed.
+        """
+        if not self.use_file_history:
+            return None
+        from ...processing.discovery_checkpoint import DiscoveryCheckpoint
+
+        try:
+            return DiscoveryCheckpoint.load(
+                source_fs,
+                self.organization_id,
+                self.workflow_id,
+                connector_config.connector_id if connector_config else None,
+                connector_config.connector_name if connector_config else None,
+                root_dir_path,
+                sorted(valid_directories),
+                sorted(patterns),
+                recursive,
+            )
+        except Exception as e:
+            logger.warning(f"Discovery checkpoint unavailable, listing all files: {e}")
+            return None
+
     # NOTE: The old _get_matched_files method has been removed and replaced with
     # StreamingFileDiscovery which applies all filters during discovery, not after.
     # This eliminates duplicate filtering and improves performance significantly.
@@ -523,6 +571,7 @@ class WorkerSourceConnector:
         patterns: list[str],
         recursive: bool,
         limit: int,
+        checkpoint: "DiscoveryCheckpoint | None" = None,
     ) -> tuple[dict[str, FileHashData], int]:
         """Process files without ordering using StreamingFileDiscovery (existing logic).
 
@@ -559,6 +608,7 @@ class WorkerSourceConnector:
             file_hard_limit=limit,  # Hard limit - will stop when reached
             filter_pipeline=filter_pipeline,
             batch_size=100,  # Process files in batches of 100
+            checkpoint=checkpoint,
         )
 
         return matched_files, total_count
@@ -571,6 +621,7 @@ class WorkerSourceConnector:
         recursive: bool,
         limit: int,
         file_processing_order: FileProcessingOrder,
+        checkpoint: "DiscoveryCheckpoint | None" = None,
     ) -> tuple[dict[str, FileHashData], int]:
         """Process files with ordering using OrderedFileDiscovery.
 
@@ -583,6 +634,7 @@ class WorkerSourceConnector:
             recursive: Whether to search recursively
             limit: Maximum number of files to return
             file_processing_order: Order to process files (OLDEST_FIRST or NEWEST_FIRST)
+            checkpoint: Optional discovery watermark (see DiscoveryCheckpoint)
 
         Returns:
             tuple: (matched_files_dict, total_count)
@@ -609,4 +661,5 @@ class WorkerSourceConnector:
             file_hard_limit=limit,
             file_processing_order=file_processing_order.value,  # Convert enum to string
             batch_size=100,  # Process in batches of 100 files
+            checkpoint=checkpoint,
         )
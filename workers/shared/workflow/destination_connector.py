@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING, Any, Optional
 from shared.enums import DestinationConfigKey, QueueResultStatus
 
 # Import database utils (stable path)
+from shared.infrastructure.database.destination_pool import write_destination_row
 from shared.infrastructure.database.utils import WorkerDatabaseUtils
 from shared.infrastructure.logging import WorkerLogger
 from shared.infrastructure.logging.helpers import log_file_error, log_file_info
@@ -969,11 +970,6 @@ class WorkerDestinationConnector:
                 "No connector_settings provided in destination configuration"
             )
 
-        db_class = WorkerDatabaseUtils.get_db_class(
-            connector_id=connector_id,
-            connector_settings=connector_settings,
-        )
-
         # Get combined metadata including usage data
         metadata = self.get_combined_metadata(api_client, metadata)
         logger.info(f"Database destination - Metadata: {metadata}")
@@ -1006,31 +1002,7 @@ class WorkerDestinationConnector:
         else:
             execution_id = self.execution_id
 
-        engine = None
         try:
-            logger.info(f"Creating database connection with connector ID: {connector_id}")
-            db_class = WorkerDatabaseUtils.get_db_class(
-                connector_id=connector_id,
-                connector_settings=connector_settings,
-            )
-            table_info = db_class.get_information_schema(table_name=table_name)
-
-            logger.info(
-                f"destination connector table_name: {table_name} with table_info: {table_info}"
-            )
-            engine = db_class.get_engine()
-
-            if table_info:
-                if db_class.has_no_metadata(table_info=table_info):
-                    table_info = WorkerDatabaseUtils.migrate_table_to_v2(
-                        db_class=db_class,
-                        engine=engine,
-                        table_name=table_name,
-                        column_name=single_column_name,
-                    )
-
-            logger.info(f"Creating table {table_name} if not exists")
-
             values = WorkerDatabaseUtils.get_columns_and_values(
                 column_mode_str=column_mode,
                 data=data,
@@ -1046,38 +1018,21 @@ class WorkerDestinationConnector:
                 error=error_message,
             )
 
-            WorkerDatabaseUtils.create_table_if_not_exists(
-                db_class=db_class,
-                engine=engine,
-                table_name=table_name,
-                database_entry=values,
-            )
-
-            # Remove None values from INSERT to let database handle as NULL
-            # Table schema already created with all columns (including data column)
-            # Removing None values prevents "invalid JSON" errors when inserting error records
-            values = {k: v for k, v in values.items() if v is not None}
-
-            logger.info(f"Preparing SQL query data for table {table_name}")
-            sql_columns_and_values = WorkerDatabaseUtils.get_sql_query_data(
-                conn_cls=db_class,
+            # Connector, connection and table check are pooled per worker
+            # process across files writing to the same table; within a file
+            # batch the row is buffered and written when the batch ends
+            logger.info(f"Writing to table {table_name} via connector {connector_id}")
+            buffered = write_destination_row(
+                connector_id=connector_id,
+                connector_settings=connector_settings,
                 table_name=table_name,
                 values=values,
+                single_column_name=single_column_name,
+                key=file_execution_id,
             )
-            logger.info(
-                f"sql_columns_and_values for table_name: {table_name} are: {sql_columns_and_values}"
-            )
-            logger.info(
-                f"Executing insert query for {len(sql_columns_and_values)} columns"
-            )
-            WorkerDatabaseUtils.execute_write_query(
-                db_class=db_class,
-                engine=engine,
-                table_name=table_name,
-                sql_keys=list(sql_columns_and_values.keys()),
-                sql_values=list(sql_columns_and_values.values()),
-            )
-
+            if buffered:
+                logger.info(f"Queued data for database table {table_name}")
+                return
             logger.info(f"Successfully inserted data into database table {table_name}")
 
             # Log to UI with file_execution_id for better correlation
@@ -1097,18 +1052,6 @@ class WorkerDestinationConnector:
             )
             logger.error(error_msg)
             raise
-        finally:
-            self._close_engine(engine, input_file_path)
-
-    def _close_engine(self, engine: Any, input_file_path: str) -> None:
-        """Safely close database engine."""
-        if engine:
-            try:
-                engine.close()
-            except Exception as e:
-                logger.error(
-                    f"Failed to close database engine for {input_file_path}: {str(e)}"
-                )
 
     def copy_output_to_output_directory(
         self,
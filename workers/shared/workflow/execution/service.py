@@ -5,8 +5,10 @@ from unstract/workflow-execution, enabling workers to execute workflows
 directly using the ToolSandbox and runner services.
 """
 
+import functools
 import os
 import time
+from collections.abc import Iterator
 from typing import Any
 
 import magic
@@ -52,6 +54,7 @@ from unstract.workflow_execution.execution_file_handler import ExecutionFileHand
 from unstract.workflow_execution.workflow_execution import WorkflowExecutionService
 
 from ...api.internal_client import InternalAPIClient
+from ...infrastructure.database.destination_pool import current_destination_batch
 from ...infrastructure.logging import WorkerLogger
 from ...utils.error_utils import get_user_friendly_error_message
 from ..destination_connector import (
@@ -1109,8 +1112,6 @@ class WorkerWorkflowExecutionService:
         file_processing_context: FileProcessingContext,
     ) -> str:
         """Copy file from API storage to workflow execution directory using chunked reading."""
-        import hashlib
-
         from unstract.filesystem import FileStorageType, FileSystem
 
         logger.info(f"Handling API file copy from {file_path} to execution directory")
@@ -1122,36 +1123,30 @@ class WorkerWorkflowExecutionService:
         workflow_file_system = FileSystem(FileStorageType.WORKFLOW_EXECUTION)
         workflow_file_storage = workflow_file_system.get_file_storage()
 
-        # Copy file in chunks
-        file_content_hash = hashlib.sha256()
-        total_bytes_copied = 0
-        seek_position = 0  # Track position for sequential reads
+        def read_chunks():
+            seek_position = 0  # Track position for sequential reads
+            while chunk := api_file_storage.read(
+                path=file_path,
+                mode="rb",
+                seek_position=seek_position,
+                length=self.READ_CHUNK_SIZE,
+            ):
+                seek_position += len(chunk)
+                yield chunk
 
         logger.info(f"Starting chunked file copy from API storage for {file_path}")
+        computed_hash, total_bytes_copied = self._stream_to_execution_files(
+            chunks=read_chunks(),
+            file_path=file_path,
+            infile_path=infile_path,
+            source_file_path=source_file_path,
+            workflow_file_storage=workflow_file_storage,
+            check_mime_type=False,
+        )
 
-        # Read and write in chunks
-        while chunk := api_file_storage.read(
-            path=file_path,
-            mode="rb",
-            seek_position=seek_position,
-            length=self.READ_CHUNK_SIZE,
-        ):
-            file_content_hash.update(chunk)
-            total_bytes_copied += len(chunk)
-            seek_position += len(chunk)
-
-            # Write chunk to both INFILE and SOURCE
-            workflow_file_storage.write(path=infile_path, mode="ab", data=chunk)
-            workflow_file_storage.write(path=source_file_path, mode="ab", data=chunk)
-
-        # Handle empty files - raise exception instead of creating placeholders
-        if total_bytes_copied == 0:
-            raise EmptyFileError(file_path)
-        else:
-            computed_hash = file_content_hash.hexdigest()
-            logger.info(
-                f"Successfully copied {total_bytes_copied} bytes from API storage with hash: {computed_hash}"
-            )
+        logger.info(
+            f"Successfully copied {total_bytes_copied} bytes from API storage with hash: {computed_hash}"
+        )
 
         # Store computed hash in file_data for file history
         file_processing_context.file_hash.file_hash = computed_hash
@@ -1168,8 +1163,6 @@ class WorkerWorkflowExecutionService:
         connector_metadata: dict[str, Any],
     ) -> str:
         """Copy file from filesystem connector to workflow execution directory."""
-        import hashlib
-
         from unstract.connectors.constants import Common
         from unstract.connectors.filesystems import connectors
         from unstract.filesystem import FileStorageType, FileSystem
@@ -1209,45 +1202,102 @@ class WorkerWorkflowExecutionService:
         source_connector = connector_class(connector_settings_to_use)
         source_fs = source_connector.get_fsspec_fs()
 
-        # Copy file in chunks
-        file_content_hash = hashlib.sha256()
-        total_bytes_copied = 0
-        first_chunk = True
-
         logger.info(f"Starting chunked file copy from {file_path} to execution directory")
 
         with source_fs.open(file_path, "rb") as source_file:
-            while chunk := source_file.read(self.READ_CHUNK_SIZE):
-                # MIME type detection and validation on first chunk
-                if first_chunk:
-                    mime_type = magic.from_buffer(chunk, mime=True)
-                    logger.info(f"Detected MIME type: {mime_type} for file {file_path}")
-
-                    if not AllowedFileTypes.is_allowed(mime_type):
-                        raise UnsupportedMimeTypeError(
-                            f"Unsupported MIME type '{mime_type}' for file '{file_path}'"
+            computed_hash, total_bytes_copied = self._stream_to_execution_files(
+                chunks=iter(lambda: source_file.read(self.READ_CHUNK_SIZE), b""),
+                file_path=file_path,
+                infile_path=infile_path,
+                source_file_path=source_file_path,
+                workflow_file_storage=workflow_file_storage,
+                check_mime_type=True,
+            )
+        logger.info(
+            f"Successfully copied {total_bytes_copied} bytes with hash: {computed_hash}"
+        )
+
+        # Store computed hash in file_data for file history
+        file_processing_context.file_hash.file_hash = computed_hash
+        return computed_hash
+
+    def _stream_to_execution_files(
+        self,
+        chunks: Iterator[bytes],
+        file_path: str,
+        infile_path: str,
+        source_file_path: str,
+        workflow_file_storage: Any,
+        check_mime_type: bool,
+    ) -> tuple[str, int]:
+        """Write a source stream to INFILE and SOURCE in one pass.
+
+        Hashing, MIME validation (on the first chunk) and the upload share one
+        read of the source. INFILE is opened once, so object stores see a single
+        buffered/multipart upload instead of an append-mode reopen per chunk,
+        and SOURCE is derived from it with ``cp_file`` (a server-side copy on
+        S3/MinIO/GCS).
+
+        Returns:
+            tuple[str, int]: SHA-256 of the content and number of bytes copied
+
+        Raises:
+            UnsupportedMimeTypeError: If ``check_mime_type`` and the content
+                type is not allowed; nothing is written in that case
+            EmptyFileError: If the source is empty; nothing is written
+        """
+        import hashlib
+
+        file_content_hash = hashlib.sha256()
+        total_bytes_copied = 0
+        infile = None
+        try:
+            for chunk in chunks:
+                if infile is None:
+                    if check_mime_type:
+                        mime_type = magic.from_buffer(chunk, mime=True)
+                        logger.info(
+                            f"Detected MIME type: {mime_type} for file {file_path}"
                         )
-                    first_chunk = False
+                        if not AllowedFileTypes.is_allowed(mime_type):
+                            raise UnsupportedMimeTypeError(
+                                f"Unsupported MIME type '{mime_type}' for file '{file_path}'"
+                            )
+                    infile = workflow_file_storage.fs.open(infile_path, "wb")
 
                 file_content_hash.update(chunk)
                 total_bytes_copied += len(chunk)
+                infile.write(chunk)
+        except BaseException:
+            if infile is not None:
+                self._discard_partial_file(infile, infile_path, workflow_file_storage)
+            raise
 
-                # Write chunk to both INFILE and SOURCE
-                workflow_file_storage.write(path=infile_path, mode="ab", data=chunk)
-                workflow_file_storage.write(path=source_file_path, mode="ab", data=chunk)
-
-        # Handle empty files - raise exception instead of using _handle_empty_file
-        if total_bytes_copied == 0:
+        # Handle empty files - raise exception instead of creating placeholders
+        if infile is None:
             raise EmptyFileError(file_path)
-        else:
-            computed_hash = file_content_hash.hexdigest()
-            logger.info(
-                f"Successfully copied {total_bytes_copied} bytes with hash: {computed_hash}"
-            )
+        infile.close()
 
-        # Store computed hash in file_data for file history
-        file_processing_context.file_hash.file_hash = computed_hash
-        return computed_hash
+        # fs.cp_file directly: FileStorage.cp forwards ``overwrite`` to the
+        # provider, which S3's CopyObject rejects
+        workflow_file_storage.fs.cp_file(infile_path, source_file_path)
+        return file_content_hash.hexdigest(), total_bytes_copied
+
+    @staticmethod
+    def _discard_partial_file(
+        file_handle: Any, path: str, workflow_file_storage: Any
+    ) -> None:
+        """Abort an interrupted upload so no truncated INFILE is left behind."""
+        try:
+            if hasattr(file_handle, "discard"):
+                # fsspec buffered files: aborts the multipart upload
+                file_handle.discard()
+            else:
+                file_handle.close()
+            if workflow_file_storage.exists(path):
+                workflow_file_storage.rm(path, recursive=False)
+        except Exception as e:
+            logger.warning(f"Failed to clean up partial file {path}: {e}")
 
     def _check_existing_input_files(
         self,
@@ -1605,55 +1655,34 @@ class WorkerWorkflowExecutionService:
                 output_result=output_result,
                 processing_error=processing_error,
             ):
-                # Create file history entry via API client
-                logger.info(f"Creating file history entry for {file_hash.file_name}")
-
-                # Serialize result and metadata for API
-                import json
-
-                result_json = ""
-                if output_result and destination.is_api:
-                    try:
-                        result_json = (
-                            json.dumps(output_result)
-                            if isinstance(output_result, (dict, list))
-                            else str(output_result)
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to serialize result: {e}")
-                        result_json = str(output_result)
-
-                # Determine status and error based on processing outcome
                 if processing_error or self._last_execution_error:
-                    file_status = ExecutionStatus.ERROR.value
                     error_message = str(processing_error or self._last_execution_error)
                 else:
-                    file_status = ExecutionStatus.COMPLETED.value
                     error_message = ""
-
-                # Create file history via API (for both success and error)
-                file_history_response = self.api_client.create_file_history(
-                    file_path=file_hash.file_path if not destination.is_api else None,
-                    file_name=file_hash.file_name,
-                    source_connection_type=str(source_connection_type),
+                create_file_history = functools.partial(
+                    self._create_file_history,
+                    destination=destination,
+                    file_hash=file_hash,
                     workflow_id=workflow_id,
-                    file_hash=file_hash.file_hash,
-                    file_size=getattr(file_hash, "file_size", 0),
-                    mime_type=getattr(file_hash, "mime_type", ""),
-                    result=result_json,
+                    source_connection_type=source_connection_type,
+                    output_result=output_result,
                     metadata=metadata,
-                    status=file_status,
-                    error=error_message,
-                    provider_file_uuid=getattr(file_hash, "provider_file_uuid", None),
-                    is_api=destination.is_api,
                 )
-
-                if file_history_response.success:
-                    logger.info(f"Created file history entry for {file_hash.file_name}")
-                else:
-                    logger.warning(
-                        f"Failed to create file history: {file_history_response.error}"
+                destination_writes = current_destination_batch()
+                if destination_writes and destination_writes.is_pending(
+                    workflow_file_execution_id
+                ):
+                    # The row is written when the file batch ends; record the
+                    # history then, so a failed write never leaves a COMPLETED
+                    # entry behind that skips the file on the next run
+                    destination_writes.after_write(
+                        workflow_file_execution_id,
+                        lambda write_error: create_file_history(
+                            error_message=error_message or str(write_error or "")
+                        ),
                     )
+                else:
+                    create_file_history(error_message=error_message)
 
             if processing_error:
                 logger.error(
@@ -1678,6 +1707,64 @@ class WorkerWorkflowExecutionService:
             logger.error(error_msg, exc_info=True)
             return FinalOutputResult(output=None, metadata=None, error=error_msg)
 
+    def _create_file_history(
+        self,
+        destination,
+        file_hash: FileHashData,
+        workflow_id: str,
+        source_connection_type: Any,
+        output_result: Any,
+        metadata: dict[str, Any] | None,
+        error_message: str,
+    ) -> None:
+        """Create the file history entry of a processed file via the API client."""
+        logger.info(f"Creating file history entry for {file_hash.file_name}")
+
+        # Serialize result and metadata for API
+        import json
+
+        result_json = ""
+        if output_result and destination.is_api:
+            try:
+                result_json = (
+                    json.dumps(output_result)
+                    if isinstance(output_result, (dict, list))
+                    else str(output_result)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to serialize result: {e}")
+                result_json = str(output_result)
+
+        # Determine status based on processing outcome
+        if error_message:
+            file_status = ExecutionStatus.ERROR.value
+        else:
+            file_status = ExecutionStatus.COMPLETED.value
+
+        # Create file history via API (for both success and error)
+        file_history_response = self.api_client.create_file_history(
+            file_path=file_hash.file_path if not destination.is_api else None,
+            file_name=file_hash.file_name,
+            source_connection_type=str(source_connection_type),
+            workflow_id=workflow_id,
+            file_hash=file_hash.file_hash,
+            file_size=getattr(file_hash, "file_size", 0),
+            mime_type=getattr(file_hash, "mime_type", ""),
+            result=result_json,
+            metadata=metadata,
+            status=file_status,
+            error=error_message,
+            provider_file_uuid=getattr(file_hash, "provider_file_uuid", None),
+            is_api=destination.is_api,
+        )
+
+        if file_history_response.success:
+            logger.info(f"Created file history entry for {file_hash.file_name}")
+        else:
+            logger.warning(
+                f"Failed to create file history: {file_history_response.error}"
+            )
+
     def _should_create_file_history(
         self,
         destination,
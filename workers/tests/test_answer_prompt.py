@@ -100,6 +100,7 @@ def _mock_llm():
     }
     llm.get_usage_reason.return_value = "extraction"
     llm.get_metrics.return_value = {"tokens": 100}
+    llm.fork.return_value = llm  # the adapter pool forks it for later prompts
     return llm
 
 
@@ -113,6 +114,7 @@ def _mock_deps(llm=None):
 
     retrieval_svc = MagicMock(name="RetrievalService")
     retrieval_svc.run_retrieval.return_value = ["chunk1", "chunk2"]
+    retrieval_svc.run_batch_retrieval.return_value = {}
     retrieval_svc.retrieve_complete_context.return_value = ["full content"]
 
     variable_replacement_svc = MagicMock(name="VariableReplacementService")
@@ -962,3 +964,303 @@ class TestVariableReplacementService:
                 variable="custom_data.missing",
                 custom_data={"other": "value"},
             )
+
+    def test_referenced_prompt_names(self):
+        """Static, dynamic and %legacy% references resolve to prompt names."""
+        from executor.executors.variable_replacement import (
+            VariableReplacementService,
+        )
+
+        text = (
+            "Use {{revenue}} and %date_signed% with "
+            "{{https://api.example.com/lookup[party]}} and {{custom_data.x}}"
+        )
+        names = ["revenue", "date_signed", "party", "other"]
+        assert VariableReplacementService.referenced_prompt_names(text, names) == {
+            "revenue",
+            "date_signed",
+            "party",
+        }
+
+
+class TestConcurrentAnswerPrompt:
+    """EXECUTOR_PROMPT_CONCURRENCY > 1: dependency-aware parallel prompts."""
+
+    @pytest.fixture(autouse=True)
+    def _concurrency(self, monkeypatch):
+        monkeypatch.setenv(PSKeys.PROMPT_CONCURRENCY, "4")
+
+    def test_dependency_levels(self):
+        from executor.executors.legacy_executor import LegacyExecutor
+
+        prompts = [
+            _make_prompt(name="a"),
+            _make_prompt(name="b", prompt="Given {{a}}, what?"),
+            _make_prompt(name="c", prompt="Unrelated; refers to later {{d}}"),
+            _make_prompt(name="d", prompt="Combine %b% and {{c}}"),
+        ]
+        assert LegacyExecutor._prompt_dependency_levels(prompts) == [0, 1, 0, 2]
+
+    @patch(
+        "executor.executors.legacy_executor.LegacyExecutor._get_prompt_deps"
+    )
+    @patch("executor.executors.legacy_executor.ExecutorToolShim")
+    def test_results_merged_in_prompt_order(self, mock_shim_cls, mock_deps):
+        from executor.executors.legacy_executor import LegacyExecutor
+
+        mock_deps.return_value = _mock_deps(_mock_llm())
+        mock_shim_cls.return_value = MagicMock()
+        names = ["p1", "p2", "p3", "p4", "p5"]
+        ctx = _make_context(prompts=[_make_prompt(name=n) for n in names])
+
+        result = LegacyExecutor()._handle_answer_prompt(ctx)
+
+        assert list(result.data[PSKeys.OUTPUT]) == names
+        assert all(v == "test answer" for v in result.data[PSKeys.OUTPUT].values())
+        assert list(result.data[PSKeys.METADATA][PSKeys.CONTEXT]) == names
+        assert list(result.data[PSKeys.METRICS]) == names
+        assert result.data[PSKeys.METADATA][PSKeys.RUN_ID] == "run-1"
+
+    @patch(
+        "executor.executors.legacy_executor.LegacyExecutor._get_prompt_deps"
+    )
+    @patch("executor.executors.legacy_executor.ExecutorToolShim")
+    def test_dependent_prompt_sees_its_inputs(self, mock_shim_cls, mock_deps):
+        from executor.executors.legacy_executor import LegacyExecutor
+
+        mock_deps.return_value = _mock_deps(_mock_llm())
+        mock_shim_cls.return_value = MagicMock()
+        seen = {}
+
+        def fake_prompt(self, output, structured_output, **_kwargs):
+            name = output[PSKeys.NAME]
+            seen[name] = dict(structured_output)
+            structured_output[name] = f"{name}-answer"
+            return [{"prompt": name}]
+
+        prompts = [
+            _make_prompt(name="a"),
+            _make_prompt(name="b"),
+            _make_prompt(name="c", prompt="Given {{a}}, what?"),
+        ]
+        with patch.object(LegacyExecutor, "_execute_single_prompt", fake_prompt):
+            result = LegacyExecutor()._handle_answer_prompt(
+                _make_context(prompts=prompts)
+            )
+
+        assert seen["c"] == {"a": "a-answer", "b": "b-answer"}
+        assert seen["a"] == seen["b"] == {}
+        assert result.metadata["usage_records"] == [
+            {"prompt": "a"},
+            {"prompt": "b"},
+            {"prompt": "c"},
+        ]
+
+    @patch(
+        "executor.executors.legacy_executor.LegacyExecutor._get_prompt_deps"
+    )
+    @patch("executor.executors.legacy_executor.ExecutorToolShim")
+    def test_failure_raises_first_error_with_all_usage(
+        self, mock_shim_cls, mock_deps
+    ):
+        from executor.executors.exceptions import LegacyExecutorError
+        from executor.executors.legacy_executor import LegacyExecutor
+
+        mock_deps.return_value = _mock_deps(_mock_llm())
+        mock_shim_cls.return_value = MagicMock()
+        ran = []
+
+        def fake_prompt(self, output, structured_output, **_kwargs):
+            name = output[PSKeys.NAME]
+            ran.append(name)
+            if name == "b":
+                raise LegacyExecutorError(message="b failed")
+            return [{"prompt": name}]
+
+        prompts = [
+            _make_prompt(name="a"),
+            _make_prompt(name="b"),
+            _make_prompt(name="c"),
+            _make_prompt(name="d", prompt="Given {{b}}"),
+        ]
+        with patch.object(LegacyExecutor, "_execute_single_prompt", fake_prompt):
+            with pytest.raises(LegacyExecutorError, match="b failed") as exc_info:
+                LegacyExecutor()._handle_answer_prompt(_make_context(prompts=prompts))
+
+        assert "d" not in ran  # the failing wave stops later waves
+        assert exc_info.value.partial_usage_records == [
+            {"prompt": "a"},
+            {"prompt": "c"},
+        ]
+
+
+class TestAdapterPool:
+    """Adapters are built once per answer_prompt run and shared by its prompts."""
+
+    @patch(
+        "executor.executors.legacy_executor.LegacyExecutor._get_prompt_deps"
+    )
+    @patch("executor.executors.legacy_executor.ExecutorToolShim")
+    def test_adapters_built_once_per_run(self, mock_shim_cls, mock_deps):
+        from executor.executors.legacy_executor import LegacyExecutor
+
+        llm = _mock_llm()
+        deps = _mock_deps(llm)
+        mock_deps.return_value = deps
+        _, _, _, _, llm_cls, embedding_compat_cls, vector_db_cls = deps
+        vdb_instance = MagicMock()
+        vector_db_cls.return_value = vdb_instance
+        mock_shim_cls.return_value = MagicMock()
+        prompts = [_make_prompt(name=n) for n in ("a", "b", "c")]
+
+        result = LegacyExecutor()._handle_answer_prompt(_make_context(prompts=prompts))
+
+        assert list(result.data[PSKeys.OUTPUT]) == ["a", "b", "c"]
+        llm_cls.assert_called_once()
+        embedding_compat_cls.assert_called_once()
+        vector_db_cls.assert_called_once()
+        assert llm.fork.call_count == 2  # later prompts get their own usage state
+        vdb_instance.close.assert_called_once()  # closed once, after the run
+
+    def test_distinct_adapter_ids_are_not_shared(self):
+        from executor.executors.adapter_pool import AdapterPool
+
+        llm_cls = MagicMock(side_effect=lambda **kw: MagicMock(name=kw["adapter_instance_id"]))
+        pool = AdapterPool(llm_cls, MagicMock(), MagicMock(), platform_api_key="pk")
+        usage = {"run_id": "r"}
+
+        first = pool.llm("llm-1", tool=MagicMock(), usage_kwargs=usage)
+        other = pool.llm("llm-2", tool=MagicMock(), usage_kwargs=usage)
+        again = pool.llm("llm-1", tool="shim-2", usage_kwargs=usage)
+
+        assert llm_cls.call_count == 2
+        assert other is not first
+        first.fork.assert_called_once_with(tool="shim-2")
+        assert again is first.fork.return_value
+
+    def test_failed_build_is_retried(self):
+        from executor.executors.adapter_pool import AdapterPool
+
+        embedding_cls = MagicMock(side_effect=[RuntimeError("platform down"), "emb"])
+        pool = AdapterPool(MagicMock(), embedding_cls, MagicMock())
+
+        with pytest.raises(RuntimeError):
+            pool.embedding("emb-1", tool=MagicMock(), kwargs={})
+        assert pool.embedding("emb-1", tool=MagicMock(), kwargs={}) == "emb"
+
+    def test_index_key_memoized_per_combination(self):
+        from executor.executors.adapter_pool import AdapterPool
+
+        pool = AdapterPool(MagicMock(), MagicMock(), MagicMock())
+        key_args = {
+            "vector_db": "vdb-1",
+            "embedding": "emb-1",
+            "x2text": "x2t-1",
+            "chunk_size": "512",
+            "chunk_overlap": "128",
+            "file_path": "/data/test.pdf",
+        }
+
+        with patch(_PATCH_INDEX_UTILS, side_effect=["doc-a", "doc-b"]) as gen_key:
+            first = pool.index_key(MagicMock(), **key_args)
+            again = pool.index_key(MagicMock(), **key_args)
+            other = pool.index_key(MagicMock(), **{**key_args, "chunk_size": "256"})
+
+        assert (first, again, other) == ("doc-a", "doc-a", "doc-b")
+        assert gen_key.call_count == 2
+
+
+class TestBatchedRetrieval:
+    """Simple-strategy prompts on one document are retrieved as a batch."""
+
+    def _run(self, mock_shim_cls, mock_deps, prompts, batch=None):
+        from executor.executors.legacy_executor import LegacyExecutor
+
+        deps = _mock_deps(_mock_llm())
+        retrieval_svc = deps[1]
+        if batch is not None:
+            retrieval_svc.run_batch_retrieval.side_effect = batch
+        mock_deps.return_value = deps
+        mock_shim_cls.return_value = MagicMock()
+        result = LegacyExecutor()._handle_answer_prompt(_make_context(prompts=prompts))
+        return result, retrieval_svc
+
+    @patch(
+        "executor.executors.legacy_executor.LegacyExecutor._get_prompt_deps"
+    )
+    @patch("executor.executors.legacy_executor.ExecutorToolShim")
+    def test_batchable_prompts_share_one_batch(self, mock_shim_cls, mock_deps):
+        prompts = [
+            _make_prompt(name="a"),
+            _make_prompt(name="b", prompt="Who signed?"),
+            _make_prompt(name="c", prompt="Given %a%, what?"),
+            _make_prompt(name="d", retrieval_strategy="fusion"),
+        ]
+        result, retrieval_svc = self._run(
+            mock_shim_cls,
+            mock_deps,
+            prompts,
+            batch=lambda outputs, **_: {
+                o[PSKeys.NAME]: [o[PSKeys.PROMPTX]] for o in outputs
+            },
+        )
+
+        retrieval_svc.run_batch_retrieval.assert_called_once()
+        batched = retrieval_svc.run_batch_retrieval.call_args.kwargs["outputs"]
+        assert [o[PSKeys.NAME] for o in batched] == ["a", "b"]
+        context = result.data[PSKeys.METADATA][PSKeys.CONTEXT]
+        assert context["a"] == ["What is the revenue?"]
+        assert context["b"] == ["Who signed?"]
+        # Prompts reading other answers, or other strategies, retrieve alone
+        retrieved_alone = [
+            c.kwargs["output"][PSKeys.NAME]
+            for c in retrieval_svc.run_retrieval.call_args_list
+        ]
+        assert retrieved_alone == ["c", "d"]
+
+    @pytest.mark.parametrize("prompt_concurrency", ["1", "4"])
+    @patch(
+        "executor.executors.legacy_executor.LegacyExecutor._get_prompt_deps"
+    )
+    @patch("executor.executors.legacy_executor.ExecutorToolShim")
+    def test_batched_retrieval_metrics_reported(
+        self, mock_shim_cls, mock_deps, monkeypatch, prompt_concurrency
+    ):
+        monkeypatch.setenv(PSKeys.PROMPT_CONCURRENCY, prompt_concurrency)
+
+        def batch(outputs, context_retrieval_metrics, **_):
+            for o in outputs:
+                context_retrieval_metrics[o[PSKeys.NAME]] = {"time_taken(s)": 0.5}
+            return {o[PSKeys.NAME]: [o[PSKeys.PROMPTX]] for o in outputs}
+
+        prompts = [_make_prompt(name="a"), _make_prompt(name="b", prompt="Who?")]
+        result, _ = self._run(mock_shim_cls, mock_deps, prompts, batch=batch)
+
+        metrics = result.data[PSKeys.METRICS]
+        assert metrics["a"]["context_retrieval"] == {"time_taken(s)": 0.5}
+        assert metrics["b"]["context_retrieval"] == {"time_taken(s)": 0.5}
+
+    @patch(
+        "executor.executors.legacy_executor.LegacyExecutor._get_prompt_deps"
+    )
+    @patch("executor.executors.legacy_executor.ExecutorToolShim")
+    def test_failed_batch_falls_back_per_prompt(self, mock_shim_cls, mock_deps):
+        prompts = [_make_prompt(name="a"), _make_prompt(name="b")]
+        result, retrieval_svc = self._run(
+            mock_shim_cls, mock_deps, prompts, batch=RuntimeError("embedding down")
+        )
+
+        assert retrieval_svc.run_retrieval.call_count == 2
+        assert list(result.data[PSKeys.OUTPUT]) == ["a", "b"]
+
+    @patch(
+        "executor.executors.legacy_executor.LegacyExecutor._get_prompt_deps"
+    )
+    @patch("executor.executors.legacy_executor.ExecutorToolShim")
+    def test_batching_disabled(self, mock_shim_cls, mock_deps, monkeypatch):
+        monkeypatch.setenv(PSKeys.RETRIEVAL_CONCURRENCY, "0")
+        prompts = [_make_prompt(name="a"), _make_prompt(name="b")]
+        _, retrieval_svc = self._run(mock_shim_cls, mock_deps, prompts)
+
+        retrieval_svc.run_batch_retrieval.assert_not_called()
+        assert retrieval_svc.run_retrieval.call_count == 2
@@ -521,6 +521,7 @@ class TestHighlightMultiplePrompts:
         }
         mock_llm.get_usage_reason.return_value = "extraction"
         mock_llm.get_metrics.return_value = {}
+        mock_llm.fork.return_value = mock_llm  # pooled: later prompts get a fork
 
         from executor.executors.legacy_executor import LegacyExecutor
         from unstract.sdk1.execution.registry import ExecutorRegistry
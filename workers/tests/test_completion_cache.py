@@ -0,0 +1,154 @@
+"""Prompt completion cache: repeat calls for the same document, prompt and LLM
+config are answered from Redis without calling the provider.
+
+Redis is an in-memory fake; the LLM is a MagicMock with the SDK's ``kwargs``.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from executor.executors.answer_prompt import AnswerPromptService
+from executor.executors.completion_cache import BYPASS, HIT, MISS, CompletionCache
+from executor.executors.constants import PromptServiceConstants as PSKeys
+
+
+class _FakeRedis:
+    def __init__(self, store):
+        self.store = store
+        self.index: dict[str, float] = {}
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def zpopmin(self, name, count):
+        oldest = sorted(self.index.items(), key=lambda item: item[1])[:count]
+        for key, _ in oldest:
+            del self.index[key]
+        return oldest
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._results = []
+
+    def zadd(self, name, mapping):
+        self._redis.index.update(mapping)
+        self._results.append(len(mapping))
+
+    def expire(self, name, ttl):
+        self._results.append(True)
+
+    def zcard(self, name):
+        self._results.append(len(self._redis.index))
+
+    def execute(self):
+        return self._results
+
+
+class _FakeBackend:
+    available = True
+
+    def __init__(self):
+        self.store: dict[str, dict] = {}
+        self.redis_client = MagicMock()
+        self.redis_client.redis_client = _FakeRedis(self.store)
+
+    def get(self, key):
+        return {"data": self.store[key]} if key in self.store else None
+
+    def set(self, key, value, ttl):
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setenv("EXECUTOR_COMPLETION_CACHE_ENABLED", "true")
+    return _FakeBackend()
+
+
+def _llm(answer="42", temperature=0):
+    llm = MagicMock()
+    llm.kwargs = {"model": "gpt-4o", "temperature": temperature}
+    llm._system_prompt = "You are a helpful assistant."
+    response = MagicMock()
+    response.text = answer
+    llm.complete.return_value = {
+        PSKeys.RESPONSE: response,
+        PSKeys.HIGHLIGHT_DATA: [[1, 2]],
+        PSKeys.LINE_NUMBERS: [3],
+    }
+    return llm
+
+
+def _run(llm, cache, doc_id="doc-1", prompt="What is the total?"):
+    metadata = {}
+    answer = AnswerPromptService.run_completion(
+        llm=llm,
+        prompt=prompt,
+        metadata=metadata,
+        prompt_key="total",
+        completion_cache=cache,
+        doc_id=doc_id,
+    )
+    return answer, metadata
+
+
+def test_repeat_call_served_from_cache(backend):
+    first_llm, second_llm = _llm(), _llm()
+
+    first = _run(first_llm, CompletionCache.for_org("org-1", cache=backend))
+    cache = CompletionCache.for_org("org-1", cache=backend)
+    second = _run(second_llm, cache)
+
+    assert second == first == ("42", first[1])
+    assert second[1][PSKeys.HIGHLIGHT_DATA] == {"total": [[1, 2]]}
+    second_llm.complete.assert_not_called()
+    second_llm.record_skipped_completion.assert_called_once()
+    assert cache.outcome == HIT
+
+
+def test_key_covers_org_document_and_prompt(backend):
+    _run(_llm(), CompletionCache.for_org("org-1", cache=backend))
+
+    for org, doc_id, prompt in [
+        ("org-2", "doc-1", "What is the total?"),
+        ("org-1", "doc-2", "What is the total?"),
+        ("org-1", "doc-1", "What is the date?"),
+    ]:
+        cache = CompletionCache.for_org(org, cache=backend)
+        llm = _llm()
+        _run(llm, cache, doc_id=doc_id, prompt=prompt)
+        llm.complete.assert_called_once()
+        assert cache.outcome == MISS
+
+
+def test_sampling_temperature_bypasses_cache(backend):
+    for _ in range(2):
+        cache = CompletionCache.for_org("org-1", cache=backend)
+        llm = _llm(temperature=0.7)
+        _run(llm, cache)
+        llm.complete.assert_called_once()
+        assert cache.outcome == BYPASS
+    assert backend.store == {}
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("EXECUTOR_COMPLETION_CACHE_ENABLED", raising=False)
+    assert CompletionCache.for_org("org-1", cache=_FakeBackend()) is None
+
+
+def test_oldest_entries_evicted_past_max(backend, monkeypatch):
+    monkeypatch.setenv("EXECUTOR_COMPLETION_CACHE_MAX_ENTRIES", "2")
+    for prompt in ("a", "b", "c"):
+        _run(_llm(), CompletionCache.for_org("org-1", cache=backend), prompt=prompt)
+
+    assert len(backend.store) == 2
+    cache = CompletionCache.for_org("org-1", cache=backend)
+    _run(_llm(), cache, prompt="a")
+    assert cache.outcome == MISS
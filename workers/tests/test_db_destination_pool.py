@@ -0,0 +1,254 @@
+"""Pooled database-destination writer.
+
+Files writing to the same destination table share one connector instance,
+engine and table check per worker process; a write failure drops the cached
+table state, and a reused engine that fails its probe is replaced before the
+INSERT, which is never retried. Within a file batch rows are buffered and
+flushed per table, as one statement where the connector supports it.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from shared.infrastructure.database import destination_pool
+from shared.infrastructure.database.destination_pool import (
+    DestinationTablePool,
+    PooledTable,
+    buffered_destination_writes,
+    write_destination_row,
+)
+
+_UTILS = "shared.infrastructure.database.destination_pool.WorkerDatabaseUtils"
+
+
+@pytest.fixture
+def db_utils():
+    with mock.patch(_UTILS) as utils:
+        db_class = utils.get_db_class.return_value
+        db_class.get_information_schema.return_value = {"data": "jsonb"}
+        db_class.has_no_metadata.return_value = False
+        db_class.can_insert_many.return_value = True
+        db_class.get_engine.side_effect = lambda: mock.MagicMock(name="engine")
+        utils.get_column_types.return_value = {"data": "jsonb"}
+        utils.get_sql_values_for_query.side_effect = (
+            lambda conn_cls, values, column_types: values
+        )
+        yield utils
+
+
+def _table() -> PooledTable:
+    return PooledTable("postgresql|x", {"host": "db"}, "results")
+
+
+class TestPooledTable:
+    def test_setup_once_across_writes(self, db_utils):
+        table = _table()
+        for n in range(3):
+            table.write({"data": n, "error": None}, "data", idle_seconds=60)
+
+        db_utils.get_db_class.assert_called_once()
+        db_utils.get_db_class.return_value.get_engine.assert_called_once()
+        db_utils.create_table_if_not_exists.assert_called_once()
+        db_utils.get_column_types.assert_called_once()
+        assert db_utils.execute_write_query.call_count == 3
+        # None values are left to the database as NULL
+        assert db_utils.execute_write_query.call_args.kwargs["sql_keys"] == ["data"]
+
+    def test_idle_engine_is_reopened(self, db_utils):
+        table = _table()
+        table.write({"data": 1}, "data", idle_seconds=60)
+        first_engine = db_utils.execute_write_query.call_args.kwargs["engine"]
+
+        table.write({"data": 2}, "data", idle_seconds=0)
+
+        assert db_utils.get_db_class.return_value.get_engine.call_count == 2
+        first_engine.close.assert_called_once()
+
+    def test_dead_reused_engine_replaced_before_insert(self, db_utils):
+        table = _table()
+        table.write({"data": 1}, "data", idle_seconds=60)
+        first_engine = db_utils.execute_write_query.call_args.kwargs["engine"]
+        first_engine.cursor.return_value.execute.side_effect = RuntimeError("gone")
+
+        table.write({"data": 2}, "data", idle_seconds=60)
+
+        assert db_utils.get_db_class.return_value.get_engine.call_count == 2
+        new_engine = db_utils.execute_write_query.call_args.kwargs["engine"]
+        assert new_engine is not first_engine
+        assert db_utils.execute_write_query.call_count == 2
+        # Table state is re-checked on the new engine
+        assert db_utils.create_table_if_not_exists.call_count == 2
+
+    def test_insert_failure_on_reused_engine_is_not_retried(self, db_utils):
+        # The connector commits inside execute_query, so the row may already be
+        # written; a retry could duplicate it.
+        table = _table()
+        table.write({"data": 1}, "data", idle_seconds=60)
+        db_utils.execute_write_query.side_effect = [RuntimeError("lost"), None]
+
+        with pytest.raises(RuntimeError, match="lost"):
+            table.write({"data": 2}, "data", idle_seconds=60)
+        assert db_utils.execute_write_query.call_count == 2
+
+        table.write({"data": 3}, "data", idle_seconds=60)
+        assert db_utils.get_db_class.return_value.get_engine.call_count == 2
+        assert db_utils.create_table_if_not_exists.call_count == 2
+
+    def test_failure_on_fresh_engine_raises(self, db_utils):
+        db_utils.execute_write_query.side_effect = RuntimeError("bad value")
+
+        with pytest.raises(RuntimeError, match="bad value"):
+            _table().write({"data": 1}, "data", idle_seconds=60)
+        assert db_utils.execute_write_query.call_count == 1
+
+    def test_rows_with_same_columns_share_one_statement(self, db_utils):
+        table = _table()
+        table.write({"data": 0}, "data", idle_seconds=60)
+        engine = db_utils.execute_write_query.call_args.kwargs["engine"]
+
+        errors = table.write_many(
+            [{"data": 1}, {"data": 2, "error": None}, {"data": 3, "error": "x"}],
+            "data",
+            idle_seconds=60,
+        )
+
+        assert errors == [None, None, None]
+        many = db_utils.execute_write_many_query.call_args.kwargs
+        assert many["sql_keys"] == ["data"]
+        assert many["sql_values_list"] == [[1], [2]]
+        # The differently shaped row goes out on its own
+        assert db_utils.execute_write_query.call_args.kwargs["sql_keys"] == [
+            "data",
+            "error",
+        ]
+        # A reused engine is probed once per checkout, not once per row
+        engine.cursor.return_value.execute.assert_called_once_with("SELECT 1")
+
+    def test_without_bulk_support_rows_fail_independently(self, db_utils):
+        db_utils.get_db_class.return_value.can_insert_many.return_value = False
+        db_utils.execute_write_query.side_effect = [None, RuntimeError("bad"), None]
+
+        errors = _table().write_many(
+            [{"data": 1}, {"data": 2}, {"data": 3}], "data", idle_seconds=60
+        )
+
+        assert errors[0] is None and errors[2] is None
+        assert str(errors[1]) == "bad"
+        db_utils.execute_write_many_query.assert_not_called()
+        # The row after the failure was written on a fresh engine
+        assert db_utils.get_db_class.return_value.get_engine.call_count == 2
+
+
+class TestDestinationTablePool:
+    def test_same_destination_shares_entry(self, db_utils):
+        pool = DestinationTablePool()
+        first = pool.table("pg", {"host": "a"}, "t")
+
+        assert pool.table("pg", {"host": "a"}, "t") is first
+        assert pool.table("pg", {"host": "b"}, "t") is not first
+        assert pool.table("pg", {"host": "a"}, "other") is not first
+
+    def test_stale_entries_released(self, db_utils):
+        pool = DestinationTablePool(max_tables=2)
+        oldest = pool.table("pg", {"host": "a"}, "t1")
+        with mock.patch.object(oldest, "close") as close:
+            pool.table("pg", {"host": "a"}, "t2")
+            pool.table("pg", {"host": "a"}, "t3")
+        close.assert_called_once()
+
+    def test_pool_disabled_closes_per_write(self, db_utils, monkeypatch):
+        monkeypatch.setenv("WORKER_DB_DESTINATION_POOL_ENABLED", "false")
+
+        destination_pool.write_destination_row(
+            "pg", {"host": "a"}, "t", {"data": 1}, "data"
+        )
+
+        engine = db_utils.execute_write_query.call_args.kwargs["engine"]
+        engine.close.assert_called_once()
+
+
+class TestDestinationWriteBatch:
+    @pytest.fixture(autouse=True)
+    def _fresh_pool(self, monkeypatch):
+        monkeypatch.setattr(destination_pool, "_pool", DestinationTablePool())
+
+    def test_rows_buffered_until_flush(self, db_utils):
+        written = []
+        with buffered_destination_writes() as batch:
+            for n, table_name in enumerate(["t1", "t1", "t2"]):
+                buffered = write_destination_row(
+                    "pg", {"host": "a"}, table_name, {"data": n}, "data", key=f"f{n}"
+                )
+                assert buffered
+            batch.after_write("f0", written.append)
+            db_utils.execute_write_query.assert_not_called()
+            db_utils.execute_write_many_query.assert_not_called()
+
+            assert batch.flush() == {"f0": None, "f1": None, "f2": None}
+
+        assert written == [None]
+        many = db_utils.execute_write_many_query.call_args.kwargs
+        assert many["table_name"] == "t1"
+        assert many["sql_values_list"] == [[0], [1]]
+        assert db_utils.execute_write_query.call_args.kwargs["table_name"] == "t2"
+
+    def test_failed_flush_reported_per_key(self, db_utils):
+        db_utils.execute_write_many_query.side_effect = RuntimeError("lost")
+        outcomes = []
+        with buffered_destination_writes() as batch:
+            for n in range(2):
+                write_destination_row(
+                    "pg", {"host": "a"}, "t", {"data": n}, "data", key=f"f{n}"
+                )
+                batch.after_write(f"f{n}", outcomes.append)
+            errors = batch.flush()
+
+        assert [str(e) for e in errors.values()] == ["lost", "lost"]
+        assert [str(e) for e in outcomes] == ["lost", "lost"]
+
+    def test_written_immediately_outside_a_batch_or_without_key(self, db_utils):
+        assert not write_destination_row("pg", {"host": "a"}, "t", {"data": 1}, "data")
+        with buffered_destination_writes() as batch:
+            assert not write_destination_row(
+                "pg", {"host": "a"}, "t", {"data": 2}, "data"
+            )
+            assert not batch.is_pending("f1")
+
+        assert db_utils.execute_write_query.call_count == 2
+
+    def test_unflushed_rows_dropped(self, db_utils):
+        with buffered_destination_writes():
+            write_destination_row("pg", {"host": "a"}, "t", {"data": 1}, "data", key="f")
+
+        assert destination_pool.current_destination_batch() is None
+        db_utils.execute_write_query.assert_not_called()
+
+
+def test_deferred_files_finalised_after_flush(db_utils, monkeypatch):
+    from file_processing import tasks
+
+    monkeypatch.setattr(destination_pool, "_pool", DestinationTablePool())
+
+    db_utils.get_db_class.return_value.can_insert_many.return_value = False
+    db_utils.execute_write_query.side_effect = [None, RuntimeError("lost")]
+    results = {key: SimpleNamespace(success=True, destination_error=None) for key in "ab"}
+    with buffered_destination_writes() as batch:
+        for key in "ab":
+            write_destination_row("pg", {"host": "z"}, "t", {"data": key}, "d", key=key)
+        context = SimpleNamespace(
+            metadata={
+                "deferred_file_results": [
+                    (key, 0.0, (results[key], f"{key}.pdf", 0.0, "rest")) for key in "ab"
+                ]
+            }
+        )
+        with mock.patch.object(tasks, "_handle_file_processing_result") as handle:
+            tasks._flush_destination_writes(context, batch)
+
+    assert [c.args[0] for c in handle.call_args_list] == [results["a"], results["b"]]
+    assert results["a"].destination_error is None
+    assert results["b"].success is False
+    assert "lost" in results["b"].destination_error
@@ -0,0 +1,132 @@
+"""Concurrent directory walking for source discovery."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from fsspec.spec import AbstractFileSystem
+from shared.processing.directory_walker import DirectoryWalker
+
+
+class _TreeFS(AbstractFileSystem):
+    """Filesystem over a {dir: [child, ...]} tree whose listings are slow."""
+
+    cachable = False
+
+    def __init__(self, tree: dict[str, list[str]], delay: float = 0.0):
+        super().__init__()
+        self.tree = tree
+        self.delay = delay
+        self.listed: list[str] = []
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.peak = 0
+
+    def ls(self, path, detail=True, **kwargs):
+        path = path.rstrip("/")
+        if path not in self.tree:
+            raise FileNotFoundError(path)
+        with self._lock:
+            self.listed.append(path)
+            self._in_flight += 1
+            self.peak = max(self.peak, self._in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self._in_flight -= 1
+        return [
+            {
+                "name": f"{path}/{child}",
+                "type": "directory" if f"{path}/{child}" in self.tree else "file",
+                "size": 1,
+            }
+            for child in self.tree[path]
+        ]
+
+
+def _tree(dirs: int, files_per_dir: int) -> dict[str, list[str]]:
+    tree = {"/root": [f"d{i}" for i in range(dirs)]}
+    for i in range(dirs):
+        tree[f"/root/d{i}"] = [f"f{j}.pdf" for j in range(files_per_dir)]
+    return tree
+
+
+def _files(entries) -> list[str]:
+    return sorted(info["name"] for _, _, files in entries for info in files.values())
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_lists_same_files_as_walk(concurrency):
+    fs = _TreeFS({**_tree(3, 2), "/root/d0": ["f0.pdf", "sub"], "/root/d0/sub": ["x"]})
+    expected = _files(fs.walk("/root", maxdepth=3, detail=True))
+
+    walker = DirectoryWalker(fs, max_depth=3, concurrency=concurrency)
+
+    assert _files(walker.walk(["/root"])) == expected
+    assert walker.stats.listings == 5
+    assert walker.stats.files_listed == len(expected)
+
+
+def test_respects_max_depth():
+    fs = _TreeFS(_tree(2, 1))
+
+    entries = list(DirectoryWalker(fs, max_depth=1, concurrency=4).walk(["/root"]))
+
+    assert fs.listed == ["/root"]
+    assert [root for root, _, _ in entries] == ["/root"]
+
+
+def test_lists_directories_concurrently():
+    fs = _TreeFS(_tree(8, 1), delay=0.05)
+    walker = DirectoryWalker(fs, max_depth=2, concurrency=4)
+
+    assert len(_files(walker.walk(["/root"]))) == 8
+    assert fs.peak == 4
+    assert walker.stats.peak_in_flight == 4
+    # Eight 50 ms listings, four at a time
+    assert walker.stats.listing_seconds > walker.stats.wall_seconds
+
+
+def test_closing_walk_stops_listing():
+    fs = _TreeFS(_tree(20, 1))
+    walker = DirectoryWalker(fs, max_depth=2, concurrency=2)
+
+    walk = walker.walk(["/root"])
+    next(walk)
+    next(walk)
+    walk.close()
+
+    assert len(fs.listed) < 21
+
+
+def test_listing_errors_reported_and_walk_continues():
+    errors: list[Exception] = []
+    fs = _TreeFS(_tree(1, 1))
+    walker = DirectoryWalker(fs, max_depth=2, on_error=errors.append, concurrency=4)
+
+    assert _files(walker.walk(["/missing", "/root"])) == ["/root/d0/f0.pdf"]
+    assert [type(e) for e in errors] == [FileNotFoundError]
+
+
+class _S3TreeFS(_TreeFS):
+    protocol = ("s3", "s3a")
+
+
+def test_invalid_concurrency_falls_back(monkeypatch):
+    monkeypatch.setenv("WORKER_DISCOVERY_LISTING_CONCURRENCY", "many")
+    assert DirectoryWalker(_S3TreeFS({}), max_depth=1).concurrency == 4
+    monkeypatch.setenv("WORKER_DISCOVERY_LISTING_CONCURRENCY", "0")
+    assert DirectoryWalker(_S3TreeFS({}), max_depth=1).concurrency == 1
+
+
+def test_filesystems_not_known_thread_safe_walked_sequentially(monkeypatch):
+    monkeypatch.setenv("WORKER_DISCOVERY_LISTING_CONCURRENCY", "8")
+    fs = _TreeFS(_tree(4, 1), delay=0.01)
+    fs.protocol = "sftp"
+    walker = DirectoryWalker(fs, max_depth=2)
+
+    assert walker.concurrency == 1
+    assert len(_files(walker.walk(["/root"]))) == 4
+    assert fs.peak == 1
+    assert DirectoryWalker(_S3TreeFS({}), max_depth=1).concurrency == 8
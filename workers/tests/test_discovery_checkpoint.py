@@ -0,0 +1,231 @@
+"""Incremental source discovery via a persisted modified-time watermark.
+
+Files modified before the watermark are dropped right after listing; the
+watermark only moves after a scan that saw every candidate, and never past a
+file file history hasn't settled (picked this run, running elsewhere, failed).
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+from unittest import mock
+
+import pytest
+from shared.processing.discovery_checkpoint import DiscoveryCheckpoint
+from shared.processing.file_discovery import StreamingFileDiscovery
+from shared.processing.filter_pipeline import FileHistoryFilter, FilterPipeline
+
+from unstract.core.file_operations import FileOperations
+
+
+class _Cache:
+    """In-memory stand-in for RedisCacheBackend."""
+
+    available = True
+
+    def __init__(self):
+        self.store: dict[str, dict] = {}
+
+    def get(self, key):
+        return {"data": self.store[key]} if key in self.store else None
+
+    def set(self, key, value, ttl):
+        self.store[key] = value
+        return True
+
+    def delete_pattern(self, pattern):
+        prefix = pattern.rstrip("*")
+        keys = [k for k in self.store if k.startswith(prefix)]
+        for key in keys:
+            del self.store[key]
+        return len(keys)
+
+
+class _SourceFS:
+    def __init__(self, files: dict[str, float]):
+        self.fsspec = mock.MagicMock()
+        self.fsspec.walk.side_effect = lambda *a, **kw: iter(
+            [
+                (
+                    "/src",
+                    {},
+                    {
+                        path: {"name": path, "type": "file", "size": 1, "mtime": mtime}
+                        for path, mtime in files.items()
+                    },
+                )
+            ]
+        )
+
+    def get_fsspec_fs(self):
+        return self.fsspec
+
+    def is_dir_by_metadata(self, metadata):
+        return False
+
+    def get_file_system_uuid(self, file_path, metadata):
+        return f"uuid-{file_path}"
+
+    def extract_modified_date(self, metadata):
+        return datetime.fromtimestamp(metadata["mtime"], tz=UTC)
+
+
+@pytest.fixture(autouse=True)
+def _enabled(monkeypatch):
+    monkeypatch.setenv("WORKER_DISCOVERY_CHECKPOINT_ENABLED", "true")
+    monkeypatch.setenv("WORKER_DISCOVERY_CHECKPOINT_SKEW_SECONDS", "300")
+
+
+def _load(cache, source_fs=None, **kwargs):
+    return DiscoveryCheckpoint.load(
+        source_fs or _SourceFS({}), "org", "wf", "conn", ["/src"], cache=cache, **kwargs
+    )
+
+
+class TestDiscoveryCheckpoint:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("WORKER_DISCOVERY_CHECKPOINT_ENABLED")
+        assert _load(_Cache()) is None
+
+    def test_first_run_is_full_and_advances_to_walk_start(self):
+        cache = _Cache()
+        checkpoint = _load(cache)
+        assert checkpoint.full_rescan and checkpoint.watermark is None
+
+        assert checkpoint.save()
+        state = cache.store[checkpoint.key]
+        assert state["watermark"] == pytest.approx(checkpoint.started_at - 300)
+
+    def test_unsettled_file_holds_watermark_back(self):
+        cache = _Cache()
+        checkpoint = _load(cache)
+        checkpoint.note_unsettled({"mtime": 1000.0})
+        checkpoint.save()
+
+        again = _load(cache)
+        assert again.watermark == 1000.0
+        assert again.skips({"mtime": 999.0})
+        assert not again.skips({"mtime": 1000.0})
+        assert again.skipped == 1
+
+    def test_incomplete_scan_keeps_old_watermark(self):
+        cache = _Cache()
+        cache.store[DiscoveryCheckpoint.build_key("org", "wf", "conn", ["/src"])] = {
+            "watermark": 50.0,
+            "rescanned_at": time.time(),
+        }
+        checkpoint = _load(cache)
+        checkpoint.mark_incomplete("file limit reached")
+
+        assert not checkpoint.save()
+        assert _load(cache).watermark == 50.0
+
+    def test_periodic_and_on_demand_full_rescan(self, monkeypatch):
+        cache = _Cache()
+        _load(cache).save()
+        assert not _load(cache).full_rescan
+
+        monkeypatch.setenv("WORKER_DISCOVERY_FULL_RESCAN_SECONDS", "0")
+        assert _load(cache).full_rescan
+        monkeypatch.delenv("WORKER_DISCOVERY_FULL_RESCAN_SECONDS")
+
+        assert DiscoveryCheckpoint.reset("org", "wf", cache=cache) == 1
+        assert _load(cache).full_rescan
+
+    def test_scope_change_is_a_new_checkpoint(self):
+        assert DiscoveryCheckpoint.build_key(
+            "org", "wf", "conn", ["/a"]
+        ) != DiscoveryCheckpoint.build_key("org", "wf", "conn", ["/a", "/b"])
+
+
+class TestStreamingDiscoveryWithCheckpoint:
+    @pytest.fixture(autouse=True)
+    def _no_active_file_cache(self):
+        with mock.patch(
+            "shared.workflow.execution.active_file_manager.ActiveFileManager"
+            ".create_cache_entries_simple",
+            return_value={},
+        ):
+            yield
+
+    def _discover(self, source_fs, cache, api_client, limit=10):
+        discovery = StreamingFileDiscovery(
+            source_fs=source_fs,
+            api_client=api_client,
+            workflow_id="wf",
+            execution_id="exec",
+            organization_id="org",
+        )
+        matched, _ = discovery.discover_files_streaming(
+            directories=["/src"],
+            patterns=["*"],
+            recursive=True,
+            file_hard_limit=limit,
+            filter_pipeline=FilterPipeline([FileHistoryFilter()]),
+            checkpoint=_load(cache, source_fs),
+        )
+        return matched
+
+    @staticmethod
+    def _history(completed: set[str]):
+        def get_files_history_batch(workflow_id, files, organization_id):
+            return {
+                f["identifier"]: {
+                    "found": True,
+                    "file_history": {"status": "COMPLETED", "file_path": f["file_path"]},
+                }
+                for f in files
+                if f["file_path"] in completed
+            }
+
+        api_client = mock.MagicMock()
+        api_client.get_files_history_batch.side_effect = get_files_history_batch
+        return api_client
+
+    def test_settled_files_not_looked_up_again(self):
+        now = time.time()
+        source_fs = _SourceFS({"/src/old.pdf": now - 5000, "/src/new.pdf": now - 4000})
+        cache = _Cache()
+        api_client = self._history(completed={"/src/old.pdf"})
+
+        assert list(self._discover(source_fs, cache, api_client)) == ["/src/new.pdf"]
+        # new.pdf was picked by this run, so it holds the watermark
+        assert _load(cache).watermark == pytest.approx(now - 4000)
+
+        api_client.get_files_history_batch.reset_mock()
+        assert list(self._discover(source_fs, cache, api_client)) == ["/src/new.pdf"]
+        looked_up = api_client.get_files_history_batch.call_args.kwargs["files"]
+        assert [f["file_path"] for f in looked_up] == ["/src/new.pdf"]
+
+    def test_file_limit_keeps_watermark(self):
+        now = time.time()
+        source_fs = _SourceFS({"/src/a.pdf": now - 5000, "/src/b.pdf": now - 4000})
+        cache = _Cache()
+
+        self._discover(source_fs, cache, self._history(completed=set()), limit=1)
+
+        assert cache.store == {}
+
+    def test_file_that_fails_to_hash_holds_watermark(self):
+        now = time.time()
+        source_fs = _SourceFS({"/src/bad.pdf": now - 5000, "/src/done.pdf": now - 4000})
+        cache = _Cache()
+        create = FileOperations.create_file_hash_from_backend_logic
+
+        def create_or_fail(file_path, **kwargs):
+            if file_path == "/src/bad.pdf":
+                raise ValueError("no provider uuid")
+            return create(file_path=file_path, **kwargs)
+
+        with mock.patch.object(
+            FileOperations,
+            "create_file_hash_from_backend_logic",
+            side_effect=create_or_fail,
+        ):
+            matched = self._discover(
+                source_fs, cache, self._history(completed={"/src/done.pdf"})
+            )
+
+        assert matched == {}
+        assert _load(cache).watermark == pytest.approx(now - 5000)
@@ -0,0 +1,97 @@
+"""Copying a source file into the execution directory: one pass over the
+source, INFILE written with a single open, SOURCE derived by a copy.
+
+Execution storage is fsspec's in-memory filesystem.
+"""
+
+import hashlib
+from unittest.mock import MagicMock
+
+import fsspec
+import pytest
+from shared.exceptions.file_exceptions import EmptyFileError, UnsupportedMimeTypeError
+from shared.workflow.execution.service import WorkerWorkflowExecutionService
+
+INFILE = "/exec/INFILE"
+SOURCE = "/exec/SOURCE"
+PDF = b"%PDF-1.4\n" + b"x" * 5000
+
+
+class _Storage:
+    def __init__(self):
+        self.fs = fsspec.filesystem("memory", skip_instance_cache=True)
+        self.opens = 0
+        open_ = self.fs.open
+
+        def counting_open(*args, **kwargs):
+            self.opens += 1
+            return open_(*args, **kwargs)
+
+        self.fs.open = counting_open
+
+    def exists(self, path):
+        return self.fs.exists(path)
+
+    def rm(self, path, recursive=True):
+        self.fs.rm(path, recursive=recursive)
+
+
+def _chunks(data, size=1024):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+@pytest.fixture
+def storage():
+    storage = _Storage()
+    yield storage
+    if storage.exists("/exec"):
+        storage.rm("/exec")
+
+
+def _copy(storage, chunks, check_mime_type=True):
+    return WorkerWorkflowExecutionService(
+        api_client=MagicMock()
+    )._stream_to_execution_files(
+        chunks=chunks,
+        file_path="input.pdf",
+        infile_path=INFILE,
+        source_file_path=SOURCE,
+        workflow_file_storage=storage,
+        check_mime_type=check_mime_type,
+    )
+
+
+def test_single_open_and_copy(storage):
+    computed_hash, size = _copy(storage, _chunks(PDF))
+
+    assert (computed_hash, size) == (hashlib.sha256(PDF).hexdigest(), len(PDF))
+    assert storage.fs.cat_file(INFILE) == PDF
+    assert storage.fs.cat_file(SOURCE) == PDF
+    assert storage.opens == 1
+
+
+def test_rejected_mime_type_writes_nothing(storage):
+    with pytest.raises(UnsupportedMimeTypeError):
+        _copy(storage, _chunks(b"MZ\x90\x00" + b"\x00" * 2000))
+
+    assert not storage.exists(INFILE)
+    assert not storage.exists(SOURCE)
+
+
+def test_empty_source_raises(storage):
+    with pytest.raises(EmptyFileError):
+        _copy(storage, iter([]))
+
+    assert not storage.exists(INFILE)
+
+
+def test_interrupted_stream_leaves_no_partial_file(storage):
+    def failing_chunks():
+        yield PDF[:1024]
+        raise OSError("connection reset")
+
+    with pytest.raises(OSError):
+        _copy(storage, failing_chunks())
+
+    assert not storage.exists(INFILE)
+    assert not storage.exists(SOURCE)
@@ -11,6 +11,7 @@ Verifies:
 8. Celery eager-mode: full task chain returns indexing result
 9. Index class: generate_index_key called with correct DTOs
 10. EmbeddingCompat and VectorDB created with correct params
+11. Index.is_document_indexed: metadata lookup before a blank-query embed
 
 Heavy SDK1 dependencies (llama_index, qdrant) are lazily imported
 via ``LegacyExecutor._get_indexing_deps()``. We mock that method
@@ -222,6 +223,9 @@ class TestReindex:
         assert init_call.kwargs["processing_options"].reindex is True
         # reindex=True with already-indexed doc must still call perform_indexing
         mock_index_cls.return_value.perform_indexing.assert_called_once()
+        # and drops the keyword tables built from the replaced nodes
+        fs = mock_get_fs.return_value
+        fs.glob.assert_called_once_with("/data/keyword_table/doc-reindex.*.json")
 
     @patch(_PATCH_FS)
     def test_already_indexed_no_reindex_short_circuits(
@@ -252,6 +256,7 @@ class TestReindex:
         assert result.data[IKeys.DOC_ID] == "doc-already-indexed"
         mock_index.is_document_indexed.assert_called_once()
         mock_index.perform_indexing.assert_not_called()
+        mock_get_fs.return_value.glob.assert_not_called()
 
 
 # --- 5. VectorDB.close() always called ---
@@ -483,3 +488,55 @@ class TestAdapterCreation:
         vdb_call = mock_vdb_cls.call_args
         assert vdb_call.kwargs["adapter_instance_id"] == "vdb-check"
         assert vdb_call.kwargs["embedding"] is mock_emb
+
+
+# --- 11. Index.is_document_indexed existence check ---
+
+
+def _real_index(reindex=False):
+    from executor.executors.dto import (
+        ChunkingConfig,
+        InstanceIdentifiers,
+        ProcessingOptions,
+    )
+    from executor.executors.index import Index
+
+    return Index(
+        tool=MagicMock(),
+        instance_identifiers=InstanceIdentifiers(
+            embedding_instance_id="emb-001",
+            vector_db_instance_id="vdb-001",
+            x2text_instance_id="x2t-001",
+            llm_instance_id="",
+            tool_id="tool-001",
+        ),
+        chunking_config=ChunkingConfig(chunk_size=512, chunk_overlap=128),
+        processing_options=ProcessingOptions(reindex=reindex),
+    )
+
+
+class TestIsDocumentIndexed:
+    @pytest.mark.parametrize("exists", [True, False])
+    def test_metadata_lookup_skips_embedding(self, exists):
+        embedding, vector_db = MagicMock(), MagicMock()
+        vector_db.doc_exists.return_value = exists
+
+        found = _real_index().is_document_indexed("doc-1", embedding, vector_db)
+
+        assert found is exists
+        vector_db.doc_exists.assert_called_once_with("doc-1")
+        embedding.get_query_embedding.assert_not_called()
+        vector_db.query.assert_not_called()
+
+    def test_unsupported_store_falls_back_to_query(self):
+        embedding, vector_db = MagicMock(), MagicMock()
+        vector_db.doc_exists.return_value = None
+        embedding.get_query_embedding.return_value = [0.0, 1.0]
+        vector_db.query.return_value = MagicMock(nodes=[MagicMock()])
+
+        found = _real_index().is_document_indexed("doc-1", embedding, vector_db)
+
+        assert found is True
+        embedding.get_query_embedding.assert_called_once_with(" ")
+        # Recorded so the next run can skip the query
+        vector_db.record_indexed.assert_called_once_with("doc-1")
@@ -0,0 +1,168 @@
+"""Log history drain mode: block on the queue, take batches atomically, and
+requeue a batch the backend failed to store, keeping the ids given to its logs.
+
+The Redis list is a plain Python list behind a small fake client; the backend
+is an ``httpx.MockTransport``.
+"""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+from log_consumer.drain_log_history import (
+    STORE_LOG_HISTORY_ENDPOINT,
+    LogHistoryDrainer,
+)
+
+QUEUE = "log_history_queue"
+
+
+class _Pipeline:
+    def __init__(self, queue: list[str]):
+        self._queue = queue
+        self._ops = []
+
+    def lrange(self, name, start, end):
+        self._ops.append(("lrange", start, end))
+
+    def ltrim(self, name, start, end):
+        self._ops.append(("ltrim", start, end))
+
+    def execute(self):
+        results = []
+        for op, start, end in self._ops:
+            stop = None if end == -1 else end + 1
+            if op == "lrange":
+                results.append(self._queue[start:stop])
+            else:
+                self._queue[:] = self._queue[start:stop]
+                results.append(True)
+        return results
+
+
+class _FakeRedisQueue:
+    def __init__(self, items: list[str]):
+        self.queue = list(items)
+        self.redis_client = self
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self.queue)
+
+    def blpop(self, queue_name, timeout=0):
+        return (queue_name, self.queue.pop(0)) if self.queue else None
+
+    def lpush(self, queue_name, *values):
+        for value in values:
+            self.queue.insert(0, value)
+        return len(self.queue)
+
+    def llen(self, queue_name):
+        return len(self.queue)
+
+
+def _logs(n: int) -> list[str]:
+    return [json.dumps({"execution_id": "e", "n": i}) for i in range(n)]
+
+
+def _without_ids(logs: list[str]) -> list[str]:
+    stripped = []
+    for log in logs:
+        payload = json.loads(log)
+        payload.pop("log_id")
+        stripped.append(json.dumps(payload))
+    return stripped
+
+
+def _ids(logs: list[str]) -> list[str]:
+    return [json.loads(log)["log_id"] for log in logs]
+
+
+def _drainer(redis, handler, batch_size=3) -> LogHistoryDrainer:
+    http_client = httpx.Client(
+        base_url="http://backend/", transport=httpx.MockTransport(handler)
+    )
+    drainer = LogHistoryDrainer(
+        redis_client=redis,
+        http_client=http_client,
+        queue_name=QUEUE,
+        batch_size=batch_size,
+        linger_seconds=0,
+    )
+    # Don't actually sleep between retries
+    drainer.stop_event.wait = lambda timeout=None: True
+    return drainer
+
+
+def test_drains_in_full_batches_preserving_order():
+    redis = _FakeRedisQueue(_logs(7))
+    received = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == f"/{STORE_LOG_HISTORY_ENDPOINT}"
+        logs = json.loads(request.content)["logs"]
+        received.append(logs)
+        return httpx.Response(200, json={"processed_count": len(logs)})
+
+    drainer = _drainer(redis, handler)
+    while drainer.drain_once():
+        pass
+
+    assert [len(batch) for batch in received] == [3, 3, 1]
+    assert _without_ids(sum(received, [])) == _logs(7)
+    assert len(set(_ids(sum(received, [])))) == 7
+    assert redis.queue == []
+    assert drainer.stats.inserted == 7
+    assert drainer.stats.batches == 3
+
+
+def test_failed_insert_requeues_batch_at_head():
+    redis = _FakeRedisQueue(_logs(5))
+
+    def handler(request):
+        return httpx.Response(503, text="unavailable")
+
+    drainer = _drainer(redis, handler)
+    assert drainer.drain_once() == 3
+
+    assert _without_ids(redis.queue[:3]) == _logs(3)
+    assert redis.queue[3:] == _logs(5)[3:]
+    assert drainer.stats.failed_batches == 1
+    assert drainer._backoff == pytest.approx(1.0)
+
+    drainer.drain_once()
+    assert drainer._backoff == pytest.approx(2.0)
+
+
+def test_rejected_batch_is_dropped():
+    redis = _FakeRedisQueue(_logs(2))
+
+    def handler(request):
+        return httpx.Response(400, json={"error": "logs must be a list of strings"})
+
+    drainer = _drainer(redis, handler)
+    drainer.drain_once()
+
+    assert redis.queue == []
+    assert drainer.stats.dropped == 2
+
+
+def test_batch_retried_after_timeout_keeps_log_ids():
+    redis = _FakeRedisQueue(_logs(2))
+    received = []
+
+    def handler(request):
+        received.append(json.loads(request.content)["logs"])
+        if len(received) == 1:
+            # The backend may have committed the batch before timing out
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, json={"processed_count": 2})
+
+    drainer = _drainer(redis, handler)
+    drainer.drain_once()
+    drainer.drain_once()
+
+    assert received[0] == received[1]
+    assert len(set(_ids(received[1]))) == 2
+    assert redis.queue == []
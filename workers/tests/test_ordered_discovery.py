@@ -0,0 +1,179 @@
+"""Ordered (FIFO/LIFO) discovery: bounded top-K selection vs collect-then-sort."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from shared.processing.file_discovery import OrderedFileDiscovery, _TopFiles
+from shared.processing.filter_pipeline import (
+    DeduplicationFilter,
+    FileHistoryFilter,
+    FilterPipeline,
+)
+
+from unstract.connectors.filesystems.local_storage.local_storage import LocalStorageFS
+
+
+class _ListedFS(LocalStorageFS):
+    """Local storage connector listing a fixed set of files in a fixed order."""
+
+    def __init__(self, mtimes: dict[str, float]):
+        super().__init__({"path": "/src"})
+        self.fsspec = mock.MagicMock()
+        self.fsspec.walk.side_effect = lambda *a, **kw: iter(
+            [
+                (
+                    "/src",
+                    {},
+                    {
+                        path: {"name": path, "type": "file", "size": 1, "mtime": mtime}
+                        for path, mtime in mtimes.items()
+                    },
+                )
+            ]
+        )
+
+    def get_fsspec_fs(self):
+        return self.fsspec
+
+    def get_file_system_uuid(self, file_path, metadata):
+        return f"uuid-{file_path}"
+
+
+# Listed out of order; a.pdf and c.pdf were completed by earlier runs
+_MTIMES = {
+    "/src/e.pdf": 5000.0,
+    "/src/a.pdf": 1000.0,
+    "/src/f.txt": 500.0,
+    "/src/d.pdf": 4000.0,
+    "/src/c.pdf": 3000.0,
+    "/src/b.pdf": 2000.0,
+    "/src/g.pdf": 2000.0,
+}
+_COMPLETED = {"/src/a.pdf", "/src/c.pdf"}
+
+
+@pytest.fixture
+def history_api():
+    looked_up: list[str] = []
+
+    def get_files_history_batch(workflow_id, files, organization_id):
+        looked_up.extend(f["file_path"] for f in files)
+        return {
+            f["identifier"]: {
+                "found": True,
+                "file_history": {"status": "COMPLETED", "file_path": f["file_path"]},
+            }
+            for f in files
+            if f["file_path"] in _COMPLETED
+        }
+
+    api_client = mock.MagicMock()
+    api_client.get_files_history_batch.side_effect = get_files_history_batch
+    api_client.looked_up = looked_up
+    return api_client
+
+
+@pytest.fixture(autouse=True)
+def _pipeline_without_active_files():
+    with (
+        mock.patch(
+            "shared.processing.filter_pipeline.create_standard_pipeline",
+            side_effect=lambda **kw: FilterPipeline(
+                [DeduplicationFilter(), FileHistoryFilter()]
+            ),
+        ),
+        mock.patch(
+            "shared.workflow.execution.active_file_manager.ActiveFileManager"
+            ".create_cache_entries_simple",
+            return_value={},
+        ),
+    ):
+        yield
+
+
+def _discover(api_client, order, limit, batch_size=100, mtimes=_MTIMES):
+    discovery = OrderedFileDiscovery(
+        source_fs=_ListedFS(mtimes),
+        api_client=api_client,
+        workflow_id="wf",
+        execution_id="exec",
+        organization_id="org",
+    )
+    matched, count = discovery.discover_files_ordered(
+        directories=["/src"],
+        patterns=["*.pdf"],
+        recursive=True,
+        file_hard_limit=limit,
+        file_processing_order=order,
+        batch_size=batch_size,
+    )
+    assert count == len(matched)
+    return list(matched)
+
+
+class TestTopFiles:
+    def test_keeps_lowest_ranks_in_order(self):
+        top = _TopFiles(2)
+        for rank, name in [((3, 0), "c"), ((1, 1), "a"), ((2, 2), "b")]:
+            top.push(rank, mock.MagicMock(file_path=name))
+        assert list(top.ordered()) == ["a", "b"]
+        assert not top.admits((2, 3))
+        assert top.admits((1, 4))
+
+    def test_zero_limit_admits_nothing(self):
+        assert not _TopFiles(0).admits((0, 0))
+
+
+class TestOrderedDiscovery:
+    @pytest.mark.parametrize(
+        "order, expected",
+        [
+            ("oldest_first", ["/src/b.pdf", "/src/g.pdf", "/src/d.pdf"]),
+            ("newest_first", ["/src/e.pdf", "/src/d.pdf", "/src/b.pdf"]),
+        ],
+    )
+    def test_top_k_matches_collect_then_sort(
+        self, monkeypatch, history_api, order, expected
+    ):
+        assert _discover(history_api, order, limit=3, batch_size=2) == expected
+
+        monkeypatch.setenv("WORKER_ORDERED_DISCOVERY_TOP_K", "false")
+        assert _discover(history_api, order, limit=3, batch_size=2) == expected
+
+    def test_files_ranked_out_are_never_looked_up(self, history_api):
+        # Newest listed first: each later file displaces the current worst one
+        mtimes = {f"/src/{i}.pdf": float(1000 - i) for i in range(10)}
+        mtimes.update({"/src/late-1.pdf": 5000.0, "/src/late-2.pdf": 6000.0})
+
+        selected = _discover(
+            history_api, "newest_first", limit=2, batch_size=1, mtimes=mtimes
+        )
+
+        assert selected == ["/src/late-2.pdf", "/src/late-1.pdf"]
+        # Heap fills with 0.pdf and 1.pdf; every older file is dropped unfiltered
+        assert history_api.looked_up == [
+            "/src/0.pdf",
+            "/src/1.pdf",
+            "/src/late-1.pdf",
+            "/src/late-2.pdf",
+        ]
+
+    def test_walk_error_is_reported_to_user(self, history_api):
+        source_fs = _ListedFS({})
+        source_fs.fsspec.walk.side_effect = lambda *a, on_error, **kw: (
+            on_error(PermissionError("denied")) or iter([])
+        )
+        discovery = OrderedFileDiscovery(
+            source_fs=source_fs,
+            api_client=history_api,
+            workflow_id="wf",
+            execution_id="exec",
+            organization_id="org",
+        )
+
+        assert discovery.discover_files_ordered(
+            ["/src"], ["*"], True, 10, "oldest_first"
+        ) == ({}, 0)
+        assert source_fs.report_errors_to_user() == ["Could not access directory: denied"]
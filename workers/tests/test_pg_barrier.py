@@ -1276,11 +1276,12 @@ class TestPgFireAndForgetMode:
     self-chained onto PG, and dedup-marker cleanup at enqueue/finalise/abort.
     """
 
-    def test_enqueue_pg_mode_dispatches_headers_via_pg_with_context(self, barrier_db):
+    def test_enqueue_pg_mode_bulk_inserts_headers_with_context(self, barrier_db):
         with barrier_db.cursor() as cur:
             cur.execute("DELETE FROM pg_batch_dedup")
+            cur.execute("DELETE FROM pg_queue_message")
         # A header with a pre-existing kwarg, real args, and a queue — to prove
-        # the Signature→dispatch unpacking preserves all three (a dropped args or
+        # the Signature→row unpacking preserves all three (a dropped args or
         # queue would silently process an empty/misrouted batch).
         h0 = _pg_header(args=[{"file": "f0"}], queue="api_file_processing")
         h0.kwargs = {"pre_existing": "keep"}
@@ -1294,17 +1295,25 @@ class TestPgFireAndForgetMode:
                 app_instance=None,
                 transport="pg_queue",
             )
-        assert mock_dispatch.call_count == 2  # one per header, no .link
-        for i, call in enumerate(mock_dispatch.call_args_list):
-            assert call.kwargs["backend"] is QueueBackend.PG
-            assert call.kwargs["args"] == [{"file": f"f{i}"}]  # args preserved
-            assert call.kwargs["queue"] == "api_file_processing"  # queue preserved
-            ctx = call.kwargs["kwargs"]["_barrier_context"]
+        mock_dispatch.assert_not_called()  # one bulk INSERT, not N dispatches
+        with barrier_db.cursor() as cur:
+            cur.execute(
+                "SELECT queue_name, message FROM pg_queue_message ORDER BY msg_id"
+            )
+            rows = cur.fetchall()
+            cur.execute("DELETE FROM pg_queue_message")
+        assert len(rows) == 2
+        for i, (queue_name, message) in enumerate(rows):
+            assert queue_name == "api_file_processing"  # queue preserved
+            assert message["task_name"] == "process_file_batch"
+            assert message["args"] == [{"file": f"f{i}"}]  # args preserved, in order
+            ctx = message["kwargs"]["_barrier_context"]
             assert ctx["execution_id"] == "exec-pg"
             assert ctx["batch_index"] == i
             assert ctx["callback_descriptor"]["transport"] == "pg_queue"
         # The pre-existing kwarg on h0 survives alongside the injected context.
-        assert mock_dispatch.call_args_list[0].kwargs["kwargs"]["pre_existing"] == "keep"
+        assert rows[0][1]["kwargs"]["pre_existing"] == "keep"
+        assert _row(barrier_db, "exec-pg") == (2, [])
 
     def test_enqueue_pg_mode_clears_stale_dedup_on_reuse(self, barrier_db):
         # greptile #2068: a re-enqueue with the same execution_id must wipe prior
@@ -1589,34 +1598,30 @@ class TestPgFireAndForgetMode:
                 run_batch_with_barrier(ctx, lambda: {"ok": 1})
         assert _row(barrier_db, "exec-decfail") is None  # barrier torn down
 
-    def test_pg_mid_loop_dispatch_failure_deletes_row_and_clears_dedup(self, barrier_db):
+    def test_pg_header_insert_failure_deletes_row_and_clears_dedup(self, barrier_db):
         # The PG-branch counterpart of test_mid_loop_dispatch_failure_deletes_row:
-        # a header PG-dispatch failure mid fan-out deletes the barrier row AND
-        # reclaims dedup markers (greptile #2069) — an already-claimed earlier
-        # header's marker would otherwise orphan, since the in-flight abort is a
-        # no-op once the barrier row is gone.
+        # a failed (or ambiguously-committed) header insert deletes the barrier row
+        # AND reclaims dedup markers (greptile #2069) — a header that did land and
+        # claimed its batch would otherwise orphan its marker, since the in-flight
+        # abort is a no-op once the barrier row is gone.
         #
-        # The marker must be claimed AFTER enqueue's UPSERT block (which wipes
-        # stale markers for this execution_id) — else the assertion would pass on
-        # the UPSERT, not the mid-loop clear under test. So the first dispatch
-        # call claims it (a fast consumer on the PG path), the second fails.
+        # The marker must be claimed AFTER enqueue's UPSERT (which wipes stale
+        # markers for this execution_id) — else the assertion would pass on the
+        # UPSERT, not the failure-path clear under test. barrier_db autocommits,
+        # so the UPSERT is already visible when the insert runs.
         with barrier_db.cursor() as cur:
             cur.execute("DELETE FROM pg_batch_dedup")
 
-        def dispatch_side_effect(*args, **kwargs):
-            if not dispatch_side_effect.claimed:
-                dispatch_side_effect.claimed = True
-                claim_batch("exec-midfail", 0)  # marker created post-UPSERT
-                return MagicMock(id="1")
-            raise RuntimeError("broker down")
-
-        dispatch_side_effect.claimed = False
-        with patch("queue_backend.dispatch.dispatch", side_effect=dispatch_side_effect):
-            barrier = PgBarrier()
-            headers = [_pg_header(), _pg_header()]
-            with pytest.raises(RuntimeError, match="broker down"):
-                barrier.enqueue(
-                    headers,
+        def insert_side_effect(*_args, **_kwargs):
+            claim_batch("exec-midfail", 0)  # marker created post-UPSERT
+            raise RuntimeError("insert failed")
+
+        with patch(
+            "queue_backend.pg_barrier.insert_messages", side_effect=insert_side_effect
+        ):
+            with pytest.raises(RuntimeError, match="insert failed"):
+                PgBarrier().enqueue(
+                    [_pg_header(), _pg_header()],
                     callback_task_name="process_batch_callback",
                     callback_kwargs={"execution_id": "exec-midfail"},
                     callback_queue="general",
@@ -1629,11 +1634,82 @@ class TestPgFireAndForgetMode:
                 "SELECT count(*) FROM pg_batch_dedup WHERE execution_id = %s",
                 ("exec-midfail",),
             )
-            # The marker existed post-UPSERT and was removed by the mid-loop
+            # The marker existed post-UPSERT and was removed by the failure-path
             # clear_execution_batches under test (not by the UPSERT reset).
             assert cur.fetchone()[0] == 0
 
 
+class TestPgFanOutAtomicity:
+    """The ``pg_queue`` fan-out resets the barrier and inserts every header in ONE
+    transaction (mocked connection — no DB), so it can't be left half-dispatched.
+    """
+
+    @staticmethod
+    def _conn():
+        cur = MagicMock()
+        cur.fetchall.return_value = [(11, 1), (12, 2)]
+        conn = MagicMock()
+        conn.closed = 0
+        conn.cursor.return_value.__enter__.return_value = cur
+        return conn, cur
+
+    def test_reset_and_header_insert_share_one_commit(self, monkeypatch):
+        conn, cur = self._conn()
+        monkeypatch.setattr(pg_barrier._local, "conn", conn, raising=False)
+        PgBarrier().enqueue(
+            [_pg_header(), _pg_header()],
+            callback_task_name="process_batch_callback",
+            callback_kwargs={"execution_id": "exec-atomic", "organization_id": "o"},
+            callback_queue="general",
+            app_instance=None,
+            transport="pg_queue",
+        )
+        statements = [c.args[0] for c in cur.execute.call_args_list]
+        assert "pg_barrier_state" in statements[0]  # UPSERT
+        assert "pg_batch_dedup" in statements[1]  # dedup reset
+        # One batch INSERT carries both headers.
+        inserts = [sql for sql in statements if "pg_queue_message" in str(sql)]
+        assert len(inserts) == 1
+        conn.commit.assert_called_once()
+
+    def test_execute_failure_on_cached_conn_retries_once(self, monkeypatch):
+        dead, dead_cur = self._conn()
+        dead_cur.execute.side_effect = psycopg2.OperationalError("reaped")
+        fresh, fresh_cur = self._conn()
+        monkeypatch.setattr(pg_barrier._local, "conn", dead, raising=False)
+        monkeypatch.setattr(pg_barrier, "create_pg_connection", lambda **_kw: fresh)
+        monkeypatch.setattr(pg_barrier.time, "sleep", lambda _s: None)
+        PgBarrier().enqueue(
+            [_pg_header()],
+            callback_task_name="process_batch_callback",
+            callback_kwargs={"execution_id": "exec-retry", "organization_id": "o"},
+            callback_queue="general",
+            app_instance=None,
+            transport="pg_queue",
+        )
+        fresh.commit.assert_called_once()
+        dead.commit.assert_not_called()
+
+    def test_commit_failure_is_not_retried(self, monkeypatch):
+        conn, cur = self._conn()
+        conn.commit.side_effect = psycopg2.OperationalError("gone at commit")
+        monkeypatch.setattr(pg_barrier._local, "conn", conn, raising=False)
+        monkeypatch.setattr(pg_barrier, "_delete_barrier", MagicMock())
+        monkeypatch.setattr(pg_barrier, "clear_execution_batches", MagicMock())
+        with pytest.raises(psycopg2.OperationalError):
+            PgBarrier().enqueue(
+                [_pg_header()],
+                callback_task_name="process_batch_callback",
+                callback_kwargs={"execution_id": "exec-amb", "organization_id": "o"},
+                callback_queue="general",
+                app_instance=None,
+                transport="pg_queue",
+            )
+        conn.commit.assert_called_once()  # ambiguous → never re-run
+        pg_barrier._delete_barrier.assert_called_once_with("exec-amb")
+        pg_barrier.clear_execution_batches.assert_called_once_with("exec-amb")
+
+
 class TestMarkExecutionErrorOnAbort:
     """``_mark_execution_error_on_abort`` — the in-body PG failure → terminal mark
     (no DB; the internal API client + mark helper are mocked).
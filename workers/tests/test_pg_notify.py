@@ -0,0 +1,133 @@
+"""Tests for the opt-in LISTEN/NOTIFY wake-up (``queue_backend.pg_queue.notify``).
+
+The listener is driven with a fake psycopg2 connection (``poll`` fills
+``notifies``) and a patched ``select.select``, so no DB and no real waiting.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from queue_backend.pg_queue import notify as notify_mod
+from queue_backend.pg_queue.notify import QueueWaker, notify_channel
+
+
+class _FakeListenConn:
+    def __init__(self, pending: list[list[str]] | None = None):
+        # One entry per poll(): the notifications that poll "receives".
+        self._pending = list(pending or [])
+        self.notifies: list[str] = []
+        self.autocommit = False
+        self.cursor_obj = MagicMock()
+        self.closed = False
+
+    def cursor(self):
+        conn = self
+
+        class _Ctx:
+            def __enter__(self):
+                return conn.cursor_obj
+
+            def __exit__(self, *_):
+                return False
+
+        return _Ctx()
+
+    def poll(self):
+        if self._pending:
+            self.notifies.extend(self._pending.pop(0))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _quote_ident(monkeypatch):
+    # quote_ident needs a real cursor; the fake one just double-quotes.
+    monkeypatch.setattr(
+        "psycopg2.extensions.quote_ident", lambda name, _scope: f'"{name}"'
+    )
+
+
+class TestNotifyChannel:
+    def test_channel_is_schema_and_queue_scoped(self, monkeypatch):
+        monkeypatch.setenv("DB_SCHEMA", "tenant_a")
+        assert notify_channel("file_processing") == "pg_queue.tenant_a.file_processing"
+
+    def test_long_names_fold_to_stable_digest(self, monkeypatch):
+        monkeypatch.setenv("DB_SCHEMA", "unstract")
+        long_queue = "q" * 80
+        channel = notify_channel(long_queue)
+        assert len(channel.encode()) <= 63
+        assert channel == notify_channel(long_queue)
+        assert channel != notify_channel("r" * 80)
+
+
+class TestQueueWaker:
+    def test_listens_on_every_queue_with_autocommit(self):
+        conn = _FakeListenConn()
+        waker = QueueWaker(["a", "b"], connect=lambda: conn)
+        waker.wait(0)
+        assert conn.autocommit is True
+        executed = [c.args[0] for c in conn.cursor_obj.execute.call_args_list]
+        assert executed == [
+            f'LISTEN "{notify_channel("a")}"',
+            f'LISTEN "{notify_channel("b")}"',
+        ]
+
+    def test_buffered_notification_returns_without_blocking(self, monkeypatch):
+        conn = _FakeListenConn(pending=[["n1"]])
+        select_calls: list = []
+        monkeypatch.setattr(
+            notify_mod.select, "select", lambda *a: select_calls.append(a)
+        )
+        assert QueueWaker(["q"], connect=lambda: conn).wait(5) is True
+        assert select_calls == []
+        assert conn.notifies == []  # drained
+
+    def test_wakes_on_notification(self, monkeypatch):
+        conn = _FakeListenConn(pending=[[], ["n1"]])
+        monkeypatch.setattr(notify_mod.select, "select", lambda r, w, x, t: (r, [], []))
+        assert QueueWaker(["q"], connect=lambda: conn).wait(5) is True
+
+    def test_times_out(self, monkeypatch):
+        conn = _FakeListenConn()
+        seen: list[float] = []
+
+        def _select(r, w, x, timeout):
+            seen.append(timeout)
+            return ([], [], [])
+
+        monkeypatch.setattr(notify_mod.select, "select", _select)
+        assert QueueWaker(["q"], connect=lambda: conn).wait(1.5) is False
+        assert seen == [1.5]
+
+    def test_connect_failure_degrades_to_sleep_then_reconnects(self):
+        conn = _FakeListenConn()
+        connects = [RuntimeError("db down"), conn]
+        sleeps: list[float] = []
+
+        def _connect():
+            item = connects.pop(0)
+            if isinstance(item, Exception):
+                raise item
+            return item
+
+        waker = QueueWaker(["q"], connect=_connect, sleep=sleeps.append)
+        assert waker.wait(2.0) is False  # never raises into the run loop
+        assert sleeps == [2.0]
+        waker.wait(0)  # next idle wait reconnects
+        assert connects == []
+
+    def test_broken_listener_is_closed_and_dropped(self, monkeypatch):
+        conn = _FakeListenConn()
+        waker = QueueWaker(["q"], connect=lambda: conn, sleep=lambda _s: None)
+
+        def _boom(*_a):
+            raise OSError("socket gone")
+
+        monkeypatch.setattr(notify_mod.select, "select", _boom)
+        assert waker.wait(1) is False
+        assert conn.closed is True
+        assert waker._conn is None
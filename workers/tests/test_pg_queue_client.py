@@ -23,9 +23,10 @@ from unittest.mock import MagicMock
 import psycopg2
 import pytest
 from queue_backend.fairness import DEFAULT_PRIORITY, MAX_PRIORITY, MIN_PRIORITY
-from queue_backend.pg_queue import PgQueueClient, QueueMessage
+from queue_backend.pg_queue import OutboundMessage, PgQueueClient, QueueMessage
 from queue_backend.pg_queue.client import _SEND_RETRY_BACKOFF_SECONDS
 from queue_backend.pg_queue.connection import create_pg_connection
+from queue_backend.pg_queue.notify import notify_channel, notify_sql
 from queue_backend.pg_queue.reaper import rearm_expired_claims
 from queue_backend.pg_queue.schema import qualified
 
@@ -87,6 +88,80 @@ class TestPgQueueClientUnit:
         _, params = cur.execute.call_args.args
         assert params[3] == 9
 
+    def test_send_notifies_queue_channel_when_enabled(self):
+        # Wake mode: the NOTIFY rides the INSERT's transaction (one commit), so a
+        # listener is only woken once the row is visible.
+        conn, cur = _mock_conn(fetchone=(5,))
+        assert PgQueueClient(conn=conn, notify=True).send("q1", {"a": 1}) == 5
+        insert_call, notify_call = cur.execute.call_args_list
+        assert "INSERT INTO" in insert_call.args[0]
+        assert notify_call.args == (notify_sql(), (notify_channel("q1"),))
+        conn.commit.assert_called_once()
+
+    def test_send_notify_defaults_from_env(self, monkeypatch):
+        monkeypatch.delenv("WORKER_PG_QUEUE_NOTIFY_ENABLED", raising=False)
+        conn, cur = _mock_conn(fetchone=(1,))
+        PgQueueClient(conn=conn).send("q1", {"a": 1})
+        assert cur.execute.call_count == 1  # off by default: INSERT only
+
+        monkeypatch.setenv("WORKER_PG_QUEUE_NOTIFY_ENABLED", "true")
+        conn, cur = _mock_conn(fetchone=(1,))
+        PgQueueClient(conn=conn).send("q1", {"a": 1})
+        assert cur.execute.call_count == 2
+
+    def test_send_many_is_one_statement_and_one_commit(self):
+        conn, cur = _mock_conn(fetchall=[(7, 1), (8, 2)])
+        msg_ids = PgQueueClient(conn=conn, notify=False).send_many(
+            [
+                OutboundMessage("q1", {"n": 1}, org_id="org-1", priority=9),
+                OutboundMessage("q2", {"n": 2}),
+            ]
+        )
+        assert msg_ids == [7, 8]
+        cur.execute.assert_called_once()
+        sql, params = cur.execute.call_args.args
+        assert "WITH ORDINALITY" in sql
+        # One array per column, whatever the batch size.
+        assert params[1:] == (
+            ["q1", "q2"],
+            ['{"n": 1}', '{"n": 2}'],
+            ["org-1", ""],
+            [9, DEFAULT_PRIORITY],
+        )
+        conn.commit.assert_called_once()
+
+    def test_send_many_maps_ids_by_ordinal_not_row_order(self):
+        # Postgres doesn't promise the result rows come back in input order; the
+        # ids must follow the ordinal returned next to each one.
+        conn, _ = _mock_conn(fetchall=[(42, 3), (40, 1), (41, 2)])
+        msg_ids = PgQueueClient(conn=conn, notify=False).send_many(
+            [OutboundMessage("q", {"n": i}) for i in range(3)]
+        )
+        assert msg_ids == [40, 41, 42]
+
+    def test_send_many_notifies_each_queue_once(self):
+        conn, cur = _mock_conn(fetchall=[(1, 1), (2, 2), (3, 3)])
+        PgQueueClient(conn=conn, notify=True).send_many(
+            [OutboundMessage("a", {}), OutboundMessage("b", {}), OutboundMessage("a", {})]
+        )
+        notified = [
+            c.args[1][0] for c in cur.execute.call_args_list if c.args[0] == notify_sql()
+        ]
+        assert notified == [notify_channel("a"), notify_channel("b")]
+
+    def test_send_many_validates_priorities_before_writing(self):
+        conn, cur = _mock_conn()
+        with pytest.raises(ValueError, match="priority out of range"):
+            PgQueueClient(conn=conn).send_many(
+                [OutboundMessage("q", {}), OutboundMessage("q", {}, priority=99)]
+            )
+        cur.execute.assert_not_called()
+
+    def test_send_many_empty_is_a_no_op(self):
+        conn, cur = _mock_conn()
+        assert PgQueueClient(conn=conn).send_many([]) == []
+        conn.cursor.assert_not_called()
+
     @pytest.mark.parametrize("bad", [0, -1, 11, 99])
     def test_send_rejects_out_of_range_priority(self, bad):
         # An out-of-range priority would silently jump/sink the row in the
@@ -134,6 +209,31 @@ class TestPgQueueClientUnit:
         conn, _ = _mock_conn(rowcount=0)
         assert PgQueueClient(conn=conn).set_vt(999, 300) is False
 
+    def test_set_vt_many_renews_all_ids_in_one_update(self):
+        conn, cur = _mock_conn(fetchall=[(1,), (3,)])
+        assert PgQueueClient(conn=conn).set_vt_many([1, 2, 3], 60) == [1, 3]
+        cur.execute.assert_called_once()
+        sql, params = cur.execute.call_args.args
+        assert "WHERE msg_id = ANY(%s) RETURNING msg_id" in sql
+        assert "GREATEST(vt," in sql  # never shortens a longer vt
+        assert params == (60, [1, 2, 3])
+        conn.commit.assert_called_once()
+
+    def test_set_vt_many_empty_is_a_no_op(self):
+        conn, cur = _mock_conn()
+        assert PgQueueClient(conn=conn).set_vt_many([], 60) == []
+        cur.execute.assert_not_called()
+
+    def test_delete_many_is_one_grouped_delete(self):
+        conn, cur = _mock_conn(fetchall=[(5,), (6,)])
+        assert PgQueueClient(conn=conn).delete_many([5, 6, 7]) == [5, 6]
+        cur.execute.assert_called_once()
+        sql, params = cur.execute.call_args.args
+        assert f"DELETE FROM {qualified('pg_queue_message')}" in sql
+        assert "WHERE msg_id = ANY(%s) RETURNING msg_id" in sql
+        assert params == ([5, 6, 7],)
+        conn.commit.assert_called_once()
+
     def test_set_vt_rejects_non_positive(self):
         conn, _ = _mock_conn()
         client = PgQueueClient(conn=conn)
@@ -441,6 +541,21 @@ class TestDeleteReconnectRetry:
             client.delete(1)
         factory.assert_called_once()  # one reconnect only, no loop
 
+    def test_delete_many_reused_stale_conn_retries_once(self, monkeypatch):
+        dead, _ = self._conn(execute_side_effect=psycopg2.OperationalError("reap"))
+        fresh, fresh_cur = self._conn()
+        fresh_cur.fetchall.return_value = [(1,), (2,)]
+        factory = MagicMock(return_value=fresh)
+        monkeypatch.setattr("queue_backend.pg_queue.client.create_pg_connection", factory)
+        self._no_sleep(monkeypatch)
+        client = PgQueueClient()
+        client._conn = dead
+
+        assert client.delete_many([1, 2]) == [1, 2]
+        factory.assert_called_once()
+        _, params = fresh_cur.execute.call_args.args
+        assert params == ([1, 2],)
+
 
 class TestCreatePgConnection:
     """Unit coverage for the connection factory (no real DB)."""
@@ -523,6 +638,70 @@ class TestPgQueueClientIntegration:
         assert client.delete(msg_id) is True
         assert client.read(queue_name, vt_seconds=30, qty=10) == []  # gone
 
+    def test_send_many_roundtrip_preserves_input_order(self, pg_conn, queue_name):
+        client = PgQueueClient(conn=pg_conn)
+        msg_ids = client.send_many(
+            [OutboundMessage(queue_name, {"n": i}) for i in range(5)]
+        )
+        msgs = client.read(queue_name, vt_seconds=30, qty=10)
+        assert {m.msg_id: m.message["n"] for m in msgs} == dict(
+            zip(msg_ids, range(5), strict=True)
+        )
+
+    def test_send_many_ids_point_at_their_own_rows(self, pg_conn, queue_name):
+        # Runs the unnest ... WITH ORDINALITY statement for real: every returned
+        # id must carry the columns of the message at the same input position.
+        client = PgQueueClient(conn=pg_conn, notify=False)
+        messages = [
+            OutboundMessage(queue_name, {"n": i}, org_id=f"org-{i % 2}", priority=i)
+            for i in range(6)
+        ]
+        msg_ids = client.send_many(messages)
+        assert len(set(msg_ids)) == len(messages)
+        with pg_conn.cursor() as cur:
+            cur.execute(
+                "SELECT msg_id, queue_name, message, org_id, priority "
+                f"FROM {qualified('pg_queue_message')} WHERE msg_id = ANY(%s)",
+                (msg_ids,),
+            )
+            rows = {row[0]: row[1:] for row in cur.fetchall()}
+        pg_conn.commit()
+        assert [rows[msg_id] for msg_id in msg_ids] == [
+            (m.queue_name, m.message, m.org_id, m.priority) for m in messages
+        ]
+
+    def test_batch_renew_and_grouped_ack_roundtrip(self, pg_conn, queue_name):
+        client = PgQueueClient(conn=pg_conn)
+        msg_ids = client.send_many(
+            [OutboundMessage(queue_name, {"n": i}) for i in range(3)]
+        )
+        client.read(queue_name, vt_seconds=30, qty=10)
+        assert client.delete_many(msg_ids[:1]) == msg_ids[:1]
+        # The acked id is no longer renewable; the rest are.
+        assert sorted(client.set_vt_many(msg_ids, 60)) == msg_ids[1:]
+        assert sorted(client.delete_many(msg_ids)) == msg_ids[1:]
+        with pg_conn.cursor() as cur:
+            cur.execute(
+                f"SELECT count(*) FROM {qualified('pg_queue_message')} "
+                "WHERE queue_name = %s",
+                (queue_name,),
+            )
+            assert cur.fetchone()[0] == 0
+
+    def test_batch_renew_keeps_a_longer_vt(self, pg_conn, queue_name):
+        # A poison re-park racing a batch renewal tick keeps its long vt.
+        client = PgQueueClient(conn=pg_conn)
+        msg_id = client.send(queue_name, {"n": 1})
+        assert client.set_vt(msg_id, 3600)
+        assert client.set_vt_many([msg_id], 60) == [msg_id]
+        with pg_conn.cursor() as cur:
+            cur.execute(
+                "SELECT vt > now() + interval '30 minutes' "
+                f"FROM {qualified('pg_queue_message')} WHERE msg_id = %s",
+                (msg_id,),
+            )
+            assert cur.fetchone()[0] is True
+
     def test_read_hides_message_for_vt(self, pg_conn, queue_name):
         client = PgQueueClient(conn=pg_conn)
         client.send(queue_name, {"n": 1})
@@ -564,6 +564,36 @@ class TestRunLoop:
         # empty→0.1, empty→0.2 (doubled), [msg] resets, empty→0.1 again.
         assert sleeps == [0.1, 0.2, 0.1]
 
+    def test_listen_mode_waits_on_waker_and_resets_backoff_on_wake(self):
+        client = MagicMock()
+        client.read.side_effect = [[], [], [], []]
+        consumer = PgQueueConsumer(
+            ["q"],
+            client=client,
+            poll_interval=0.1,
+            backoff_max=0.25,
+            wake_mode="listen",
+        )
+        waits: list[float] = []
+        # timeout, notification, timeout, then stop.
+        outcomes = [False, True, False, False]
+
+        def _wait(timeout):
+            waits.append(timeout)
+            if len(waits) == len(outcomes):
+                consumer.stop()
+            return outcomes[len(waits) - 1]
+
+        consumer._waker = MagicMock(wait=_wait)
+        consumer.run(install_signals=False)
+        # 0.1 timed out → doubled; woken → reset to 0.1; timed out → doubled.
+        assert waits == [0.1, 0.2, 0.1, 0.2]
+        consumer._waker.close.assert_called_once()
+
+    def test_rejects_unknown_wake_mode(self):
+        with pytest.raises(ValueError, match="wake_mode"):
+            PgQueueConsumer(["q"], client=MagicMock(), wake_mode="push")
+
     def test_poll_error_does_not_kill_loop(self, monkeypatch):
         client = MagicMock()
         # first poll raises (transient), then empty → loop must survive the raise.
@@ -1337,3 +1367,145 @@ class TestLeaseRenewal:
         lease.assert_called_once_with(1)  # the in-flight msg_id was leased
         assert _calls == [(3, 4)]  # task still ran
         client.delete.assert_called_once_with(1)  # and acked
+
+
+class TestBatchLease:
+    """``batch_lease``: one thread renews the whole claimed batch (``set_vt_many``)
+    and completed messages are acked with one grouped ``delete_many``.
+    """
+
+    def _consumer(self, client, **kwargs):
+        kwargs.setdefault("vt_seconds", 9060)
+        kwargs.setdefault("lease_seconds", 120)
+        return PgQueueConsumer(
+            ["q"], client=client, batch_size=50, batch_lease=True, **kwargs
+        )
+
+    def test_batch_size_kept_under_the_short_lease(self):
+        c = self._consumer(MagicMock())
+        assert c.batch_size == 50  # the batch-wide renewal covers the tail
+
+    def test_batch_is_acked_with_one_grouped_delete(self):
+        client = MagicMock()
+        client.read.return_value = [_msg(i, _ok_payload(i)) for i in (1, 2, 3)]
+        client.delete_many.return_value = [1, 2, 3]
+        assert self._consumer(client).poll_once() == 3
+        assert _calls == [(1, 0), (2, 0), (3, 0)]
+        client.delete_many.assert_called_once_with([1, 2, 3])
+        client.delete.assert_not_called()
+
+    def test_failed_fire_and_forget_is_left_and_released_from_the_lease(self):
+        client = MagicMock()
+        client.read.return_value = [
+            _msg(1, _ok_payload(1)),
+            _msg(2, {"task_name": "test_pg_consumer.boom"}),
+        ]
+        client.delete_many.return_value = [1]
+        c = self._consumer(client)
+        seen = {}
+        real_flush = c._flush_acks
+
+        def flush(batch):
+            seen["leased"] = sorted(batch._leased)
+            real_flush(batch)
+
+        with patch.object(c, "_flush_acks", flush):
+            c.poll_once()
+        client.delete_many.assert_called_once_with([1])  # 2 left for redelivery
+        assert seen["leased"] == [1]  # 2 no longer renewed → its lease lapses
+
+    def test_acks_flushed_when_the_batch_aborts(self):
+        client = MagicMock()
+        client.read.return_value = [_msg(1, _ok_payload(1)), _msg(2, _ok_payload(2))]
+        client.delete_many.return_value = [1]
+        c = self._consumer(client)
+        real_handle = c._handle
+
+        def handle(message):
+            if message.msg_id == 2:
+                raise RuntimeError("unexpected")
+            real_handle(message)
+
+        with patch.object(c, "_handle", handle):
+            c.poll_once()  # the per-queue guard logs and moves on
+        client.delete_many.assert_called_once_with([1])  # finished work still acked
+        assert c._batch is None
+
+    def test_missing_rows_on_grouped_ack_warn(self, caplog):
+        client = MagicMock()
+        client.read.return_value = [_msg(1, _ok_payload(1)), _msg(2, _ok_payload(2))]
+        client.delete_many.return_value = [1]
+        with caplog.at_level(logging.WARNING, logger="queue_backend.pg_queue.consumer"):
+            self._consumer(client).poll_once()
+        assert "msg_ids=[2]" in caplog.text
+        assert "possible double-run" in caplog.text
+
+    def test_per_message_renewal_skipped_inside_a_batch(self):
+        client = MagicMock()
+        client.read.return_value = [_msg(1, _ok_payload(1))]
+        client.delete_many.return_value = [1]
+        c = self._consumer(client)
+        with patch.object(c, "_renew_lease_loop") as per_message:
+            with patch.object(c, "_renew_batch_lease_loop") as batch_loop:
+                c.poll_once()
+        per_message.assert_not_called()
+        batch_loop.assert_called_once()
+
+    def test_batch_loop_renews_leased_ids_and_drops_lost_ones(self, caplog):
+        from queue_backend.pg_queue.consumer import _InFlightBatch
+
+        rc = MagicMock()
+        rc.set_vt_many.side_effect = [[1, 3], [3]]
+        c = self._consumer(MagicMock(), vt_seconds=3, lease_seconds=3)
+        c._make_renew_client = MagicMock(return_value=rc)
+        batch = _InFlightBatch([1, 2, 3])
+        stop = MagicMock()
+        stop.wait.side_effect = [False, False, True]
+        with caplog.at_level(logging.WARNING, logger="queue_backend.pg_queue.consumer"):
+            c._renew_batch_lease_loop(batch, stop)
+        assert rc.set_vt_many.call_args_list[0].args == ([1, 2, 3], 3)
+        assert rc.set_vt_many.call_args_list[1].args == ([1, 3], 3)  # 2 dropped
+        assert sorted(batch._leased) == [3]
+        assert "may double-run" in caplog.text
+        rc.close.assert_called_once()
+
+    def test_release_does_not_wait_for_an_in_flight_renewal(self):
+        # The renewal's round trip runs outside the lock: acks and releases go
+        # through while it is in flight, and an id released meanwhile is neither
+        # reported lost nor renewed again on the next tick.
+        from queue_backend.pg_queue.consumer import _InFlightBatch
+
+        batch = _InFlightBatch([1, 2])
+        in_flight = threading.Event()
+        finish = threading.Event()
+        result = {}
+
+        def set_vt_many(ids):
+            in_flight.set()
+            finish.wait(timeout=5)
+            return [1]  # 2 was acked + deleted while the renewal was in flight
+
+        renewer = threading.Thread(
+            target=lambda: result.update(lost=batch.renew(set_vt_many))
+        )
+        renewer.start()
+        assert in_flight.wait(timeout=5)
+        releaser = threading.Thread(target=batch.release, args=(2,))
+        releaser.start()
+        releaser.join(timeout=5)
+        assert not releaser.is_alive()  # not blocked behind the renewal
+        finish.set()
+        renewer.join(timeout=5)
+        assert result["lost"] == []
+        renewed = []
+        batch.renew(lambda ids: renewed.extend(ids) or ids)
+        assert renewed == [1]
+
+    def test_env_wires_batch_lease(self, monkeypatch):
+        from queue_backend.pg_queue import consumer as mod
+
+        monkeypatch.setenv("WORKER_PG_QUEUE_CONSUMER_BATCH_LEASE", "true")
+        monkeypatch.setenv("WORKER_PG_QUEUE_CONSUMER_BATCH", "100")
+        with patch.object(mod, "PgQueueClient"):  # no real DB connection
+            c = mod.build_consumer_from_env()
+        assert c.batch_lease is True and c.batch_size == 100
@@ -16,6 +16,7 @@ from executor.executors.retrieval import RetrievalService
 # Helpers
 # ---------------------------------------------------------------------------
 
+
 def _make_output(prompt: str = "What is X?", top_k: int = 5, name: str = "field_a"):
     """Build a minimal ``output`` dict matching PromptServiceConstants keys."""
     return {
@@ -40,6 +41,7 @@ def _mock_retriever_class(return_value=None):
 # Factory — run_retrieval
 # ---------------------------------------------------------------------------
 
+
 class TestRunRetrieval:
     """Tests for RetrievalService.run_retrieval()."""
 
@@ -152,11 +154,108 @@ class TestRunRetrieval:
             context_retrieval_metrics=None,
         )
 
+    @patch("executor.executors.retrieval.RetrievalService._get_keyword_table_store")
+    @patch("executor.executors.retrieval.RetrievalService._get_retriever_map")
+    def test_keyword_table_gets_persisted_store(self, mock_map, mock_store):
+        """Only the keyword table strategy is handed a table store."""
+        cls, _inst = _mock_retriever_class()
+        mock_map.return_value = {
+            RetrievalStrategy.KEYWORD_TABLE.value: cls,
+            RetrievalStrategy.SIMPLE.value: cls,
+        }
+
+        for strategy in (RetrievalStrategy.KEYWORD_TABLE, RetrievalStrategy.SIMPLE):
+            RetrievalService.run_retrieval(
+                output={**_make_output(), "llm": "llm-1"},
+                doc_id="doc-1",
+                llm=MagicMock(),
+                vector_db=MagicMock(),
+                retrieval_type=strategy.value,
+                execution_source="ide",
+                file_path="/org/doc.pdf",
+            )
+
+        mock_store.assert_called_once_with(
+            execution_source="ide", file_path="/org/doc.pdf", llm_id="llm-1"
+        )
+        keyword_call, simple_call = cls.call_args_list
+        assert keyword_call.kwargs["store"] is mock_store.return_value
+        assert "store" not in simple_call.kwargs
+
+
+# ---------------------------------------------------------------------------
+# Batched retrieval — run_batch_retrieval
+# ---------------------------------------------------------------------------
+
+
+class TestRunBatchRetrieval:
+    """Tests for RetrievalService.run_batch_retrieval()."""
+
+    def _outputs(self):
+        return [
+            {**_make_output(prompt="q1", name="a"), "promptx": "q1"},
+            {**_make_output(prompt="q2", name="b"), "promptx": "q2"},
+        ]
+
+    @patch("executor.executors.retrieval.RetrievalService._get_retriever_map")
+    def test_one_embedding_call_for_all_prompts(self, mock_map):
+        cls = MagicMock()
+        cls.side_effect = lambda **kw: MagicMock(
+            retrieve=MagicMock(return_value={kw["prompt"]})
+        )
+        mock_map.return_value = {RetrievalStrategy.SIMPLE.value: cls}
+        embedding = MagicMock()
+        embedding.get_query_embeddings.return_value = [[0.1], [0.2]]
+
+        result = RetrievalService.run_batch_retrieval(
+            outputs=self._outputs(),
+            doc_id="doc-1",
+            llm=None,
+            vector_db=MagicMock(),
+            embedding=embedding,
+            max_workers=2,
+        )
+
+        embedding.get_query_embeddings.assert_called_once_with(["q1", "q2"])
+        assert result == {"a": ["q1"], "b": ["q2"]}
+        passed = {
+            c.kwargs["prompt"]: c.kwargs["query_embedding"] for c in cls.call_args_list
+        }
+        assert passed == {"q1": [0.1], "q2": [0.2]}
+
+    @patch("executor.executors.retrieval.RetrievalService._get_retriever_map")
+    def test_failed_query_left_out(self, mock_map):
+        def build(**kw):
+            retriever = MagicMock()
+            if kw["prompt"] == "q2":
+                retriever.retrieve.side_effect = RuntimeError("timeout")
+            else:
+                retriever.retrieve.return_value = {"chunk"}
+            return retriever
+
+        mock_map.return_value = {
+            RetrievalStrategy.SIMPLE.value: MagicMock(side_effect=build)
+        }
+        embedding = MagicMock()
+        embedding.get_query_embeddings.return_value = [[0.1], [0.2]]
+
+        result = RetrievalService.run_batch_retrieval(
+            outputs=self._outputs(),
+            doc_id="doc-1",
+            llm=None,
+            vector_db=MagicMock(),
+            embedding=embedding,
+            max_workers=2,
+        )
+
+        assert result == {"a": ["chunk"]}
+
 
 # ---------------------------------------------------------------------------
 # Complete context — retrieve_complete_context
 # ---------------------------------------------------------------------------
 
+
 class TestRetrieveCompleteContext:
     """Tests for RetrievalService.retrieve_complete_context()."""
 
@@ -228,6 +327,7 @@ class TestRetrieveCompleteContext:
 # BaseRetriever interface
 # ---------------------------------------------------------------------------
 
+
 class TestBaseRetriever:
     """Tests for BaseRetriever base class."""
 
@@ -303,3 +403,158 @@ class TestBaseRetriever:
         )
         with pytest.raises(ValueError, match="requires an LLM"):
             r.require_llm()
+
+
+# ---------------------------------------------------------------------------
+# Keyword table persistence
+# ---------------------------------------------------------------------------
+
+
+class _LocalFS:
+    """Minimal stand-in for the file storage API used by KeywordTableStore."""
+
+    def exists(self, path):
+        import os
+
+        return os.path.exists(path)
+
+    def mkdir(self, path):
+        import os
+
+        os.makedirs(path, exist_ok=True)
+
+    def read(self, path, mode):
+        with open(path, mode) as f:
+            return f.read()
+
+    def write(self, path, mode, data):
+        with open(path, mode) as f:
+            f.write(data)
+
+    def glob(self, path):
+        import glob
+
+        return glob.glob(path)
+
+    def rm(self, path, recursive=True):
+        import os
+
+        os.remove(path)
+
+
+class TestKeywordTablePersistence:
+    """Keyword tables are built once per doc_id and reused from storage."""
+
+    def _nodes(self):
+        from llama_index.core.schema import NodeWithScore, TextNode
+
+        return [
+            NodeWithScore(node=TextNode(text="Invoice total revenue 500")),
+            NodeWithScore(node=TextNode(text="Shipping address Berlin")),
+        ]
+
+    def _retriever(self, store, vector_db):
+        from executor.executors.retrievers.keyword_table import KeywordTableRetriever
+
+        return KeywordTableRetriever(
+            vector_db=vector_db,
+            prompt="revenue",
+            doc_id="doc-1",
+            top_k=2,
+            llm=MagicMock(),
+            store=store,
+        )
+
+    def _store(self, tmp_path, llm_id="llm-1"):
+        from executor.executors.retrievers.keyword_table import KeywordTableStore
+
+        return KeywordTableStore(
+            fs=_LocalFS(), file_path=str(tmp_path / "doc.pdf"), llm_id=llm_id
+        )
+
+    def test_table_built_once_then_loaded(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("EXECUTOR_KEYWORD_EXTRACTOR", "simple")
+        store = self._store(tmp_path)
+        vector_db = MagicMock()
+        node_retriever = vector_db.get_vector_store_index.return_value.as_retriever
+        node_retriever.return_value.retrieve.return_value = self._nodes()
+
+        first = self._retriever(store, vector_db).retrieve()
+        second = self._retriever(store, vector_db).retrieve()
+
+        assert first == second == {"Invoice total revenue 500"}
+        vector_db.get_vector_store_index.assert_called_once()
+        assert (tmp_path / "keyword_table" / "doc-1.simple.json").exists()
+
+    def test_without_store_rebuilds(self, monkeypatch):
+        monkeypatch.setenv("EXECUTOR_KEYWORD_EXTRACTOR", "simple")
+        vector_db = MagicMock()
+        node_retriever = vector_db.get_vector_store_index.return_value.as_retriever
+        node_retriever.return_value.retrieve.return_value = self._nodes()
+
+        self._retriever(None, vector_db).retrieve()
+        self._retriever(None, vector_db).retrieve()
+
+        assert vector_db.get_vector_store_index.call_count == 2
+
+    def test_unreadable_table_is_ignored(self, tmp_path):
+        from executor.executors.constants import KeywordExtractor
+
+        store = self._store(tmp_path)
+        (tmp_path / "keyword_table").mkdir()
+        (tmp_path / "keyword_table" / "doc-1.llm.llm-1.json").write_text("{not json")
+
+        assert store.load("doc-1", KeywordExtractor.LLM) is None
+
+    def test_llm_tables_kept_per_llm(self, tmp_path):
+        from executor.executors.constants import KeywordExtractor
+
+        self._store(tmp_path, "llm-1").save("doc-1", KeywordExtractor.LLM, {"v": 1})
+
+        assert self._store(tmp_path, "llm-2").load("doc-1", KeywordExtractor.LLM) is None
+        assert self._store(tmp_path, "llm-1").load("doc-1", KeywordExtractor.LLM) == {
+            "v": 1
+        }
+        # Regex keywords don't depend on the LLM
+        self._store(tmp_path, "llm-1").save("doc-1", KeywordExtractor.SIMPLE, {"v": 2})
+        assert self._store(tmp_path, "llm-2").load("doc-1", KeywordExtractor.SIMPLE) == {
+            "v": 2
+        }
+
+    def test_invalidate_drops_all_tables_of_the_doc(self, tmp_path):
+        from executor.executors.constants import KeywordExtractor
+        from executor.executors.retrievers.keyword_table import KeywordTableStore
+
+        for doc_id in ("doc-1", "doc-2"):
+            self._store(tmp_path).save(doc_id, KeywordExtractor.LLM, {})
+            self._store(tmp_path).save(doc_id, KeywordExtractor.SIMPLE, {})
+
+        KeywordTableStore.invalidate(
+            fs=_LocalFS(), file_path=str(tmp_path / "doc.pdf"), doc_id="doc-1"
+        )
+
+        assert sorted(p.name for p in (tmp_path / "keyword_table").iterdir()) == [
+            "doc-2.llm.llm-1.json",
+            "doc-2.simple.json",
+        ]
+
+    def test_table_locks_are_a_fixed_pool(self, tmp_path):
+        from executor.executors.constants import KeywordExtractor
+        from executor.executors.retrievers.keyword_table import KeywordTableStore
+
+        store = self._store(tmp_path)
+        locks = {id(store.lock(f"doc-{n}", KeywordExtractor.LLM)) for n in range(500)}
+
+        assert store.lock("doc-1", KeywordExtractor.LLM) is store.lock(
+            "doc-1", KeywordExtractor.LLM
+        )
+        assert len(locks) <= KeywordTableStore._LOCK_STRIPES
+
+    @pytest.mark.parametrize(
+        "raw, expected", [("", "llm"), ("SIMPLE", "simple"), ("rake", "llm")]
+    )
+    def test_extractor_from_env(self, monkeypatch, raw, expected):
+        from executor.executors.retrievers.keyword_table import keyword_extractor
+
+        monkeypatch.setenv("EXECUTOR_KEYWORD_EXTRACTOR", raw)
+        assert keyword_extractor().value == expected
@@ -123,9 +123,7 @@ def test_run_batch_stages_skips_terminal_without_processing():
         mock.patch(
             "file_processing.tasks._refactored_pre_create_file_executions"
         ) as pre_create,
-        mock.patch(
-            "file_processing.tasks._process_individual_files"
-        ) as process_files,
+        mock.patch("file_processing.tasks._process_individual_files") as process_files,
     ):
         result = _run_batch_stages({"any": "payload"}, "task-1", is_pg=True)
 
@@ -192,6 +190,7 @@ def test_run_batch_stages_proceeds_when_not_terminal():
         mock.patch(
             "file_processing.tasks._process_individual_files", return_value="ctx"
         ) as process_files,
+        mock.patch("file_processing.tasks._flush_destination_writes") as flush,
         mock.patch(
             "file_processing.tasks._compile_batch_result",
             return_value={"total_files": 1, "successful_files": 1, "failed_files": 0},
@@ -201,4 +200,5 @@ def test_run_batch_stages_proceeds_when_not_terminal():
 
     pre_create.assert_called_once()
     process_files.assert_called_once()
+    flush.assert_called_once()
     assert result["successful_files"] == 1
@@ -0,0 +1,195 @@
+"""Two-tier worker cache: in-process L1 in front of Redis, invalidated via pub/sub."""
+
+from __future__ import annotations
+
+import json
+import queue
+import time
+from datetime import UTC, datetime
+from unittest import mock
+
+import pytest
+from shared.cache.cache_backends import BaseCacheBackend
+from shared.cache.cache_manager import CacheManager
+from shared.cache.local_cache import INVALIDATION_CHANNEL, LocalCache
+
+
+class _Bus:
+    def __init__(self):
+        self.subscribers: list[queue.Queue] = []
+
+    def publish(self, channel, message):
+        assert channel == INVALIDATION_CHANNEL
+        for subscriber in self.subscribers:
+            subscriber.put({"type": "message", "data": message})
+        return True
+
+
+class _PubSub:
+    def __init__(self, bus: _Bus):
+        self._bus = bus
+        self._queue: queue.Queue = queue.Queue()
+
+    def subscribe(self, channel):
+        self._bus.subscribers.append(self._queue)
+
+    def listen(self):
+        while True:
+            yield self._queue.get()
+
+
+class _MemoryBackend(BaseCacheBackend):
+    """Stand-in for RedisCacheBackend shared by every simulated process."""
+
+    available = True
+
+    def __init__(self, bus: _Bus):
+        self.bus = bus
+        self.store: dict[str, dict] = {}
+        self.gets = 0
+
+    def get(self, key):
+        self.gets += 1
+        return json.loads(self.store[key]) if key in self.store else None
+
+    def set(self, key, value, ttl):
+        self.store[key] = json.dumps(
+            {"data": value, "cached_at": datetime.now(UTC).isoformat(), "ttl": ttl}
+        )
+        return True
+
+    def delete(self, key):
+        return self.store.pop(key, None) is not None
+
+    def delete_pattern(self, pattern):
+        return 0
+
+    def mget(self, keys):
+        return {}
+
+    def mset(self, data):
+        return 0
+
+    def keys(self, pattern):
+        return []
+
+    def scan_keys(self, pattern, count=100):
+        return []
+
+    def publish(self, channel, message):
+        return self.bus.publish(channel, message)
+
+    def pubsub(self):
+        return _PubSub(self.bus)
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def backend():
+    return _MemoryBackend(_Bus())
+
+
+def _process(backend) -> CacheManager:
+    """A CacheManager with its own L1, as in a separate worker process."""
+    with mock.patch(
+        "shared.cache.cache_manager.get_local_cache", return_value=LocalCache()
+    ):
+        manager = CacheManager(backend=backend)
+    _wait_for(lambda: manager.local_cache.live)
+    return manager
+
+
+class TestLocalCache:
+    def test_lru_bound_and_expiry(self):
+        cache = LocalCache(max_entries=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.stats["evictions"] == 1
+
+        cache.set("d", 4, ttl=0.01)
+        time.sleep(0.02)
+        assert cache.get("d") == (False, None)
+
+    def test_not_live_without_listener(self):
+        assert not LocalCache().live
+
+
+class TestTwoTierCacheManager:
+    def test_hot_reads_stay_in_process(self, backend):
+        manager = _process(backend)
+        manager.set("worker_cache:workflow:wf", {"steps": [1]}, "workflow")
+
+        first = manager.get("worker_cache:workflow:wf", "workflow")
+        first["steps"].append(2)
+        second = manager.get("worker_cache:workflow:wf", "workflow")
+
+        assert second == {"steps": [1]}
+        assert backend.gets == 0
+        tiers = manager.get_stats()["tiers"]
+        assert tiers["l1"]["hits"] == 2
+        assert tiers["l1"]["hit_rate"] == "100.0%"
+
+    def test_redis_hit_fills_l1(self, backend):
+        writer, reader = _process(backend), _process(backend)
+        writer.set("worker_cache:pipeline:p", {"name": "p"}, "pipeline")
+
+        assert reader.get("worker_cache:pipeline:p", "pipeline") == {"name": "p"}
+        assert reader.get("worker_cache:pipeline:p", "pipeline") == {"name": "p"}
+
+        assert backend.gets == 1
+        tiers = reader.get_stats()["tiers"]
+        assert tiers["redis"] == {"hits": 1, "misses": 0, "hit_rate": "100.0%"}
+        assert tiers["l1"]["hits"] == 1
+
+    def test_invalidation_reaches_other_processes(self, backend):
+        invalidating, other = _process(backend), _process(backend)
+        for manager in (invalidating, other):
+            manager.set("worker_cache:workflow:wf", {"v": 1}, "workflow")
+
+        invalidating.invalidate_workflow("wf")
+
+        _wait_for(lambda: not other.local_cache.get("worker_cache:workflow:wf")[0])
+        assert other.get("worker_cache:workflow:wf", "workflow") is None
+
+    def test_invalidation_published_after_redis_delete(self, backend):
+        manager = _process(backend)
+        manager.set("worker_cache:workflow:wf", {"v": 1}, "workflow")
+        in_redis_at_publish = []
+        publish = backend.publish
+
+        def recording_publish(channel, message):
+            in_redis_at_publish.append("worker_cache:workflow:wf" in backend.store)
+            return publish(channel, message)
+
+        with mock.patch.object(backend, "publish", recording_publish):
+            assert manager.delete("worker_cache:workflow:wf")
+
+        assert in_redis_at_publish == [False]
+
+    def test_dynamic_types_skip_l1(self, backend):
+        manager = _process(backend)
+        manager.set("worker_cache:file_batch:x", {"files": []}, "file_batch")
+
+        manager.get("worker_cache:file_batch:x", "file_batch")
+
+        assert backend.gets == 1
+
+    def test_disabled_by_env(self, backend, monkeypatch):
+        monkeypatch.setenv("WORKER_CACHE_L1_ENABLED", "false")
+        manager = CacheManager(backend=backend)
+        manager.set("worker_cache:workflow:wf", {"v": 1}, "workflow")
+
+        assert manager.local_cache is None
+        assert manager.get("worker_cache:workflow:wf", "workflow") == {"v": 1}
+        assert "l1" not in manager.get_stats()["tiers"]